@@ -25,18 +25,38 @@ var google_protobuf_timestamp_pb = require('google-protobuf/google/protobuf/time
 goog.object.extend(proto, google_protobuf_timestamp_pb);
 var google_protobuf_duration_pb = require('google-protobuf/google/protobuf/duration_pb.js');
 goog.object.extend(proto, google_protobuf_duration_pb);
+goog.exportSymbol('proto.IVM.slam.Box', null, global);
+goog.exportSymbol('proto.IVM.slam.ChunkDirective', null, global);
 goog.exportSymbol('proto.IVM.slam.ChunkRequest', null, global);
 goog.exportSymbol('proto.IVM.slam.DataChunk', null, global);
+goog.exportSymbol('proto.IVM.slam.DecimationMode', null, global);
+goog.exportSymbol('proto.IVM.slam.Frustum', null, global);
+goog.exportSymbol('proto.IVM.slam.Heartbeat', null, global);
+goog.exportSymbol('proto.IVM.slam.HistoryRequest', null, global);
+goog.exportSymbol('proto.IVM.slam.HistoryRequest.RangeCase', null, global);
 goog.exportSymbol('proto.IVM.slam.Index', null, global);
+goog.exportSymbol('proto.IVM.slam.KeyframePose', null, global);
+goog.exportSymbol('proto.IVM.slam.KeyframeRequest', null, global);
+goog.exportSymbol('proto.IVM.slam.MapSnapshotRequest', null, global);
 goog.exportSymbol('proto.IVM.slam.Point', null, global);
 goog.exportSymbol('proto.IVM.slam.PointCloud', null, global);
 goog.exportSymbol('proto.IVM.slam.PointCloudList', null, global);
 goog.exportSymbol('proto.IVM.slam.PointCloudWithPose', null, global);
 goog.exportSymbol('proto.IVM.slam.Pose', null, global);
+goog.exportSymbol('proto.IVM.slam.PoseCorrection', null, global);
 goog.exportSymbol('proto.IVM.slam.PoseList', null, global);
+goog.exportSymbol('proto.IVM.slam.RegionRequest', null, global);
+goog.exportSymbol('proto.IVM.slam.RegionRequest.RegionCase', null, global);
+goog.exportSymbol('proto.IVM.slam.SequenceRange', null, global);
 goog.exportSymbol('proto.IVM.slam.SessionInfo', null, global);
+goog.exportSymbol('proto.IVM.slam.SessionUpdate', null, global);
+goog.exportSymbol('proto.IVM.slam.SessionUpdate.PayloadCase', null, global);
 goog.exportSymbol('proto.IVM.slam.SlamData', null, global);
+goog.exportSymbol('proto.IVM.slam.Sphere', null, global);
 goog.exportSymbol('proto.IVM.slam.SyncStatus', null, global);
+goog.exportSymbol('proto.IVM.slam.TimeRange', null, global);
+goog.exportSymbol('proto.IVM.slam.TrajectoryRequest', null, global);
+goog.exportSymbol('proto.IVM.slam.Vector3', null, global);
 /**
  * Generated by JsPbCodeGenerator.
  * @param {Array=} opt_data Optional initial data array, typically from a
@@ -268,6 +288,279 @@ if (goog.DEBUG && !COMPILED) {
    */
   proto.IVM.slam.PointCloudWithPose.displayName = 'proto.IVM.slam.PointCloudWithPose';
 }
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.Vector3 = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.Vector3, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.Vector3.displayName = 'proto.IVM.slam.Vector3';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.Box = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.Box, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.Box.displayName = 'proto.IVM.slam.Box';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.Sphere = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.Sphere, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.Sphere.displayName = 'proto.IVM.slam.Sphere';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.Frustum = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.Frustum, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.Frustum.displayName = 'proto.IVM.slam.Frustum';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.RegionRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, proto.IVM.slam.RegionRequest.oneofGroups_);
+};
+goog.inherits(proto.IVM.slam.RegionRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.RegionRequest.displayName = 'proto.IVM.slam.RegionRequest';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.SequenceRange = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.SequenceRange, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.SequenceRange.displayName = 'proto.IVM.slam.SequenceRange';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.TimeRange = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.TimeRange, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.TimeRange.displayName = 'proto.IVM.slam.TimeRange';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.HistoryRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, proto.IVM.slam.HistoryRequest.oneofGroups_);
+};
+goog.inherits(proto.IVM.slam.HistoryRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.HistoryRequest.displayName = 'proto.IVM.slam.HistoryRequest';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.KeyframeRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.IVM.slam.KeyframeRequest.repeatedFields_, null);
+};
+goog.inherits(proto.IVM.slam.KeyframeRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.KeyframeRequest.displayName = 'proto.IVM.slam.KeyframeRequest';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.KeyframePose = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.KeyframePose, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.KeyframePose.displayName = 'proto.IVM.slam.KeyframePose';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.PoseCorrection = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.IVM.slam.PoseCorrection.repeatedFields_, null);
+};
+goog.inherits(proto.IVM.slam.PoseCorrection, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.PoseCorrection.displayName = 'proto.IVM.slam.PoseCorrection';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.MapSnapshotRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.MapSnapshotRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.MapSnapshotRequest.displayName = 'proto.IVM.slam.MapSnapshotRequest';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.TrajectoryRequest = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.TrajectoryRequest, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.TrajectoryRequest.displayName = 'proto.IVM.slam.TrajectoryRequest';
+}
 /**
  * Generated by JsPbCodeGenerator.
  * @param {Array=} opt_data Optional initial data array, typically from a
@@ -289,6 +582,3526 @@ if (goog.DEBUG && !COMPILED) {
    */
   proto.IVM.slam.SessionInfo.displayName = 'proto.IVM.slam.SessionInfo';
 }
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.Heartbeat = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.IVM.slam.Heartbeat, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.Heartbeat.displayName = 'proto.IVM.slam.Heartbeat';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.IVM.slam.SessionUpdate = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, proto.IVM.slam.SessionUpdate.oneofGroups_);
+};
+goog.inherits(proto.IVM.slam.SessionUpdate, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.IVM.slam.SessionUpdate.displayName = 'proto.IVM.slam.SessionUpdate';
+}
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.DataChunk.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.DataChunk.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.DataChunk} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.DataChunk.toObject = function(includeInstance, msg) {
+  var f, obj = {
+chunkId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+sequenceNumber: jspb.Message.getFieldWithDefault(msg, 2, 0),
+sessionId: jspb.Message.getFieldWithDefault(msg, 3, ""),
+timestamp: jspb.Message.getFieldWithDefault(msg, 4, 0),
+pointcloud: (f = msg.getPointcloud()) && proto.IVM.slam.PointCloud.toObject(includeInstance, f),
+pose: (f = msg.getPose()) && proto.IVM.slam.Pose.toObject(includeInstance, f),
+isKeyframe: jspb.Message.getBooleanFieldWithDefault(msg, 7, false)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.DataChunk}
+ */
+proto.IVM.slam.DataChunk.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.DataChunk;
+  return proto.IVM.slam.DataChunk.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.DataChunk} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.DataChunk}
+ */
+proto.IVM.slam.DataChunk.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setChunkId(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setSequenceNumber(value);
+      break;
+    case 3:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSessionId(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setTimestamp(value);
+      break;
+    case 5:
+      var value = new proto.IVM.slam.PointCloud;
+      reader.readMessage(value,proto.IVM.slam.PointCloud.deserializeBinaryFromReader);
+      msg.setPointcloud(value);
+      break;
+    case 6:
+      var value = new proto.IVM.slam.Pose;
+      reader.readMessage(value,proto.IVM.slam.Pose.deserializeBinaryFromReader);
+      msg.setPose(value);
+      break;
+    case 7:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setIsKeyframe(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.DataChunk.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.DataChunk.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.DataChunk} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.DataChunk.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getChunkId();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getSequenceNumber();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getSessionId();
+  if (f.length > 0) {
+    writer.writeString(
+      3,
+      f
+    );
+  }
+  f = message.getTimestamp();
+  if (f !== 0) {
+    writer.writeInt64(
+      4,
+      f
+    );
+  }
+  f = message.getPointcloud();
+  if (f != null) {
+    writer.writeMessage(
+      5,
+      f,
+      proto.IVM.slam.PointCloud.serializeBinaryToWriter
+    );
+  }
+  f = message.getPose();
+  if (f != null) {
+    writer.writeMessage(
+      6,
+      f,
+      proto.IVM.slam.Pose.serializeBinaryToWriter
+    );
+  }
+  f = message.getIsKeyframe();
+  if (f) {
+    writer.writeBool(
+      7,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string chunk_id = 1;
+ * @return {string}
+ */
+proto.IVM.slam.DataChunk.prototype.getChunkId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.IVM.slam.DataChunk} returns this
+ */
+proto.IVM.slam.DataChunk.prototype.setChunkId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional int32 sequence_number = 2;
+ * @return {number}
+ */
+proto.IVM.slam.DataChunk.prototype.getSequenceNumber = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.DataChunk} returns this
+ */
+proto.IVM.slam.DataChunk.prototype.setSequenceNumber = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional string session_id = 3;
+ * @return {string}
+ */
+proto.IVM.slam.DataChunk.prototype.getSessionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.IVM.slam.DataChunk} returns this
+ */
+proto.IVM.slam.DataChunk.prototype.setSessionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 3, value);
+};
+
+
+/**
+ * optional int64 timestamp = 4;
+ * @return {number}
+ */
+proto.IVM.slam.DataChunk.prototype.getTimestamp = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.DataChunk} returns this
+ */
+proto.IVM.slam.DataChunk.prototype.setTimestamp = function(value) {
+  return jspb.Message.setProto3IntField(this, 4, value);
+};
+
+
+/**
+ * optional PointCloud pointcloud = 5;
+ * @return {?proto.IVM.slam.PointCloud}
+ */
+proto.IVM.slam.DataChunk.prototype.getPointcloud = function() {
+  return /** @type{?proto.IVM.slam.PointCloud} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.PointCloud, 5));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.PointCloud|undefined} value
+ * @return {!proto.IVM.slam.DataChunk} returns this
+*/
+proto.IVM.slam.DataChunk.prototype.setPointcloud = function(value) {
+  return jspb.Message.setWrapperField(this, 5, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.DataChunk} returns this
+ */
+proto.IVM.slam.DataChunk.prototype.clearPointcloud = function() {
+  return this.setPointcloud(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.DataChunk.prototype.hasPointcloud = function() {
+  return jspb.Message.getField(this, 5) != null;
+};
+
+
+/**
+ * optional Pose pose = 6;
+ * @return {?proto.IVM.slam.Pose}
+ */
+proto.IVM.slam.DataChunk.prototype.getPose = function() {
+  return /** @type{?proto.IVM.slam.Pose} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Pose, 6));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.Pose|undefined} value
+ * @return {!proto.IVM.slam.DataChunk} returns this
+*/
+proto.IVM.slam.DataChunk.prototype.setPose = function(value) {
+  return jspb.Message.setWrapperField(this, 6, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.DataChunk} returns this
+ */
+proto.IVM.slam.DataChunk.prototype.clearPose = function() {
+  return this.setPose(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.DataChunk.prototype.hasPose = function() {
+  return jspb.Message.getField(this, 6) != null;
+};
+
+
+/**
+ * optional bool is_keyframe = 7;
+ * @return {boolean}
+ */
+proto.IVM.slam.DataChunk.prototype.getIsKeyframe = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 7, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.IVM.slam.DataChunk} returns this
+ */
+proto.IVM.slam.DataChunk.prototype.setIsKeyframe = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 7, value);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.IVM.slam.ChunkRequest.repeatedFields_ = [2];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.ChunkRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.ChunkRequest.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.ChunkRequest} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.ChunkRequest.toObject = function(includeInstance, msg) {
+  var f, obj = {
+sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+missingChunkIdsList: (f = jspb.Message.getRepeatedField(msg, 2)) == null ? undefined : f,
+lastSequenceNumber: jspb.Message.getFieldWithDefault(msg, 3, 0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.ChunkRequest}
+ */
+proto.IVM.slam.ChunkRequest.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.ChunkRequest;
+  return proto.IVM.slam.ChunkRequest.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.ChunkRequest} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.ChunkRequest}
+ */
+proto.IVM.slam.ChunkRequest.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSessionId(value);
+      break;
+    case 2:
+      var value = /** @type {string} */ (reader.readString());
+      msg.addMissingChunkIds(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setLastSequenceNumber(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.ChunkRequest.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.ChunkRequest.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.ChunkRequest} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.ChunkRequest.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getSessionId();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getMissingChunkIdsList();
+  if (f.length > 0) {
+    writer.writeRepeatedString(
+      2,
+      f
+    );
+  }
+  f = message.getLastSequenceNumber();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string session_id = 1;
+ * @return {string}
+ */
+proto.IVM.slam.ChunkRequest.prototype.getSessionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.IVM.slam.ChunkRequest} returns this
+ */
+proto.IVM.slam.ChunkRequest.prototype.setSessionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * repeated string missing_chunk_ids = 2;
+ * @return {!Array<string>}
+ */
+proto.IVM.slam.ChunkRequest.prototype.getMissingChunkIdsList = function() {
+  return /** @type {!Array<string>} */ (jspb.Message.getRepeatedField(this, 2));
+};
+
+
+/**
+ * @param {!Array<string>} value
+ * @return {!proto.IVM.slam.ChunkRequest} returns this
+ */
+proto.IVM.slam.ChunkRequest.prototype.setMissingChunkIdsList = function(value) {
+  return jspb.Message.setField(this, 2, value || []);
+};
+
+
+/**
+ * @param {string} value
+ * @param {number=} opt_index
+ * @return {!proto.IVM.slam.ChunkRequest} returns this
+ */
+proto.IVM.slam.ChunkRequest.prototype.addMissingChunkIds = function(value, opt_index) {
+  return jspb.Message.addToRepeatedField(this, 2, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.IVM.slam.ChunkRequest} returns this
+ */
+proto.IVM.slam.ChunkRequest.prototype.clearMissingChunkIdsList = function() {
+  return this.setMissingChunkIdsList([]);
+};
+
+
+/**
+ * optional int32 last_sequence_number = 3;
+ * @return {number}
+ */
+proto.IVM.slam.ChunkRequest.prototype.getLastSequenceNumber = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.ChunkRequest} returns this
+ */
+proto.IVM.slam.ChunkRequest.prototype.setLastSequenceNumber = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.IVM.slam.SyncStatus.repeatedFields_ = [4];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.SyncStatus.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.SyncStatus.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.SyncStatus} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.SyncStatus.toObject = function(includeInstance, msg) {
+  var f, obj = {
+sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+totalChunks: jspb.Message.getFieldWithDefault(msg, 2, 0),
+latestSequenceNumber: jspb.Message.getFieldWithDefault(msg, 3, 0),
+availableChunkIdsList: (f = jspb.Message.getRepeatedField(msg, 4)) == null ? undefined : f,
+clientQueueDepthsMap: (f = msg.getClientQueueDepthsMap()) ? f.toObject(includeInstance, undefined) : []
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.SyncStatus}
+ */
+proto.IVM.slam.SyncStatus.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.SyncStatus;
+  return proto.IVM.slam.SyncStatus.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.SyncStatus} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.SyncStatus}
+ */
+proto.IVM.slam.SyncStatus.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSessionId(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setTotalChunks(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setLatestSequenceNumber(value);
+      break;
+    case 4:
+      var value = /** @type {string} */ (reader.readString());
+      msg.addAvailableChunkIds(value);
+      break;
+    case 5:
+      var value = msg.getClientQueueDepthsMap();
+      reader.readMessage(value, function(message, reader) {
+        jspb.Map.deserializeBinary(message, reader, jspb.BinaryReader.prototype.readString, jspb.BinaryReader.prototype.readInt32, null, "", 0);
+         });
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.SyncStatus.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.SyncStatus.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.SyncStatus} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.SyncStatus.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getSessionId();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getTotalChunks();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getLatestSequenceNumber();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
+  f = message.getAvailableChunkIdsList();
+  if (f.length > 0) {
+    writer.writeRepeatedString(
+      4,
+      f
+    );
+  }
+  f = message.getClientQueueDepthsMap(true);
+  if (f && f.getLength() > 0) {
+    f.serializeBinary(5, writer, jspb.BinaryWriter.prototype.writeString, jspb.BinaryWriter.prototype.writeInt32);
+  }
+};
+
+
+/**
+ * optional string session_id = 1;
+ * @return {string}
+ */
+proto.IVM.slam.SyncStatus.prototype.getSessionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.IVM.slam.SyncStatus} returns this
+ */
+proto.IVM.slam.SyncStatus.prototype.setSessionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional int32 total_chunks = 2;
+ * @return {number}
+ */
+proto.IVM.slam.SyncStatus.prototype.getTotalChunks = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.SyncStatus} returns this
+ */
+proto.IVM.slam.SyncStatus.prototype.setTotalChunks = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * optional int32 latest_sequence_number = 3;
+ * @return {number}
+ */
+proto.IVM.slam.SyncStatus.prototype.getLatestSequenceNumber = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.SyncStatus} returns this
+ */
+proto.IVM.slam.SyncStatus.prototype.setLatestSequenceNumber = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+/**
+ * repeated string available_chunk_ids = 4;
+ * @return {!Array<string>}
+ */
+proto.IVM.slam.SyncStatus.prototype.getAvailableChunkIdsList = function() {
+  return /** @type {!Array<string>} */ (jspb.Message.getRepeatedField(this, 4));
+};
+
+
+/**
+ * @param {!Array<string>} value
+ * @return {!proto.IVM.slam.SyncStatus} returns this
+ */
+proto.IVM.slam.SyncStatus.prototype.setAvailableChunkIdsList = function(value) {
+  return jspb.Message.setField(this, 4, value || []);
+};
+
+
+/**
+ * @param {string} value
+ * @param {number=} opt_index
+ * @return {!proto.IVM.slam.SyncStatus} returns this
+ */
+proto.IVM.slam.SyncStatus.prototype.addAvailableChunkIds = function(value, opt_index) {
+  return jspb.Message.addToRepeatedField(this, 4, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.IVM.slam.SyncStatus} returns this
+ */
+proto.IVM.slam.SyncStatus.prototype.clearAvailableChunkIdsList = function() {
+  return this.setAvailableChunkIdsList([]);
+};
+
+
+/**
+ * map<string, int32> client_queue_depths = 5;
+ * @param {boolean=} opt_noLazyCreate Do not create the map if
+ * empty, instead returning `undefined`
+ * @return {!jspb.Map<string,number>}
+ */
+proto.IVM.slam.SyncStatus.prototype.getClientQueueDepthsMap = function(opt_noLazyCreate) {
+  return /** @type {!jspb.Map<string,number>} */ (
+      jspb.Message.getMapField(this, 5, opt_noLazyCreate,
+      null));
+};
+
+
+/**
+ * Clears values from the map. The map will be non-null.
+ * @return {!proto.IVM.slam.SyncStatus} returns this
+ */
+proto.IVM.slam.SyncStatus.prototype.clearClientQueueDepthsMap = function() {
+  this.getClientQueueDepthsMap().clear();
+  return this;
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.SlamData.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.SlamData.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.SlamData} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.SlamData.toObject = function(includeInstance, msg) {
+  var f, obj = {
+pointcloudlist: (f = msg.getPointcloudlist()) && proto.IVM.slam.PointCloudList.toObject(includeInstance, f),
+poselist: (f = msg.getPoselist()) && proto.IVM.slam.PoseList.toObject(includeInstance, f),
+indexlist: (f = msg.getIndexlist()) && proto.IVM.slam.Index.toObject(includeInstance, f),
+chunkId: jspb.Message.getFieldWithDefault(msg, 4, ""),
+sequenceNumber: jspb.Message.getFieldWithDefault(msg, 5, 0),
+lodLevel: jspb.Message.getFieldWithDefault(msg, 6, 0),
+lodVoxelSize: jspb.Message.getFloatingPointFieldWithDefault(msg, 7, 0.0),
+directive: jspb.Message.getFieldWithDefault(msg, 8, 0),
+localCoordinates: jspb.Message.getBooleanFieldWithDefault(msg, 9, false),
+resumeSequence: jspb.Message.getFieldWithDefault(msg, 10, 0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.SlamData}
+ */
+proto.IVM.slam.SlamData.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.SlamData;
+  return proto.IVM.slam.SlamData.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.SlamData} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.SlamData}
+ */
+proto.IVM.slam.SlamData.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.IVM.slam.PointCloudList;
+      reader.readMessage(value,proto.IVM.slam.PointCloudList.deserializeBinaryFromReader);
+      msg.setPointcloudlist(value);
+      break;
+    case 2:
+      var value = new proto.IVM.slam.PoseList;
+      reader.readMessage(value,proto.IVM.slam.PoseList.deserializeBinaryFromReader);
+      msg.setPoselist(value);
+      break;
+    case 3:
+      var value = new proto.IVM.slam.Index;
+      reader.readMessage(value,proto.IVM.slam.Index.deserializeBinaryFromReader);
+      msg.setIndexlist(value);
+      break;
+    case 4:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setChunkId(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setSequenceNumber(value);
+      break;
+    case 6:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setLodLevel(value);
+      break;
+    case 7:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setLodVoxelSize(value);
+      break;
+    case 8:
+      var value = /** @type {!proto.IVM.slam.ChunkDirective} */ (reader.readEnum());
+      msg.setDirective(value);
+      break;
+    case 9:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setLocalCoordinates(value);
+      break;
+    case 10:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setResumeSequence(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.SlamData.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.SlamData.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.SlamData} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.SlamData.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getPointcloudlist();
+  if (f != null) {
+    writer.writeMessage(
+      1,
+      f,
+      proto.IVM.slam.PointCloudList.serializeBinaryToWriter
+    );
+  }
+  f = message.getPoselist();
+  if (f != null) {
+    writer.writeMessage(
+      2,
+      f,
+      proto.IVM.slam.PoseList.serializeBinaryToWriter
+    );
+  }
+  f = message.getIndexlist();
+  if (f != null) {
+    writer.writeMessage(
+      3,
+      f,
+      proto.IVM.slam.Index.serializeBinaryToWriter
+    );
+  }
+  f = message.getChunkId();
+  if (f.length > 0) {
+    writer.writeString(
+      4,
+      f
+    );
+  }
+  f = message.getSequenceNumber();
+  if (f !== 0) {
+    writer.writeInt32(
+      5,
+      f
+    );
+  }
+  f = message.getLodLevel();
+  if (f !== 0) {
+    writer.writeInt32(
+      6,
+      f
+    );
+  }
+  f = message.getLodVoxelSize();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      7,
+      f
+    );
+  }
+  f = message.getDirective();
+  if (f !== 0.0) {
+    writer.writeEnum(
+      8,
+      f
+    );
+  }
+  f = message.getLocalCoordinates();
+  if (f) {
+    writer.writeBool(
+      9,
+      f
+    );
+  }
+  f = /** @type {number} */ (jspb.Message.getField(message, 10));
+  if (f != null) {
+    writer.writeInt32(
+      10,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional PointCloudList pointcloudlist = 1;
+ * @return {?proto.IVM.slam.PointCloudList}
+ */
+proto.IVM.slam.SlamData.prototype.getPointcloudlist = function() {
+  return /** @type{?proto.IVM.slam.PointCloudList} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.PointCloudList, 1));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.PointCloudList|undefined} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+*/
+proto.IVM.slam.SlamData.prototype.setPointcloudlist = function(value) {
+  return jspb.Message.setWrapperField(this, 1, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.clearPointcloudlist = function() {
+  return this.setPointcloudlist(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.SlamData.prototype.hasPointcloudlist = function() {
+  return jspb.Message.getField(this, 1) != null;
+};
+
+
+/**
+ * optional PoseList poselist = 2;
+ * @return {?proto.IVM.slam.PoseList}
+ */
+proto.IVM.slam.SlamData.prototype.getPoselist = function() {
+  return /** @type{?proto.IVM.slam.PoseList} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.PoseList, 2));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.PoseList|undefined} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+*/
+proto.IVM.slam.SlamData.prototype.setPoselist = function(value) {
+  return jspb.Message.setWrapperField(this, 2, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.clearPoselist = function() {
+  return this.setPoselist(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.SlamData.prototype.hasPoselist = function() {
+  return jspb.Message.getField(this, 2) != null;
+};
+
+
+/**
+ * optional Index indexlist = 3;
+ * @return {?proto.IVM.slam.Index}
+ */
+proto.IVM.slam.SlamData.prototype.getIndexlist = function() {
+  return /** @type{?proto.IVM.slam.Index} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Index, 3));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.Index|undefined} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+*/
+proto.IVM.slam.SlamData.prototype.setIndexlist = function(value) {
+  return jspb.Message.setWrapperField(this, 3, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.clearIndexlist = function() {
+  return this.setIndexlist(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.SlamData.prototype.hasIndexlist = function() {
+  return jspb.Message.getField(this, 3) != null;
+};
+
+
+/**
+ * optional string chunk_id = 4;
+ * @return {string}
+ */
+proto.IVM.slam.SlamData.prototype.getChunkId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 4, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.setChunkId = function(value) {
+  return jspb.Message.setProto3StringField(this, 4, value);
+};
+
+
+/**
+ * optional int32 sequence_number = 5;
+ * @return {number}
+ */
+proto.IVM.slam.SlamData.prototype.getSequenceNumber = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.setSequenceNumber = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
+};
+
+
+/**
+ * optional int32 lod_level = 6;
+ * @return {number}
+ */
+proto.IVM.slam.SlamData.prototype.getLodLevel = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 6, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.setLodLevel = function(value) {
+  return jspb.Message.setProto3IntField(this, 6, value);
+};
+
+
+/**
+ * optional double lod_voxel_size = 7;
+ * @return {number}
+ */
+proto.IVM.slam.SlamData.prototype.getLodVoxelSize = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 7, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.setLodVoxelSize = function(value) {
+  return jspb.Message.setProto3FloatField(this, 7, value);
+};
+
+
+/**
+ * optional ChunkDirective directive = 8;
+ * @return {!proto.IVM.slam.ChunkDirective}
+ */
+proto.IVM.slam.SlamData.prototype.getDirective = function() {
+  return /** @type {!proto.IVM.slam.ChunkDirective} */ (jspb.Message.getFieldWithDefault(this, 8, 0));
+};
+
+
+/**
+ * @param {!proto.IVM.slam.ChunkDirective} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.setDirective = function(value) {
+  return jspb.Message.setProto3EnumField(this, 8, value);
+};
+
+
+/**
+ * optional bool local_coordinates = 9;
+ * @return {boolean}
+ */
+proto.IVM.slam.SlamData.prototype.getLocalCoordinates = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 9, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.setLocalCoordinates = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 9, value);
+};
+
+
+/**
+ * optional int32 resume_sequence = 10;
+ * @return {number}
+ */
+proto.IVM.slam.SlamData.prototype.getResumeSequence = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 10, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.setResumeSequence = function(value) {
+  return jspb.Message.setField(this, 10, value);
+};
+
+
+/**
+ * Clears the field making it undefined.
+ * @return {!proto.IVM.slam.SlamData} returns this
+ */
+proto.IVM.slam.SlamData.prototype.clearResumeSequence = function() {
+  return jspb.Message.setField(this, 10, undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.SlamData.prototype.hasResumeSequence = function() {
+  return jspb.Message.getField(this, 10) != null;
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.Point.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.Point.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.Point} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Point.toObject = function(includeInstance, msg) {
+  var f, obj = {
+x: jspb.Message.getFloatingPointFieldWithDefault(msg, 1, 0.0),
+y: jspb.Message.getFloatingPointFieldWithDefault(msg, 2, 0.0),
+z: jspb.Message.getFloatingPointFieldWithDefault(msg, 3, 0.0),
+r: jspb.Message.getFloatingPointFieldWithDefault(msg, 4, 0.0),
+g: jspb.Message.getFloatingPointFieldWithDefault(msg, 5, 0.0),
+b: jspb.Message.getFloatingPointFieldWithDefault(msg, 6, 0.0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.Point}
+ */
+proto.IVM.slam.Point.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.Point;
+  return proto.IVM.slam.Point.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.Point} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.Point}
+ */
+proto.IVM.slam.Point.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setX(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setY(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setZ(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setR(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setG(value);
+      break;
+    case 6:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setB(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.Point.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.Point.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.Point} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Point.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getX();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      1,
+      f
+    );
+  }
+  f = message.getY();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      2,
+      f
+    );
+  }
+  f = message.getZ();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      3,
+      f
+    );
+  }
+  f = message.getR();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      4,
+      f
+    );
+  }
+  f = message.getG();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      5,
+      f
+    );
+  }
+  f = message.getB();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      6,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional double x = 1;
+ * @return {number}
+ */
+proto.IVM.slam.Point.prototype.getX = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 1, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Point} returns this
+ */
+proto.IVM.slam.Point.prototype.setX = function(value) {
+  return jspb.Message.setProto3FloatField(this, 1, value);
+};
+
+
+/**
+ * optional double y = 2;
+ * @return {number}
+ */
+proto.IVM.slam.Point.prototype.getY = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 2, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Point} returns this
+ */
+proto.IVM.slam.Point.prototype.setY = function(value) {
+  return jspb.Message.setProto3FloatField(this, 2, value);
+};
+
+
+/**
+ * optional double z = 3;
+ * @return {number}
+ */
+proto.IVM.slam.Point.prototype.getZ = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 3, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Point} returns this
+ */
+proto.IVM.slam.Point.prototype.setZ = function(value) {
+  return jspb.Message.setProto3FloatField(this, 3, value);
+};
+
+
+/**
+ * optional double r = 4;
+ * @return {number}
+ */
+proto.IVM.slam.Point.prototype.getR = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 4, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Point} returns this
+ */
+proto.IVM.slam.Point.prototype.setR = function(value) {
+  return jspb.Message.setProto3FloatField(this, 4, value);
+};
+
+
+/**
+ * optional double g = 5;
+ * @return {number}
+ */
+proto.IVM.slam.Point.prototype.getG = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 5, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Point} returns this
+ */
+proto.IVM.slam.Point.prototype.setG = function(value) {
+  return jspb.Message.setProto3FloatField(this, 5, value);
+};
+
+
+/**
+ * optional double b = 6;
+ * @return {number}
+ */
+proto.IVM.slam.Point.prototype.getB = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 6, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Point} returns this
+ */
+proto.IVM.slam.Point.prototype.setB = function(value) {
+  return jspb.Message.setProto3FloatField(this, 6, value);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.IVM.slam.PointCloud.repeatedFields_ = [1];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.PointCloud.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.PointCloud.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.PointCloud} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.PointCloud.toObject = function(includeInstance, msg) {
+  var f, obj = {
+pointsList: jspb.Message.toObjectList(msg.getPointsList(),
+    proto.IVM.slam.Point.toObject, includeInstance)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.PointCloud}
+ */
+proto.IVM.slam.PointCloud.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.PointCloud;
+  return proto.IVM.slam.PointCloud.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.PointCloud} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.PointCloud}
+ */
+proto.IVM.slam.PointCloud.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.IVM.slam.Point;
+      reader.readMessage(value,proto.IVM.slam.Point.deserializeBinaryFromReader);
+      msg.addPoints(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.PointCloud.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.PointCloud.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.PointCloud} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.PointCloud.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getPointsList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      1,
+      f,
+      proto.IVM.slam.Point.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * repeated Point points = 1;
+ * @return {!Array<!proto.IVM.slam.Point>}
+ */
+proto.IVM.slam.PointCloud.prototype.getPointsList = function() {
+  return /** @type{!Array<!proto.IVM.slam.Point>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.IVM.slam.Point, 1));
+};
+
+
+/**
+ * @param {!Array<!proto.IVM.slam.Point>} value
+ * @return {!proto.IVM.slam.PointCloud} returns this
+*/
+proto.IVM.slam.PointCloud.prototype.setPointsList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 1, value);
+};
+
+
+/**
+ * @param {!proto.IVM.slam.Point=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.IVM.slam.Point}
+ */
+proto.IVM.slam.PointCloud.prototype.addPoints = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.IVM.slam.Point, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.IVM.slam.PointCloud} returns this
+ */
+proto.IVM.slam.PointCloud.prototype.clearPointsList = function() {
+  return this.setPointsList([]);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.IVM.slam.Pose.repeatedFields_ = [1];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.Pose.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.Pose.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.Pose} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Pose.toObject = function(includeInstance, msg) {
+  var f, obj = {
+matrixList: (f = jspb.Message.getRepeatedFloatingPointField(msg, 1)) == null ? undefined : f
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.Pose}
+ */
+proto.IVM.slam.Pose.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.Pose;
+  return proto.IVM.slam.Pose.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.Pose} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.Pose}
+ */
+proto.IVM.slam.Pose.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var values = /** @type {!Array<number>} */ (reader.isDelimited() ? reader.readPackedDouble() : [reader.readDouble()]);
+      for (var i = 0; i < values.length; i++) {
+        msg.addMatrix(values[i]);
+      }
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.Pose.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.Pose.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.Pose} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Pose.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getMatrixList();
+  if (f.length > 0) {
+    writer.writePackedDouble(
+      1,
+      f
+    );
+  }
+};
+
+
+/**
+ * repeated double matrix = 1;
+ * @return {!Array<number>}
+ */
+proto.IVM.slam.Pose.prototype.getMatrixList = function() {
+  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedFloatingPointField(this, 1));
+};
+
+
+/**
+ * @param {!Array<number>} value
+ * @return {!proto.IVM.slam.Pose} returns this
+ */
+proto.IVM.slam.Pose.prototype.setMatrixList = function(value) {
+  return jspb.Message.setField(this, 1, value || []);
+};
+
+
+/**
+ * @param {number} value
+ * @param {number=} opt_index
+ * @return {!proto.IVM.slam.Pose} returns this
+ */
+proto.IVM.slam.Pose.prototype.addMatrix = function(value, opt_index) {
+  return jspb.Message.addToRepeatedField(this, 1, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.IVM.slam.Pose} returns this
+ */
+proto.IVM.slam.Pose.prototype.clearMatrixList = function() {
+  return this.setMatrixList([]);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.IVM.slam.Index.repeatedFields_ = [1];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.Index.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.Index.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.Index} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Index.toObject = function(includeInstance, msg) {
+  var f, obj = {
+indexList: (f = jspb.Message.getRepeatedField(msg, 1)) == null ? undefined : f
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.Index}
+ */
+proto.IVM.slam.Index.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.Index;
+  return proto.IVM.slam.Index.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.Index} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.Index}
+ */
+proto.IVM.slam.Index.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var values = /** @type {!Array<number>} */ (reader.isDelimited() ? reader.readPackedInt32() : [reader.readInt32()]);
+      for (var i = 0; i < values.length; i++) {
+        msg.addIndex(values[i]);
+      }
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.Index.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.Index.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.Index} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Index.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getIndexList();
+  if (f.length > 0) {
+    writer.writePackedInt32(
+      1,
+      f
+    );
+  }
+};
+
+
+/**
+ * repeated int32 index = 1;
+ * @return {!Array<number>}
+ */
+proto.IVM.slam.Index.prototype.getIndexList = function() {
+  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedField(this, 1));
+};
+
+
+/**
+ * @param {!Array<number>} value
+ * @return {!proto.IVM.slam.Index} returns this
+ */
+proto.IVM.slam.Index.prototype.setIndexList = function(value) {
+  return jspb.Message.setField(this, 1, value || []);
+};
+
+
+/**
+ * @param {number} value
+ * @param {number=} opt_index
+ * @return {!proto.IVM.slam.Index} returns this
+ */
+proto.IVM.slam.Index.prototype.addIndex = function(value, opt_index) {
+  return jspb.Message.addToRepeatedField(this, 1, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.IVM.slam.Index} returns this
+ */
+proto.IVM.slam.Index.prototype.clearIndexList = function() {
+  return this.setIndexList([]);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.IVM.slam.PointCloudList.repeatedFields_ = [1];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.PointCloudList.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.PointCloudList.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.PointCloudList} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.PointCloudList.toObject = function(includeInstance, msg) {
+  var f, obj = {
+pointcloudsList: jspb.Message.toObjectList(msg.getPointcloudsList(),
+    proto.IVM.slam.PointCloud.toObject, includeInstance)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.PointCloudList}
+ */
+proto.IVM.slam.PointCloudList.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.PointCloudList;
+  return proto.IVM.slam.PointCloudList.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.PointCloudList} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.PointCloudList}
+ */
+proto.IVM.slam.PointCloudList.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.IVM.slam.PointCloud;
+      reader.readMessage(value,proto.IVM.slam.PointCloud.deserializeBinaryFromReader);
+      msg.addPointclouds(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.PointCloudList.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.PointCloudList.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.PointCloudList} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.PointCloudList.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getPointcloudsList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      1,
+      f,
+      proto.IVM.slam.PointCloud.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * repeated PointCloud pointclouds = 1;
+ * @return {!Array<!proto.IVM.slam.PointCloud>}
+ */
+proto.IVM.slam.PointCloudList.prototype.getPointcloudsList = function() {
+  return /** @type{!Array<!proto.IVM.slam.PointCloud>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.IVM.slam.PointCloud, 1));
+};
+
+
+/**
+ * @param {!Array<!proto.IVM.slam.PointCloud>} value
+ * @return {!proto.IVM.slam.PointCloudList} returns this
+*/
+proto.IVM.slam.PointCloudList.prototype.setPointcloudsList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 1, value);
+};
+
+
+/**
+ * @param {!proto.IVM.slam.PointCloud=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.IVM.slam.PointCloud}
+ */
+proto.IVM.slam.PointCloudList.prototype.addPointclouds = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.IVM.slam.PointCloud, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.IVM.slam.PointCloudList} returns this
+ */
+proto.IVM.slam.PointCloudList.prototype.clearPointcloudsList = function() {
+  return this.setPointcloudsList([]);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.IVM.slam.PoseList.repeatedFields_ = [1];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.PoseList.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.PoseList.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.PoseList} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.PoseList.toObject = function(includeInstance, msg) {
+  var f, obj = {
+posesList: jspb.Message.toObjectList(msg.getPosesList(),
+    proto.IVM.slam.Pose.toObject, includeInstance)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.PoseList}
+ */
+proto.IVM.slam.PoseList.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.PoseList;
+  return proto.IVM.slam.PoseList.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.PoseList} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.PoseList}
+ */
+proto.IVM.slam.PoseList.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.IVM.slam.Pose;
+      reader.readMessage(value,proto.IVM.slam.Pose.deserializeBinaryFromReader);
+      msg.addPoses(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.PoseList.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.PoseList.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.PoseList} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.PoseList.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getPosesList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      1,
+      f,
+      proto.IVM.slam.Pose.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * repeated Pose poses = 1;
+ * @return {!Array<!proto.IVM.slam.Pose>}
+ */
+proto.IVM.slam.PoseList.prototype.getPosesList = function() {
+  return /** @type{!Array<!proto.IVM.slam.Pose>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.IVM.slam.Pose, 1));
+};
+
+
+/**
+ * @param {!Array<!proto.IVM.slam.Pose>} value
+ * @return {!proto.IVM.slam.PoseList} returns this
+*/
+proto.IVM.slam.PoseList.prototype.setPosesList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 1, value);
+};
+
+
+/**
+ * @param {!proto.IVM.slam.Pose=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.IVM.slam.Pose}
+ */
+proto.IVM.slam.PoseList.prototype.addPoses = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.IVM.slam.Pose, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.IVM.slam.PoseList} returns this
+ */
+proto.IVM.slam.PoseList.prototype.clearPosesList = function() {
+  return this.setPosesList([]);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.PointCloudWithPose.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.PointCloudWithPose.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.PointCloudWithPose} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.PointCloudWithPose.toObject = function(includeInstance, msg) {
+  var f, obj = {
+pointcloud: (f = msg.getPointcloud()) && proto.IVM.slam.PointCloud.toObject(includeInstance, f),
+pose: (f = msg.getPose()) && proto.IVM.slam.Pose.toObject(includeInstance, f)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.PointCloudWithPose}
+ */
+proto.IVM.slam.PointCloudWithPose.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.PointCloudWithPose;
+  return proto.IVM.slam.PointCloudWithPose.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.PointCloudWithPose} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.PointCloudWithPose}
+ */
+proto.IVM.slam.PointCloudWithPose.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.IVM.slam.PointCloud;
+      reader.readMessage(value,proto.IVM.slam.PointCloud.deserializeBinaryFromReader);
+      msg.setPointcloud(value);
+      break;
+    case 2:
+      var value = new proto.IVM.slam.Pose;
+      reader.readMessage(value,proto.IVM.slam.Pose.deserializeBinaryFromReader);
+      msg.setPose(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.PointCloudWithPose.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.PointCloudWithPose.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.PointCloudWithPose} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.PointCloudWithPose.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getPointcloud();
+  if (f != null) {
+    writer.writeMessage(
+      1,
+      f,
+      proto.IVM.slam.PointCloud.serializeBinaryToWriter
+    );
+  }
+  f = message.getPose();
+  if (f != null) {
+    writer.writeMessage(
+      2,
+      f,
+      proto.IVM.slam.Pose.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * optional PointCloud pointCloud = 1;
+ * @return {?proto.IVM.slam.PointCloud}
+ */
+proto.IVM.slam.PointCloudWithPose.prototype.getPointcloud = function() {
+  return /** @type{?proto.IVM.slam.PointCloud} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.PointCloud, 1));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.PointCloud|undefined} value
+ * @return {!proto.IVM.slam.PointCloudWithPose} returns this
+*/
+proto.IVM.slam.PointCloudWithPose.prototype.setPointcloud = function(value) {
+  return jspb.Message.setWrapperField(this, 1, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.PointCloudWithPose} returns this
+ */
+proto.IVM.slam.PointCloudWithPose.prototype.clearPointcloud = function() {
+  return this.setPointcloud(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.PointCloudWithPose.prototype.hasPointcloud = function() {
+  return jspb.Message.getField(this, 1) != null;
+};
+
+
+/**
+ * optional Pose pose = 2;
+ * @return {?proto.IVM.slam.Pose}
+ */
+proto.IVM.slam.PointCloudWithPose.prototype.getPose = function() {
+  return /** @type{?proto.IVM.slam.Pose} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Pose, 2));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.Pose|undefined} value
+ * @return {!proto.IVM.slam.PointCloudWithPose} returns this
+*/
+proto.IVM.slam.PointCloudWithPose.prototype.setPose = function(value) {
+  return jspb.Message.setWrapperField(this, 2, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.PointCloudWithPose} returns this
+ */
+proto.IVM.slam.PointCloudWithPose.prototype.clearPose = function() {
+  return this.setPose(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.PointCloudWithPose.prototype.hasPose = function() {
+  return jspb.Message.getField(this, 2) != null;
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.Vector3.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.Vector3.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.Vector3} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Vector3.toObject = function(includeInstance, msg) {
+  var f, obj = {
+x: jspb.Message.getFloatingPointFieldWithDefault(msg, 1, 0.0),
+y: jspb.Message.getFloatingPointFieldWithDefault(msg, 2, 0.0),
+z: jspb.Message.getFloatingPointFieldWithDefault(msg, 3, 0.0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.Vector3}
+ */
+proto.IVM.slam.Vector3.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.Vector3;
+  return proto.IVM.slam.Vector3.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.Vector3} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.Vector3}
+ */
+proto.IVM.slam.Vector3.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setX(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setY(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setZ(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.Vector3.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.Vector3.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.Vector3} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Vector3.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getX();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      1,
+      f
+    );
+  }
+  f = message.getY();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      2,
+      f
+    );
+  }
+  f = message.getZ();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      3,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional double x = 1;
+ * @return {number}
+ */
+proto.IVM.slam.Vector3.prototype.getX = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 1, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Vector3} returns this
+ */
+proto.IVM.slam.Vector3.prototype.setX = function(value) {
+  return jspb.Message.setProto3FloatField(this, 1, value);
+};
+
+
+/**
+ * optional double y = 2;
+ * @return {number}
+ */
+proto.IVM.slam.Vector3.prototype.getY = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 2, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Vector3} returns this
+ */
+proto.IVM.slam.Vector3.prototype.setY = function(value) {
+  return jspb.Message.setProto3FloatField(this, 2, value);
+};
+
+
+/**
+ * optional double z = 3;
+ * @return {number}
+ */
+proto.IVM.slam.Vector3.prototype.getZ = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 3, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Vector3} returns this
+ */
+proto.IVM.slam.Vector3.prototype.setZ = function(value) {
+  return jspb.Message.setProto3FloatField(this, 3, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.Box.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.Box.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.Box} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Box.toObject = function(includeInstance, msg) {
+  var f, obj = {
+min: (f = msg.getMin()) && proto.IVM.slam.Vector3.toObject(includeInstance, f),
+max: (f = msg.getMax()) && proto.IVM.slam.Vector3.toObject(includeInstance, f)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.Box}
+ */
+proto.IVM.slam.Box.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.Box;
+  return proto.IVM.slam.Box.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.Box} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.Box}
+ */
+proto.IVM.slam.Box.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.IVM.slam.Vector3;
+      reader.readMessage(value,proto.IVM.slam.Vector3.deserializeBinaryFromReader);
+      msg.setMin(value);
+      break;
+    case 2:
+      var value = new proto.IVM.slam.Vector3;
+      reader.readMessage(value,proto.IVM.slam.Vector3.deserializeBinaryFromReader);
+      msg.setMax(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.Box.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.Box.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.Box} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Box.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getMin();
+  if (f != null) {
+    writer.writeMessage(
+      1,
+      f,
+      proto.IVM.slam.Vector3.serializeBinaryToWriter
+    );
+  }
+  f = message.getMax();
+  if (f != null) {
+    writer.writeMessage(
+      2,
+      f,
+      proto.IVM.slam.Vector3.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * optional Vector3 min = 1;
+ * @return {?proto.IVM.slam.Vector3}
+ */
+proto.IVM.slam.Box.prototype.getMin = function() {
+  return /** @type{?proto.IVM.slam.Vector3} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Vector3, 1));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.Vector3|undefined} value
+ * @return {!proto.IVM.slam.Box} returns this
+*/
+proto.IVM.slam.Box.prototype.setMin = function(value) {
+  return jspb.Message.setWrapperField(this, 1, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.Box} returns this
+ */
+proto.IVM.slam.Box.prototype.clearMin = function() {
+  return this.setMin(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.Box.prototype.hasMin = function() {
+  return jspb.Message.getField(this, 1) != null;
+};
+
+
+/**
+ * optional Vector3 max = 2;
+ * @return {?proto.IVM.slam.Vector3}
+ */
+proto.IVM.slam.Box.prototype.getMax = function() {
+  return /** @type{?proto.IVM.slam.Vector3} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Vector3, 2));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.Vector3|undefined} value
+ * @return {!proto.IVM.slam.Box} returns this
+*/
+proto.IVM.slam.Box.prototype.setMax = function(value) {
+  return jspb.Message.setWrapperField(this, 2, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.Box} returns this
+ */
+proto.IVM.slam.Box.prototype.clearMax = function() {
+  return this.setMax(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.Box.prototype.hasMax = function() {
+  return jspb.Message.getField(this, 2) != null;
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.Sphere.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.Sphere.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.Sphere} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Sphere.toObject = function(includeInstance, msg) {
+  var f, obj = {
+center: (f = msg.getCenter()) && proto.IVM.slam.Vector3.toObject(includeInstance, f),
+radius: jspb.Message.getFloatingPointFieldWithDefault(msg, 2, 0.0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.Sphere}
+ */
+proto.IVM.slam.Sphere.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.Sphere;
+  return proto.IVM.slam.Sphere.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.Sphere} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.Sphere}
+ */
+proto.IVM.slam.Sphere.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.IVM.slam.Vector3;
+      reader.readMessage(value,proto.IVM.slam.Vector3.deserializeBinaryFromReader);
+      msg.setCenter(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setRadius(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.Sphere.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.Sphere.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.Sphere} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Sphere.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getCenter();
+  if (f != null) {
+    writer.writeMessage(
+      1,
+      f,
+      proto.IVM.slam.Vector3.serializeBinaryToWriter
+    );
+  }
+  f = message.getRadius();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      2,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional Vector3 center = 1;
+ * @return {?proto.IVM.slam.Vector3}
+ */
+proto.IVM.slam.Sphere.prototype.getCenter = function() {
+  return /** @type{?proto.IVM.slam.Vector3} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Vector3, 1));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.Vector3|undefined} value
+ * @return {!proto.IVM.slam.Sphere} returns this
+*/
+proto.IVM.slam.Sphere.prototype.setCenter = function(value) {
+  return jspb.Message.setWrapperField(this, 1, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.Sphere} returns this
+ */
+proto.IVM.slam.Sphere.prototype.clearCenter = function() {
+  return this.setCenter(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.Sphere.prototype.hasCenter = function() {
+  return jspb.Message.getField(this, 1) != null;
+};
+
+
+/**
+ * optional double radius = 2;
+ * @return {number}
+ */
+proto.IVM.slam.Sphere.prototype.getRadius = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 2, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Sphere} returns this
+ */
+proto.IVM.slam.Sphere.prototype.setRadius = function(value) {
+  return jspb.Message.setProto3FloatField(this, 2, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.Frustum.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.Frustum.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.Frustum} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Frustum.toObject = function(includeInstance, msg) {
+  var f, obj = {
+pose: (f = msg.getPose()) && proto.IVM.slam.Pose.toObject(includeInstance, f),
+fovY: jspb.Message.getFloatingPointFieldWithDefault(msg, 2, 0.0),
+aspect: jspb.Message.getFloatingPointFieldWithDefault(msg, 3, 0.0),
+near: jspb.Message.getFloatingPointFieldWithDefault(msg, 4, 0.0),
+far: jspb.Message.getFloatingPointFieldWithDefault(msg, 5, 0.0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.Frustum}
+ */
+proto.IVM.slam.Frustum.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.Frustum;
+  return proto.IVM.slam.Frustum.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.Frustum} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.Frustum}
+ */
+proto.IVM.slam.Frustum.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.IVM.slam.Pose;
+      reader.readMessage(value,proto.IVM.slam.Pose.deserializeBinaryFromReader);
+      msg.setPose(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setFovY(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setAspect(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setNear(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readDouble());
+      msg.setFar(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.IVM.slam.Frustum.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.Frustum.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.Frustum} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.Frustum.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getPose();
+  if (f != null) {
+    writer.writeMessage(
+      1,
+      f,
+      proto.IVM.slam.Pose.serializeBinaryToWriter
+    );
+  }
+  f = message.getFovY();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      2,
+      f
+    );
+  }
+  f = message.getAspect();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      3,
+      f
+    );
+  }
+  f = message.getNear();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      4,
+      f
+    );
+  }
+  f = message.getFar();
+  if (f !== 0.0) {
+    writer.writeDouble(
+      5,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional Pose pose = 1;
+ * @return {?proto.IVM.slam.Pose}
+ */
+proto.IVM.slam.Frustum.prototype.getPose = function() {
+  return /** @type{?proto.IVM.slam.Pose} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Pose, 1));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.Pose|undefined} value
+ * @return {!proto.IVM.slam.Frustum} returns this
+*/
+proto.IVM.slam.Frustum.prototype.setPose = function(value) {
+  return jspb.Message.setWrapperField(this, 1, value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.Frustum} returns this
+ */
+proto.IVM.slam.Frustum.prototype.clearPose = function() {
+  return this.setPose(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.Frustum.prototype.hasPose = function() {
+  return jspb.Message.getField(this, 1) != null;
+};
+
+
+/**
+ * optional double fov_y = 2;
+ * @return {number}
+ */
+proto.IVM.slam.Frustum.prototype.getFovY = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 2, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Frustum} returns this
+ */
+proto.IVM.slam.Frustum.prototype.setFovY = function(value) {
+  return jspb.Message.setProto3FloatField(this, 2, value);
+};
+
+
+/**
+ * optional double aspect = 3;
+ * @return {number}
+ */
+proto.IVM.slam.Frustum.prototype.getAspect = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 3, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Frustum} returns this
+ */
+proto.IVM.slam.Frustum.prototype.setAspect = function(value) {
+  return jspb.Message.setProto3FloatField(this, 3, value);
+};
+
+
+/**
+ * optional double near = 4;
+ * @return {number}
+ */
+proto.IVM.slam.Frustum.prototype.getNear = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 4, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Frustum} returns this
+ */
+proto.IVM.slam.Frustum.prototype.setNear = function(value) {
+  return jspb.Message.setProto3FloatField(this, 4, value);
+};
+
+
+/**
+ * optional double far = 5;
+ * @return {number}
+ */
+proto.IVM.slam.Frustum.prototype.getFar = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 5, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.Frustum} returns this
+ */
+proto.IVM.slam.Frustum.prototype.setFar = function(value) {
+  return jspb.Message.setProto3FloatField(this, 5, value);
+};
+
+
+
+/**
+ * Oneof group definitions for this message. Each group defines the field
+ * numbers belonging to that group. When of these fields' value is set, all
+ * other fields in the group are cleared. During deserialization, if multiple
+ * fields are encountered for a group, only the last value seen will be kept.
+ * @private {!Array<!Array<number>>}
+ * @const
+ */
+proto.IVM.slam.RegionRequest.oneofGroups_ = [[2,3,4]];
+
+/**
+ * @enum {number}
+ */
+proto.IVM.slam.RegionRequest.RegionCase = {
+  REGION_NOT_SET: 0,
+  BOX: 2,
+  SPHERE: 3,
+  FRUSTUM: 4
+};
+
+/**
+ * @return {proto.IVM.slam.RegionRequest.RegionCase}
+ */
+proto.IVM.slam.RegionRequest.prototype.getRegionCase = function() {
+  return /** @type {proto.IVM.slam.RegionRequest.RegionCase} */(jspb.Message.computeOneofCase(this, proto.IVM.slam.RegionRequest.oneofGroups_[0]));
+};
 
 
 
@@ -305,8 +4118,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.DataChunk.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.DataChunk.toObject(opt_includeInstance, this);
+proto.IVM.slam.RegionRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.RegionRequest.toObject(opt_includeInstance, this);
 };
 
 
@@ -315,19 +4128,17 @@ proto.IVM.slam.DataChunk.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.DataChunk} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.RegionRequest} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.DataChunk.toObject = function(includeInstance, msg) {
+proto.IVM.slam.RegionRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
-chunkId: jspb.Message.getFieldWithDefault(msg, 1, ""),
-sequenceNumber: jspb.Message.getFieldWithDefault(msg, 2, 0),
-sessionId: jspb.Message.getFieldWithDefault(msg, 3, ""),
-timestamp: jspb.Message.getFieldWithDefault(msg, 4, 0),
-pointcloud: (f = msg.getPointcloud()) && proto.IVM.slam.PointCloud.toObject(includeInstance, f),
-pose: (f = msg.getPose()) && proto.IVM.slam.Pose.toObject(includeInstance, f),
-isKeyframe: jspb.Message.getBooleanFieldWithDefault(msg, 7, false)
+sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+box: (f = msg.getBox()) && proto.IVM.slam.Box.toObject(includeInstance, f),
+sphere: (f = msg.getSphere()) && proto.IVM.slam.Sphere.toObject(includeInstance, f),
+frustum: (f = msg.getFrustum()) && proto.IVM.slam.Frustum.toObject(includeInstance, f),
+clipPoints: jspb.Message.getBooleanFieldWithDefault(msg, 5, false)
   };
 
   if (includeInstance) {
@@ -341,23 +4152,23 @@ isKeyframe: jspb.Message.getBooleanFieldWithDefault(msg, 7, false)
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.DataChunk}
+ * @return {!proto.IVM.slam.RegionRequest}
  */
-proto.IVM.slam.DataChunk.deserializeBinary = function(bytes) {
+proto.IVM.slam.RegionRequest.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.DataChunk;
-  return proto.IVM.slam.DataChunk.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.RegionRequest;
+  return proto.IVM.slam.RegionRequest.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.DataChunk} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.RegionRequest} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.DataChunk}
+ * @return {!proto.IVM.slam.RegionRequest}
  */
-proto.IVM.slam.DataChunk.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.RegionRequest.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -366,33 +4177,26 @@ proto.IVM.slam.DataChunk.deserializeBinaryFromReader = function(msg, reader) {
     switch (field) {
     case 1:
       var value = /** @type {string} */ (reader.readString());
-      msg.setChunkId(value);
+      msg.setSessionId(value);
       break;
     case 2:
-      var value = /** @type {number} */ (reader.readInt32());
-      msg.setSequenceNumber(value);
+      var value = new proto.IVM.slam.Box;
+      reader.readMessage(value,proto.IVM.slam.Box.deserializeBinaryFromReader);
+      msg.setBox(value);
       break;
     case 3:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setSessionId(value);
+      var value = new proto.IVM.slam.Sphere;
+      reader.readMessage(value,proto.IVM.slam.Sphere.deserializeBinaryFromReader);
+      msg.setSphere(value);
       break;
     case 4:
-      var value = /** @type {number} */ (reader.readInt64());
-      msg.setTimestamp(value);
+      var value = new proto.IVM.slam.Frustum;
+      reader.readMessage(value,proto.IVM.slam.Frustum.deserializeBinaryFromReader);
+      msg.setFrustum(value);
       break;
     case 5:
-      var value = new proto.IVM.slam.PointCloud;
-      reader.readMessage(value,proto.IVM.slam.PointCloud.deserializeBinaryFromReader);
-      msg.setPointcloud(value);
-      break;
-    case 6:
-      var value = new proto.IVM.slam.Pose;
-      reader.readMessage(value,proto.IVM.slam.Pose.deserializeBinaryFromReader);
-      msg.setPose(value);
-      break;
-    case 7:
       var value = /** @type {boolean} */ (reader.readBool());
-      msg.setIsKeyframe(value);
+      msg.setClipPoints(value);
       break;
     default:
       reader.skipField();
@@ -407,9 +4211,9 @@ proto.IVM.slam.DataChunk.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.DataChunk.prototype.serializeBinary = function() {
+proto.IVM.slam.RegionRequest.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.DataChunk.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.RegionRequest.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -417,60 +4221,47 @@ proto.IVM.slam.DataChunk.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.DataChunk} message
+ * @param {!proto.IVM.slam.RegionRequest} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.DataChunk.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.RegionRequest.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getChunkId();
+  f = message.getSessionId();
   if (f.length > 0) {
     writer.writeString(
       1,
       f
     );
   }
-  f = message.getSequenceNumber();
-  if (f !== 0) {
-    writer.writeInt32(
+  f = message.getBox();
+  if (f != null) {
+    writer.writeMessage(
       2,
-      f
-    );
-  }
-  f = message.getSessionId();
-  if (f.length > 0) {
-    writer.writeString(
-      3,
-      f
-    );
-  }
-  f = message.getTimestamp();
-  if (f !== 0) {
-    writer.writeInt64(
-      4,
-      f
+      f,
+      proto.IVM.slam.Box.serializeBinaryToWriter
     );
   }
-  f = message.getPointcloud();
+  f = message.getSphere();
   if (f != null) {
     writer.writeMessage(
-      5,
+      3,
       f,
-      proto.IVM.slam.PointCloud.serializeBinaryToWriter
+      proto.IVM.slam.Sphere.serializeBinaryToWriter
     );
   }
-  f = message.getPose();
+  f = message.getFrustum();
   if (f != null) {
     writer.writeMessage(
-      6,
+      4,
       f,
-      proto.IVM.slam.Pose.serializeBinaryToWriter
+      proto.IVM.slam.Frustum.serializeBinaryToWriter
     );
   }
-  f = message.getIsKeyframe();
+  f = message.getClipPoints();
   if (f) {
     writer.writeBool(
-      7,
+      5,
       f
     );
   }
@@ -478,102 +4269,85 @@ proto.IVM.slam.DataChunk.serializeBinaryToWriter = function(message, writer) {
 
 
 /**
- * optional string chunk_id = 1;
+ * optional string session_id = 1;
  * @return {string}
  */
-proto.IVM.slam.DataChunk.prototype.getChunkId = function() {
+proto.IVM.slam.RegionRequest.prototype.getSessionId = function() {
   return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
  * @param {string} value
- * @return {!proto.IVM.slam.DataChunk} returns this
+ * @return {!proto.IVM.slam.RegionRequest} returns this
  */
-proto.IVM.slam.DataChunk.prototype.setChunkId = function(value) {
+proto.IVM.slam.RegionRequest.prototype.setSessionId = function(value) {
   return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
 /**
- * optional int32 sequence_number = 2;
- * @return {number}
- */
-proto.IVM.slam.DataChunk.prototype.getSequenceNumber = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
-};
-
-
-/**
- * @param {number} value
- * @return {!proto.IVM.slam.DataChunk} returns this
- */
-proto.IVM.slam.DataChunk.prototype.setSequenceNumber = function(value) {
-  return jspb.Message.setProto3IntField(this, 2, value);
-};
-
-
-/**
- * optional string session_id = 3;
- * @return {string}
+ * optional Box box = 2;
+ * @return {?proto.IVM.slam.Box}
  */
-proto.IVM.slam.DataChunk.prototype.getSessionId = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 3, ""));
+proto.IVM.slam.RegionRequest.prototype.getBox = function() {
+  return /** @type{?proto.IVM.slam.Box} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Box, 2));
 };
 
 
 /**
- * @param {string} value
- * @return {!proto.IVM.slam.DataChunk} returns this
- */
-proto.IVM.slam.DataChunk.prototype.setSessionId = function(value) {
-  return jspb.Message.setProto3StringField(this, 3, value);
+ * @param {?proto.IVM.slam.Box|undefined} value
+ * @return {!proto.IVM.slam.RegionRequest} returns this
+*/
+proto.IVM.slam.RegionRequest.prototype.setBox = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 2, proto.IVM.slam.RegionRequest.oneofGroups_[0], value);
 };
 
 
 /**
- * optional int64 timestamp = 4;
- * @return {number}
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.RegionRequest} returns this
  */
-proto.IVM.slam.DataChunk.prototype.getTimestamp = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+proto.IVM.slam.RegionRequest.prototype.clearBox = function() {
+  return this.setBox(undefined);
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.IVM.slam.DataChunk} returns this
+ * Returns whether this field is set.
+ * @return {boolean}
  */
-proto.IVM.slam.DataChunk.prototype.setTimestamp = function(value) {
-  return jspb.Message.setProto3IntField(this, 4, value);
+proto.IVM.slam.RegionRequest.prototype.hasBox = function() {
+  return jspb.Message.getField(this, 2) != null;
 };
 
 
 /**
- * optional PointCloud pointcloud = 5;
- * @return {?proto.IVM.slam.PointCloud}
+ * optional Sphere sphere = 3;
+ * @return {?proto.IVM.slam.Sphere}
  */
-proto.IVM.slam.DataChunk.prototype.getPointcloud = function() {
-  return /** @type{?proto.IVM.slam.PointCloud} */ (
-    jspb.Message.getWrapperField(this, proto.IVM.slam.PointCloud, 5));
+proto.IVM.slam.RegionRequest.prototype.getSphere = function() {
+  return /** @type{?proto.IVM.slam.Sphere} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Sphere, 3));
 };
 
 
 /**
- * @param {?proto.IVM.slam.PointCloud|undefined} value
- * @return {!proto.IVM.slam.DataChunk} returns this
+ * @param {?proto.IVM.slam.Sphere|undefined} value
+ * @return {!proto.IVM.slam.RegionRequest} returns this
 */
-proto.IVM.slam.DataChunk.prototype.setPointcloud = function(value) {
-  return jspb.Message.setWrapperField(this, 5, value);
+proto.IVM.slam.RegionRequest.prototype.setSphere = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 3, proto.IVM.slam.RegionRequest.oneofGroups_[0], value);
 };
 
 
 /**
  * Clears the message field making it undefined.
- * @return {!proto.IVM.slam.DataChunk} returns this
+ * @return {!proto.IVM.slam.RegionRequest} returns this
  */
-proto.IVM.slam.DataChunk.prototype.clearPointcloud = function() {
-  return this.setPointcloud(undefined);
+proto.IVM.slam.RegionRequest.prototype.clearSphere = function() {
+  return this.setSphere(undefined);
 };
 
 
@@ -581,36 +4355,36 @@ proto.IVM.slam.DataChunk.prototype.clearPointcloud = function() {
  * Returns whether this field is set.
  * @return {boolean}
  */
-proto.IVM.slam.DataChunk.prototype.hasPointcloud = function() {
-  return jspb.Message.getField(this, 5) != null;
+proto.IVM.slam.RegionRequest.prototype.hasSphere = function() {
+  return jspb.Message.getField(this, 3) != null;
 };
 
 
 /**
- * optional Pose pose = 6;
- * @return {?proto.IVM.slam.Pose}
+ * optional Frustum frustum = 4;
+ * @return {?proto.IVM.slam.Frustum}
  */
-proto.IVM.slam.DataChunk.prototype.getPose = function() {
-  return /** @type{?proto.IVM.slam.Pose} */ (
-    jspb.Message.getWrapperField(this, proto.IVM.slam.Pose, 6));
+proto.IVM.slam.RegionRequest.prototype.getFrustum = function() {
+  return /** @type{?proto.IVM.slam.Frustum} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Frustum, 4));
 };
 
 
 /**
- * @param {?proto.IVM.slam.Pose|undefined} value
- * @return {!proto.IVM.slam.DataChunk} returns this
+ * @param {?proto.IVM.slam.Frustum|undefined} value
+ * @return {!proto.IVM.slam.RegionRequest} returns this
 */
-proto.IVM.slam.DataChunk.prototype.setPose = function(value) {
-  return jspb.Message.setWrapperField(this, 6, value);
+proto.IVM.slam.RegionRequest.prototype.setFrustum = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 4, proto.IVM.slam.RegionRequest.oneofGroups_[0], value);
 };
 
 
 /**
  * Clears the message field making it undefined.
- * @return {!proto.IVM.slam.DataChunk} returns this
+ * @return {!proto.IVM.slam.RegionRequest} returns this
  */
-proto.IVM.slam.DataChunk.prototype.clearPose = function() {
-  return this.setPose(undefined);
+proto.IVM.slam.RegionRequest.prototype.clearFrustum = function() {
+  return this.setFrustum(undefined);
 };
 
 
@@ -618,37 +4392,30 @@ proto.IVM.slam.DataChunk.prototype.clearPose = function() {
  * Returns whether this field is set.
  * @return {boolean}
  */
-proto.IVM.slam.DataChunk.prototype.hasPose = function() {
-  return jspb.Message.getField(this, 6) != null;
+proto.IVM.slam.RegionRequest.prototype.hasFrustum = function() {
+  return jspb.Message.getField(this, 4) != null;
 };
 
 
 /**
- * optional bool is_keyframe = 7;
+ * optional bool clip_points = 5;
  * @return {boolean}
  */
-proto.IVM.slam.DataChunk.prototype.getIsKeyframe = function() {
-  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 7, false));
+proto.IVM.slam.RegionRequest.prototype.getClipPoints = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 5, false));
 };
 
 
 /**
  * @param {boolean} value
- * @return {!proto.IVM.slam.DataChunk} returns this
+ * @return {!proto.IVM.slam.RegionRequest} returns this
  */
-proto.IVM.slam.DataChunk.prototype.setIsKeyframe = function(value) {
-  return jspb.Message.setProto3BooleanField(this, 7, value);
+proto.IVM.slam.RegionRequest.prototype.setClipPoints = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 5, value);
 };
 
 
 
-/**
- * List of repeated fields within this message type.
- * @private {!Array<number>}
- * @const
- */
-proto.IVM.slam.ChunkRequest.repeatedFields_ = [2];
-
 
 
 if (jspb.Message.GENERATE_TO_OBJECT) {
@@ -664,8 +4431,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.ChunkRequest.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.ChunkRequest.toObject(opt_includeInstance, this);
+proto.IVM.slam.SequenceRange.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.SequenceRange.toObject(opt_includeInstance, this);
 };
 
 
@@ -674,15 +4441,14 @@ proto.IVM.slam.ChunkRequest.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.ChunkRequest} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.SequenceRange} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.ChunkRequest.toObject = function(includeInstance, msg) {
+proto.IVM.slam.SequenceRange.toObject = function(includeInstance, msg) {
   var f, obj = {
-sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
-missingChunkIdsList: (f = jspb.Message.getRepeatedField(msg, 2)) == null ? undefined : f,
-lastSequenceNumber: jspb.Message.getFieldWithDefault(msg, 3, 0)
+start: jspb.Message.getFieldWithDefault(msg, 1, 0),
+end: jspb.Message.getFieldWithDefault(msg, 2, 0)
   };
 
   if (includeInstance) {
@@ -696,23 +4462,23 @@ lastSequenceNumber: jspb.Message.getFieldWithDefault(msg, 3, 0)
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.ChunkRequest}
+ * @return {!proto.IVM.slam.SequenceRange}
  */
-proto.IVM.slam.ChunkRequest.deserializeBinary = function(bytes) {
+proto.IVM.slam.SequenceRange.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.ChunkRequest;
-  return proto.IVM.slam.ChunkRequest.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.SequenceRange;
+  return proto.IVM.slam.SequenceRange.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.ChunkRequest} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.SequenceRange} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.ChunkRequest}
+ * @return {!proto.IVM.slam.SequenceRange}
  */
-proto.IVM.slam.ChunkRequest.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.SequenceRange.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -720,16 +4486,12 @@ proto.IVM.slam.ChunkRequest.deserializeBinaryFromReader = function(msg, reader)
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setSessionId(value);
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setStart(value);
       break;
     case 2:
-      var value = /** @type {string} */ (reader.readString());
-      msg.addMissingChunkIds(value);
-      break;
-    case 3:
       var value = /** @type {number} */ (reader.readInt32());
-      msg.setLastSequenceNumber(value);
+      msg.setEnd(value);
       break;
     default:
       reader.skipField();
@@ -744,9 +4506,9 @@ proto.IVM.slam.ChunkRequest.deserializeBinaryFromReader = function(msg, reader)
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.ChunkRequest.prototype.serializeBinary = function() {
+proto.IVM.slam.SequenceRange.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.ChunkRequest.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.SequenceRange.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -754,30 +4516,23 @@ proto.IVM.slam.ChunkRequest.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.ChunkRequest} message
+ * @param {!proto.IVM.slam.SequenceRange} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.ChunkRequest.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.SequenceRange.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getSessionId();
-  if (f.length > 0) {
-    writer.writeString(
+  f = message.getStart();
+  if (f !== 0) {
+    writer.writeInt32(
       1,
       f
     );
   }
-  f = message.getMissingChunkIdsList();
-  if (f.length > 0) {
-    writer.writeRepeatedString(
-      2,
-      f
-    );
-  }
-  f = message.getLastSequenceNumber();
-  if (f !== 0) {
+  f = /** @type {number} */ (jspb.Message.getField(message, 2));
+  if (f != null) {
     writer.writeInt32(
-      3,
+      2,
       f
     );
   }
@@ -785,85 +4540,59 @@ proto.IVM.slam.ChunkRequest.serializeBinaryToWriter = function(message, writer)
 
 
 /**
- * optional string session_id = 1;
- * @return {string}
- */
-proto.IVM.slam.ChunkRequest.prototype.getSessionId = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
-};
-
-
-/**
- * @param {string} value
- * @return {!proto.IVM.slam.ChunkRequest} returns this
- */
-proto.IVM.slam.ChunkRequest.prototype.setSessionId = function(value) {
-  return jspb.Message.setProto3StringField(this, 1, value);
-};
-
-
-/**
- * repeated string missing_chunk_ids = 2;
- * @return {!Array<string>}
- */
-proto.IVM.slam.ChunkRequest.prototype.getMissingChunkIdsList = function() {
-  return /** @type {!Array<string>} */ (jspb.Message.getRepeatedField(this, 2));
-};
-
-
-/**
- * @param {!Array<string>} value
- * @return {!proto.IVM.slam.ChunkRequest} returns this
+ * optional int32 start = 1;
+ * @return {number}
  */
-proto.IVM.slam.ChunkRequest.prototype.setMissingChunkIdsList = function(value) {
-  return jspb.Message.setField(this, 2, value || []);
+proto.IVM.slam.SequenceRange.prototype.getStart = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 1, 0));
 };
 
 
 /**
- * @param {string} value
- * @param {number=} opt_index
- * @return {!proto.IVM.slam.ChunkRequest} returns this
+ * @param {number} value
+ * @return {!proto.IVM.slam.SequenceRange} returns this
  */
-proto.IVM.slam.ChunkRequest.prototype.addMissingChunkIds = function(value, opt_index) {
-  return jspb.Message.addToRepeatedField(this, 2, value, opt_index);
+proto.IVM.slam.SequenceRange.prototype.setStart = function(value) {
+  return jspb.Message.setProto3IntField(this, 1, value);
 };
 
 
 /**
- * Clears the list making it empty but non-null.
- * @return {!proto.IVM.slam.ChunkRequest} returns this
+ * optional int32 end = 2;
+ * @return {number}
  */
-proto.IVM.slam.ChunkRequest.prototype.clearMissingChunkIdsList = function() {
-  return this.setMissingChunkIdsList([]);
+proto.IVM.slam.SequenceRange.prototype.getEnd = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
 };
 
 
 /**
- * optional int32 last_sequence_number = 3;
- * @return {number}
- */
-proto.IVM.slam.ChunkRequest.prototype.getLastSequenceNumber = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+ * @param {number} value
+ * @return {!proto.IVM.slam.SequenceRange} returns this
+ */
+proto.IVM.slam.SequenceRange.prototype.setEnd = function(value) {
+  return jspb.Message.setField(this, 2, value);
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.IVM.slam.ChunkRequest} returns this
+ * Clears the field making it undefined.
+ * @return {!proto.IVM.slam.SequenceRange} returns this
  */
-proto.IVM.slam.ChunkRequest.prototype.setLastSequenceNumber = function(value) {
-  return jspb.Message.setProto3IntField(this, 3, value);
+proto.IVM.slam.SequenceRange.prototype.clearEnd = function() {
+  return jspb.Message.setField(this, 2, undefined);
 };
 
 
-
 /**
- * List of repeated fields within this message type.
- * @private {!Array<number>}
- * @const
+ * Returns whether this field is set.
+ * @return {boolean}
  */
-proto.IVM.slam.SyncStatus.repeatedFields_ = [4];
+proto.IVM.slam.SequenceRange.prototype.hasEnd = function() {
+  return jspb.Message.getField(this, 2) != null;
+};
+
+
 
 
 
@@ -880,8 +4609,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.SyncStatus.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.SyncStatus.toObject(opt_includeInstance, this);
+proto.IVM.slam.TimeRange.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.TimeRange.toObject(opt_includeInstance, this);
 };
 
 
@@ -890,16 +4619,14 @@ proto.IVM.slam.SyncStatus.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.SyncStatus} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.TimeRange} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.SyncStatus.toObject = function(includeInstance, msg) {
+proto.IVM.slam.TimeRange.toObject = function(includeInstance, msg) {
   var f, obj = {
-sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
-totalChunks: jspb.Message.getFieldWithDefault(msg, 2, 0),
-latestSequenceNumber: jspb.Message.getFieldWithDefault(msg, 3, 0),
-availableChunkIdsList: (f = jspb.Message.getRepeatedField(msg, 4)) == null ? undefined : f
+startMs: jspb.Message.getFieldWithDefault(msg, 1, 0),
+endMs: jspb.Message.getFieldWithDefault(msg, 2, 0)
   };
 
   if (includeInstance) {
@@ -913,23 +4640,23 @@ availableChunkIdsList: (f = jspb.Message.getRepeatedField(msg, 4)) == null ? und
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.SyncStatus}
+ * @return {!proto.IVM.slam.TimeRange}
  */
-proto.IVM.slam.SyncStatus.deserializeBinary = function(bytes) {
+proto.IVM.slam.TimeRange.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.SyncStatus;
-  return proto.IVM.slam.SyncStatus.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.TimeRange;
+  return proto.IVM.slam.TimeRange.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.SyncStatus} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.TimeRange} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.SyncStatus}
+ * @return {!proto.IVM.slam.TimeRange}
  */
-proto.IVM.slam.SyncStatus.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.TimeRange.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -937,20 +4664,12 @@ proto.IVM.slam.SyncStatus.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setSessionId(value);
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setStartMs(value);
       break;
     case 2:
-      var value = /** @type {number} */ (reader.readInt32());
-      msg.setTotalChunks(value);
-      break;
-    case 3:
-      var value = /** @type {number} */ (reader.readInt32());
-      msg.setLatestSequenceNumber(value);
-      break;
-    case 4:
-      var value = /** @type {string} */ (reader.readString());
-      msg.addAvailableChunkIds(value);
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setEndMs(value);
       break;
     default:
       reader.skipField();
@@ -965,9 +4684,9 @@ proto.IVM.slam.SyncStatus.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.SyncStatus.prototype.serializeBinary = function() {
+proto.IVM.slam.TimeRange.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.SyncStatus.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.TimeRange.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -975,137 +4694,94 @@ proto.IVM.slam.SyncStatus.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.SyncStatus} message
+ * @param {!proto.IVM.slam.TimeRange} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.SyncStatus.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.TimeRange.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getSessionId();
-  if (f.length > 0) {
-    writer.writeString(
+  f = message.getStartMs();
+  if (f !== 0) {
+    writer.writeInt64(
       1,
       f
     );
   }
-  f = message.getTotalChunks();
+  f = message.getEndMs();
   if (f !== 0) {
-    writer.writeInt32(
+    writer.writeInt64(
       2,
       f
     );
   }
-  f = message.getLatestSequenceNumber();
-  if (f !== 0) {
-    writer.writeInt32(
-      3,
-      f
-    );
-  }
-  f = message.getAvailableChunkIdsList();
-  if (f.length > 0) {
-    writer.writeRepeatedString(
-      4,
-      f
-    );
-  }
-};
-
-
-/**
- * optional string session_id = 1;
- * @return {string}
- */
-proto.IVM.slam.SyncStatus.prototype.getSessionId = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
-};
-
-
-/**
- * @param {string} value
- * @return {!proto.IVM.slam.SyncStatus} returns this
- */
-proto.IVM.slam.SyncStatus.prototype.setSessionId = function(value) {
-  return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
 /**
- * optional int32 total_chunks = 2;
+ * optional int64 start_ms = 1;
  * @return {number}
  */
-proto.IVM.slam.SyncStatus.prototype.getTotalChunks = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+proto.IVM.slam.TimeRange.prototype.getStartMs = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 1, 0));
 };
 
 
 /**
  * @param {number} value
- * @return {!proto.IVM.slam.SyncStatus} returns this
+ * @return {!proto.IVM.slam.TimeRange} returns this
  */
-proto.IVM.slam.SyncStatus.prototype.setTotalChunks = function(value) {
-  return jspb.Message.setProto3IntField(this, 2, value);
+proto.IVM.slam.TimeRange.prototype.setStartMs = function(value) {
+  return jspb.Message.setProto3IntField(this, 1, value);
 };
 
 
 /**
- * optional int32 latest_sequence_number = 3;
+ * optional int64 end_ms = 2;
  * @return {number}
  */
-proto.IVM.slam.SyncStatus.prototype.getLatestSequenceNumber = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+proto.IVM.slam.TimeRange.prototype.getEndMs = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
 };
 
 
 /**
  * @param {number} value
- * @return {!proto.IVM.slam.SyncStatus} returns this
+ * @return {!proto.IVM.slam.TimeRange} returns this
  */
-proto.IVM.slam.SyncStatus.prototype.setLatestSequenceNumber = function(value) {
-  return jspb.Message.setProto3IntField(this, 3, value);
+proto.IVM.slam.TimeRange.prototype.setEndMs = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
 };
 
 
-/**
- * repeated string available_chunk_ids = 4;
- * @return {!Array<string>}
- */
-proto.IVM.slam.SyncStatus.prototype.getAvailableChunkIdsList = function() {
-  return /** @type {!Array<string>} */ (jspb.Message.getRepeatedField(this, 4));
-};
-
 
 /**
- * @param {!Array<string>} value
- * @return {!proto.IVM.slam.SyncStatus} returns this
+ * Oneof group definitions for this message. Each group defines the field
+ * numbers belonging to that group. When of these fields' value is set, all
+ * other fields in the group are cleared. During deserialization, if multiple
+ * fields are encountered for a group, only the last value seen will be kept.
+ * @private {!Array<!Array<number>>}
+ * @const
  */
-proto.IVM.slam.SyncStatus.prototype.setAvailableChunkIdsList = function(value) {
-  return jspb.Message.setField(this, 4, value || []);
-};
-
+proto.IVM.slam.HistoryRequest.oneofGroups_ = [[2,3]];
 
 /**
- * @param {string} value
- * @param {number=} opt_index
- * @return {!proto.IVM.slam.SyncStatus} returns this
+ * @enum {number}
  */
-proto.IVM.slam.SyncStatus.prototype.addAvailableChunkIds = function(value, opt_index) {
-  return jspb.Message.addToRepeatedField(this, 4, value, opt_index);
+proto.IVM.slam.HistoryRequest.RangeCase = {
+  RANGE_NOT_SET: 0,
+  SEQUENCE: 2,
+  TIME: 3
 };
 
-
 /**
- * Clears the list making it empty but non-null.
- * @return {!proto.IVM.slam.SyncStatus} returns this
+ * @return {proto.IVM.slam.HistoryRequest.RangeCase}
  */
-proto.IVM.slam.SyncStatus.prototype.clearAvailableChunkIdsList = function() {
-  return this.setAvailableChunkIdsList([]);
+proto.IVM.slam.HistoryRequest.prototype.getRangeCase = function() {
+  return /** @type {proto.IVM.slam.HistoryRequest.RangeCase} */(jspb.Message.computeOneofCase(this, proto.IVM.slam.HistoryRequest.oneofGroups_[0]));
 };
 
 
 
-
-
 if (jspb.Message.GENERATE_TO_OBJECT) {
 /**
  * Creates an object representation of this proto.
@@ -1119,8 +4795,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.SlamData.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.SlamData.toObject(opt_includeInstance, this);
+proto.IVM.slam.HistoryRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.HistoryRequest.toObject(opt_includeInstance, this);
 };
 
 
@@ -1129,17 +4805,15 @@ proto.IVM.slam.SlamData.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.SlamData} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.HistoryRequest} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.SlamData.toObject = function(includeInstance, msg) {
+proto.IVM.slam.HistoryRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
-pointcloudlist: (f = msg.getPointcloudlist()) && proto.IVM.slam.PointCloudList.toObject(includeInstance, f),
-poselist: (f = msg.getPoselist()) && proto.IVM.slam.PoseList.toObject(includeInstance, f),
-indexlist: (f = msg.getIndexlist()) && proto.IVM.slam.Index.toObject(includeInstance, f),
-chunkId: jspb.Message.getFieldWithDefault(msg, 4, ""),
-sequenceNumber: jspb.Message.getFieldWithDefault(msg, 5, 0)
+sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+sequence: (f = msg.getSequence()) && proto.IVM.slam.SequenceRange.toObject(includeInstance, f),
+time: (f = msg.getTime()) && proto.IVM.slam.TimeRange.toObject(includeInstance, f)
   };
 
   if (includeInstance) {
@@ -1153,23 +4827,23 @@ sequenceNumber: jspb.Message.getFieldWithDefault(msg, 5, 0)
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.SlamData}
+ * @return {!proto.IVM.slam.HistoryRequest}
  */
-proto.IVM.slam.SlamData.deserializeBinary = function(bytes) {
+proto.IVM.slam.HistoryRequest.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.SlamData;
-  return proto.IVM.slam.SlamData.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.HistoryRequest;
+  return proto.IVM.slam.HistoryRequest.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.SlamData} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.HistoryRequest} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.SlamData}
+ * @return {!proto.IVM.slam.HistoryRequest}
  */
-proto.IVM.slam.SlamData.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.HistoryRequest.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -1177,27 +4851,18 @@ proto.IVM.slam.SlamData.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = new proto.IVM.slam.PointCloudList;
-      reader.readMessage(value,proto.IVM.slam.PointCloudList.deserializeBinaryFromReader);
-      msg.setPointcloudlist(value);
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSessionId(value);
       break;
     case 2:
-      var value = new proto.IVM.slam.PoseList;
-      reader.readMessage(value,proto.IVM.slam.PoseList.deserializeBinaryFromReader);
-      msg.setPoselist(value);
+      var value = new proto.IVM.slam.SequenceRange;
+      reader.readMessage(value,proto.IVM.slam.SequenceRange.deserializeBinaryFromReader);
+      msg.setSequence(value);
       break;
     case 3:
-      var value = new proto.IVM.slam.Index;
-      reader.readMessage(value,proto.IVM.slam.Index.deserializeBinaryFromReader);
-      msg.setIndexlist(value);
-      break;
-    case 4:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setChunkId(value);
-      break;
-    case 5:
-      var value = /** @type {number} */ (reader.readInt32());
-      msg.setSequenceNumber(value);
+      var value = new proto.IVM.slam.TimeRange;
+      reader.readMessage(value,proto.IVM.slam.TimeRange.deserializeBinaryFromReader);
+      msg.setTime(value);
       break;
     default:
       reader.skipField();
@@ -1212,9 +4877,9 @@ proto.IVM.slam.SlamData.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.SlamData.prototype.serializeBinary = function() {
+proto.IVM.slam.HistoryRequest.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.SlamData.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.HistoryRequest.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -1222,152 +4887,81 @@ proto.IVM.slam.SlamData.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.SlamData} message
+ * @param {!proto.IVM.slam.HistoryRequest} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.SlamData.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.HistoryRequest.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getPointcloudlist();
-  if (f != null) {
-    writer.writeMessage(
+  f = message.getSessionId();
+  if (f.length > 0) {
+    writer.writeString(
       1,
-      f,
-      proto.IVM.slam.PointCloudList.serializeBinaryToWriter
+      f
     );
   }
-  f = message.getPoselist();
+  f = message.getSequence();
   if (f != null) {
     writer.writeMessage(
       2,
       f,
-      proto.IVM.slam.PoseList.serializeBinaryToWriter
+      proto.IVM.slam.SequenceRange.serializeBinaryToWriter
     );
   }
-  f = message.getIndexlist();
+  f = message.getTime();
   if (f != null) {
-    writer.writeMessage(
-      3,
-      f,
-      proto.IVM.slam.Index.serializeBinaryToWriter
-    );
-  }
-  f = message.getChunkId();
-  if (f.length > 0) {
-    writer.writeString(
-      4,
-      f
-    );
-  }
-  f = message.getSequenceNumber();
-  if (f !== 0) {
-    writer.writeInt32(
-      5,
-      f
-    );
-  }
-};
-
-
-/**
- * optional PointCloudList pointcloudlist = 1;
- * @return {?proto.IVM.slam.PointCloudList}
- */
-proto.IVM.slam.SlamData.prototype.getPointcloudlist = function() {
-  return /** @type{?proto.IVM.slam.PointCloudList} */ (
-    jspb.Message.getWrapperField(this, proto.IVM.slam.PointCloudList, 1));
-};
-
-
-/**
- * @param {?proto.IVM.slam.PointCloudList|undefined} value
- * @return {!proto.IVM.slam.SlamData} returns this
-*/
-proto.IVM.slam.SlamData.prototype.setPointcloudlist = function(value) {
-  return jspb.Message.setWrapperField(this, 1, value);
-};
-
-
-/**
- * Clears the message field making it undefined.
- * @return {!proto.IVM.slam.SlamData} returns this
- */
-proto.IVM.slam.SlamData.prototype.clearPointcloudlist = function() {
-  return this.setPointcloudlist(undefined);
-};
-
-
-/**
- * Returns whether this field is set.
- * @return {boolean}
- */
-proto.IVM.slam.SlamData.prototype.hasPointcloudlist = function() {
-  return jspb.Message.getField(this, 1) != null;
-};
-
-
-/**
- * optional PoseList poselist = 2;
- * @return {?proto.IVM.slam.PoseList}
- */
-proto.IVM.slam.SlamData.prototype.getPoselist = function() {
-  return /** @type{?proto.IVM.slam.PoseList} */ (
-    jspb.Message.getWrapperField(this, proto.IVM.slam.PoseList, 2));
-};
-
-
-/**
- * @param {?proto.IVM.slam.PoseList|undefined} value
- * @return {!proto.IVM.slam.SlamData} returns this
-*/
-proto.IVM.slam.SlamData.prototype.setPoselist = function(value) {
-  return jspb.Message.setWrapperField(this, 2, value);
+    writer.writeMessage(
+      3,
+      f,
+      proto.IVM.slam.TimeRange.serializeBinaryToWriter
+    );
+  }
 };
 
 
 /**
- * Clears the message field making it undefined.
- * @return {!proto.IVM.slam.SlamData} returns this
+ * optional string session_id = 1;
+ * @return {string}
  */
-proto.IVM.slam.SlamData.prototype.clearPoselist = function() {
-  return this.setPoselist(undefined);
+proto.IVM.slam.HistoryRequest.prototype.getSessionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
- * Returns whether this field is set.
- * @return {boolean}
+ * @param {string} value
+ * @return {!proto.IVM.slam.HistoryRequest} returns this
  */
-proto.IVM.slam.SlamData.prototype.hasPoselist = function() {
-  return jspb.Message.getField(this, 2) != null;
+proto.IVM.slam.HistoryRequest.prototype.setSessionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
 /**
- * optional Index indexlist = 3;
- * @return {?proto.IVM.slam.Index}
+ * optional SequenceRange sequence = 2;
+ * @return {?proto.IVM.slam.SequenceRange}
  */
-proto.IVM.slam.SlamData.prototype.getIndexlist = function() {
-  return /** @type{?proto.IVM.slam.Index} */ (
-    jspb.Message.getWrapperField(this, proto.IVM.slam.Index, 3));
+proto.IVM.slam.HistoryRequest.prototype.getSequence = function() {
+  return /** @type{?proto.IVM.slam.SequenceRange} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.SequenceRange, 2));
 };
 
 
 /**
- * @param {?proto.IVM.slam.Index|undefined} value
- * @return {!proto.IVM.slam.SlamData} returns this
+ * @param {?proto.IVM.slam.SequenceRange|undefined} value
+ * @return {!proto.IVM.slam.HistoryRequest} returns this
 */
-proto.IVM.slam.SlamData.prototype.setIndexlist = function(value) {
-  return jspb.Message.setWrapperField(this, 3, value);
+proto.IVM.slam.HistoryRequest.prototype.setSequence = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 2, proto.IVM.slam.HistoryRequest.oneofGroups_[0], value);
 };
 
 
 /**
  * Clears the message field making it undefined.
- * @return {!proto.IVM.slam.SlamData} returns this
+ * @return {!proto.IVM.slam.HistoryRequest} returns this
  */
-proto.IVM.slam.SlamData.prototype.clearIndexlist = function() {
-  return this.setIndexlist(undefined);
+proto.IVM.slam.HistoryRequest.prototype.clearSequence = function() {
+  return this.setSequence(undefined);
 };
 
 
@@ -1375,48 +4969,56 @@ proto.IVM.slam.SlamData.prototype.clearIndexlist = function() {
  * Returns whether this field is set.
  * @return {boolean}
  */
-proto.IVM.slam.SlamData.prototype.hasIndexlist = function() {
-  return jspb.Message.getField(this, 3) != null;
+proto.IVM.slam.HistoryRequest.prototype.hasSequence = function() {
+  return jspb.Message.getField(this, 2) != null;
 };
 
 
 /**
- * optional string chunk_id = 4;
- * @return {string}
+ * optional TimeRange time = 3;
+ * @return {?proto.IVM.slam.TimeRange}
  */
-proto.IVM.slam.SlamData.prototype.getChunkId = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 4, ""));
+proto.IVM.slam.HistoryRequest.prototype.getTime = function() {
+  return /** @type{?proto.IVM.slam.TimeRange} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.TimeRange, 3));
 };
 
 
 /**
- * @param {string} value
- * @return {!proto.IVM.slam.SlamData} returns this
- */
-proto.IVM.slam.SlamData.prototype.setChunkId = function(value) {
-  return jspb.Message.setProto3StringField(this, 4, value);
+ * @param {?proto.IVM.slam.TimeRange|undefined} value
+ * @return {!proto.IVM.slam.HistoryRequest} returns this
+*/
+proto.IVM.slam.HistoryRequest.prototype.setTime = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 3, proto.IVM.slam.HistoryRequest.oneofGroups_[0], value);
 };
 
 
 /**
- * optional int32 sequence_number = 5;
- * @return {number}
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.HistoryRequest} returns this
  */
-proto.IVM.slam.SlamData.prototype.getSequenceNumber = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+proto.IVM.slam.HistoryRequest.prototype.clearTime = function() {
+  return this.setTime(undefined);
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.IVM.slam.SlamData} returns this
+ * Returns whether this field is set.
+ * @return {boolean}
  */
-proto.IVM.slam.SlamData.prototype.setSequenceNumber = function(value) {
-  return jspb.Message.setProto3IntField(this, 5, value);
+proto.IVM.slam.HistoryRequest.prototype.hasTime = function() {
+  return jspb.Message.getField(this, 3) != null;
 };
 
 
 
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.IVM.slam.KeyframeRequest.repeatedFields_ = [2];
+
 
 
 if (jspb.Message.GENERATE_TO_OBJECT) {
@@ -1432,8 +5034,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.Point.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.Point.toObject(opt_includeInstance, this);
+proto.IVM.slam.KeyframeRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.KeyframeRequest.toObject(opt_includeInstance, this);
 };
 
 
@@ -1442,18 +5044,15 @@ proto.IVM.slam.Point.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.Point} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.KeyframeRequest} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.Point.toObject = function(includeInstance, msg) {
+proto.IVM.slam.KeyframeRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
-x: jspb.Message.getFloatingPointFieldWithDefault(msg, 1, 0.0),
-y: jspb.Message.getFloatingPointFieldWithDefault(msg, 2, 0.0),
-z: jspb.Message.getFloatingPointFieldWithDefault(msg, 3, 0.0),
-r: jspb.Message.getFloatingPointFieldWithDefault(msg, 4, 0.0),
-g: jspb.Message.getFloatingPointFieldWithDefault(msg, 5, 0.0),
-b: jspb.Message.getFloatingPointFieldWithDefault(msg, 6, 0.0)
+sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+keyframeIdsList: (f = jspb.Message.getRepeatedField(msg, 2)) == null ? undefined : f,
+keyframesOnly: jspb.Message.getBooleanFieldWithDefault(msg, 3, false)
   };
 
   if (includeInstance) {
@@ -1467,23 +5066,23 @@ b: jspb.Message.getFloatingPointFieldWithDefault(msg, 6, 0.0)
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.Point}
+ * @return {!proto.IVM.slam.KeyframeRequest}
  */
-proto.IVM.slam.Point.deserializeBinary = function(bytes) {
+proto.IVM.slam.KeyframeRequest.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.Point;
-  return proto.IVM.slam.Point.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.KeyframeRequest;
+  return proto.IVM.slam.KeyframeRequest.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.Point} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.KeyframeRequest} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.Point}
+ * @return {!proto.IVM.slam.KeyframeRequest}
  */
-proto.IVM.slam.Point.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.KeyframeRequest.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -1491,28 +5090,18 @@ proto.IVM.slam.Point.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = /** @type {number} */ (reader.readDouble());
-      msg.setX(value);
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSessionId(value);
       break;
     case 2:
-      var value = /** @type {number} */ (reader.readDouble());
-      msg.setY(value);
+      var values = /** @type {!Array<number>} */ (reader.isDelimited() ? reader.readPackedInt32() : [reader.readInt32()]);
+      for (var i = 0; i < values.length; i++) {
+        msg.addKeyframeIds(values[i]);
+      }
       break;
     case 3:
-      var value = /** @type {number} */ (reader.readDouble());
-      msg.setZ(value);
-      break;
-    case 4:
-      var value = /** @type {number} */ (reader.readDouble());
-      msg.setR(value);
-      break;
-    case 5:
-      var value = /** @type {number} */ (reader.readDouble());
-      msg.setG(value);
-      break;
-    case 6:
-      var value = /** @type {number} */ (reader.readDouble());
-      msg.setB(value);
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setKeyframesOnly(value);
       break;
     default:
       reader.skipField();
@@ -1527,9 +5116,9 @@ proto.IVM.slam.Point.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.Point.prototype.serializeBinary = function() {
+proto.IVM.slam.KeyframeRequest.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.Point.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.KeyframeRequest.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -1537,162 +5126,287 @@ proto.IVM.slam.Point.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.Point} message
+ * @param {!proto.IVM.slam.KeyframeRequest} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.Point.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.KeyframeRequest.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getX();
-  if (f !== 0.0) {
-    writer.writeDouble(
+  f = message.getSessionId();
+  if (f.length > 0) {
+    writer.writeString(
       1,
       f
     );
   }
-  f = message.getY();
-  if (f !== 0.0) {
-    writer.writeDouble(
+  f = message.getKeyframeIdsList();
+  if (f.length > 0) {
+    writer.writePackedInt32(
       2,
       f
     );
   }
-  f = message.getZ();
-  if (f !== 0.0) {
-    writer.writeDouble(
+  f = message.getKeyframesOnly();
+  if (f) {
+    writer.writeBool(
       3,
       f
     );
   }
-  f = message.getR();
-  if (f !== 0.0) {
-    writer.writeDouble(
-      4,
-      f
-    );
-  }
-  f = message.getG();
-  if (f !== 0.0) {
-    writer.writeDouble(
-      5,
-      f
-    );
-  }
-  f = message.getB();
-  if (f !== 0.0) {
-    writer.writeDouble(
-      6,
-      f
-    );
-  }
 };
 
 
 /**
- * optional double x = 1;
- * @return {number}
+ * optional string session_id = 1;
+ * @return {string}
  */
-proto.IVM.slam.Point.prototype.getX = function() {
-  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 1, 0.0));
+proto.IVM.slam.KeyframeRequest.prototype.getSessionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.IVM.slam.Point} returns this
+ * @param {string} value
+ * @return {!proto.IVM.slam.KeyframeRequest} returns this
  */
-proto.IVM.slam.Point.prototype.setX = function(value) {
-  return jspb.Message.setProto3FloatField(this, 1, value);
+proto.IVM.slam.KeyframeRequest.prototype.setSessionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
 /**
- * optional double y = 2;
- * @return {number}
+ * repeated int32 keyframe_ids = 2;
+ * @return {!Array<number>}
  */
-proto.IVM.slam.Point.prototype.getY = function() {
-  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 2, 0.0));
+proto.IVM.slam.KeyframeRequest.prototype.getKeyframeIdsList = function() {
+  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedField(this, 2));
+};
+
+
+/**
+ * @param {!Array<number>} value
+ * @return {!proto.IVM.slam.KeyframeRequest} returns this
+ */
+proto.IVM.slam.KeyframeRequest.prototype.setKeyframeIdsList = function(value) {
+  return jspb.Message.setField(this, 2, value || []);
 };
 
 
 /**
  * @param {number} value
- * @return {!proto.IVM.slam.Point} returns this
+ * @param {number=} opt_index
+ * @return {!proto.IVM.slam.KeyframeRequest} returns this
  */
-proto.IVM.slam.Point.prototype.setY = function(value) {
-  return jspb.Message.setProto3FloatField(this, 2, value);
+proto.IVM.slam.KeyframeRequest.prototype.addKeyframeIds = function(value, opt_index) {
+  return jspb.Message.addToRepeatedField(this, 2, value, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.IVM.slam.KeyframeRequest} returns this
+ */
+proto.IVM.slam.KeyframeRequest.prototype.clearKeyframeIdsList = function() {
+  return this.setKeyframeIdsList([]);
+};
+
+
+/**
+ * optional bool keyframes_only = 3;
+ * @return {boolean}
+ */
+proto.IVM.slam.KeyframeRequest.prototype.getKeyframesOnly = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 3, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.IVM.slam.KeyframeRequest} returns this
+ */
+proto.IVM.slam.KeyframeRequest.prototype.setKeyframesOnly = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 3, value);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.IVM.slam.KeyframePose.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.KeyframePose.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.IVM.slam.KeyframePose} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.IVM.slam.KeyframePose.toObject = function(includeInstance, msg) {
+  var f, obj = {
+keyframeId: jspb.Message.getFieldWithDefault(msg, 1, 0),
+pose: (f = msg.getPose()) && proto.IVM.slam.Pose.toObject(includeInstance, f)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.IVM.slam.KeyframePose}
+ */
+proto.IVM.slam.KeyframePose.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.IVM.slam.KeyframePose;
+  return proto.IVM.slam.KeyframePose.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.IVM.slam.KeyframePose} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.IVM.slam.KeyframePose}
+ */
+proto.IVM.slam.KeyframePose.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setKeyframeId(value);
+      break;
+    case 2:
+      var value = new proto.IVM.slam.Pose;
+      reader.readMessage(value,proto.IVM.slam.Pose.deserializeBinaryFromReader);
+      msg.setPose(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
 };
 
 
 /**
- * optional double z = 3;
- * @return {number}
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
  */
-proto.IVM.slam.Point.prototype.getZ = function() {
-  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 3, 0.0));
+proto.IVM.slam.KeyframePose.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.KeyframePose.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.IVM.slam.Point} returns this
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.KeyframePose} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.Point.prototype.setZ = function(value) {
-  return jspb.Message.setProto3FloatField(this, 3, value);
+proto.IVM.slam.KeyframePose.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getKeyframeId();
+  if (f !== 0) {
+    writer.writeInt32(
+      1,
+      f
+    );
+  }
+  f = message.getPose();
+  if (f != null) {
+    writer.writeMessage(
+      2,
+      f,
+      proto.IVM.slam.Pose.serializeBinaryToWriter
+    );
+  }
 };
 
 
 /**
- * optional double r = 4;
+ * optional int32 keyframe_id = 1;
  * @return {number}
  */
-proto.IVM.slam.Point.prototype.getR = function() {
-  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 4, 0.0));
+proto.IVM.slam.KeyframePose.prototype.getKeyframeId = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 1, 0));
 };
 
 
 /**
  * @param {number} value
- * @return {!proto.IVM.slam.Point} returns this
+ * @return {!proto.IVM.slam.KeyframePose} returns this
  */
-proto.IVM.slam.Point.prototype.setR = function(value) {
-  return jspb.Message.setProto3FloatField(this, 4, value);
+proto.IVM.slam.KeyframePose.prototype.setKeyframeId = function(value) {
+  return jspb.Message.setProto3IntField(this, 1, value);
 };
 
 
 /**
- * optional double g = 5;
- * @return {number}
+ * optional Pose pose = 2;
+ * @return {?proto.IVM.slam.Pose}
  */
-proto.IVM.slam.Point.prototype.getG = function() {
-  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 5, 0.0));
+proto.IVM.slam.KeyframePose.prototype.getPose = function() {
+  return /** @type{?proto.IVM.slam.Pose} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Pose, 2));
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.IVM.slam.Point} returns this
- */
-proto.IVM.slam.Point.prototype.setG = function(value) {
-  return jspb.Message.setProto3FloatField(this, 5, value);
+ * @param {?proto.IVM.slam.Pose|undefined} value
+ * @return {!proto.IVM.slam.KeyframePose} returns this
+*/
+proto.IVM.slam.KeyframePose.prototype.setPose = function(value) {
+  return jspb.Message.setWrapperField(this, 2, value);
 };
 
 
 /**
- * optional double b = 6;
- * @return {number}
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.KeyframePose} returns this
  */
-proto.IVM.slam.Point.prototype.getB = function() {
-  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 6, 0.0));
+proto.IVM.slam.KeyframePose.prototype.clearPose = function() {
+  return this.setPose(undefined);
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.IVM.slam.Point} returns this
+ * Returns whether this field is set.
+ * @return {boolean}
  */
-proto.IVM.slam.Point.prototype.setB = function(value) {
-  return jspb.Message.setProto3FloatField(this, 6, value);
+proto.IVM.slam.KeyframePose.prototype.hasPose = function() {
+  return jspb.Message.getField(this, 2) != null;
 };
 
 
@@ -1702,7 +5416,7 @@ proto.IVM.slam.Point.prototype.setB = function(value) {
  * @private {!Array<number>}
  * @const
  */
-proto.IVM.slam.PointCloud.repeatedFields_ = [1];
+proto.IVM.slam.PoseCorrection.repeatedFields_ = [3];
 
 
 
@@ -1719,8 +5433,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.PointCloud.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.PointCloud.toObject(opt_includeInstance, this);
+proto.IVM.slam.PoseCorrection.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.PoseCorrection.toObject(opt_includeInstance, this);
 };
 
 
@@ -1729,14 +5443,16 @@ proto.IVM.slam.PointCloud.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.PointCloud} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.PoseCorrection} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.PointCloud.toObject = function(includeInstance, msg) {
+proto.IVM.slam.PoseCorrection.toObject = function(includeInstance, msg) {
   var f, obj = {
-pointsList: jspb.Message.toObjectList(msg.getPointsList(),
-    proto.IVM.slam.Point.toObject, includeInstance)
+sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+revision: jspb.Message.getFieldWithDefault(msg, 2, 0),
+posesList: jspb.Message.toObjectList(msg.getPosesList(),
+    proto.IVM.slam.KeyframePose.toObject, includeInstance)
   };
 
   if (includeInstance) {
@@ -1750,23 +5466,23 @@ pointsList: jspb.Message.toObjectList(msg.getPointsList(),
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.PointCloud}
+ * @return {!proto.IVM.slam.PoseCorrection}
  */
-proto.IVM.slam.PointCloud.deserializeBinary = function(bytes) {
+proto.IVM.slam.PoseCorrection.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.PointCloud;
-  return proto.IVM.slam.PointCloud.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.PoseCorrection;
+  return proto.IVM.slam.PoseCorrection.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.PointCloud} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.PoseCorrection} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.PointCloud}
+ * @return {!proto.IVM.slam.PoseCorrection}
  */
-proto.IVM.slam.PointCloud.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.PoseCorrection.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -1774,9 +5490,17 @@ proto.IVM.slam.PointCloud.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = new proto.IVM.slam.Point;
-      reader.readMessage(value,proto.IVM.slam.Point.deserializeBinaryFromReader);
-      msg.addPoints(value);
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSessionId(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setRevision(value);
+      break;
+    case 3:
+      var value = new proto.IVM.slam.KeyframePose;
+      reader.readMessage(value,proto.IVM.slam.KeyframePose.deserializeBinaryFromReader);
+      msg.addPoses(value);
       break;
     default:
       reader.skipField();
@@ -1791,9 +5515,9 @@ proto.IVM.slam.PointCloud.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.PointCloud.prototype.serializeBinary = function() {
+proto.IVM.slam.PoseCorrection.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.PointCloud.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.PoseCorrection.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -1801,68 +5525,111 @@ proto.IVM.slam.PointCloud.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.PointCloud} message
+ * @param {!proto.IVM.slam.PoseCorrection} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.PointCloud.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.PoseCorrection.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getPointsList();
+  f = message.getSessionId();
   if (f.length > 0) {
-    writer.writeRepeatedMessage(
+    writer.writeString(
       1,
+      f
+    );
+  }
+  f = message.getRevision();
+  if (f !== 0) {
+    writer.writeInt32(
+      2,
+      f
+    );
+  }
+  f = message.getPosesList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      3,
       f,
-      proto.IVM.slam.Point.serializeBinaryToWriter
+      proto.IVM.slam.KeyframePose.serializeBinaryToWriter
     );
   }
 };
 
 
 /**
- * repeated Point points = 1;
- * @return {!Array<!proto.IVM.slam.Point>}
+ * optional string session_id = 1;
+ * @return {string}
  */
-proto.IVM.slam.PointCloud.prototype.getPointsList = function() {
-  return /** @type{!Array<!proto.IVM.slam.Point>} */ (
-    jspb.Message.getRepeatedWrapperField(this, proto.IVM.slam.Point, 1));
+proto.IVM.slam.PoseCorrection.prototype.getSessionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
- * @param {!Array<!proto.IVM.slam.Point>} value
- * @return {!proto.IVM.slam.PointCloud} returns this
-*/
-proto.IVM.slam.PointCloud.prototype.setPointsList = function(value) {
-  return jspb.Message.setRepeatedWrapperField(this, 1, value);
+ * @param {string} value
+ * @return {!proto.IVM.slam.PoseCorrection} returns this
+ */
+proto.IVM.slam.PoseCorrection.prototype.setSessionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
 /**
- * @param {!proto.IVM.slam.Point=} opt_value
- * @param {number=} opt_index
- * @return {!proto.IVM.slam.Point}
+ * optional int32 revision = 2;
+ * @return {number}
  */
-proto.IVM.slam.PointCloud.prototype.addPoints = function(opt_value, opt_index) {
-  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.IVM.slam.Point, opt_index);
+proto.IVM.slam.PoseCorrection.prototype.getRevision = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
 };
 
 
 /**
- * Clears the list making it empty but non-null.
- * @return {!proto.IVM.slam.PointCloud} returns this
+ * @param {number} value
+ * @return {!proto.IVM.slam.PoseCorrection} returns this
  */
-proto.IVM.slam.PointCloud.prototype.clearPointsList = function() {
-  return this.setPointsList([]);
+proto.IVM.slam.PoseCorrection.prototype.setRevision = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+/**
+ * repeated KeyframePose poses = 3;
+ * @return {!Array<!proto.IVM.slam.KeyframePose>}
+ */
+proto.IVM.slam.PoseCorrection.prototype.getPosesList = function() {
+  return /** @type{!Array<!proto.IVM.slam.KeyframePose>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.IVM.slam.KeyframePose, 3));
 };
 
 
+/**
+ * @param {!Array<!proto.IVM.slam.KeyframePose>} value
+ * @return {!proto.IVM.slam.PoseCorrection} returns this
+*/
+proto.IVM.slam.PoseCorrection.prototype.setPosesList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 3, value);
+};
+
 
 /**
- * List of repeated fields within this message type.
- * @private {!Array<number>}
- * @const
+ * @param {!proto.IVM.slam.KeyframePose=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.IVM.slam.KeyframePose}
  */
-proto.IVM.slam.Pose.repeatedFields_ = [1];
+proto.IVM.slam.PoseCorrection.prototype.addPoses = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 3, opt_value, proto.IVM.slam.KeyframePose, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.IVM.slam.PoseCorrection} returns this
+ */
+proto.IVM.slam.PoseCorrection.prototype.clearPosesList = function() {
+  return this.setPosesList([]);
+};
+
+
 
 
 
@@ -1879,8 +5646,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.Pose.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.Pose.toObject(opt_includeInstance, this);
+proto.IVM.slam.MapSnapshotRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.MapSnapshotRequest.toObject(opt_includeInstance, this);
 };
 
 
@@ -1889,13 +5656,15 @@ proto.IVM.slam.Pose.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.Pose} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.MapSnapshotRequest} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.Pose.toObject = function(includeInstance, msg) {
+proto.IVM.slam.MapSnapshotRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
-matrixList: (f = jspb.Message.getRepeatedFloatingPointField(msg, 1)) == null ? undefined : f
+sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+voxelSize: jspb.Message.getFloatingPointFieldWithDefault(msg, 2, 0.0),
+maxPoints: jspb.Message.getFieldWithDefault(msg, 3, 0)
   };
 
   if (includeInstance) {
@@ -1909,23 +5678,23 @@ matrixList: (f = jspb.Message.getRepeatedFloatingPointField(msg, 1)) == null ? u
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.Pose}
+ * @return {!proto.IVM.slam.MapSnapshotRequest}
  */
-proto.IVM.slam.Pose.deserializeBinary = function(bytes) {
+proto.IVM.slam.MapSnapshotRequest.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.Pose;
-  return proto.IVM.slam.Pose.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.MapSnapshotRequest;
+  return proto.IVM.slam.MapSnapshotRequest.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.Pose} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.MapSnapshotRequest} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.Pose}
+ * @return {!proto.IVM.slam.MapSnapshotRequest}
  */
-proto.IVM.slam.Pose.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.MapSnapshotRequest.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -1933,10 +5702,16 @@ proto.IVM.slam.Pose.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var values = /** @type {!Array<number>} */ (reader.isDelimited() ? reader.readPackedDouble() : [reader.readDouble()]);
-      for (var i = 0; i < values.length; i++) {
-        msg.addMatrix(values[i]);
-      }
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSessionId(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readFloat());
+      msg.setVoxelSize(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setMaxPoints(value);
       break;
     default:
       reader.skipField();
@@ -1951,9 +5726,9 @@ proto.IVM.slam.Pose.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.Pose.prototype.serializeBinary = function() {
+proto.IVM.slam.MapSnapshotRequest.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.Pose.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.MapSnapshotRequest.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -1961,66 +5736,90 @@ proto.IVM.slam.Pose.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.Pose} message
+ * @param {!proto.IVM.slam.MapSnapshotRequest} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.Pose.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.MapSnapshotRequest.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getMatrixList();
+  f = message.getSessionId();
   if (f.length > 0) {
-    writer.writePackedDouble(
+    writer.writeString(
       1,
       f
     );
   }
+  f = message.getVoxelSize();
+  if (f !== 0.0) {
+    writer.writeFloat(
+      2,
+      f
+    );
+  }
+  f = message.getMaxPoints();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
 };
 
 
 /**
- * repeated double matrix = 1;
- * @return {!Array<number>}
+ * optional string session_id = 1;
+ * @return {string}
  */
-proto.IVM.slam.Pose.prototype.getMatrixList = function() {
-  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedFloatingPointField(this, 1));
+proto.IVM.slam.MapSnapshotRequest.prototype.getSessionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
- * @param {!Array<number>} value
- * @return {!proto.IVM.slam.Pose} returns this
+ * @param {string} value
+ * @return {!proto.IVM.slam.MapSnapshotRequest} returns this
  */
-proto.IVM.slam.Pose.prototype.setMatrixList = function(value) {
-  return jspb.Message.setField(this, 1, value || []);
+proto.IVM.slam.MapSnapshotRequest.prototype.setSessionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
 /**
- * @param {number} value
- * @param {number=} opt_index
- * @return {!proto.IVM.slam.Pose} returns this
+ * optional float voxel_size = 2;
+ * @return {number}
  */
-proto.IVM.slam.Pose.prototype.addMatrix = function(value, opt_index) {
-  return jspb.Message.addToRepeatedField(this, 1, value, opt_index);
+proto.IVM.slam.MapSnapshotRequest.prototype.getVoxelSize = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 2, 0.0));
 };
 
 
 /**
- * Clears the list making it empty but non-null.
- * @return {!proto.IVM.slam.Pose} returns this
+ * @param {number} value
+ * @return {!proto.IVM.slam.MapSnapshotRequest} returns this
  */
-proto.IVM.slam.Pose.prototype.clearMatrixList = function() {
-  return this.setMatrixList([]);
+proto.IVM.slam.MapSnapshotRequest.prototype.setVoxelSize = function(value) {
+  return jspb.Message.setProto3FloatField(this, 2, value);
 };
 
 
+/**
+ * optional int32 max_points = 3;
+ * @return {number}
+ */
+proto.IVM.slam.MapSnapshotRequest.prototype.getMaxPoints = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
 
 /**
- * List of repeated fields within this message type.
- * @private {!Array<number>}
- * @const
+ * @param {number} value
+ * @return {!proto.IVM.slam.MapSnapshotRequest} returns this
  */
-proto.IVM.slam.Index.repeatedFields_ = [1];
+proto.IVM.slam.MapSnapshotRequest.prototype.setMaxPoints = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
 
 
 
@@ -2037,8 +5836,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.Index.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.Index.toObject(opt_includeInstance, this);
+proto.IVM.slam.TrajectoryRequest.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.TrajectoryRequest.toObject(opt_includeInstance, this);
 };
 
 
@@ -2047,13 +5846,18 @@ proto.IVM.slam.Index.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.Index} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.TrajectoryRequest} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.Index.toObject = function(includeInstance, msg) {
+proto.IVM.slam.TrajectoryRequest.toObject = function(includeInstance, msg) {
   var f, obj = {
-indexList: (f = jspb.Message.getRepeatedField(msg, 1)) == null ? undefined : f
+sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+mode: jspb.Message.getFieldWithDefault(msg, 2, 0),
+minTranslation: jspb.Message.getFloatingPointFieldWithDefault(msg, 3, 0.0),
+minRotation: jspb.Message.getFloatingPointFieldWithDefault(msg, 4, 0.0),
+epsilon: jspb.Message.getFloatingPointFieldWithDefault(msg, 5, 0.0),
+historyOnly: jspb.Message.getBooleanFieldWithDefault(msg, 6, false)
   };
 
   if (includeInstance) {
@@ -2067,23 +5871,23 @@ indexList: (f = jspb.Message.getRepeatedField(msg, 1)) == null ? undefined : f
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.Index}
+ * @return {!proto.IVM.slam.TrajectoryRequest}
  */
-proto.IVM.slam.Index.deserializeBinary = function(bytes) {
+proto.IVM.slam.TrajectoryRequest.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.Index;
-  return proto.IVM.slam.Index.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.TrajectoryRequest;
+  return proto.IVM.slam.TrajectoryRequest.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.Index} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.TrajectoryRequest} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.Index}
+ * @return {!proto.IVM.slam.TrajectoryRequest}
  */
-proto.IVM.slam.Index.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.TrajectoryRequest.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -2091,10 +5895,28 @@ proto.IVM.slam.Index.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var values = /** @type {!Array<number>} */ (reader.isDelimited() ? reader.readPackedInt32() : [reader.readInt32()]);
-      for (var i = 0; i < values.length; i++) {
-        msg.addIndex(values[i]);
-      }
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSessionId(value);
+      break;
+    case 2:
+      var value = /** @type {!proto.IVM.slam.DecimationMode} */ (reader.readEnum());
+      msg.setMode(value);
+      break;
+    case 3:
+      var value = /** @type {number} */ (reader.readFloat());
+      msg.setMinTranslation(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readFloat());
+      msg.setMinRotation(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readFloat());
+      msg.setEpsilon(value);
+      break;
+    case 6:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setHistoryOnly(value);
       break;
     default:
       reader.skipField();
@@ -2109,9 +5931,9 @@ proto.IVM.slam.Index.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.Index.prototype.serializeBinary = function() {
+proto.IVM.slam.TrajectoryRequest.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.Index.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.TrajectoryRequest.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -2119,66 +5941,165 @@ proto.IVM.slam.Index.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.Index} message
+ * @param {!proto.IVM.slam.TrajectoryRequest} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.Index.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.TrajectoryRequest.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getIndexList();
+  f = message.getSessionId();
   if (f.length > 0) {
-    writer.writePackedInt32(
+    writer.writeString(
       1,
       f
     );
   }
+  f = message.getMode();
+  if (f !== 0.0) {
+    writer.writeEnum(
+      2,
+      f
+    );
+  }
+  f = message.getMinTranslation();
+  if (f !== 0.0) {
+    writer.writeFloat(
+      3,
+      f
+    );
+  }
+  f = message.getMinRotation();
+  if (f !== 0.0) {
+    writer.writeFloat(
+      4,
+      f
+    );
+  }
+  f = message.getEpsilon();
+  if (f !== 0.0) {
+    writer.writeFloat(
+      5,
+      f
+    );
+  }
+  f = message.getHistoryOnly();
+  if (f) {
+    writer.writeBool(
+      6,
+      f
+    );
+  }
 };
 
 
 /**
- * repeated int32 index = 1;
- * @return {!Array<number>}
+ * optional string session_id = 1;
+ * @return {string}
  */
-proto.IVM.slam.Index.prototype.getIndexList = function() {
-  return /** @type {!Array<number>} */ (jspb.Message.getRepeatedField(this, 1));
+proto.IVM.slam.TrajectoryRequest.prototype.getSessionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
- * @param {!Array<number>} value
- * @return {!proto.IVM.slam.Index} returns this
+ * @param {string} value
+ * @return {!proto.IVM.slam.TrajectoryRequest} returns this
  */
-proto.IVM.slam.Index.prototype.setIndexList = function(value) {
-  return jspb.Message.setField(this, 1, value || []);
+proto.IVM.slam.TrajectoryRequest.prototype.setSessionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional DecimationMode mode = 2;
+ * @return {!proto.IVM.slam.DecimationMode}
+ */
+proto.IVM.slam.TrajectoryRequest.prototype.getMode = function() {
+  return /** @type {!proto.IVM.slam.DecimationMode} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {!proto.IVM.slam.DecimationMode} value
+ * @return {!proto.IVM.slam.TrajectoryRequest} returns this
+ */
+proto.IVM.slam.TrajectoryRequest.prototype.setMode = function(value) {
+  return jspb.Message.setProto3EnumField(this, 2, value);
+};
+
+
+/**
+ * optional float min_translation = 3;
+ * @return {number}
+ */
+proto.IVM.slam.TrajectoryRequest.prototype.getMinTranslation = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 3, 0.0));
 };
 
 
 /**
  * @param {number} value
- * @param {number=} opt_index
- * @return {!proto.IVM.slam.Index} returns this
+ * @return {!proto.IVM.slam.TrajectoryRequest} returns this
  */
-proto.IVM.slam.Index.prototype.addIndex = function(value, opt_index) {
-  return jspb.Message.addToRepeatedField(this, 1, value, opt_index);
+proto.IVM.slam.TrajectoryRequest.prototype.setMinTranslation = function(value) {
+  return jspb.Message.setProto3FloatField(this, 3, value);
 };
 
 
 /**
- * Clears the list making it empty but non-null.
- * @return {!proto.IVM.slam.Index} returns this
+ * optional float min_rotation = 4;
+ * @return {number}
  */
-proto.IVM.slam.Index.prototype.clearIndexList = function() {
-  return this.setIndexList([]);
+proto.IVM.slam.TrajectoryRequest.prototype.getMinRotation = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 4, 0.0));
 };
 
 
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.TrajectoryRequest} returns this
+ */
+proto.IVM.slam.TrajectoryRequest.prototype.setMinRotation = function(value) {
+  return jspb.Message.setProto3FloatField(this, 4, value);
+};
+
 
 /**
- * List of repeated fields within this message type.
- * @private {!Array<number>}
- * @const
+ * optional float epsilon = 5;
+ * @return {number}
  */
-proto.IVM.slam.PointCloudList.repeatedFields_ = [1];
+proto.IVM.slam.TrajectoryRequest.prototype.getEpsilon = function() {
+  return /** @type {number} */ (jspb.Message.getFloatingPointFieldWithDefault(this, 5, 0.0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.IVM.slam.TrajectoryRequest} returns this
+ */
+proto.IVM.slam.TrajectoryRequest.prototype.setEpsilon = function(value) {
+  return jspb.Message.setProto3FloatField(this, 5, value);
+};
+
+
+/**
+ * optional bool history_only = 6;
+ * @return {boolean}
+ */
+proto.IVM.slam.TrajectoryRequest.prototype.getHistoryOnly = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 6, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.IVM.slam.TrajectoryRequest} returns this
+ */
+proto.IVM.slam.TrajectoryRequest.prototype.setHistoryOnly = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 6, value);
+};
+
+
 
 
 
@@ -2195,8 +6116,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.PointCloudList.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.PointCloudList.toObject(opt_includeInstance, this);
+proto.IVM.slam.SessionInfo.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.SessionInfo.toObject(opt_includeInstance, this);
 };
 
 
@@ -2205,14 +6126,18 @@ proto.IVM.slam.PointCloudList.prototype.toObject = function(opt_includeInstance)
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.PointCloudList} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.SessionInfo} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.PointCloudList.toObject = function(includeInstance, msg) {
+proto.IVM.slam.SessionInfo.toObject = function(includeInstance, msg) {
   var f, obj = {
-pointcloudsList: jspb.Message.toObjectList(msg.getPointcloudsList(),
-    proto.IVM.slam.PointCloud.toObject, includeInstance)
+sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
+startTime: jspb.Message.getFieldWithDefault(msg, 2, ""),
+isActive: jspb.Message.getBooleanFieldWithDefault(msg, 3, false),
+clientsConnected: jspb.Message.getFieldWithDefault(msg, 4, 0),
+totalChunks: jspb.Message.getFieldWithDefault(msg, 5, 0),
+lastActivityMs: jspb.Message.getFieldWithDefault(msg, 6, 0)
   };
 
   if (includeInstance) {
@@ -2226,23 +6151,23 @@ pointcloudsList: jspb.Message.toObjectList(msg.getPointcloudsList(),
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.PointCloudList}
+ * @return {!proto.IVM.slam.SessionInfo}
  */
-proto.IVM.slam.PointCloudList.deserializeBinary = function(bytes) {
+proto.IVM.slam.SessionInfo.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.PointCloudList;
-  return proto.IVM.slam.PointCloudList.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.SessionInfo;
+  return proto.IVM.slam.SessionInfo.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.PointCloudList} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.SessionInfo} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.PointCloudList}
+ * @return {!proto.IVM.slam.SessionInfo}
  */
-proto.IVM.slam.PointCloudList.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.SessionInfo.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -2250,9 +6175,28 @@ proto.IVM.slam.PointCloudList.deserializeBinaryFromReader = function(msg, reader
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = new proto.IVM.slam.PointCloud;
-      reader.readMessage(value,proto.IVM.slam.PointCloud.deserializeBinaryFromReader);
-      msg.addPointclouds(value);
+      var value = /** @type {string} */ (reader.readString());
+      msg.setSessionId(value);
+      break;
+    case 2:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setStartTime(value);
+      break;
+    case 3:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setIsActive(value);
+      break;
+    case 4:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setClientsConnected(value);
+      break;
+    case 5:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setTotalChunks(value);
+      break;
+    case 6:
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setLastActivityMs(value);
       break;
     default:
       reader.skipField();
@@ -2267,9 +6211,9 @@ proto.IVM.slam.PointCloudList.deserializeBinaryFromReader = function(msg, reader
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.PointCloudList.prototype.serializeBinary = function() {
+proto.IVM.slam.SessionInfo.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.PointCloudList.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.SessionInfo.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -2277,218 +6221,162 @@ proto.IVM.slam.PointCloudList.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.PointCloudList} message
+ * @param {!proto.IVM.slam.SessionInfo} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.PointCloudList.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.SessionInfo.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getPointcloudsList();
+  f = message.getSessionId();
   if (f.length > 0) {
-    writer.writeRepeatedMessage(
+    writer.writeString(
       1,
-      f,
-      proto.IVM.slam.PointCloud.serializeBinaryToWriter
+      f
+    );
+  }
+  f = message.getStartTime();
+  if (f.length > 0) {
+    writer.writeString(
+      2,
+      f
+    );
+  }
+  f = message.getIsActive();
+  if (f) {
+    writer.writeBool(
+      3,
+      f
+    );
+  }
+  f = message.getClientsConnected();
+  if (f !== 0) {
+    writer.writeInt32(
+      4,
+      f
+    );
+  }
+  f = message.getTotalChunks();
+  if (f !== 0) {
+    writer.writeInt32(
+      5,
+      f
+    );
+  }
+  f = message.getLastActivityMs();
+  if (f !== 0) {
+    writer.writeInt64(
+      6,
+      f
     );
   }
 };
 
 
 /**
- * repeated PointCloud pointclouds = 1;
- * @return {!Array<!proto.IVM.slam.PointCloud>}
- */
-proto.IVM.slam.PointCloudList.prototype.getPointcloudsList = function() {
-  return /** @type{!Array<!proto.IVM.slam.PointCloud>} */ (
-    jspb.Message.getRepeatedWrapperField(this, proto.IVM.slam.PointCloud, 1));
-};
-
-
-/**
- * @param {!Array<!proto.IVM.slam.PointCloud>} value
- * @return {!proto.IVM.slam.PointCloudList} returns this
-*/
-proto.IVM.slam.PointCloudList.prototype.setPointcloudsList = function(value) {
-  return jspb.Message.setRepeatedWrapperField(this, 1, value);
-};
-
-
-/**
- * @param {!proto.IVM.slam.PointCloud=} opt_value
- * @param {number=} opt_index
- * @return {!proto.IVM.slam.PointCloud}
+ * optional string session_id = 1;
+ * @return {string}
  */
-proto.IVM.slam.PointCloudList.prototype.addPointclouds = function(opt_value, opt_index) {
-  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.IVM.slam.PointCloud, opt_index);
+proto.IVM.slam.SessionInfo.prototype.getSessionId = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
 };
 
 
 /**
- * Clears the list making it empty but non-null.
- * @return {!proto.IVM.slam.PointCloudList} returns this
+ * @param {string} value
+ * @return {!proto.IVM.slam.SessionInfo} returns this
  */
-proto.IVM.slam.PointCloudList.prototype.clearPointcloudsList = function() {
-  return this.setPointcloudsList([]);
+proto.IVM.slam.SessionInfo.prototype.setSessionId = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
 };
 
 
-
-/**
- * List of repeated fields within this message type.
- * @private {!Array<number>}
- * @const
- */
-proto.IVM.slam.PoseList.repeatedFields_ = [1];
-
-
-
-if (jspb.Message.GENERATE_TO_OBJECT) {
 /**
- * Creates an object representation of this proto.
- * Field names that are reserved in JavaScript and will be renamed to pb_name.
- * Optional fields that are not set will be set to undefined.
- * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
- * For the list of reserved names please see:
- *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
- * @param {boolean=} opt_includeInstance Deprecated. whether to include the
- *     JSPB instance for transitional soy proto support:
- *     http://goto/soy-param-migration
- * @return {!Object}
+ * optional string start_time = 2;
+ * @return {string}
  */
-proto.IVM.slam.PoseList.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.PoseList.toObject(opt_includeInstance, this);
+proto.IVM.slam.SessionInfo.prototype.getStartTime = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 2, ""));
 };
 
 
 /**
- * Static version of the {@see toObject} method.
- * @param {boolean|undefined} includeInstance Deprecated. Whether to include
- *     the JSPB instance for transitional soy proto support:
- *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.PoseList} msg The msg instance to transform.
- * @return {!Object}
- * @suppress {unusedLocalVariables} f is only used for nested messages
+ * @param {string} value
+ * @return {!proto.IVM.slam.SessionInfo} returns this
  */
-proto.IVM.slam.PoseList.toObject = function(includeInstance, msg) {
-  var f, obj = {
-posesList: jspb.Message.toObjectList(msg.getPosesList(),
-    proto.IVM.slam.Pose.toObject, includeInstance)
-  };
-
-  if (includeInstance) {
-    obj.$jspbMessageInstance = msg;
-  }
-  return obj;
+proto.IVM.slam.SessionInfo.prototype.setStartTime = function(value) {
+  return jspb.Message.setProto3StringField(this, 2, value);
 };
-}
 
 
 /**
- * Deserializes binary data (in protobuf wire format).
- * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.PoseList}
+ * optional bool is_active = 3;
+ * @return {boolean}
  */
-proto.IVM.slam.PoseList.deserializeBinary = function(bytes) {
-  var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.PoseList;
-  return proto.IVM.slam.PoseList.deserializeBinaryFromReader(msg, reader);
+proto.IVM.slam.SessionInfo.prototype.getIsActive = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 3, false));
 };
 
 
 /**
- * Deserializes binary data (in protobuf wire format) from the
- * given reader into the given message object.
- * @param {!proto.IVM.slam.PoseList} msg The message object to deserialize into.
- * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.PoseList}
+ * @param {boolean} value
+ * @return {!proto.IVM.slam.SessionInfo} returns this
  */
-proto.IVM.slam.PoseList.deserializeBinaryFromReader = function(msg, reader) {
-  while (reader.nextField()) {
-    if (reader.isEndGroup()) {
-      break;
-    }
-    var field = reader.getFieldNumber();
-    switch (field) {
-    case 1:
-      var value = new proto.IVM.slam.Pose;
-      reader.readMessage(value,proto.IVM.slam.Pose.deserializeBinaryFromReader);
-      msg.addPoses(value);
-      break;
-    default:
-      reader.skipField();
-      break;
-    }
-  }
-  return msg;
+proto.IVM.slam.SessionInfo.prototype.setIsActive = function(value) {
+  return jspb.Message.setProto3BooleanField(this, 3, value);
 };
 
 
 /**
- * Serializes the message to binary data (in protobuf wire format).
- * @return {!Uint8Array}
+ * optional int32 clients_connected = 4;
+ * @return {number}
  */
-proto.IVM.slam.PoseList.prototype.serializeBinary = function() {
-  var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.PoseList.serializeBinaryToWriter(this, writer);
-  return writer.getResultBuffer();
+proto.IVM.slam.SessionInfo.prototype.getClientsConnected = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
 };
 
 
 /**
- * Serializes the given message to binary data (in protobuf wire
- * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.PoseList} message
- * @param {!jspb.BinaryWriter} writer
- * @suppress {unusedLocalVariables} f is only used for nested messages
+ * @param {number} value
+ * @return {!proto.IVM.slam.SessionInfo} returns this
  */
-proto.IVM.slam.PoseList.serializeBinaryToWriter = function(message, writer) {
-  var f = undefined;
-  f = message.getPosesList();
-  if (f.length > 0) {
-    writer.writeRepeatedMessage(
-      1,
-      f,
-      proto.IVM.slam.Pose.serializeBinaryToWriter
-    );
-  }
+proto.IVM.slam.SessionInfo.prototype.setClientsConnected = function(value) {
+  return jspb.Message.setProto3IntField(this, 4, value);
 };
 
 
 /**
- * repeated Pose poses = 1;
- * @return {!Array<!proto.IVM.slam.Pose>}
+ * optional int32 total_chunks = 5;
+ * @return {number}
  */
-proto.IVM.slam.PoseList.prototype.getPosesList = function() {
-  return /** @type{!Array<!proto.IVM.slam.Pose>} */ (
-    jspb.Message.getRepeatedWrapperField(this, proto.IVM.slam.Pose, 1));
+proto.IVM.slam.SessionInfo.prototype.getTotalChunks = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
 };
 
 
 /**
- * @param {!Array<!proto.IVM.slam.Pose>} value
- * @return {!proto.IVM.slam.PoseList} returns this
-*/
-proto.IVM.slam.PoseList.prototype.setPosesList = function(value) {
-  return jspb.Message.setRepeatedWrapperField(this, 1, value);
+ * @param {number} value
+ * @return {!proto.IVM.slam.SessionInfo} returns this
+ */
+proto.IVM.slam.SessionInfo.prototype.setTotalChunks = function(value) {
+  return jspb.Message.setProto3IntField(this, 5, value);
 };
 
 
 /**
- * @param {!proto.IVM.slam.Pose=} opt_value
- * @param {number=} opt_index
- * @return {!proto.IVM.slam.Pose}
+ * optional int64 last_activity_ms = 6;
+ * @return {number}
  */
-proto.IVM.slam.PoseList.prototype.addPoses = function(opt_value, opt_index) {
-  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.IVM.slam.Pose, opt_index);
+proto.IVM.slam.SessionInfo.prototype.getLastActivityMs = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 6, 0));
 };
 
 
 /**
- * Clears the list making it empty but non-null.
- * @return {!proto.IVM.slam.PoseList} returns this
+ * @param {number} value
+ * @return {!proto.IVM.slam.SessionInfo} returns this
  */
-proto.IVM.slam.PoseList.prototype.clearPosesList = function() {
-  return this.setPosesList([]);
+proto.IVM.slam.SessionInfo.prototype.setLastActivityMs = function(value) {
+  return jspb.Message.setProto3IntField(this, 6, value);
 };
 
 
@@ -2508,8 +6396,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.PointCloudWithPose.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.PointCloudWithPose.toObject(opt_includeInstance, this);
+proto.IVM.slam.Heartbeat.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.Heartbeat.toObject(opt_includeInstance, this);
 };
 
 
@@ -2518,14 +6406,13 @@ proto.IVM.slam.PointCloudWithPose.prototype.toObject = function(opt_includeInsta
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.PointCloudWithPose} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.Heartbeat} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.PointCloudWithPose.toObject = function(includeInstance, msg) {
+proto.IVM.slam.Heartbeat.toObject = function(includeInstance, msg) {
   var f, obj = {
-pointcloud: (f = msg.getPointcloud()) && proto.IVM.slam.PointCloud.toObject(includeInstance, f),
-pose: (f = msg.getPose()) && proto.IVM.slam.Pose.toObject(includeInstance, f)
+timestampMs: jspb.Message.getFieldWithDefault(msg, 1, 0)
   };
 
   if (includeInstance) {
@@ -2539,23 +6426,23 @@ pose: (f = msg.getPose()) && proto.IVM.slam.Pose.toObject(includeInstance, f)
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.PointCloudWithPose}
+ * @return {!proto.IVM.slam.Heartbeat}
  */
-proto.IVM.slam.PointCloudWithPose.deserializeBinary = function(bytes) {
+proto.IVM.slam.Heartbeat.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.PointCloudWithPose;
-  return proto.IVM.slam.PointCloudWithPose.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.Heartbeat;
+  return proto.IVM.slam.Heartbeat.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.PointCloudWithPose} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.Heartbeat} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.PointCloudWithPose}
+ * @return {!proto.IVM.slam.Heartbeat}
  */
-proto.IVM.slam.PointCloudWithPose.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.Heartbeat.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -2563,14 +6450,8 @@ proto.IVM.slam.PointCloudWithPose.deserializeBinaryFromReader = function(msg, re
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = new proto.IVM.slam.PointCloud;
-      reader.readMessage(value,proto.IVM.slam.PointCloud.deserializeBinaryFromReader);
-      msg.setPointcloud(value);
-      break;
-    case 2:
-      var value = new proto.IVM.slam.Pose;
-      reader.readMessage(value,proto.IVM.slam.Pose.deserializeBinaryFromReader);
-      msg.setPose(value);
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setTimestampMs(value);
       break;
     default:
       reader.skipField();
@@ -2582,118 +6463,82 @@ proto.IVM.slam.PointCloudWithPose.deserializeBinaryFromReader = function(msg, re
 
 
 /**
- * Serializes the message to binary data (in protobuf wire format).
- * @return {!Uint8Array}
- */
-proto.IVM.slam.PointCloudWithPose.prototype.serializeBinary = function() {
-  var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.PointCloudWithPose.serializeBinaryToWriter(this, writer);
-  return writer.getResultBuffer();
-};
-
-
-/**
- * Serializes the given message to binary data (in protobuf wire
- * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.PointCloudWithPose} message
- * @param {!jspb.BinaryWriter} writer
- * @suppress {unusedLocalVariables} f is only used for nested messages
- */
-proto.IVM.slam.PointCloudWithPose.serializeBinaryToWriter = function(message, writer) {
-  var f = undefined;
-  f = message.getPointcloud();
-  if (f != null) {
-    writer.writeMessage(
-      1,
-      f,
-      proto.IVM.slam.PointCloud.serializeBinaryToWriter
-    );
-  }
-  f = message.getPose();
-  if (f != null) {
-    writer.writeMessage(
-      2,
-      f,
-      proto.IVM.slam.Pose.serializeBinaryToWriter
-    );
-  }
-};
-
-
-/**
- * optional PointCloud pointCloud = 1;
- * @return {?proto.IVM.slam.PointCloud}
- */
-proto.IVM.slam.PointCloudWithPose.prototype.getPointcloud = function() {
-  return /** @type{?proto.IVM.slam.PointCloud} */ (
-    jspb.Message.getWrapperField(this, proto.IVM.slam.PointCloud, 1));
-};
-
-
-/**
- * @param {?proto.IVM.slam.PointCloud|undefined} value
- * @return {!proto.IVM.slam.PointCloudWithPose} returns this
-*/
-proto.IVM.slam.PointCloudWithPose.prototype.setPointcloud = function(value) {
-  return jspb.Message.setWrapperField(this, 1, value);
-};
-
-
-/**
- * Clears the message field making it undefined.
- * @return {!proto.IVM.slam.PointCloudWithPose} returns this
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
  */
-proto.IVM.slam.PointCloudWithPose.prototype.clearPointcloud = function() {
-  return this.setPointcloud(undefined);
+proto.IVM.slam.Heartbeat.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.IVM.slam.Heartbeat.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
 };
 
 
 /**
- * Returns whether this field is set.
- * @return {boolean}
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.IVM.slam.Heartbeat} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.PointCloudWithPose.prototype.hasPointcloud = function() {
-  return jspb.Message.getField(this, 1) != null;
+proto.IVM.slam.Heartbeat.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getTimestampMs();
+  if (f !== 0) {
+    writer.writeInt64(
+      1,
+      f
+    );
+  }
 };
 
 
 /**
- * optional Pose pose = 2;
- * @return {?proto.IVM.slam.Pose}
+ * optional int64 timestamp_ms = 1;
+ * @return {number}
  */
-proto.IVM.slam.PointCloudWithPose.prototype.getPose = function() {
-  return /** @type{?proto.IVM.slam.Pose} */ (
-    jspb.Message.getWrapperField(this, proto.IVM.slam.Pose, 2));
+proto.IVM.slam.Heartbeat.prototype.getTimestampMs = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 1, 0));
 };
 
 
 /**
- * @param {?proto.IVM.slam.Pose|undefined} value
- * @return {!proto.IVM.slam.PointCloudWithPose} returns this
-*/
-proto.IVM.slam.PointCloudWithPose.prototype.setPose = function(value) {
-  return jspb.Message.setWrapperField(this, 2, value);
+ * @param {number} value
+ * @return {!proto.IVM.slam.Heartbeat} returns this
+ */
+proto.IVM.slam.Heartbeat.prototype.setTimestampMs = function(value) {
+  return jspb.Message.setProto3IntField(this, 1, value);
 };
 
 
+
 /**
- * Clears the message field making it undefined.
- * @return {!proto.IVM.slam.PointCloudWithPose} returns this
+ * Oneof group definitions for this message. Each group defines the field
+ * numbers belonging to that group. When of these fields' value is set, all
+ * other fields in the group are cleared. During deserialization, if multiple
+ * fields are encountered for a group, only the last value seen will be kept.
+ * @private {!Array<!Array<number>>}
+ * @const
  */
-proto.IVM.slam.PointCloudWithPose.prototype.clearPose = function() {
-  return this.setPose(undefined);
-};
-
+proto.IVM.slam.SessionUpdate.oneofGroups_ = [[2,3,4,5,6]];
 
 /**
- * Returns whether this field is set.
- * @return {boolean}
+ * @enum {number}
  */
-proto.IVM.slam.PointCloudWithPose.prototype.hasPose = function() {
-  return jspb.Message.getField(this, 2) != null;
+proto.IVM.slam.SessionUpdate.PayloadCase = {
+  PAYLOAD_NOT_SET: 0,
+  CHUNK: 2,
+  POSES: 3,
+  SESSION: 4,
+  CORRECTION: 5,
+  HEARTBEAT: 6
 };
 
-
+/**
+ * @return {proto.IVM.slam.SessionUpdate.PayloadCase}
+ */
+proto.IVM.slam.SessionUpdate.prototype.getPayloadCase = function() {
+  return /** @type {proto.IVM.slam.SessionUpdate.PayloadCase} */(jspb.Message.computeOneofCase(this, proto.IVM.slam.SessionUpdate.oneofGroups_[0]));
+};
 
 
 
@@ -2710,8 +6555,8 @@ if (jspb.Message.GENERATE_TO_OBJECT) {
  *     http://goto/soy-param-migration
  * @return {!Object}
  */
-proto.IVM.slam.SessionInfo.prototype.toObject = function(opt_includeInstance) {
-  return proto.IVM.slam.SessionInfo.toObject(opt_includeInstance, this);
+proto.IVM.slam.SessionUpdate.prototype.toObject = function(opt_includeInstance) {
+  return proto.IVM.slam.SessionUpdate.toObject(opt_includeInstance, this);
 };
 
 
@@ -2720,17 +6565,18 @@ proto.IVM.slam.SessionInfo.prototype.toObject = function(opt_includeInstance) {
  * @param {boolean|undefined} includeInstance Deprecated. Whether to include
  *     the JSPB instance for transitional soy proto support:
  *     http://goto/soy-param-migration
- * @param {!proto.IVM.slam.SessionInfo} msg The msg instance to transform.
+ * @param {!proto.IVM.slam.SessionUpdate} msg The msg instance to transform.
  * @return {!Object}
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.SessionInfo.toObject = function(includeInstance, msg) {
+proto.IVM.slam.SessionUpdate.toObject = function(includeInstance, msg) {
   var f, obj = {
-sessionId: jspb.Message.getFieldWithDefault(msg, 1, ""),
-startTime: jspb.Message.getFieldWithDefault(msg, 2, ""),
-isActive: jspb.Message.getBooleanFieldWithDefault(msg, 3, false),
-clientsConnected: jspb.Message.getFieldWithDefault(msg, 4, 0),
-totalChunks: jspb.Message.getFieldWithDefault(msg, 5, 0)
+tick: jspb.Message.getFieldWithDefault(msg, 1, 0),
+chunk: (f = msg.getChunk()) && proto.IVM.slam.SlamData.toObject(includeInstance, f),
+poses: (f = msg.getPoses()) && proto.IVM.slam.PoseList.toObject(includeInstance, f),
+session: (f = msg.getSession()) && proto.IVM.slam.SessionInfo.toObject(includeInstance, f),
+correction: (f = msg.getCorrection()) && proto.IVM.slam.PoseCorrection.toObject(includeInstance, f),
+heartbeat: (f = msg.getHeartbeat()) && proto.IVM.slam.Heartbeat.toObject(includeInstance, f)
   };
 
   if (includeInstance) {
@@ -2744,23 +6590,23 @@ totalChunks: jspb.Message.getFieldWithDefault(msg, 5, 0)
 /**
  * Deserializes binary data (in protobuf wire format).
  * @param {jspb.ByteSource} bytes The bytes to deserialize.
- * @return {!proto.IVM.slam.SessionInfo}
+ * @return {!proto.IVM.slam.SessionUpdate}
  */
-proto.IVM.slam.SessionInfo.deserializeBinary = function(bytes) {
+proto.IVM.slam.SessionUpdate.deserializeBinary = function(bytes) {
   var reader = new jspb.BinaryReader(bytes);
-  var msg = new proto.IVM.slam.SessionInfo;
-  return proto.IVM.slam.SessionInfo.deserializeBinaryFromReader(msg, reader);
+  var msg = new proto.IVM.slam.SessionUpdate;
+  return proto.IVM.slam.SessionUpdate.deserializeBinaryFromReader(msg, reader);
 };
 
 
 /**
  * Deserializes binary data (in protobuf wire format) from the
  * given reader into the given message object.
- * @param {!proto.IVM.slam.SessionInfo} msg The message object to deserialize into.
+ * @param {!proto.IVM.slam.SessionUpdate} msg The message object to deserialize into.
  * @param {!jspb.BinaryReader} reader The BinaryReader to use.
- * @return {!proto.IVM.slam.SessionInfo}
+ * @return {!proto.IVM.slam.SessionUpdate}
  */
-proto.IVM.slam.SessionInfo.deserializeBinaryFromReader = function(msg, reader) {
+proto.IVM.slam.SessionUpdate.deserializeBinaryFromReader = function(msg, reader) {
   while (reader.nextField()) {
     if (reader.isEndGroup()) {
       break;
@@ -2768,24 +6614,33 @@ proto.IVM.slam.SessionInfo.deserializeBinaryFromReader = function(msg, reader) {
     var field = reader.getFieldNumber();
     switch (field) {
     case 1:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setSessionId(value);
+      var value = /** @type {number} */ (reader.readInt64());
+      msg.setTick(value);
       break;
     case 2:
-      var value = /** @type {string} */ (reader.readString());
-      msg.setStartTime(value);
+      var value = new proto.IVM.slam.SlamData;
+      reader.readMessage(value,proto.IVM.slam.SlamData.deserializeBinaryFromReader);
+      msg.setChunk(value);
       break;
     case 3:
-      var value = /** @type {boolean} */ (reader.readBool());
-      msg.setIsActive(value);
+      var value = new proto.IVM.slam.PoseList;
+      reader.readMessage(value,proto.IVM.slam.PoseList.deserializeBinaryFromReader);
+      msg.setPoses(value);
       break;
     case 4:
-      var value = /** @type {number} */ (reader.readInt32());
-      msg.setClientsConnected(value);
+      var value = new proto.IVM.slam.SessionInfo;
+      reader.readMessage(value,proto.IVM.slam.SessionInfo.deserializeBinaryFromReader);
+      msg.setSession(value);
       break;
     case 5:
-      var value = /** @type {number} */ (reader.readInt32());
-      msg.setTotalChunks(value);
+      var value = new proto.IVM.slam.PoseCorrection;
+      reader.readMessage(value,proto.IVM.slam.PoseCorrection.deserializeBinaryFromReader);
+      msg.setCorrection(value);
+      break;
+    case 6:
+      var value = new proto.IVM.slam.Heartbeat;
+      reader.readMessage(value,proto.IVM.slam.Heartbeat.deserializeBinaryFromReader);
+      msg.setHeartbeat(value);
       break;
     default:
       reader.skipField();
@@ -2800,9 +6655,9 @@ proto.IVM.slam.SessionInfo.deserializeBinaryFromReader = function(msg, reader) {
  * Serializes the message to binary data (in protobuf wire format).
  * @return {!Uint8Array}
  */
-proto.IVM.slam.SessionInfo.prototype.serializeBinary = function() {
+proto.IVM.slam.SessionUpdate.prototype.serializeBinary = function() {
   var writer = new jspb.BinaryWriter();
-  proto.IVM.slam.SessionInfo.serializeBinaryToWriter(this, writer);
+  proto.IVM.slam.SessionUpdate.serializeBinaryToWriter(this, writer);
   return writer.getResultBuffer();
 };
 
@@ -2810,138 +6665,281 @@ proto.IVM.slam.SessionInfo.prototype.serializeBinary = function() {
 /**
  * Serializes the given message to binary data (in protobuf wire
  * format), writing to the given BinaryWriter.
- * @param {!proto.IVM.slam.SessionInfo} message
+ * @param {!proto.IVM.slam.SessionUpdate} message
  * @param {!jspb.BinaryWriter} writer
  * @suppress {unusedLocalVariables} f is only used for nested messages
  */
-proto.IVM.slam.SessionInfo.serializeBinaryToWriter = function(message, writer) {
+proto.IVM.slam.SessionUpdate.serializeBinaryToWriter = function(message, writer) {
   var f = undefined;
-  f = message.getSessionId();
-  if (f.length > 0) {
-    writer.writeString(
+  f = message.getTick();
+  if (f !== 0) {
+    writer.writeInt64(
       1,
       f
     );
   }
-  f = message.getStartTime();
-  if (f.length > 0) {
-    writer.writeString(
+  f = message.getChunk();
+  if (f != null) {
+    writer.writeMessage(
       2,
-      f
+      f,
+      proto.IVM.slam.SlamData.serializeBinaryToWriter
     );
   }
-  f = message.getIsActive();
-  if (f) {
-    writer.writeBool(
+  f = message.getPoses();
+  if (f != null) {
+    writer.writeMessage(
       3,
-      f
+      f,
+      proto.IVM.slam.PoseList.serializeBinaryToWriter
     );
   }
-  f = message.getClientsConnected();
-  if (f !== 0) {
-    writer.writeInt32(
+  f = message.getSession();
+  if (f != null) {
+    writer.writeMessage(
       4,
-      f
+      f,
+      proto.IVM.slam.SessionInfo.serializeBinaryToWriter
     );
   }
-  f = message.getTotalChunks();
-  if (f !== 0) {
-    writer.writeInt32(
+  f = message.getCorrection();
+  if (f != null) {
+    writer.writeMessage(
       5,
-      f
+      f,
+      proto.IVM.slam.PoseCorrection.serializeBinaryToWriter
+    );
+  }
+  f = message.getHeartbeat();
+  if (f != null) {
+    writer.writeMessage(
+      6,
+      f,
+      proto.IVM.slam.Heartbeat.serializeBinaryToWriter
     );
   }
 };
 
 
 /**
- * optional string session_id = 1;
- * @return {string}
+ * optional int64 tick = 1;
+ * @return {number}
  */
-proto.IVM.slam.SessionInfo.prototype.getSessionId = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+proto.IVM.slam.SessionUpdate.prototype.getTick = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 1, 0));
 };
 
 
 /**
- * @param {string} value
- * @return {!proto.IVM.slam.SessionInfo} returns this
+ * @param {number} value
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
  */
-proto.IVM.slam.SessionInfo.prototype.setSessionId = function(value) {
-  return jspb.Message.setProto3StringField(this, 1, value);
+proto.IVM.slam.SessionUpdate.prototype.setTick = function(value) {
+  return jspb.Message.setProto3IntField(this, 1, value);
 };
 
 
 /**
- * optional string start_time = 2;
- * @return {string}
+ * optional SlamData chunk = 2;
+ * @return {?proto.IVM.slam.SlamData}
  */
-proto.IVM.slam.SessionInfo.prototype.getStartTime = function() {
-  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 2, ""));
+proto.IVM.slam.SessionUpdate.prototype.getChunk = function() {
+  return /** @type{?proto.IVM.slam.SlamData} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.SlamData, 2));
 };
 
 
 /**
- * @param {string} value
- * @return {!proto.IVM.slam.SessionInfo} returns this
+ * @param {?proto.IVM.slam.SlamData|undefined} value
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
+*/
+proto.IVM.slam.SessionUpdate.prototype.setChunk = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 2, proto.IVM.slam.SessionUpdate.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
  */
-proto.IVM.slam.SessionInfo.prototype.setStartTime = function(value) {
-  return jspb.Message.setProto3StringField(this, 2, value);
+proto.IVM.slam.SessionUpdate.prototype.clearChunk = function() {
+  return this.setChunk(undefined);
 };
 
 
 /**
- * optional bool is_active = 3;
+ * Returns whether this field is set.
  * @return {boolean}
  */
-proto.IVM.slam.SessionInfo.prototype.getIsActive = function() {
-  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 3, false));
+proto.IVM.slam.SessionUpdate.prototype.hasChunk = function() {
+  return jspb.Message.getField(this, 2) != null;
 };
 
 
 /**
- * @param {boolean} value
- * @return {!proto.IVM.slam.SessionInfo} returns this
+ * optional PoseList poses = 3;
+ * @return {?proto.IVM.slam.PoseList}
  */
-proto.IVM.slam.SessionInfo.prototype.setIsActive = function(value) {
-  return jspb.Message.setProto3BooleanField(this, 3, value);
+proto.IVM.slam.SessionUpdate.prototype.getPoses = function() {
+  return /** @type{?proto.IVM.slam.PoseList} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.PoseList, 3));
 };
 
 
 /**
- * optional int32 clients_connected = 4;
- * @return {number}
+ * @param {?proto.IVM.slam.PoseList|undefined} value
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
+*/
+proto.IVM.slam.SessionUpdate.prototype.setPoses = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 3, proto.IVM.slam.SessionUpdate.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
  */
-proto.IVM.slam.SessionInfo.prototype.getClientsConnected = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 4, 0));
+proto.IVM.slam.SessionUpdate.prototype.clearPoses = function() {
+  return this.setPoses(undefined);
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.IVM.slam.SessionInfo} returns this
+ * Returns whether this field is set.
+ * @return {boolean}
  */
-proto.IVM.slam.SessionInfo.prototype.setClientsConnected = function(value) {
-  return jspb.Message.setProto3IntField(this, 4, value);
+proto.IVM.slam.SessionUpdate.prototype.hasPoses = function() {
+  return jspb.Message.getField(this, 3) != null;
 };
 
 
 /**
- * optional int32 total_chunks = 5;
- * @return {number}
+ * optional SessionInfo session = 4;
+ * @return {?proto.IVM.slam.SessionInfo}
  */
-proto.IVM.slam.SessionInfo.prototype.getTotalChunks = function() {
-  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 5, 0));
+proto.IVM.slam.SessionUpdate.prototype.getSession = function() {
+  return /** @type{?proto.IVM.slam.SessionInfo} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.SessionInfo, 4));
 };
 
 
 /**
- * @param {number} value
- * @return {!proto.IVM.slam.SessionInfo} returns this
+ * @param {?proto.IVM.slam.SessionInfo|undefined} value
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
+*/
+proto.IVM.slam.SessionUpdate.prototype.setSession = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 4, proto.IVM.slam.SessionUpdate.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
  */
-proto.IVM.slam.SessionInfo.prototype.setTotalChunks = function(value) {
-  return jspb.Message.setProto3IntField(this, 5, value);
+proto.IVM.slam.SessionUpdate.prototype.clearSession = function() {
+  return this.setSession(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.SessionUpdate.prototype.hasSession = function() {
+  return jspb.Message.getField(this, 4) != null;
+};
+
+
+/**
+ * optional PoseCorrection correction = 5;
+ * @return {?proto.IVM.slam.PoseCorrection}
+ */
+proto.IVM.slam.SessionUpdate.prototype.getCorrection = function() {
+  return /** @type{?proto.IVM.slam.PoseCorrection} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.PoseCorrection, 5));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.PoseCorrection|undefined} value
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
+*/
+proto.IVM.slam.SessionUpdate.prototype.setCorrection = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 5, proto.IVM.slam.SessionUpdate.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
+ */
+proto.IVM.slam.SessionUpdate.prototype.clearCorrection = function() {
+  return this.setCorrection(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.SessionUpdate.prototype.hasCorrection = function() {
+  return jspb.Message.getField(this, 5) != null;
 };
 
 
+/**
+ * optional Heartbeat heartbeat = 6;
+ * @return {?proto.IVM.slam.Heartbeat}
+ */
+proto.IVM.slam.SessionUpdate.prototype.getHeartbeat = function() {
+  return /** @type{?proto.IVM.slam.Heartbeat} */ (
+    jspb.Message.getWrapperField(this, proto.IVM.slam.Heartbeat, 6));
+};
+
+
+/**
+ * @param {?proto.IVM.slam.Heartbeat|undefined} value
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
+*/
+proto.IVM.slam.SessionUpdate.prototype.setHeartbeat = function(value) {
+  return jspb.Message.setOneofWrapperField(this, 6, proto.IVM.slam.SessionUpdate.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the message field making it undefined.
+ * @return {!proto.IVM.slam.SessionUpdate} returns this
+ */
+proto.IVM.slam.SessionUpdate.prototype.clearHeartbeat = function() {
+  return this.setHeartbeat(undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.IVM.slam.SessionUpdate.prototype.hasHeartbeat = function() {
+  return jspb.Message.getField(this, 6) != null;
+};
+
+
+/**
+ * @enum {number}
+ */
+proto.IVM.slam.ChunkDirective = {
+  CHUNK_ADD: 0,
+  CHUNK_REPLACE: 1,
+  CHUNK_DROP: 2
+};
+
+/**
+ * @enum {number}
+ */
+proto.IVM.slam.DecimationMode = {
+  DECIMATION_FULL: 0,
+  DECIMATION_MIN_DELTA: 1,
+  DECIMATION_RDP: 2
+};
+
 goog.object.extend(exports, proto.IVM.slam);
@@ -26,35 +26,73 @@ from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__
 from google.protobuf import duration_pb2 as google_dot_protobuf_dot_duration__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10pointcloud.proto\x12\x08IVM.slam\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\"\xba\x01\n\tDataChunk\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x17\n\x0fsequence_number\x18\x02 \x01(\x05\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\x03\x12(\n\npointcloud\x18\x05 \x01(\x0b\x32\x14.IVM.slam.PointCloud\x12\x1c\n\x04pose\x18\x06 \x01(\x0b\x32\x0e.IVM.slam.Pose\x12\x13\n\x0bis_keyframe\x18\x07 \x01(\x08\"[\n\x0c\x43hunkRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x19\n\x11missing_chunk_ids\x18\x02 \x03(\t\x12\x1c\n\x14last_sequence_number\x18\x03 \x01(\x05\"s\n\nSyncStatus\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x14\n\x0ctotal_chunks\x18\x02 \x01(\x05\x12\x1e\n\x16latest_sequence_number\x18\x03 \x01(\x05\x12\x1b\n\x13\x61vailable_chunk_ids\x18\x04 \x03(\t\"\xb1\x01\n\x08SlamData\x12\x30\n\x0epointcloudlist\x18\x01 \x01(\x0b\x32\x18.IVM.slam.PointCloudList\x12$\n\x08poselist\x18\x02 \x01(\x0b\x32\x12.IVM.slam.PoseList\x12\"\n\tindexlist\x18\x03 \x01(\x0b\x32\x0f.IVM.slam.Index\x12\x10\n\x08\x63hunk_id\x18\x04 \x01(\t\x12\x17\n\x0fsequence_number\x18\x05 \x01(\x05\"I\n\x05Point\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\x12\t\n\x01z\x18\x03 \x01(\x01\x12\t\n\x01r\x18\x04 \x01(\x01\x12\t\n\x01g\x18\x05 \x01(\x01\x12\t\n\x01\x62\x18\x06 \x01(\x01\"-\n\nPointCloud\x12\x1f\n\x06points\x18\x01 \x03(\x0b\x32\x0f.IVM.slam.Point\"\x16\n\x04Pose\x12\x0e\n\x06matrix\x18\x01 \x03(\x01\"\x16\n\x05Index\x12\r\n\x05index\x18\x01 \x03(\x05\";\n\x0ePointCloudList\x12)\n\x0bpointclouds\x18\x01 \x03(\x0b\x32\x14.IVM.slam.PointCloud\")\n\x08PoseList\x12\x1d\n\x05poses\x18\x01 \x03(\x0b\x32\x0e.IVM.slam.Pose\"\\\n\x12PointCloudWithPose\x12(\n\npointCloud\x18\x01 \x01(\x0b\x32\x14.IVM.slam.PointCloud\x12\x1c\n\x04pose\x18\x02 \x01(\x0b\x32\x0e.IVM.slam.Pose\"y\n\x0bSessionInfo\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x11\n\tis_active\x18\x03 \x01(\x08\x12\x19\n\x11\x63lients_connected\x18\x04 \x01(\x05\x12\x14\n\x0ctotal_chunks\x18\x05 \x01(\x05\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x10pointcloud.proto\x12\x08IVM.slam\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1egoogle/protobuf/duration.proto\"\xba\x01\n\tDataChunk\x12\x10\n\x08\x63hunk_id\x18\x01 \x01(\t\x12\x17\n\x0fsequence_number\x18\x02 \x01(\x05\x12\x12\n\nsession_id\x18\x03 \x01(\t\x12\x11\n\ttimestamp\x18\x04 \x01(\x03\x12(\n\npointcloud\x18\x05 \x01(\x0b\x32\x14.IVM.slam.PointCloud\x12\x1c\n\x04pose\x18\x06 \x01(\x0b\x32\x0e.IVM.slam.Pose\x12\x13\n\x0bis_keyframe\x18\x07 \x01(\x08\"[\n\x0c\x43hunkRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x19\n\x11missing_chunk_ids\x18\x02 \x03(\t\x12\x1c\n\x14last_sequence_number\x18\x03 \x01(\x05\"\xf7\x01\n\nSyncStatus\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x14\n\x0ctotal_chunks\x18\x02 \x01(\x05\x12\x1e\n\x16latest_sequence_number\x18\x03 \x01(\x05\x12\x1b\n\x13\x61vailable_chunk_ids\x18\x04 \x03(\t\x12H\n\x13\x63lient_queue_depths\x18\x05 \x03(\x0b\x32+.IVM.slam.SyncStatus.ClientQueueDepthsEntry\x1a\x38\n\x16\x43lientQueueDepthsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\x05:\x02\x38\x01\"\xd6\x02\n\x08SlamData\x12\x30\n\x0epointcloudlist\x18\x01 \x01(\x0b\x32\x18.IVM.slam.PointCloudList\x12$\n\x08poselist\x18\x02 \x01(\x0b\x32\x12.IVM.slam.PoseList\x12\"\n\tindexlist\x18\x03 \x01(\x0b\x32\x0f.IVM.slam.Index\x12\x10\n\x08\x63hunk_id\x18\x04 \x01(\t\x12\x17\n\x0fsequence_number\x18\x05 \x01(\x05\x12\x11\n\tlod_level\x18\x06 \x01(\x05\x12\x16\n\x0elod_voxel_size\x18\x07 \x01(\x01\x12+\n\tdirective\x18\x08 \x01(\x0e\x32\x18.IVM.slam.ChunkDirective\x12\x19\n\x11local_coordinates\x18\t \x01(\x08\x12\x1c\n\x0fresume_sequence\x18\n \x01(\x05H\x00\x88\x01\x01\x42\x12\n\x10_resume_sequence\"I\n\x05Point\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\x12\t\n\x01z\x18\x03 \x01(\x01\x12\t\n\x01r\x18\x04 \x01(\x01\x12\t\n\x01g\x18\x05 \x01(\x01\x12\t\n\x01\x62\x18\x06 \x01(\x01\"-\n\nPointCloud\x12\x1f\n\x06points\x18\x01 \x03(\x0b\x32\x0f.IVM.slam.Point\"\x16\n\x04Pose\x12\x0e\n\x06matrix\x18\x01 \x03(\x01\"\x16\n\x05Index\x12\r\n\x05index\x18\x01 \x03(\x05\";\n\x0ePointCloudList\x12)\n\x0bpointclouds\x18\x01 \x03(\x0b\x32\x14.IVM.slam.PointCloud\")\n\x08PoseList\x12\x1d\n\x05poses\x18\x01 \x03(\x0b\x32\x0e.IVM.slam.Pose\"\\\n\x12PointCloudWithPose\x12(\n\npointCloud\x18\x01 \x01(\x0b\x32\x14.IVM.slam.PointCloud\x12\x1c\n\x04pose\x18\x02 \x01(\x0b\x32\x0e.IVM.slam.Pose\"*\n\x07Vector3\x12\t\n\x01x\x18\x01 \x01(\x01\x12\t\n\x01y\x18\x02 \x01(\x01\x12\t\n\x01z\x18\x03 \x01(\x01\"E\n\x03\x42ox\x12\x1e\n\x03min\x18\x01 \x01(\x0b\x32\x11.IVM.slam.Vector3\x12\x1e\n\x03max\x18\x02 \x01(\x0b\x32\x11.IVM.slam.Vector3\";\n\x06Sphere\x12!\n\x06\x63\x65nter\x18\x01 \x01(\x0b\x32\x11.IVM.slam.Vector3\x12\x0e\n\x06radius\x18\x02 \x01(\x01\"a\n\x07\x46rustum\x12\x1c\n\x04pose\x18\x01 \x01(\x0b\x32\x0e.IVM.slam.Pose\x12\r\n\x05\x66ov_y\x18\x02 \x01(\x01\x12\x0e\n\x06\x61spect\x18\x03 \x01(\x01\x12\x0c\n\x04near\x18\x04 \x01(\x01\x12\x0b\n\x03\x66\x61r\x18\x05 \x01(\x01\"\xaa\x01\n\rRegionRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x1c\n\x03\x62ox\x18\x02 \x01(\x0b\x32\r.IVM.slam.BoxH\x00\x12\"\n\x06sphere\x18\x03 \x01(\x0b\x32\x10.IVM.slam.SphereH\x00\x12$\n\x07\x66rustum\x18\x04 \x01(\x0b\x32\x11.IVM.slam.FrustumH\x00\x12\x13\n\x0b\x63lip_points\x18\x05 \x01(\x08\x42\x08\n\x06region\"8\n\rSequenceRange\x12\r\n\x05start\x18\x01 \x01(\x05\x12\x10\n\x03\x65nd\x18\x02 \x01(\x05H\x00\x88\x01\x01\x42\x06\n\x04_end\"-\n\tTimeRange\x12\x10\n\x08start_ms\x18\x01 \x01(\x03\x12\x0e\n\x06\x65nd_ms\x18\x02 \x01(\x03\"\x7f\n\x0eHistoryRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12+\n\x08sequence\x18\x02 \x01(\x0b\x32\x17.IVM.slam.SequenceRangeH\x00\x12#\n\x04time\x18\x03 \x01(\x0b\x32\x13.IVM.slam.TimeRangeH\x00\x42\x07\n\x05range\"S\n\x0fKeyframeRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x14\n\x0ckeyframe_ids\x18\x02 \x03(\x05\x12\x16\n\x0ekeyframes_only\x18\x03 \x01(\x08\"A\n\x0cKeyframePose\x12\x13\n\x0bkeyframe_id\x18\x01 \x01(\x05\x12\x1c\n\x04pose\x18\x02 \x01(\x0b\x32\x0e.IVM.slam.Pose\"]\n\x0ePoseCorrection\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x10\n\x08revision\x18\x02 \x01(\x05\x12%\n\x05poses\x18\x03 \x03(\x0b\x32\x16.IVM.slam.KeyframePose\"P\n\x12MapSnapshotRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nvoxel_size\x18\x02 \x01(\x02\x12\x12\n\nmax_points\x18\x03 \x01(\x05\"\xa5\x01\n\x11TrajectoryRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12&\n\x04mode\x18\x02 \x01(\x0e\x32\x18.IVM.slam.DecimationMode\x12\x17\n\x0fmin_translation\x18\x03 \x01(\x02\x12\x14\n\x0cmin_rotation\x18\x04 \x01(\x02\x12\x0f\n\x07\x65psilon\x18\x05 \x01(\x02\x12\x14\n\x0chistory_only\x18\x06 \x01(\x08\"\x93\x01\n\x0bSessionInfo\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nstart_time\x18\x02 \x01(\t\x12\x11\n\tis_active\x18\x03 \x01(\x08\x12\x19\n\x11\x63lients_connected\x18\x04 \x01(\x05\x12\x14\n\x0ctotal_chunks\x18\x05 \x01(\x05\x12\x18\n\x10last_activity_ms\x18\x06 \x01(\x03\"!\n\tHeartbeat\x12\x14\n\x0ctimestamp_ms\x18\x01 \x01(\x03\"\xf6\x01\n\rSessionUpdate\x12\x0c\n\x04tick\x18\x01 \x01(\x03\x12#\n\x05\x63hunk\x18\x02 \x01(\x0b\x32\x12.IVM.slam.SlamDataH\x00\x12#\n\x05poses\x18\x03 \x01(\x0b\x32\x12.IVM.slam.PoseListH\x00\x12(\n\x07session\x18\x04 \x01(\x0b\x32\x15.IVM.slam.SessionInfoH\x00\x12.\n\ncorrection\x18\x05 \x01(\x0b\x32\x18.IVM.slam.PoseCorrectionH\x00\x12(\n\theartbeat\x18\x06 \x01(\x0b\x32\x13.IVM.slam.HeartbeatH\x00\x42\t\n\x07payload*B\n\x0e\x43hunkDirective\x12\r\n\tCHUNK_ADD\x10\x00\x12\x11\n\rCHUNK_REPLACE\x10\x01\x12\x0e\n\nCHUNK_DROP\x10\x02*S\n\x0e\x44\x65\x63imationMode\x12\x13\n\x0f\x44\x45\x43IMATION_FULL\x10\x00\x12\x18\n\x14\x44\x45\x43IMATION_MIN_DELTA\x10\x01\x12\x12\n\x0e\x44\x45\x43IMATION_RDP\x10\x02\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'pointcloud_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_SYNCSTATUS_CLIENTQUEUEDEPTHSENTRY']._loaded_options = None
+  _globals['_SYNCSTATUS_CLIENTQUEUEDEPTHSENTRY']._serialized_options = b'8\001'
+  _globals['_CHUNKDIRECTIVE']._serialized_start=2953
+  _globals['_CHUNKDIRECTIVE']._serialized_end=3019
+  _globals['_DECIMATIONMODE']._serialized_start=3021
+  _globals['_DECIMATIONMODE']._serialized_end=3104
   _globals['_DATACHUNK']._serialized_start=96
   _globals['_DATACHUNK']._serialized_end=282
   _globals['_CHUNKREQUEST']._serialized_start=284
   _globals['_CHUNKREQUEST']._serialized_end=375
-  _globals['_SYNCSTATUS']._serialized_start=377
-  _globals['_SYNCSTATUS']._serialized_end=492
-  _globals['_SLAMDATA']._serialized_start=495
-  _globals['_SLAMDATA']._serialized_end=672
-  _globals['_POINT']._serialized_start=674
-  _globals['_POINT']._serialized_end=747
-  _globals['_POINTCLOUD']._serialized_start=749
-  _globals['_POINTCLOUD']._serialized_end=794
-  _globals['_POSE']._serialized_start=796
-  _globals['_POSE']._serialized_end=818
-  _globals['_INDEX']._serialized_start=820
-  _globals['_INDEX']._serialized_end=842
-  _globals['_POINTCLOUDLIST']._serialized_start=844
-  _globals['_POINTCLOUDLIST']._serialized_end=903
-  _globals['_POSELIST']._serialized_start=905
-  _globals['_POSELIST']._serialized_end=946
-  _globals['_POINTCLOUDWITHPOSE']._serialized_start=948
-  _globals['_POINTCLOUDWITHPOSE']._serialized_end=1040
-  _globals['_SESSIONINFO']._serialized_start=1042
-  _globals['_SESSIONINFO']._serialized_end=1163
+  _globals['_SYNCSTATUS']._serialized_start=378
+  _globals['_SYNCSTATUS']._serialized_end=625
+  _globals['_SYNCSTATUS_CLIENTQUEUEDEPTHSENTRY']._serialized_start=569
+  _globals['_SYNCSTATUS_CLIENTQUEUEDEPTHSENTRY']._serialized_end=625
+  _globals['_SLAMDATA']._serialized_start=628
+  _globals['_SLAMDATA']._serialized_end=970
+  _globals['_POINT']._serialized_start=972
+  _globals['_POINT']._serialized_end=1045
+  _globals['_POINTCLOUD']._serialized_start=1047
+  _globals['_POINTCLOUD']._serialized_end=1092
+  _globals['_POSE']._serialized_start=1094
+  _globals['_POSE']._serialized_end=1116
+  _globals['_INDEX']._serialized_start=1118
+  _globals['_INDEX']._serialized_end=1140
+  _globals['_POINTCLOUDLIST']._serialized_start=1142
+  _globals['_POINTCLOUDLIST']._serialized_end=1201
+  _globals['_POSELIST']._serialized_start=1203
+  _globals['_POSELIST']._serialized_end=1244
+  _globals['_POINTCLOUDWITHPOSE']._serialized_start=1246
+  _globals['_POINTCLOUDWITHPOSE']._serialized_end=1338
+  _globals['_VECTOR3']._serialized_start=1340
+  _globals['_VECTOR3']._serialized_end=1382
+  _globals['_BOX']._serialized_start=1384
+  _globals['_BOX']._serialized_end=1453
+  _globals['_SPHERE']._serialized_start=1455
+  _globals['_SPHERE']._serialized_end=1514
+  _globals['_FRUSTUM']._serialized_start=1516
+  _globals['_FRUSTUM']._serialized_end=1613
+  _globals['_REGIONREQUEST']._serialized_start=1616
+  _globals['_REGIONREQUEST']._serialized_end=1786
+  _globals['_SEQUENCERANGE']._serialized_start=1788
+  _globals['_SEQUENCERANGE']._serialized_end=1844
+  _globals['_TIMERANGE']._serialized_start=1846
+  _globals['_TIMERANGE']._serialized_end=1891
+  _globals['_HISTORYREQUEST']._serialized_start=1893
+  _globals['_HISTORYREQUEST']._serialized_end=2020
+  _globals['_KEYFRAMEREQUEST']._serialized_start=2022
+  _globals['_KEYFRAMEREQUEST']._serialized_end=2105
+  _globals['_KEYFRAMEPOSE']._serialized_start=2107
+  _globals['_KEYFRAMEPOSE']._serialized_end=2172
+  _globals['_POSECORRECTION']._serialized_start=2174
+  _globals['_POSECORRECTION']._serialized_end=2267
+  _globals['_MAPSNAPSHOTREQUEST']._serialized_start=2269
+  _globals['_MAPSNAPSHOTREQUEST']._serialized_end=2349
+  _globals['_TRAJECTORYREQUEST']._serialized_start=2352
+  _globals['_TRAJECTORYREQUEST']._serialized_end=2517
+  _globals['_SESSIONINFO']._serialized_start=2520
+  _globals['_SESSIONINFO']._serialized_end=2667
+  _globals['_HEARTBEAT']._serialized_start=2669
+  _globals['_HEARTBEAT']._serialized_end=2702
+  _globals['_SESSIONUPDATE']._serialized_start=2705
+  _globals['_SESSIONUPDATE']._serialized_end=2951
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,182 @@
+# AdmissionControl.py - Capacité réservée par classe de RPC (ingestion, viewers, unaires)
+import os
+import threading
+
+import grpc
+
+import logging
+LOGGER_NAME = os.path.splitext(os.path.basename(__file__))[0]
+DEBUG_LOGS = True
+
+logger = logging.getLogger(LOGGER_NAME)
+logger.setLevel(logging.DEBUG if DEBUG_LOGS else logging.INFO)
+handler = logging.StreamHandler()
+formatter = logging.Formatter('[%(asctime)s][%(name)s][%(levelname)s] %(message)s')
+handler.setFormatter(formatter)
+logger.handlers = [handler]
+
+# Classe de chaque RPC du SlamService (les méthodes inconnues sont 'unary')
+RPC_CLASSES = {
+    # Producteur SLAM: ne doit jamais attendre derrière les viewers
+    'ConnectSlamData': 'ingest',
+    'ConnectPoses': 'ingest',
+    'CorrectPoses': 'ingest',
+    # Flux longs des viewers
+    'GetSlamData': 'viewer',
+    'GetPoses': 'viewer',
+    'GetTrajectory': 'viewer',
+    'GetPoseCorrections': 'viewer',
+    'GetSpecificChunks': 'viewer',
+    'GetRegionChunks': 'viewer',
+    'GetHistory': 'viewer',
+    'GetKeyframeChunks': 'viewer',
+    'StreamSession': 'viewer',
+    'WatchSession': 'viewer',
+    # Appels courts
+    'GetSyncStatus': 'unary',
+    'GetSessionInfo': 'unary',
+    'SetSessionInfo': 'unary',
+    'GetMapSnapshot': 'unary',
+}
+
+DEFAULT_CAPACITIES = {'ingest': 4, 'viewer': 32, 'unary': 4}
+
+
+def rpc_class(method):
+    """Classe d'une méthode, à partir de son nom court ou complet ('/slam.SlamService/GetSlamData')"""
+    return RPC_CLASSES.get(method.rsplit('/', 1)[-1], 'unary')
+
+
+class AdmissionController:
+    """Nombre maximal d'appels simultanés par classe de RPC
+
+    Chaque classe a sa propre capacité : une fois pleine, les nouveaux
+    appels de cette classe sont refusés (RESOURCE_EXHAUSTED) au lieu
+    d'attendre un thread. Avec un pool du serveur dimensionné sur
+    total_capacity(), les viewers ne peuvent donc jamais occuper les
+    threads réservés à l'ingestion ou aux appels unaires.
+    """
+    def __init__(self, capacities=None):
+        self.capacities = dict(DEFAULT_CAPACITIES)
+        self.capacities.update(capacities or {})
+        self._lock = threading.Lock()
+        self._active = {name: 0 for name in self.capacities}
+        self._rejected = {name: 0 for name in self.capacities}
+
+    def total_capacity(self):
+        return sum(self.capacities.values())
+
+    def try_acquire(self, name):
+        with self._lock:
+            if self._active[name] >= self.capacities[name]:
+                self._rejected[name] += 1
+                return False
+            self._active[name] += 1
+            return True
+
+    def release(self, name):
+        with self._lock:
+            self._active[name] -= 1
+
+    def get_stats(self):
+        with self._lock:
+            return {
+                name: {'active': self._active[name], 'capacity': self.capacities[name],
+                       'rejected': self._rejected[name]}
+                for name in self.capacities
+            }
+
+    def _reject_details(self, name, method):
+        logger.warning(f"⛔ {method} refusé: capacité '{name}' pleine ({self.capacities[name]} appels)")
+        return f"Serveur saturé pour les appels '{name}' ({self.capacities[name]} simultanés max), réessayer plus tard"
+
+
+def rebuild_handler(handler, unary_response=None, stream_response=None, response_serializer=None):
+    """RpcMethodHandler de même type, comportement enveloppé et/ou sérialiseur de réponse remplacé"""
+    unary_response = unary_response or (lambda behavior: behavior)
+    stream_response = stream_response or (lambda behavior: behavior)
+    response_serializer = response_serializer or handler.response_serializer
+    if handler.unary_unary:
+        return grpc.unary_unary_rpc_method_handler(
+            unary_response(handler.unary_unary), handler.request_deserializer, response_serializer)
+    if handler.unary_stream:
+        return grpc.unary_stream_rpc_method_handler(
+            stream_response(handler.unary_stream), handler.request_deserializer, response_serializer)
+    if handler.stream_unary:
+        return grpc.stream_unary_rpc_method_handler(
+            unary_response(handler.stream_unary), handler.request_deserializer, response_serializer)
+    return grpc.stream_stream_rpc_method_handler(
+        stream_response(handler.stream_stream), handler.request_deserializer, response_serializer)
+
+
+class AdmissionInterceptor(grpc.ServerInterceptor):
+    """Contrôle d'admission pour grpc.server (handlers synchrones)"""
+    def __init__(self, controller):
+        self.controller = controller
+
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None:
+            return None
+        controller = self.controller
+        method = handler_call_details.method
+        name = rpc_class(method)
+
+        def unary_response(behavior):
+            def admitted(request, context):
+                if not controller.try_acquire(name):
+                    context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, controller._reject_details(name, method))
+                try:
+                    return behavior(request, context)
+                finally:
+                    controller.release(name)
+            return admitted
+
+        def stream_response(behavior):
+            def admitted(request, context):
+                if not controller.try_acquire(name):
+                    context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, controller._reject_details(name, method))
+                try:
+                    yield from behavior(request, context)
+                finally:
+                    controller.release(name)
+            return admitted
+
+        return rebuild_handler(handler, unary_response, stream_response)
+
+
+class AsyncAdmissionInterceptor(grpc.aio.ServerInterceptor):
+    """Contrôle d'admission pour grpc.aio.server (handlers coroutines)"""
+    def __init__(self, controller):
+        self.controller = controller
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        controller = self.controller
+        method = handler_call_details.method
+        name = rpc_class(method)
+
+        def unary_response(behavior):
+            async def admitted(request, context):
+                if not controller.try_acquire(name):
+                    await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, controller._reject_details(name, method))
+                try:
+                    return await behavior(request, context)
+                finally:
+                    controller.release(name)
+            return admitted
+
+        def stream_response(behavior):
+            async def admitted(request, context):
+                if not controller.try_acquire(name):
+                    await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, controller._reject_details(name, method))
+                try:
+                    async for message in behavior(request, context):
+                        yield message
+                finally:
+                    controller.release(name)
+            return admitted
+
+        return rebuild_handler(handler, unary_response, stream_response)
@@ -0,0 +1,107 @@
+# BandwidthShaper.py - Limitation du débit d'envoi par client (seaux à jetons)
+import threading
+import time
+
+
+class TokenBucket:
+    """Seau à jetons en octets, partageable entre threads
+
+    reserve() prélève toujours les octets (le seau peut passer en négatif)
+    et retourne le délai à respecter avant l'envoi : un message plus gros
+    que la rafale autorisée est envoyé quand même, puis rembourse sa dette.
+    """
+    def __init__(self, rate, burst=None):
+        self.rate = float(rate)  # octets par seconde
+        self.burst = float(burst if burst is not None else rate)
+        self._tokens = self.burst
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def reserve(self, nbytes):
+        """Prélève nbytes, retourne l'attente (s) avant de les envoyer"""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= nbytes
+            return max(0.0, -self._tokens / self.rate) if self.rate > 0 else 0.0
+
+    def set_rate(self, rate):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = float(rate)
+
+
+class RateMeter:
+    """Débit moyen (octets/s) lissé exponentiellement sur `half_life` secondes"""
+    def __init__(self, half_life=2.0):
+        self.half_life = half_life
+        self._rate = 0.0
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _decay(self, now):
+        elapsed = now - self._last
+        self._last = now
+        return 0.5 ** (elapsed / self.half_life) if elapsed > 0 else 1.0
+
+    def add(self, nbytes):
+        with self._lock:
+            # Impulsion de nbytes étalée sur la constante de temps du lissage
+            self._rate = self._rate * self._decay(time.monotonic()) + nbytes / self.half_life
+
+    def rate(self):
+        with self._lock:
+            self._rate *= self._decay(time.monotonic())
+            return self._rate
+
+
+class ClientShaper:
+    """Rythme d'envoi d'un client GetSlamData
+
+    Chaque message prélève sa taille sérialisée dans le seau du client et,
+    s'il existe, dans le seau commun à tous les viewers (lien montant
+    partagé). Les messages de rattrapage passent en plus par un troisième
+    seau qui laisse la place au flux temps réel : son débit est plafonné
+    par catchup_rate et, si le client est limité, vaut son débit moins le
+    débit d'ingestion mesuré (live_meter), sans descendre sous
+    catchup_min_share du débit du client.
+    """
+    BURST_SECONDS = 0.5  # rafale autorisée, en secondes de débit
+
+    def __init__(self, rate=0, uplink=None, live_meter=None, catchup_min_share=0.25, catchup_rate=0):
+        self.rate = float(rate or 0)
+        self.catchup_max_rate = float(catchup_rate or 0)
+        self.uplink = uplink
+        self.live_meter = live_meter
+        self.catchup_min_share = catchup_min_share
+        self.bytes_sent = 0
+        self._bucket = TokenBucket(self.rate, self.rate * self.BURST_SECONDS) if self.rate > 0 else None
+        catchup_rate = self._catchup_rate()
+        self._catchup = TokenBucket(catchup_rate, catchup_rate * self.BURST_SECONDS) if catchup_rate > 0 else None
+
+    @property
+    def limited(self):
+        return self._bucket is not None or self._catchup is not None or self.uplink is not None
+
+    def _catchup_rate(self):
+        rates = [self.catchup_max_rate] if self.catchup_max_rate > 0 else []
+        if self.rate > 0:
+            live_rate = self.live_meter.rate() if self.live_meter is not None else 0.0
+            rates.append(max(self.rate * self.catchup_min_share, self.rate - live_rate))
+        return min(rates) if rates else 0.0
+
+    def reserve(self, nbytes, catchup=False):
+        """Prélève un message de nbytes, retourne l'attente (s) avant de l'envoyer"""
+        self.bytes_sent += nbytes
+        delay = 0.0
+        if self._bucket is not None:
+            delay = self._bucket.reserve(nbytes)
+        if catchup and self._catchup is not None:
+            self._catchup.set_rate(self._catchup_rate())
+            delay = max(delay, self._catchup.reserve(nbytes))
+        if self.uplink is not None:
+            delay = max(delay, self.uplink.reserve(nbytes))
+        return delay
@@ -0,0 +1,135 @@
+# CatchupBundle.py - Rattrapage pré-sérialisé par session (trames concaténées + index séquence -> offset)
+import bisect
+import threading
+
+import grpc
+
+from AdmissionControl import rebuild_handler
+
+
+class CatchupBundle:
+    """Chunks de la vue de rattrapage d'une session, sérialisés une seule fois
+
+    Les trames (SlamData.SerializeToString) sont concaténées dans un seul
+    buffer, avec pour chaque chunk sa séquence, sa première séquence
+    (chunks compactés) et l'offset de sa trame. sync() est appelé par
+    l'écrivain à chaque publication de snapshot : les nouveaux chunks sont
+    ajoutés en fin de buffer, une compaction tronque le buffer à partir du
+    premier chunk remplacé, les évictions avancent simplement le début.
+    Un nouveau client lit ensuite ses trames depuis son offset de reprise,
+    sans parcourir ni re-sérialiser les chunks.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()  # l'écrivain modifie le buffer pendant que les clients le lisent
+        self._buffer = bytearray()
+        self._chunk_ids = []
+        self._sequences = []
+        self._first_sequences = []
+        self._offsets = []  # début de chaque trame dans _buffer
+        self._start = 0     # première trame encore dans la vue (les évictions retirent les plus anciennes)
+        self._log, self._log_start, self._log_end = None, 0, 0  # tranche du ChunkLog déjà synchronisée
+        self.frames_serialized = 0
+
+    @property
+    def size_bytes(self):
+        return len(self._buffer) - (self._offsets[self._start] if self._start < len(self._offsets) else 0)
+
+    def _frame_end(self, index):
+        return self._offsets[index + 1] if index + 1 < len(self._offsets) else len(self._buffer)
+
+    def _truncate(self, count):
+        """Garde les `count` premières trames du buffer"""
+        if count < len(self._offsets):
+            del self._buffer[self._offsets[count]:]
+            del self._chunk_ids[count:], self._sequences[count:], self._first_sequences[count:], self._offsets[count:]
+
+    def _drop_evicted(self):
+        """Libère les trames évincées quand elles occupent plus de la moitié du buffer"""
+        base = self._offsets[self._start] if self._start < len(self._offsets) else len(self._buffer)
+        if base * 2 <= len(self._buffer):
+            return
+        del self._buffer[:base]
+        self._offsets = [offset - base for offset in self._offsets[self._start:]]
+        del self._chunk_ids[:self._start], self._sequences[:self._start], self._first_sequences[:self._start]
+        self._start = 0
+
+    def sync(self, snapshot):
+        """Aligne le buffer sur la vue publiée (ChunkSnapshot, une trame par chunk de la vue)
+
+        Tant que la vue est le même ChunkLog, seuls les chunks ajoutés ou
+        évincés depuis l'appel précédent sont traités. Un nouveau log
+        (compaction, ménage des évictions) est comparé chunk par chunk.
+        """
+        with self._lock:
+            if snapshot.view is self._log:
+                self._start += snapshot.view_start - self._log_start
+                added = snapshot.view.entries[self._log_end:snapshot.view_end]
+            else:
+                entries = snapshot.view_entries()
+                ids = [metadata.chunk_id for metadata, _ in entries]
+                # Évictions: la vue a perdu ses chunks les plus anciens
+                first_id = ids[0] if ids else None
+                while self._start < len(self._chunk_ids) and self._chunk_ids[self._start] != first_id:
+                    self._start += 1
+                # Partie commune; le reste (compaction, vidage) est reconstruit
+                held = self._chunk_ids[self._start:]
+                common = 0
+                while common < min(len(held), len(ids)) and held[common] == ids[common]:
+                    common += 1
+                self._truncate(self._start + common)
+                added = entries[common:]
+            self._drop_evicted()
+            for chunk_metadata, slam_data in added:
+                self._offsets.append(len(self._buffer))
+                self._buffer += slam_data.SerializeToString()
+                self._chunk_ids.append(chunk_metadata.chunk_id)
+                self._sequences.append(chunk_metadata.sequence_number)
+                self._first_sequences.append(chunk_metadata.first_sequence)
+                self.frames_serialized += 1
+            self._log, self._log_start, self._log_end = snapshot.view, snapshot.view_start, snapshot.view_end
+
+    def frames(self, after_sequence, until_sequence):
+        """(séquence, trame) des chunks dans ]after_sequence, until_sequence], trame par trame
+
+        S'arrête avant un chunk compacté à cheval sur la dernière séquence
+        envoyée : ses chunks d'origine restants doivent être lus dans le
+        cache (get_entries_after_sequence), comme pour le rattrapage normal.
+        """
+        while True:
+            with self._lock:
+                index = bisect.bisect_right(self._sequences, after_sequence, lo=self._start)
+                if (index >= len(self._sequences) or self._sequences[index] > until_sequence
+                        or self._first_sequences[index] <= after_sequence):
+                    return
+                after_sequence = self._sequences[index]
+                frame = bytes(self._buffer[self._offsets[index]:self._frame_end(index)])
+            yield after_sequence, frame
+
+    def clear(self):
+        with self._lock:
+            self._truncate(0)
+            self._start = 0
+            self._log, self._log_start, self._log_end = None, 0, 0
+
+
+def _pass_bytes(serializer):
+    """Sérialiseur qui laisse passer les trames déjà sérialisées (bytes)"""
+    return lambda message: message if isinstance(message, bytes) else serializer(message)
+
+
+class PreSerializedInterceptor(grpc.ServerInterceptor):
+    """Permet aux flux serveur de grpc.server d'envoyer des trames déjà sérialisées"""
+    def intercept_service(self, continuation, handler_call_details):
+        handler = continuation(handler_call_details)
+        if handler is None or not handler.response_streaming:
+            return handler
+        return rebuild_handler(handler, response_serializer=_pass_bytes(handler.response_serializer))
+
+
+class AsyncPreSerializedInterceptor(grpc.aio.ServerInterceptor):
+    """Permet aux flux serveur de grpc.aio.server d'envoyer des trames déjà sérialisées"""
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None or not handler.response_streaming:
+            return handler
+        return rebuild_handler(handler, response_serializer=_pass_bytes(handler.response_serializer))
@@ -0,0 +1,64 @@
+import os
+import threading
+import time
+import logging
+
+LOGGER_NAME = os.path.splitext(os.path.basename(__file__))[0]
+logger = logging.getLogger(LOGGER_NAME)
+
+class ChunkCompactor:
+    """Compaction en tâche de fond des petits chunks (flush_pending, reconnexions)"""
+    def __init__(self, cache, interval_seconds=10, min_fill=0.5, revoxel_size=None):
+        self.cache = cache
+        self.interval_seconds = interval_seconds
+        self.min_fill = min_fill          # seuil "petit chunk" en fraction de CHUNK_SIZE
+        self.revoxel_size = revoxel_size  # None = simple concaténation des points
+        self.is_active = False
+        self._wakeup = threading.Event()
+        self.compactor_thread = None
+
+    def start(self):
+        """Démarre le thread de compaction (sauf si le backend ne sait pas compacter)"""
+        if not self.cache.SUPPORTS_COMPACTION:
+            logger.warning(f"🧱 Compacteur de chunks désactivé: {type(self.cache).__name__} ne supporte pas la compaction")
+            return
+        self.is_active = True
+        self._wakeup.clear()
+        self.compactor_thread = threading.Thread(target=self._compact_loop, daemon=True)
+        self.compactor_thread.start()
+        logger.info(f"🧱 Compacteur de chunks démarré (intervalle {self.interval_seconds}s)")
+
+    def stop(self):
+        """Arrête le thread de compaction"""
+        self.is_active = False
+        self._wakeup.set()
+        if self.compactor_thread:
+            self.compactor_thread.join(timeout=1)
+        logger.info("🛑 Compacteur de chunks arrêté")
+
+    def compact_now(self):
+        """Demande une passe de compaction immédiate"""
+        self._wakeup.set()
+
+    def run_once(self):
+        """Compacte toutes les sessions du cache, retourne le nombre de chunks créés"""
+        created = 0
+        for session_id in self.cache.get_session_ids():
+            try:
+                created += self.cache.compact_session(
+                    session_id, min_fill=self.min_fill, revoxel_size=self.revoxel_size
+                )
+            except Exception as e:
+                logger.error(f"Erreur de compaction pour '{session_id}': {e}")
+        return created
+
+    def _compact_loop(self):
+        while self.is_active:
+            self._wakeup.wait(self.interval_seconds)
+            self._wakeup.clear()
+            if not self.is_active:
+                break
+            start = time.time()
+            created = self.run_once()
+            if created:
+                logger.debug(f"Passe de compaction: {created} chunks en {(time.time() - start) * 1000:.1f}ms")
@@ -0,0 +1,241 @@
+# LodPyramid.py - Pyramide de niveaux de détail (voxels grossiers) d'une session
+import os
+import sys
+import threading
+
+import numpy as np
+
+from PointBudget import stratified_indices
+from utils import fill_wire_points, point_wire_entries, set_wire_points, wire_xyzrgb
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+gen_python_path = os.path.join(current_dir, '..', 'proto_files_slam')
+sys.path.append(gen_python_path)
+
+import pointcloud_pb2
+
+# Tailles de voxel des niveaux 1, 2, 3 (du plus fin au plus grossier)
+LOD_VOXEL_SIZES = (0.04, 0.16, 0.64)
+
+
+class LodLevel:
+    """Un niveau de la pyramide: somme des points (x, y, z, r, g, b) et nombre de points par voxel
+
+    Les voxels occupent des lignes d'un tableau NumPy (slots), réutilisées
+    quand un voxel se vide: ajouter ou retirer un chunk ne coûte que le
+    nombre de voxels qu'il touche. Le centroïde de chaque voxel est aussi
+    gardé sous forme de Point protobuf encodé (_wire), recalculé seulement
+    pour les voxels modifiés depuis la dernière lecture.
+    """
+    def __init__(self, level, voxel_size):
+        self.level = level
+        self.voxel_size = float(voxel_size)
+        self._slots = {}  # (i, j, k) -> ligne de _sums / _counts
+        self._free = []
+        self._sums = np.zeros((0, 6), dtype=np.float64)
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._wire = point_wire_entries(0)  # centroïde encodé de chaque slot
+        self._dirty = set()  # slots modifiés depuis le dernier wire_points()
+
+    def _slot(self, key):
+        slot = self._slots.get(key)
+        if slot is None:
+            if not self._free:
+                self._grow()
+            slot = self._free.pop()
+            self._slots[key] = slot
+        return slot
+
+    def _grow(self):
+        capacity = len(self._counts)
+        new_capacity = max(1024, capacity * 2)
+        self._sums = np.concatenate((self._sums, np.zeros((new_capacity - capacity, 6))))
+        self._counts = np.concatenate((self._counts, np.zeros(new_capacity - capacity, dtype=np.int64)))
+        self._wire = np.concatenate((self._wire, point_wire_entries(new_capacity - capacity)))
+        self._free.extend(range(new_capacity - 1, capacity - 1, -1))
+
+    def accumulate(self, xyzrgb, sign=1):
+        """Ajoute (sign=1) ou retire (sign=-1) des points (N, 6)"""
+        if len(xyzrgb) == 0:
+            return
+        keys = np.floor(xyzrgb[:, :3] / self.voxel_size).astype(np.int64)
+        unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        sums = np.zeros((len(unique), 6), dtype=np.float64)
+        np.add.at(sums, inverse, xyzrgb)
+        counts = np.bincount(inverse, minlength=len(unique))
+        keys = list(map(tuple, unique.tolist()))
+        slots = np.fromiter((self._slot(key) for key in keys), dtype=np.int64, count=len(keys))
+        self._sums[slots] += sign * sums
+        self._counts[slots] += sign * counts
+        self._dirty.update(slots.tolist())
+        if sign < 0:
+            for key, slot in zip(keys, slots.tolist()):
+                if self._counts[slot] <= 0:
+                    del self._slots[key]
+                    self._sums[slot] = 0.0
+                    self._counts[slot] = 0
+                    self._free.append(slot)
+
+    def points(self):
+        """Centroïdes et couleurs moyennes des voxels occupés (M, 6)"""
+        occupied = self._counts > 0
+        return self._sums[occupied] / self._counts[occupied, None]
+
+    def wire_points(self):
+        """Centroïdes des voxels occupés, en entrées Point encodées (M,), dans l'ordre de points()"""
+        if self._dirty:
+            slots = np.fromiter(self._dirty, dtype=np.int64, count=len(self._dirty))
+            slots = slots[self._counts[slots] > 0]
+            set_wire_points(self._wire, self._sums[slots] / self._counts[slots, None], slots)
+            self._dirty = set()
+        return self._wire[self._counts > 0]
+
+    def resample(self, voxel_size):
+        """Points du niveau regroupés dans des voxels plus gros (M', 6)
+
+        Regroupe les sommes et les nombres de points des voxels occupés:
+        centroïdes et couleurs restent pondérés par le nombre de points
+        d'origine, sans repasser sur les chunks.
+        """
+        occupied = self._counts > 0
+        sums = self._sums[occupied]
+        counts = self._counts[occupied]
+        if voxel_size <= self.voxel_size or len(counts) == 0:
+            return sums / counts[:, None]
+        keys = np.floor(sums[:, :3] / counts[:, None] / voxel_size).astype(np.int64)
+        _, inverse = np.unique(keys, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        merged_sums = np.zeros((inverse.max() + 1, 6), dtype=np.float64)
+        np.add.at(merged_sums, inverse, sums)
+        merged_counts = np.bincount(inverse, weights=counts)
+        return merged_sums / merged_counts[:, None]
+
+    def clear(self):
+        self.__init__(self.level, self.voxel_size)
+
+    def __len__(self):
+        return len(self._slots)
+
+
+class LodPyramid:
+    """Représentations voxelisées grossières de la carte d'une session
+
+    Mise à jour incrémentale par l'écrivain à chaque scellement de chunk
+    (add_xyzrgb) et à chaque éviction (remove_xyzrgb). Les lecteurs obtiennent une copie
+    cohérente d'un niveau via level_points ou level_chunks, ou la carte
+    entière en un seul message via snapshot.
+    """
+    def __init__(self, voxel_sizes=LOD_VOXEL_SIZES):
+        self.levels = [LodLevel(i + 1, size) for i, size in enumerate(voxel_sizes)]
+        self.last_sequence = -1  # dernier chunk scellé pris en compte
+        self.version = 0         # incrémentée à chaque modification
+        self._snapshots = {}     # (voxel_size, max_points) -> (version, SlamData)
+        self._lock = threading.Lock()
+
+    def _changed(self):
+        self.version += 1
+
+    def add_xyzrgb(self, xyzrgb, sequence_number=-1):
+        """Intègre des points (monde, poses corrigées) à tous les niveaux: chunk scellé ou corrigé"""
+        with self._lock:
+            for level in self.levels:
+                level.accumulate(xyzrgb)
+            self.last_sequence = max(self.last_sequence, sequence_number)
+            self._changed()
+
+    def remove_xyzrgb(self, xyzrgb):
+        """Retire des points (monde): chunk évincé ou géométrie avant correction de pose"""
+        with self._lock:
+            for level in self.levels:
+                level.accumulate(xyzrgb, sign=-1)
+            self._changed()
+
+    def clear(self):
+        with self._lock:
+            for level in self.levels:
+                level.clear()
+            self.last_sequence = -1
+            self._changed()
+
+    def level_points(self, level):
+        """(voxel_size, points (M, 6), last_sequence) du niveau demandé (1 = le plus fin)"""
+        with self._lock:
+            lod = self.levels[level - 1]
+            return lod.voxel_size, lod.points(), self.last_sequence
+
+    def level_chunks(self, level, session_id, tile_points=5000):
+        """SlamData (lod_level > 0) couvrant toute la carte au niveau demandé
+
+        Les tuiles portent la séquence du dernier chunk intégré: le client
+        sait à partir de quel chunk pleine résolution le niveau est couvert.
+        """
+        voxel_size, xyzrgb, last_sequence = self.level_points(level)
+        for tile, start in enumerate(range(0, len(xyzrgb), tile_points)):
+            pointcloud = pointcloud_pb2.PointCloud()
+            pointcloud.points.extend(
+                pointcloud_pb2.Point(x=p[0], y=p[1], z=p[2], r=p[3], g=p[4], b=p[5])
+                for p in xyzrgb[start:start + tile_points].tolist()
+            )
+            slam_data = pointcloud_pb2.SlamData(
+                chunk_id=f"{session_id}_lod{level}_{tile}",
+                sequence_number=last_sequence,
+                lod_level=level,
+                lod_voxel_size=voxel_size
+            )
+            slam_data.pointcloudlist.pointclouds.append(pointcloud)
+            yield slam_data
+
+    def snapshot(self, session_id, voxel_size=0.0, max_points=0):
+        """Carte entière en un seul SlamData à la résolution demandée (monde)
+
+        Part du niveau le plus grossier dont les voxels ne dépassent pas
+        voxel_size (le plus grossier si voxel_size <= 0 ou plus grand que
+        tous les niveaux, le plus fin s'il est plus petit), regroupé à
+        voxel_size au besoin. Les points d'un niveau sont déjà encodés et
+        mis à jour voxel par voxel (LodLevel.wire_points): après un
+        scellement, seuls les voxels touchés sont recalculés. Le message
+        est gardé jusqu'à la prochaine modification de la pyramide.
+        """
+        key = (float(voxel_size), int(max_points))
+        with self._lock:
+            cached = self._snapshots.get(key)
+            if cached is not None and cached[0] == self.version:
+                return cached[1]
+            version = self.version
+            if voxel_size <= 0:
+                lod = self.levels[-1]
+            else:
+                fitting = [level for level in self.levels if level.voxel_size <= voxel_size]
+                lod = fitting[-1] if fitting else self.levels[0]
+            if voxel_size <= lod.voxel_size:
+                entries, xyzrgb = lod.wire_points(), None
+            else:
+                entries, xyzrgb = None, lod.resample(voxel_size)
+            last_sequence = self.last_sequence
+
+        if entries is None:
+            entries = point_wire_entries(len(xyzrgb))
+            set_wire_points(entries, xyzrgb)
+        if max_points and len(entries) > max_points:
+            entries = entries[stratified_indices(wire_xyzrgb(entries)[:, :3], max_points)]
+        slam_data = pointcloud_pb2.SlamData(
+            chunk_id=f"{session_id}_snapshot",
+            sequence_number=last_sequence,
+            lod_level=lod.level,
+            lod_voxel_size=max(float(voxel_size), lod.voxel_size)
+        )
+        fill_wire_points(slam_data.pointcloudlist.pointclouds.add(), entries)
+
+        with self._lock:
+            if self.version == version:
+                self._snapshots[key] = (version, slam_data)
+        return slam_data
+
+    def coarse_to_fine(self):
+        """Numéros de niveau du plus grossier au plus fin"""
+        return [level.level for level in reversed(self.levels)]
+
+    def stats(self):
+        with self._lock:
+            return {f"lod{level.level}_{level.voxel_size * 100:g}cm": len(level) for level in self.levels}
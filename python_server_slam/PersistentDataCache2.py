@@ -3,9 +3,18 @@ import threading
 import os
 import uuid
 import time
+import bisect
+import itertools
 from collections import OrderedDict
 
-from utils import apply_voxel_grid_filter
+import numpy as np
+
+from utils import (apply_voxel_grid_filter, bounds_from_xyz, fill_points, outlier_mask,
+                   points_to_xyz, points_to_xyzrgb, pose_matrix, to_local_pointcloud, to_world_slam_data,
+                   transform_xyz, world_xyzrgb)
+from SpatialIndex import ChunkSpatialIndex
+from LodPyramid import LodPyramid
+from CatchupBundle import CatchupBundle
 
 import sys
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -36,44 +45,352 @@ class ChunkMetadata:
         self.timestamp = int(time.time() * 1000)
         self.point_count = 0
         self.size_bytes = 0
+        # Un chunk compacté couvre les séquences [first_sequence, sequence_number]
+        self.first_sequence = sequence_number
+        self.source_chunk_ids = (chunk_id,)
+        # Keyframes ayant contribué des points (alignés sur pointclouds / indexlist du chunk)
+        self.keyframe_ids = ()
+        # Métadonnées spatiales calculées au scellement
+        self.bbox_min = None
+        self.bbox_max = None
+        self.centroid = None
+    
+
+class ChunkLog:
+    """Chunks (metadata, slam_data) en ajout seul, triés par séquence, partagés par les snapshots
+
+    L'écrivain ajoute en fin (append) et avance `start` pour les évictions :
+    un snapshot ne lit que la tranche [start, end) fixée à sa publication,
+    jamais ce qui a été ajouté après. Toute autre modification (compaction,
+    horloge qui recule, ménage des chunks évincés) construit un nouveau log,
+    les snapshots déjà publiés gardent l'ancien.
+    """
+    __slots__ = ('entries', 'sequences', 'positions', 'points', 'sizes', 'timestamps', 'time_order', 'start')
+
+    def __init__(self, entries=()):
+        self.entries = list(entries)
+        self.sequences = [metadata.sequence_number for metadata, _ in self.entries]
+        self.positions = {metadata.chunk_id: i for i, (metadata, _) in enumerate(self.entries)}
+        # Cumuls: points et octets des i premiers chunks (totaux d'une tranche en O(1))
+        self.points = list(itertools.accumulate((metadata.point_count for metadata, _ in self.entries), initial=0))
+        self.sizes = list(itertools.accumulate((metadata.size_bytes for metadata, _ in self.entries), initial=0))
+        # Index par date de création: time_order[i] = position du i-ème chunk le plus ancien
+        self.time_order = sorted(range(len(self.entries)), key=lambda i: self.entries[i][0].timestamp)
+        self.timestamps = [self.entries[i][0].timestamp for i in self.time_order]
+        self.start = 0
+
+    def __len__(self):
+        return len(self.entries) - self.start
+
+    def live_entries(self):
+        return self.entries[self.start:]
+
+    def appended(self, entry):
+        """Log contenant entry en fin: celui-ci, ou un nouveau si l'horloge a reculé"""
+        metadata = entry[0]
+        if self.timestamps and metadata.timestamp < self.timestamps[-1]:
+            return ChunkLog(self.live_entries() + [entry])
+        position = len(self.entries)
+        self.entries.append(entry)
+        self.sequences.append(metadata.sequence_number)
+        self.positions[metadata.chunk_id] = position
+        self.points.append(self.points[-1] + metadata.point_count)
+        self.sizes.append(self.sizes[-1] + metadata.size_bytes)
+        self.time_order.append(position)
+        self.timestamps.append(metadata.timestamp)
+        return self
+
+    def evicted(self, count):
+        """Log sans ses `count` plus anciens chunks (recopié quand les évincés en occupent plus de la moitié)"""
+        self.start += count
+        if self.start * 2 > len(self.entries):
+            return ChunkLog(self.live_entries())
+        return self
+
+    def position(self, chunk_id, start, end):
+        """Position d'un chunk présent dans la tranche [start, end), None sinon"""
+        position = self.positions.get(chunk_id)
+        if position is None or not start <= position < end:
+            return None
+        return position
+
+
+class ChunkSnapshot:
+    """Vue immuable des chunks scellés d'une session
+
+    Publiée par l'écrivain après chaque scellement par simple affectation
+    de référence : les lecteurs n'ont jamais besoin du verrou. Un snapshot
+    ne copie rien, il fige la tranche visible des deux ChunkLog de la
+    session, ce qui rend la publication indépendante du nombre de chunks.
+
+    `view` est la forme de rattrapage (petits chunks remplacés par leur
+    version compactée), `originals` garde les chunks d'origine, avec un
+    index par timestamp pour les requêtes historiques.
+    """
+    __slots__ = ('view', 'view_start', 'view_end', 'originals', 'originals_start', 'originals_end')
+
+    def __init__(self, originals=None, view=None):
+        self.originals = originals if originals is not None else ChunkLog()
+        self.view = view if view is not None else ChunkLog()
+        self.originals_start, self.originals_end = self.originals.start, len(self.originals.entries)
+        self.view_start, self.view_end = self.view.start, len(self.view.entries)
+
+    def __len__(self):
+        return self.view_end - self.view_start
+
+    @property
+    def metadata(self):
+        return [metadata for metadata, _ in self.view_entries()]
+
+    @property
+    def chunks(self):
+        return [slam_data for _, slam_data in self.view_entries()]
+
+    @property
+    def total_points(self):
+        return self.view.points[self.view_end] - self.view.points[self.view_start]
+
+    @property
+    def size_bytes(self):
+        return self.view.sizes[self.view_end] - self.view.sizes[self.view_start]
+
+    @property
+    def latest_sequence(self):
+        return self.view.sequences[self.view_end - 1] if len(self) else -1
+
+    def view_entries(self):
+        """(metadata, slam_data) de la forme de rattrapage, par séquence"""
+        return self.view.entries[self.view_start:self.view_end]
+
+    def view_position(self, chunk_id):
+        """Position d'un chunk de la forme de rattrapage dans self.view.entries (None s'il n'y est pas)"""
+        return self.view.position(chunk_id, self.view_start, self.view_end)
+
+    def entry(self, chunk_id):
+        """(metadata, slam_data) d'un chunk d'origine ou compacté, None s'il n'est pas dans ce snapshot"""
+        position = self.originals.position(chunk_id, self.originals_start, self.originals_end)
+        if position is not None:
+            return self.originals.entries[position]
+        position = self.view_position(chunk_id)
+        return self.view.entries[position] if position is not None else None
+
+    def after_sequence(self, sequence_number):
+        """Chunks dont la séquence est strictement supérieure à sequence_number"""
+        return [slam_data for _, slam_data in self.entries_after_sequence(sequence_number)]
+
+    def entries_after_sequence(self, sequence_number, until_sequence=None):
+        """(metadata, slam_data) dont la séquence est dans ]sequence_number, until_sequence]
+
+        Un chunk compacté dont la plage chevauche sequence_number est remplacé
+        par ses chunks d'origine restants : un client qui détient déjà une
+        partie des originaux ne reçoit jamais de points en double. Seuls les
+        chunks de la plage sont parcourus (recherche dichotomique).
+        """
+        view = self.view
+        start = bisect.bisect_right(view.sequences, sequence_number, self.view_start, self.view_end)
+        end = (self.view_end if until_sequence is None
+               else bisect.bisect_right(view.sequences, until_sequence, start, self.view_end))
+        result = []
+        for metadata, slam_data in view.entries[start:end]:
+            if metadata.first_sequence > sequence_number:
+                result.append((metadata, slam_data))
+                continue
+            for chunk_id in metadata.source_chunk_ids:
+                original = self.entry(chunk_id)
+                if original is not None and original[0].sequence_number > sequence_number:
+                    result.append(original)
+        return result
+
+    def entries_in_sequence_range(self, start_sequence, end_sequence):
+        """Chunks d'origine dont la séquence est dans [start_sequence, end_sequence]"""
+        originals = self.originals
+        start = bisect.bisect_left(originals.sequences, start_sequence, self.originals_start, self.originals_end)
+        end = bisect.bisect_right(originals.sequences, end_sequence, start, self.originals_end)
+        return originals.entries[start:end]
+
+    def entries_in_time_range(self, start_ms, end_ms):
+        """Chunks d'origine créés dans [start_ms, end_ms], triés par séquence"""
+        originals = self.originals
+        # Les originals_end premiers éléments de l'index par date sont les positions [0, originals_end)
+        start = bisect.bisect_left(originals.timestamps, start_ms, 0, self.originals_end)
+        end = bisect.bisect_right(originals.timestamps, end_ms, start, self.originals_end)
+        return [originals.entries[i] for i in sorted(originals.time_order[start:end]) if i >= self.originals_start]
+
+EMPTY_SNAPSHOT = ChunkSnapshot()
+
+# Versions des stores, uniques tous stores confondus: un store recréé (clear_cache) ne
+# reprend jamais la version d'un ancien
+_VERSIONS = itertools.count(1)
+
+
+class SessionStore:
+    """État de stockage propre à une session (chunks, voxels, buffer d'accumulation)"""
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.lock = threading.RLock()  # sérialise uniquement les écrivains
+        
+        # Stockage des chunks avec métadonnées (logs remplacés ou étendus par l'écrivain, sous self.lock)
+        self.originals = ChunkLog()  # chunks d'origine
+        self.view = ChunkLog()  # forme de rattrapage (après compaction)
+        # Vue publiée pour les lecteurs (remplacée atomiquement)
+        self.snapshot = EMPTY_SNAPSHOT
+        # Index spatial des chunks (originaux et compactés, publié avec le snapshot et filtré par lui)
+        self.spatial_index = ChunkSpatialIndex()
+        # Niveaux de détail grossiers, mis à jour à chaque scellement
+        self.lod = LodPyramid()
+        # Rattrapage pré-sérialisé (trames de la vue), étendu à chaque publication
+        self.bundle = CatchupBundle()
+        # Keyframe -> tuple des chunks d'origine contenant ses points (tuples remplacés par l'écrivain)
+        self.keyframe_chunks = {}
+        self.sequence_counter = 0
+        self.voxel_cache = {}
+        self.outliers_removed = 0  # points isolés retirés à l'ingestion
+        
+        # Buffer temporaire pour accumulation
+        self.temp_points = []
+        self.temp_indices = []  # keyframe de chaque point de temp_points (-1 si inconnue)
+        self.keyframe_poses = {}  # keyframe -> dernière Pose reçue
+        
+        # Corrections de poses (fermeture de boucle), dictionnaires remplacés par l'écrivain
+        self.pose_corrections = {}  # keyframe -> Pose corrigée
+        self.correction_revisions = {}  # keyframe -> révision de sa dernière correction
+        self.pose_revision = 0
+        self.world_chunks = {}  # chunk_id -> (révision de ses keyframes, SlamData en coordonnées monde)
+        
+        # Réveil des flux temps réel: version changée à chaque scellement ou correction
+        self.version = next(_VERSIONS)
+        self.changed = threading.Condition(threading.Lock())
 
 class PersistentDataCache:
-    """Cache persistant avec gestion des chunks identifiés"""
+    """Cache persistant avec gestion des chunks identifiés, indexé par session_id
+
+    Chaque session a son propre SessionStore et son propre verrou : des
+    sessions indépendantes peuvent ingérer et être lues en parallèle. Seuls
+    les écrivains prennent le verrou, les lectures passent par le
+    ChunkSnapshot publié après chaque scellement. Quand
+    aucun session_id n'est fourni, la session courante du SessionManager est
+    utilisée.
+    """
+    SUPPORTS_COMPACTION = True  # compact_session fusionne les petits chunks de la vue
     
     def __init__(self, session_manager):
-        self._lock = threading.RLock()
+        self._lock = threading.RLock()  # protège uniquement le dictionnaire des sessions
         self._session_manager = session_manager
-        
-        # Stockage des chunks avec métadonnées
-        self._chunks = OrderedDict()  # chunk_id -> (metadata, slam_data)
-        self._sequence_counter = 0
-        self._voxel_cache = {}
-        
-        # Buffer temporaire pour accumulation
-        self._temp_points = []
-        self._temp_poses = []
-        self._temp_indices = []
+        self._sessions = {}  # session_id -> SessionStore
+        self._change_listeners = []  # callback(session_id) appelés à chaque changement de version
         
         # Configuration
         self.CHUNK_SIZE = 1000  # Points par chunk
-        self.MAX_CHUNKS = 10000  # Limite de chunks en mémoire
+        self.MAX_CHUNKS = 10000  # Limite de chunks en mémoire (par session)
+        # Suppression des pixels volants après le filtre voxel: None, 'radius' ou 'statistical'
+        self.OUTLIER_FILTER = None
+        self.OUTLIER_RADIUS = 0.05  # Taille de cellule du voisinage (m)
+        self.OUTLIER_MIN_NEIGHBORS = 3
+        self.OUTLIER_STD_RATIO = 1.0  # Mode 'statistical'
+        # Trames sérialisées de la vue de rattrapage, tenues à jour au scellement (mémoire x2 environ)
+        self.CATCHUP_BUNDLE = True
+    
+    def _resolve_session_id(self, session_id):
+        if session_id is None:
+            return self._session_manager.get_session_info()['session_id']
+        return session_id
+    
+    def _get_store(self, session_id, create=True):
+        """Retourne le SessionStore d'une session (créé à la demande)"""
+        session_id = self._resolve_session_id(session_id)
+        with self._lock:
+            store = self._sessions.get(session_id)
+            if store is None and create:
+                store = SessionStore(session_id)
+                self._sessions[session_id] = store
+                logger.info(f"Nouveau store de session: '{session_id}'")
+            return store
+    
+    def _stores(self):
+        with self._lock:
+            return list(self._sessions.values())
+    
+    def _snapshot(self, session_id):
+        """Snapshot publié d'une session (lecture sans verrou)"""
+        store = self._sessions.get(session_id)
+        return store.snapshot if store is not None else EMPTY_SNAPSHOT
+    
+    def _publish_snapshot(self, store):
+        """Publie une nouvelle vue immuable des chunks (appelé par l'écrivain sous store.lock)"""
+        store.spatial_index.publish()
+        store.snapshot = ChunkSnapshot(store.originals, store.view)
+        if self.CATCHUP_BUNDLE:
+            store.bundle.sync(store.snapshot)
+    
+    def _notify_readers(self, store):
+        """Réveille les flux en attente de nouvelles données sur cette session
         
-    def generate_chunk_id(self):
-        """Génère un ID unique pour un chunk"""
-        return f"{self._session_manager.get_session_info()['session_id']}_{self._sequence_counter}_{uuid.uuid4().hex[:8]}"
+        Appelé après avoir relâché store.lock: un listener lent (file d'envoi
+        en politique 'block') ne bloque pas les autres écrivains de la session.
+        """
+        with store.changed:
+            store.version = next(_VERSIONS)
+            store.changed.notify_all()
+        for listener in self._change_listeners:
+            listener(store.session_id)
+    
+    def add_change_listener(self, callback):
+        """Enregistre callback(session_id), appelé depuis le thread écrivain (hors store.lock) à chaque changement de version"""
+        self._change_listeners.append(callback)
     
+    def data_version(self, session_id):
+        """Version courante des données d'une session (à lire avant la requête qu'elle protège)"""
+        return self._get_store(session_id).version
 
-    def add_slam_data(self, pointcloudlist, poselist, indexlist, voxel_size=0.01):
-        """Ajoute des données SLAM et crée des chunks"""
+    def latest_sequence(self, session_id):
+        """Dernière séquence scellée d'une session (-1 si aucune), lecture sans verrou"""
+        store = self._sessions.get(session_id)
+        return store.sequence_counter - 1 if store is not None else -1
+
+    def wait_for_change(self, session_id, version, timeout=None):
+        """Bloque sans consommer de CPU jusqu'à un scellement ou une correction postérieurs à `version`
+        
+        Returns:
+            int: version courante (inchangée si le délai a expiré)
+        """
+        store = self._get_store(session_id)
+        with store.changed:
+            store.changed.wait_for(lambda: store.version != version, timeout)
+            return store.version
+    
+    def get_session_ids(self):
+        """Retourne les IDs des sessions présentes dans le cache"""
         with self._lock:
-            session_info = self._session_manager.get_session_info()
-            
-            # Traiter et filtrer les points
-            pc_list = pointcloudlist.pointclouds
-            pose_list = poselist.poses if poselist and poselist.poses else []
-            
-            for i, pc in enumerate(pc_list):
-                filtered_pc = apply_voxel_grid_filter(pc, voxel_size=voxel_size)
+            return list(self._sessions.keys())
+        
+    def generate_chunk_id(self, store):
+        """Génère un ID unique pour un chunk"""
+        return f"{store.session_id}_{store.sequence_counter}_{uuid.uuid4().hex[:8]}"
+    
+
+    def add_slam_data(self, pointcloudlist, poselist, indexlist, voxel_size=0.01, session_id=None):
+        """Ajoute des données SLAM à une session et crée des chunks"""
+        store = self._get_store(session_id)
+        
+        # Filtrer les points hors verrou (ne touche pas à l'état de la session)
+        pc_list = pointcloudlist.pointclouds
+        pose_list = poselist.poses if poselist and poselist.poses else []
+        keyframe_list = indexlist.index if indexlist else []
+        filtered_pcs = [apply_voxel_grid_filter(pc, voxel_size=voxel_size) for pc in pc_list]
+        if self.OUTLIER_FILTER:
+            filtered_pcs, outliers = self._remove_outliers(filtered_pcs)
+        else:
+            outliers = 0
+        
+        with store.lock:
+            store.outliers_removed += outliers
+            for i, filtered_pc in enumerate(filtered_pcs):
+                # indexlist est aligné sur les pointclouds et poses du message
+                keyframe_id = keyframe_list[i] if i < len(keyframe_list) else -1
+                if i < len(pose_list):
+                    store.keyframe_poses[keyframe_id] = pose_list[i]
+                elif pose_list:
+                    store.keyframe_poses[keyframe_id] = pose_list[-1]
                 
                 for point in filtered_pc.points:
                     voxel_key = (
@@ -82,160 +399,572 @@ class PersistentDataCache:
                         int(point.z / voxel_size)
                     )
                     
-                    if voxel_key not in self._voxel_cache:
-                        self._voxel_cache[voxel_key] = True
-                        self._temp_points.append(point)
-                        
-                        if i < len(pose_list):
-                            self._temp_poses.append(pose_list[i])
-                        elif pose_list:
-                            self._temp_poses.append(pose_list[-1])
+                    if voxel_key not in store.voxel_cache:
+                        store.voxel_cache[voxel_key] = True
+                        store.temp_points.append(point)
+                        store.temp_indices.append(keyframe_id)
             
             # Créer des chunks si on a assez de points
             chunks_created = []
-            while len(self._temp_points) >= self.CHUNK_SIZE:
-                chunk_id, chunk_data = self._create_chunk()
+            while len(store.temp_points) >= self.CHUNK_SIZE:
+                chunk_id, chunk_data = self._create_chunk(store)
                 if chunk_id:
                     chunks_created.append(chunk_id)
             
-            logger.info(f"Créé {len(chunks_created)} chunks, points en attente: {len(self._temp_points)}")
-            return chunks_created
+            if chunks_created:
+                self._publish_snapshot(store)
+            pending = len(store.temp_points)
+        
+        if chunks_created:
+            self._notify_readers(store)
+        logger.info(f"[{store.session_id}] Créé {len(chunks_created)} chunks, points en attente: {pending}")
+        return chunks_created
     
 
 
-    def _create_chunk(self):
-        """Crée un chunk à partir du buffer temporaire"""
-        if len(self._temp_points) < self.CHUNK_SIZE:
+    def _remove_outliers(self, pointclouds):
+        """Retire les points isolés d'un lot (tous les pointclouds du message ensemble)
+
+        Returns:
+            (liste de PointCloud filtrés, nombre de points retirés)
+        """
+        xyz_list = [points_to_xyz(pc.points) for pc in pointclouds]
+        if not xyz_list:
+            return pointclouds, 0
+        std_ratio = self.OUTLIER_STD_RATIO if self.OUTLIER_FILTER == 'statistical' else 0.0
+        keep = outlier_mask(np.concatenate(xyz_list), self.OUTLIER_RADIUS, self.OUTLIER_MIN_NEIGHBORS, std_ratio)
+        kept_pcs = []
+        offset = 0
+        for pc, xyz in zip(pointclouds, xyz_list):
+            mask = keep[offset:offset + len(xyz)]
+            offset += len(xyz)
+            kept_pc = type(pc)()
+            kept_pc.points.extend(point for point, kept in zip(pc.points, mask) if kept)
+            kept_pcs.append(kept_pc)
+        return kept_pcs, int(len(keep) - keep.sum())
+
+    def _create_chunk(self, store, chunk_size=None):
+        """Crée un chunk à partir du buffer temporaire d'une session"""
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        if len(store.temp_points) < chunk_size:
             return None, None
         
-        # Extraire les points pour ce chunk
-        chunk_points = self._temp_points[:self.CHUNK_SIZE]
-        chunk_poses = self._temp_poses[:min(self.CHUNK_SIZE, len(self._temp_poses))]
-        
-        # Créer le protobuf
-        pointcloud = pointcloud_pb2.PointCloud()
-        pointcloud.points.extend(chunk_points)
+        # Extraire les points pour ce chunk, regroupés par keyframe (ordre d'arrivée)
+        by_keyframe = OrderedDict()
+        for point, keyframe_id in zip(store.temp_points[:chunk_size], store.temp_indices[:chunk_size]):
+            by_keyframe.setdefault(keyframe_id, []).append(point)
         
+        # Créer le protobuf: un PointCloud, une Pose et un index par keyframe. Les points
+        # sont stockés dans le repère de leur keyframe: une correction de pose ne touche
+        # que la pose, pas les points
+        world_pointcloudlist = pointcloud_pb2.PointCloudList()
         pointcloudlist = pointcloud_pb2.PointCloudList()
-        pointcloudlist.pointclouds.append(pointcloud)
-        
         poselist = pointcloud_pb2.PoseList()
-        if chunk_poses:
-            poselist.poses.extend(chunk_poses)
-        
         indexlist = pointcloud_pb2.Index()
+        for keyframe_id, points in by_keyframe.items():
+            world_pc = world_pointcloudlist.pointclouds.add()
+            world_pc.points.extend(points)
+            pose = store.keyframe_poses.get(keyframe_id)
+            pointcloudlist.pointclouds.append(to_local_pointcloud(world_pc, pose) if pose is not None else world_pc)
+            poselist.poses.append(pose if pose is not None else pointcloud_pb2.Pose())
+            indexlist.index.append(keyframe_id)
         
         # Créer le SlamData avec ID
-        chunk_id = self.generate_chunk_id()
+        chunk_id = self.generate_chunk_id(store)
         slam_data = pointcloud_pb2.SlamData(
             pointcloudlist=pointcloudlist,
             poselist=poselist,
             indexlist=indexlist,
             chunk_id=chunk_id,
-            sequence_number=self._sequence_counter
+            sequence_number=store.sequence_counter,
+            local_coordinates=True
         )
         
         # Créer les métadonnées
         metadata = ChunkMetadata(
             chunk_id=chunk_id,
-            sequence_number=self._sequence_counter,
-            session_id=self._session_manager.get_session_info()['session_id']
+            sequence_number=store.sequence_counter,
+            session_id=store.session_id
         )
-        metadata.point_count = len(chunk_points)
+        # Géométrie monde avec les poses corrigées: celle que l'éviction et les corrections retireront
+        world = world_xyzrgb(slam_data, store.pose_corrections)
+        metadata.bbox_min, metadata.bbox_max, metadata.centroid, metadata.point_count = bounds_from_xyz(world[:, :3])
+        metadata.size_bytes = slam_data.ByteSize()
+        metadata.keyframe_ids = tuple(by_keyframe)
         
         # Stocker le chunk
-        self._chunks[chunk_id] = (metadata, slam_data)
-        self._sequence_counter += 1
+        self._store_chunk(store, metadata, slam_data)
+        store.lod.add_xyzrgb(world, metadata.sequence_number)
+        for keyframe_id in metadata.keyframe_ids:
+            store.keyframe_chunks[keyframe_id] = store.keyframe_chunks.get(keyframe_id, ()) + (chunk_id,)
+        store.sequence_counter += 1
         
         # Nettoyer le buffer
-        self._temp_points = self._temp_points[self.CHUNK_SIZE:]
-        self._temp_poses = self._temp_poses[min(self.CHUNK_SIZE, len(self._temp_poses)):]
-        
-        # Gérer la limite de chunks
-        if len(self._chunks) > self.MAX_CHUNKS:
-            # Supprimer les plus anciens
-            oldest_key = next(iter(self._chunks))
-            del self._chunks[oldest_key]
+        store.temp_points = store.temp_points[chunk_size:]
+        store.temp_indices = store.temp_indices[chunk_size:]
         
         logger.debug(f"Chunk créé: {chunk_id}, sequence: {metadata.sequence_number}, points: {metadata.point_count}")
         return chunk_id, slam_data
     
-    def get_chunk(self, chunk_id):
-        """Récupère un chunk spécifique"""
-        with self._lock:
-            if chunk_id in self._chunks:
-                return self._chunks[chunk_id][1]  # Retourne le slam_data
-            return None
+    def _store_chunk(self, store, metadata, slam_data):
+        """Stocke un chunk scellé (surchargé par les autres backends)"""
+        store.originals = store.originals.appended((metadata, slam_data))
+        store.view = store.view.appended((metadata, slam_data))
+        if metadata.bbox_min is not None:
+            store.spatial_index.insert(metadata.chunk_id, metadata.bbox_min, metadata.bbox_max)
+        
+        # Gérer la limite de chunks
+        if len(store.originals) > self.MAX_CHUNKS:
+            # Supprimer les plus anciens (avec tous les originaux d'un chunk compacté, en tête des originaux)
+            oldest_metadata, _ = store.view.entries[store.view.start]
+            store.view = store.view.evicted(1)
+            store.spatial_index.remove(oldest_metadata.chunk_id)
+            originals = store.originals
+            evicted = [originals.entries[position] for position in
+                       (originals.position(chunk_id, originals.start, len(originals.entries))
+                        for chunk_id in oldest_metadata.source_chunk_ids)
+                       if position is not None]
+            store.originals = originals.evicted(len(evicted))
+            store.world_chunks.pop(oldest_metadata.chunk_id, None)
+            for original_metadata, original_data in evicted:
+                store.spatial_index.remove(original_metadata.chunk_id)
+                store.world_chunks.pop(original_metadata.chunk_id, None)
+                store.lod.remove_xyzrgb(world_xyzrgb(original_data, store.pose_corrections))
+                self._unindex_keyframes(store, original_metadata)
+    
+    def _unindex_keyframes(self, store, metadata):
+        """Retire un chunk d'origine évincé de l'index keyframe -> chunks"""
+        for keyframe_id in metadata.keyframe_ids:
+            remaining = tuple(c for c in store.keyframe_chunks.get(keyframe_id, ()) if c != metadata.chunk_id)
+            if remaining:
+                store.keyframe_chunks[keyframe_id] = remaining
+            else:
+                store.keyframe_chunks.pop(keyframe_id, None)
+    
+    def compact_session(self, session_id, min_fill=0.5, revoxel_size=None):
+        """Fusionne les suites de petits chunks scellés en chunks de taille pleine
+
+        Un chunk est "petit" s'il a moins de min_fill * CHUNK_SIZE points.
+        Les fusions sont calculées hors verrou sur le snapshot publié, puis
+        appliquées sous le verrou si la vue n'a pas changé entre-temps. Les
+        originaux restent accessibles (get_chunk, clients en cours de flux).
+        
+        Returns:
+            int: nombre de chunks compactés créés
+        """
+        store = self._sessions.get(session_id)
+        if store is None:
+            return 0
+        
+        snapshot = store.snapshot
+        small = self.CHUNK_SIZE * min_fill
+        groups, current, current_points = [], [], 0
+        for metadata, slam_data in snapshot.view_entries():
+            if metadata.point_count < small and current_points + metadata.point_count <= self.CHUNK_SIZE:
+                current.append((metadata, slam_data))
+                current_points += metadata.point_count
+                continue
+            if len(current) >= 2:
+                groups.append(current)
+            if metadata.point_count < small:
+                current, current_points = [(metadata, slam_data)], metadata.point_count
+            else:
+                current, current_points = [], 0
+        if len(current) >= 2:
+            groups.append(current)
+        
+        if not groups:
+            return 0
+        
+        corrections = store.pose_corrections
+        merged = {group[0][0].chunk_id: (group, self._merge_chunks(session_id, group, revoxel_size, corrections))
+                  for group in groups}
+        
+        compacted = 0
+        with store.lock:
+            # Nouvelle vue (un nouveau log: les snapshots publiés gardent l'ancienne)
+            live, view, i = store.view.live_entries(), [], 0
+            while i < len(live):
+                group, entry = merged.get(live[i][0].chunk_id, (None, None))
+                # La suite doit être toujours présente telle quelle dans la vue
+                if group is None or [metadata for metadata, _ in live[i:i + len(group)]] != [
+                        metadata for metadata, _ in group]:
+                    view.append(live[i])
+                    i += 1
+                    continue
+                view.append(entry)
+                i += len(group)
+                # Les originaux restent indexés: un lecteur sur l'ancien snapshot les trouve encore
+                if entry[0].bbox_min is not None:
+                    store.spatial_index.insert(entry[0].chunk_id, entry[0].bbox_min, entry[0].bbox_max)
+                compacted += 1
+            if compacted:
+                store.view = ChunkLog(view)
+                self._publish_snapshot(store)
+        
+        logger.info(f"[{session_id}] Compaction: {compacted} chunks créés à partir de "
+                    f"{sum(len(group) for group, _ in merged.values())} petits chunks")
+        return compacted
+    
+    def _merge_chunks(self, session_id, group, revoxel_size=None, corrections=None):
+        """Construit le chunk compacté d'une suite de chunks (métadonnées, slam_data)"""
+        first_metadata, last_metadata = group[0][0], group[-1][0]
+        
+        pointcloudlist = pointcloud_pb2.PointCloudList()
+        poselist = pointcloud_pb2.PoseList()
+        indexlist = pointcloud_pb2.Index()
+        for _, slam_data in group:
+            pointcloudlist.pointclouds.extend(slam_data.pointcloudlist.pointclouds)
+            poselist.poses.extend(slam_data.poselist.poses)
+            indexlist.index.extend(slam_data.indexlist.index)
+        
+        local_coordinates = all(slam_data.local_coordinates for _, slam_data in group)
+        if revoxel_size and local_coordinates:
+            # Re-voxelisation par keyframe, dans son repère: le chunk compacté reste en repère
+            # local et suit les corrections de pose comme ses originaux
+            pointcloudlist, poselist, indexlist = self._revoxel_by_keyframe(
+                pointcloudlist, poselist, indexlist, revoxel_size)
+        elif revoxel_size:
+            # Originaux déjà en coordonnées monde (pas de pose à suivre): un seul PointCloud
+            merged_pc = pointcloud_pb2.PointCloud()
+            for _, source in group:
+                fill_points(merged_pc.points, world_xyzrgb(source))
+            pointcloudlist = pointcloud_pb2.PointCloudList()
+            pointcloudlist.pointclouds.append(apply_voxel_grid_filter(merged_pc, voxel_size=revoxel_size))
+            poselist = pointcloud_pb2.PoseList()
+            indexlist = pointcloud_pb2.Index()
+        
+        chunk_id = (f"{session_id}_{first_metadata.first_sequence}-{last_metadata.sequence_number}"
+                    f"_{uuid.uuid4().hex[:8]}")
+        slam_data = pointcloud_pb2.SlamData(
+            pointcloudlist=pointcloudlist,
+            poselist=poselist,
+            indexlist=indexlist,
+            chunk_id=chunk_id,
+            sequence_number=last_metadata.sequence_number,
+            local_coordinates=local_coordinates
+        )
+        
+        metadata = ChunkMetadata(chunk_id, last_metadata.sequence_number, session_id)
+        metadata.timestamp = last_metadata.timestamp
+        metadata.first_sequence = first_metadata.first_sequence
+        metadata.source_chunk_ids = tuple(
+            chunk_id for source, _ in group for chunk_id in source.source_chunk_ids
+        )
+        metadata.keyframe_ids = tuple(dict.fromkeys(
+            keyframe_id for source, _ in group for keyframe_id in source.keyframe_ids
+        ))
+        metadata.bbox_min, metadata.bbox_max, metadata.centroid, metadata.point_count = bounds_from_xyz(
+            world_xyzrgb(slam_data, corrections)[:, :3]
+        )
+        metadata.size_bytes = slam_data.ByteSize()
+        return metadata, slam_data
+    
+    @staticmethod
+    def _revoxel_by_keyframe(pointcloudlist, poselist, indexlist, revoxel_size):
+        """Un PointCloud re-voxelisé par keyframe, exprimé dans le repère de sa dernière pose
+        
+        Les points d'une keyframe stockés avec une autre pose (pose mise à jour
+        entre deux chunks) sont ramenés dans ce repère avant le filtre.
+        """
+        by_keyframe = OrderedDict()
+        for pc, pose, keyframe_id in zip(pointcloudlist.pointclouds, poselist.poses, indexlist.index):
+            by_keyframe.setdefault(keyframe_id, []).append((pc, pose))
+        
+        merged_pcs = pointcloud_pb2.PointCloudList()
+        merged_poses = pointcloud_pb2.PoseList()
+        merged_index = pointcloud_pb2.Index()
+        for keyframe_id, sources in by_keyframe.items():
+            reference = sources[-1][1]
+            to_reference = np.linalg.inv(pose_matrix(reference))
+            merged_pc = pointcloud_pb2.PointCloud()
+            for pc, pose in sources:
+                xyzrgb = points_to_xyzrgb(pc.points)
+                if list(pose.matrix) != list(reference.matrix):
+                    xyzrgb[:, :3] = transform_xyz(xyzrgb[:, :3], to_reference @ pose_matrix(pose))
+                fill_points(merged_pc.points, xyzrgb)
+            merged_pcs.pointclouds.append(apply_voxel_grid_filter(merged_pc, voxel_size=revoxel_size))
+            merged_poses.poses.append(reference)
+            merged_index.index.append(keyframe_id)
+        return merged_pcs, merged_poses, merged_index
+    
+    def get_chunk(self, chunk_id, session_id=None):
+        """Récupère un chunk spécifique (recherché dans toutes les sessions si session_id est None)"""
+        session_ids = [session_id] if session_id else list(self._sessions)
+        for sid in session_ids:
+            entry = self._snapshot(sid).entry(chunk_id)
+            if entry is not None:
+                return entry[1]
+        return None
     
     def get_chunks_after_sequence(self, sequence_number, session_id):
         """Récupère tous les chunks après un numéro de séquence"""
-        with self._lock:
-            chunks = []
-            for chunk_id, (metadata, slam_data) in self._chunks.items():
-                if metadata.session_id == session_id and metadata.sequence_number > sequence_number:
-                    chunks.append(slam_data)
-            return sorted(chunks, key=lambda x: x.sequence_number)
+        return self._snapshot(session_id).after_sequence(sequence_number)
+    
+    def get_entries_after_sequence(self, sequence_number, session_id, until_sequence=None):
+        """Comme get_chunks_after_sequence, avec les métadonnées: [(metadata, slam_data)]
+        
+        until_sequence borne la plage (incluse): seuls les chunks de
+        ]sequence_number, until_sequence] sont parcourus.
+        """
+        return self._snapshot(session_id).entries_after_sequence(sequence_number, until_sequence)
+    
+    def get_catchup_frames(self, session_id, after_sequence, until_sequence):
+        """Chunks de rattrapage déjà sérialisés: (séquence, bytes) dans ]after_sequence, until_sequence]
+        
+        Mêmes chunks que get_entries_after_sequence, tels que stockés (repère
+        keyframe). Peut s'arrêter avant until_sequence (chunk compacté à cheval
+        sur le curseur, bundle désactivé): le reste se lit avec
+        get_entries_after_sequence.
+        """
+        store = self._sessions.get(session_id)
+        if store is None or not self.CATCHUP_BUNDLE:
+            return iter(())
+        return store.bundle.frames(after_sequence, until_sequence)
+    
+    def get_chunks_in_sequence_range(self, session_id, start_sequence, end_sequence):
+        """Récupère les chunks dont la séquence est dans [start_sequence, end_sequence]"""
+        return [slam_data for _, slam_data in
+                self.get_entries_in_sequence_range(session_id, start_sequence, end_sequence)]
+    
+    def get_entries_in_sequence_range(self, session_id, start_sequence, end_sequence):
+        """Chunks d'origine (metadata, slam_data) dans [start_sequence, end_sequence]
+        
+        La carte telle qu'elle était à la séquence N est la plage [0, N].
+        """
+        return self._snapshot(session_id).entries_in_sequence_range(start_sequence, end_sequence)
+    
+    def get_entries_in_time_range(self, session_id, start_ms, end_ms):
+        """Chunks d'origine (metadata, slam_data) créés entre start_ms et end_ms (ms epoch, inclus)"""
+        return self._snapshot(session_id).entries_in_time_range(start_ms, end_ms)
     
     def get_sync_status(self, session_id):
         """Retourne l'état de synchronisation"""
+        snapshot = self._snapshot(session_id)
+        return {
+            'session_id': session_id,
+            'total_chunks': len(snapshot),
+            'latest_sequence_number': snapshot.latest_sequence,
+            'available_chunk_ids': [metadata.chunk_id for metadata, _ in snapshot.view_entries()]
+        }
+    
+    def clear_cache(self, session_id=None):
+        """Nettoie le cache d'une session (toutes les sessions si session_id est None)"""
         with self._lock:
-            session_chunks = [
-                (chunk_id, metadata) 
-                for chunk_id, (metadata, _) in self._chunks.items()
-                if metadata.session_id == session_id
-            ]
-            
-            return {
-                'session_id': session_id,
-                'total_chunks': len(session_chunks),
-                'latest_sequence_number': self._sequence_counter - 1 if self._sequence_counter > 0 else -1,
-                'available_chunk_ids': [chunk_id for chunk_id, _ in session_chunks]
-            }
-    
-    def clear_cache(self):
-        """Nettoie le cache pour une nouvelle session"""
-        with self._lock:
-            logger.info(f"Nettoyage du cache: {len(self._chunks)} chunks supprimés")
-            self._chunks.clear()
-            self._voxel_cache.clear()
-            self._temp_points.clear()
-            self._temp_poses.clear()
-            self._temp_indices.clear()
-            self._sequence_counter = 0
-    
-    def flush_pending(self):
+            if session_id is None:
+                stores = list(self._sessions.values())
+                self._sessions.clear()
+            else:
+                store = self._sessions.pop(session_id, None)
+                stores = [store] if store else []
+        for store in stores:
+            with store.lock:
+                logger.info(f"Nettoyage du cache '{store.session_id}': {len(store.originals)} chunks supprimés")
+                store.originals = ChunkLog()
+                store.view = ChunkLog()
+                store.spatial_index.clear()
+                store.lod.clear()
+                store.snapshot = EMPTY_SNAPSHOT
+                store.bundle.clear()
+                store.voxel_cache.clear()
+                store.keyframe_chunks.clear()
+                store.temp_points.clear()
+                store.temp_indices.clear()
+                store.keyframe_poses.clear()
+                store.pose_corrections = {}
+                store.correction_revisions = {}
+                store.world_chunks = {}
+                store.outliers_removed = 0
+            # Les flux en attente se réveillent et retrouvent le nouveau store de la session
+            self._notify_readers(store)
+    
+    def flush_pending(self, session_id=None):
         """Force la création d'un chunk avec les données en attente"""
-        with self._lock:
-            if self._temp_points:
-                # Créer un chunk même s'il est plus petit que CHUNK_SIZE
-                original_size = self.CHUNK_SIZE
-                self.CHUNK_SIZE = min(len(self._temp_points), self.CHUNK_SIZE)
-                chunk_id, chunk_data = self._create_chunk()
-                self.CHUNK_SIZE = original_size
-                return chunk_id
+        store = self._get_store(session_id, create=False)
+        if store is None:
             return None
+        with store.lock:
+            if not store.temp_points:
+                return None
+            # Créer un chunk même s'il est plus petit que CHUNK_SIZE
+            chunk_id, chunk_data = self._create_chunk(
+                store, chunk_size=min(len(store.temp_points), self.CHUNK_SIZE)
+            )
+            self._publish_snapshot(store)
+        self._notify_readers(store)
+        return chunk_id
+    
+    def query_region(self, session_id, region):
+        """Chunks (forme de rattrapage) dont l'AABB recoupe une région, sans lire les points
+        
+        Args:
+            region: BoxRegion, SphereRegion ou FrustumRegion (SpatialIndex.py)
+        
+        Returns:
+            list: (metadata, slam_data) triés par séquence
+        """
+        store = self._sessions.get(session_id)
+        if store is None:
+            return []
+        snapshot = store.snapshot
+        bbox_min, bbox_max = region.bounds()
+        positions = sorted(filter(lambda position: position is not None, (
+            snapshot.view_position(chunk_id) for chunk_id in store.spatial_index.candidates(bbox_min, bbox_max)
+        )))
+        result = []
+        for position in positions:
+            metadata, slam_data = snapshot.view.entries[position]
+            if region.intersects_aabb(metadata.bbox_min, metadata.bbox_max):
+                result.append((metadata, slam_data))
+        return result
+    
+    def get_chunk_ids_for_keyframes(self, session_id, keyframe_ids):
+        """IDs des chunks d'origine contenant des points des keyframes demandées (ordre de séquence)"""
+        store = self._sessions.get(session_id)
+        if store is None:
+            return []
+        keyframe_chunks, snapshot = store.keyframe_chunks, store.snapshot
+        chunk_ids = {chunk_id for keyframe_id in keyframe_ids for chunk_id in keyframe_chunks.get(keyframe_id, ())}
+        entries = {chunk_id: snapshot.entry(chunk_id) for chunk_id in chunk_ids}
+        return sorted(chunk_ids, key=lambda chunk_id: entries[chunk_id][0].sequence_number if entries[chunk_id] else -1)
+    
+    def get_entries_for_keyframes(self, session_id, keyframe_ids):
+        """Chunks d'origine (metadata, slam_data) contenant des points des keyframes demandées"""
+        snapshot = self._snapshot(session_id)
+        entries = (snapshot.entry(chunk_id) for chunk_id in self.get_chunk_ids_for_keyframes(session_id, keyframe_ids))
+        return [entry for entry in entries if entry is not None]
+    
+    def apply_pose_corrections(self, session_id, poses):
+        """Applique des poses corrigées (fermeture de boucle) sans toucher aux points stockés
+        
+        Les points des chunks sont en repère keyframe: seules les métadonnées
+        dérivées de la géométrie monde (AABB, index spatial, pyramide de
+        niveaux de détail) sont recalculées pour les chunks concernés.
+        
+        Args:
+            poses: dict keyframe_id -> Pose (keyframe -> monde)
+        
+        Returns:
+            tuple: (révision, IDs des chunks d'origine concernés)
+        """
+        store = self._get_store(session_id)
+        with store.lock:
+            old_corrections = store.pose_corrections
+            new_corrections = {**old_corrections, **poses}
+            revision = store.pose_revision + 1
+            
+            entries = self.get_entries_for_keyframes(store.session_id, list(poses))
+            for metadata, slam_data in entries:
+                old_xyzrgb = world_xyzrgb(slam_data, old_corrections)
+                new_xyzrgb = world_xyzrgb(slam_data, new_corrections)
+                store.lod.remove_xyzrgb(old_xyzrgb)
+                store.lod.add_xyzrgb(new_xyzrgb)
+                self._update_bounds(store, metadata, bounds_from_xyz(new_xyzrgb[:, :3]))
+            
+            # Chunks compactés de la vue contenant ces keyframes
+            keyframes = set(poses)
+            for metadata, slam_data in store.view.live_entries():
+                if (len(metadata.source_chunk_ids) > 1 and slam_data.local_coordinates
+                        and keyframes.intersection(metadata.keyframe_ids)):
+                    self._update_bounds(store, metadata,
+                                        bounds_from_xyz(world_xyzrgb(slam_data, new_corrections)[:, :3]))
+            
+            store.spatial_index.publish()
+            store.pose_corrections = new_corrections
+            store.correction_revisions = {**store.correction_revisions, **dict.fromkeys(poses, revision)}
+            store.pose_revision = revision
+            self._persist_pose_corrections(store, poses, revision)
+        self._notify_readers(store)
+        
+        logger.info(f"[{store.session_id}] Correction de poses #{revision}: {len(poses)} keyframes, "
+                    f"{len(entries)} chunks concernés")
+        return revision, [metadata.chunk_id for metadata, _ in entries]
+    
+    def _update_bounds(self, store, metadata, bounds):
+        """Remplace l'AABB d'un chunk après correction de pose (surchargé par les autres backends)"""
+        metadata.bbox_min, metadata.bbox_max, metadata.centroid, _ = bounds
+        if metadata.bbox_min is not None:
+            store.spatial_index.update(metadata.chunk_id, metadata.bbox_min, metadata.bbox_max)
+        else:
+            store.spatial_index.remove(metadata.chunk_id)
+    
+    def _persist_pose_corrections(self, store, poses, revision):
+        """Rend les corrections durables (rien à faire pour le cache mémoire)"""
+        pass
+    
+    def get_pose_corrections(self, session_id, after_revision=0):
+        """Poses corrigées depuis une révision: (révision courante, {keyframe_id: Pose})"""
+        store = self._sessions.get(session_id)
+        if store is None:
+            return 0, {}
+        revision, corrections, revisions = store.pose_revision, store.pose_corrections, store.correction_revisions
+        return revision, {keyframe_id: pose for keyframe_id, pose in corrections.items()
+                          if revisions.get(keyframe_id, 0) > after_revision}
+    
+    def get_keyframe_corrections(self, session_id):
+        """Toutes les poses corrigées d'une session (keyframe_id -> Pose), lecture sans verrou"""
+        store = self._sessions.get(session_id)
+        return store.pose_corrections if store is not None else {}
+    
+    def get_world_chunk(self, session_id, slam_data):
+        """Chunk stocké en coordonnées monde, converti une fois par révision de correction de ses keyframes
+        
+        La copie est partagée par tous les clients sans repère local: un
+        chunk n'est re-transformé qu'après une correction de l'une de ses
+        keyframes. Réservé aux chunks du cache (pas aux copies échantillonnées
+        ou regroupées, qui gardent le chunk_id d'origine ou en ont un éphémère).
+        """
+        if not slam_data.local_coordinates:
+            return slam_data
+        store = self._sessions.get(session_id)
+        if store is None:
+            return to_world_slam_data(slam_data)
+        # Révisions lues avant les poses (remplacées dans l'autre ordre par l'écrivain)
+        revisions = store.correction_revisions
+        revision = max((revisions.get(keyframe_id, 0) for keyframe_id in slam_data.indexlist.index), default=0)
+        cached = store.world_chunks.get(slam_data.chunk_id)
+        if cached is not None and cached[0] == revision:
+            return cached[1]
+        world = to_world_slam_data(slam_data, store.pose_corrections)
+        if len(store.world_chunks) >= 2 * self.MAX_CHUNKS:
+            store.world_chunks.clear()  # chunks évincés pendant une conversion: repartir d'un cache vide
+        store.world_chunks[slam_data.chunk_id] = (revision, world)
+        return world
+    
+    def get_lod_pyramid(self, session_id):
+        """Pyramide de niveaux de détail d'une session (None si la session est inconnue)"""
+        store = self._sessions.get(session_id)
+        return store.lod if store is not None else None
     
     def get_all_chunks_for_session(self, session_id):
         """Récupère tous les chunks d'une session dans l'ordre"""
-        with self._lock:
-            session_chunks = []
-            for chunk_id, (metadata, slam_data) in self._chunks.items():
-                if metadata.session_id == session_id:
-                    session_chunks.append((metadata.sequence_number, slam_data))
-            
-            # Trier par numéro de séquence
-            session_chunks.sort(key=lambda x: x[0])
-            return [slam_data for _, slam_data in session_chunks]
+        return self.get_chunks_after_sequence(-1, session_id)
     
-    def get_stats(self):
-        """Retourne les statistiques du cache"""
-        with self._lock:
-            total_points = sum(metadata.point_count for metadata, _ in self._chunks.values())
-            return {
-                'total_chunks': len(self._chunks),
-                'total_points': total_points,
-                'unique_voxels': len(self._voxel_cache),
-                'sequence_number': self._sequence_counter,
-                'pending_points': len(self._temp_points),
-                'session_info': self._session_manager.get_session_info()
-            }
+    def get_stats(self, session_id=None):
+        """Retourne les statistiques du cache (toutes sessions confondues si session_id est None)"""
+        session_ids = [session_id] if session_id else list(self._sessions)
+        stores = [self._sessions[sid] for sid in session_ids if sid in self._sessions]
+        total_chunks = total_points = unique_voxels = pending_points = sequence_number = size_bytes = 0
+        outliers_removed = 0
+        for store in stores:
+            # Lecture sans verrou: snapshot immuable + tailles approximatives de l'écrivain
+            snapshot = store.snapshot
+            total_chunks += len(snapshot)
+            total_points += snapshot.total_points
+            size_bytes += snapshot.size_bytes
+            unique_voxels += len(store.voxel_cache)
+            pending_points += len(store.temp_points)
+            outliers_removed += store.outliers_removed
+            sequence_number = max(sequence_number, store.sequence_counter)
+        return {
+            'total_chunks': total_chunks,
+            'total_points': total_points,
+            'unique_voxels': unique_voxels,
+            'sequence_number': sequence_number,
+            'pending_points': pending_points,
+            'outliers_removed': outliers_removed,
+            'cache_size_mb': size_bytes / (1024 * 1024),
+            'catchup_bundle_mb': sum(store.bundle.size_bytes for store in stores) / (1024 * 1024),
+            'sessions': len(stores),
+            'session_info': self._session_manager.get_session_info(session_id)
+        }
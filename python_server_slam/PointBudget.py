@@ -0,0 +1,153 @@
+# PointBudget.py - Budget de points par client: échantillonnage et directives replace / drop
+import os
+import sys
+
+import numpy as np
+
+from utils import world_xyzrgb
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+gen_python_path = os.path.join(current_dir, '..', 'proto_files_slam')
+sys.path.append(gen_python_path)
+
+import pointcloud_pb2
+
+
+def stratified_indices(xyz, count, seed=0):
+    """Indices de `count` points répartis uniformément dans l'espace
+
+    Un point par cellule d'une grille dont la taille est réduite jusqu'à
+    avoir au moins `count` cellules occupées, puis tirage parmi ces
+    représentants (déterministe pour une même graine).
+    """
+    n = len(xyz)
+    if count >= n:
+        return np.arange(n)
+    if count <= 0:
+        return np.empty(0, dtype=np.int64)
+    extent = np.maximum(xyz.max(axis=0) - xyz.min(axis=0), 1e-6)
+    cell = float(np.prod(extent) / count) ** (1.0 / 3.0)
+    origin = xyz.min(axis=0)
+    for _ in range(16):
+        keys = np.floor((xyz - origin) / cell).astype(np.int64)
+        _, first = np.unique(keys, axis=0, return_index=True)
+        if len(first) >= count:
+            break
+        cell *= 0.7
+    rng = np.random.default_rng(seed)
+    if len(first) >= count:
+        return np.sort(rng.choice(first, size=count, replace=False))
+    # Grille trop fine pour séparer les points (doublons): compléter au hasard
+    rest = np.setdiff1d(np.arange(n), first)
+    return np.sort(np.concatenate((first, rng.choice(rest, size=count - len(first), replace=False))))
+
+
+def sample_slam_data(slam_data, count, seed=0, corrections=None):
+    """Copie de SlamData réduite à `count` points échantillonnés uniformément dans l'espace (monde)"""
+    pointclouds = slam_data.pointcloudlist.pointclouds
+    xyz = world_xyzrgb(slam_data, corrections)[:, :3]
+    keep = np.zeros(len(xyz), dtype=bool)
+    keep[stratified_indices(xyz, count, seed)] = True
+
+    sampled = type(slam_data)()
+    sampled.CopyFrom(slam_data)
+    del sampled.pointcloudlist.pointclouds[:]
+    offset = 0
+    for pc in pointclouds:
+        mask = keep[offset:offset + len(pc.points)]
+        offset += len(pc.points)
+        new_pc = sampled.pointcloudlist.pointclouds.add()
+        new_pc.points.extend(point for point, kept in zip(pc.points, mask) if kept)
+    return sampled
+
+
+class PointBudgetPlanner:
+    """Répartit un budget de points entre les chunks d'une session pour un client
+
+    Chaque chunk reçoit une fraction min(1, s * importance) de ses points,
+    où l'importance décroît avec la distance au point de vue (1 sans point
+    de vue) et s est choisi pour que le total tienne dans le budget. Quand
+    la carte grandit, les chunks déjà envoyés au-delà de leur nouvelle part
+    sont renvoyés allégés (CHUNK_REPLACE) ou retirés (CHUNK_DROP) avant
+    l'envoi des nouveaux chunks: le client ne dépasse jamais le budget.
+    """
+    def __init__(self, budget, viewpoint=None, falloff=5.0, min_points=16):
+        self.budget = int(budget)
+        self.viewpoint = viewpoint
+        self.falloff = float(falloff)   # distance (m) à laquelle la densité est divisée par 2
+        self.min_points = min_points    # en dessous, le chunk n'est pas envoyé
+        self.known = {}                 # chunk_id -> metadata des chunks de la session
+        self.sent = {}                  # chunk_id -> nombre de points chez le client
+
+    def _importance(self, metadata):
+        if self.viewpoint is None or metadata.centroid is None:
+            return 1.0
+        distance = float(np.linalg.norm(np.asarray(metadata.centroid) - self.viewpoint.position))
+        return 1.0 / (1.0 + (distance / self.falloff) ** 2)
+
+    def allocate(self):
+        """chunk_id -> nombre de points alloués (somme <= budget)"""
+        if not self.known:
+            return {}
+        chunk_ids = list(self.known)
+        counts = np.array([self.known[chunk_id].point_count for chunk_id in chunk_ids], dtype=np.float64)
+        importance = np.array([self._importance(self.known[chunk_id]) for chunk_id in chunk_ids])
+        if counts.sum() <= self.budget:
+            quotas = counts
+        else:
+            # Recherche dichotomique de s tel que sum(counts * min(1, s * importance)) = budget
+            low, high = 0.0, 1.0 / importance.min()
+            for _ in range(40):
+                s = (low + high) / 2
+                if np.sum(counts * np.minimum(1.0, s * importance)) > self.budget:
+                    high = s
+                else:
+                    low = s
+            quotas = np.floor(counts * np.minimum(1.0, low * importance))
+        quotas[quotas < self.min_points] = 0
+        return dict(zip(chunk_ids, quotas.astype(np.int64).tolist()))
+
+    def plan(self, new_metadata):
+        """Intègre de nouveaux chunks et retourne les directives à appliquer, dans l'ordre
+
+        Returns:
+            list: (directive, chunk_id, nombre de points) avec directive parmi
+            CHUNK_DROP / CHUNK_REPLACE (réductions, d'abord) et CHUNK_ADD
+        """
+        for metadata in new_metadata:
+            self.known[metadata.chunk_id] = metadata
+        quotas = self.allocate()
+
+        additions = [(metadata.chunk_id, quotas[metadata.chunk_id]) for metadata in new_metadata
+                     if metadata.chunk_id not in self.sent and quotas[metadata.chunk_id] > 0]
+        projected = sum(self.sent.values()) + sum(count for _, count in additions)
+
+        directives = []
+        excess = sorted(
+            ((sent - quotas.get(chunk_id, 0), chunk_id) for chunk_id, sent in self.sent.items()
+             if sent > quotas.get(chunk_id, 0)),
+            reverse=True
+        )
+        for delta, chunk_id in excess:
+            if projected <= self.budget:
+                break
+            quota = quotas.get(chunk_id, 0)
+            directives.append((pointcloud_pb2.CHUNK_REPLACE if quota else pointcloud_pb2.CHUNK_DROP, chunk_id, quota))
+            projected -= delta
+        directives.extend((pointcloud_pb2.CHUNK_ADD, chunk_id, count) for chunk_id, count in additions)
+        return directives
+
+    def applied(self, directive, chunk_id, count):
+        """Enregistre une directive effectivement envoyée au client"""
+        if directive == pointcloud_pb2.CHUNK_DROP:
+            self.sent.pop(chunk_id, None)
+        else:
+            self.sent[chunk_id] = count
+
+    def forget(self, chunk_id):
+        """Chunk disparu du cache (éviction): il ne compte plus dans la répartition"""
+        self.known.pop(chunk_id, None)
+
+    @property
+    def points_sent(self):
+        return sum(self.sent.values())
@@ -1,3 +1,4 @@
+import itertools
 import threading
 import time
 from datetime import datetime
@@ -17,33 +18,96 @@ formatter = logging.Formatter('[%(asctime)s][%(name)s][%(levelname)s] %(message)
 handler.setFormatter(formatter)
 logger.handlers = [handler]
 
-# session manager simplifié
+# session manager multi-sessions
 class SessionManager:
-    """Gère simplement les informations de session en mémoire"""
+    """Gère les informations de session en mémoire, indexées par session_id
+
+    Plusieurs sessions (un robot par session) peuvent être actives en même
+    temps. La session "courante" est la dernière mise à jour : c'est elle qui
+    est utilisée quand aucun session_id n'est précisé.
+
+    Chaque changement incrémente une version commune à toutes les sessions
+    et appelle les listeners avec le session_id concerné (hors verrou) : les
+    flux WatchSession et StreamSession sont poussés au lieu d'être interrogés.
+    """
     
     def __init__(self):
         self._lock = threading.RLock()
-        # Stocker les informations de session
-        self._session_id = ""
-        self._start_time = ""
-        self._is_active = False
-        self._clients_connected = 0
+        self._changed = threading.Condition(self._lock)
+        # session_id -> {'start_time', 'is_active', 'clients_connected', 'last_activity_ms'}
+        self._sessions = {}
+        self._current_session_id = ""
+        self._versions = itertools.count(1)
+        self.version = next(self._versions)
+        self._change_listeners = []  # callback(session_id) appelés après chaque changement
         
         logger.info("SessionManager initialisé")
     
-    def get_session_info(self):
-        """Retourne les informations de session actuelles"""
-        with self._lock:
+    def _resolve(self, session_id):
+        return self._current_session_id if session_id is None else session_id
+    
+    def _info(self, session_id):
+        session = self._sessions.get(session_id)
+        if session is None:
             return {
-                'session_id': self._session_id,
-                'start_time': self._start_time,
-                'is_active': self._is_active,
-                'clients_connected': self._clients_connected
+                'session_id': "",
+                'start_time': "",
+                'is_active': False,
+                'clients_connected': 0,
+                'last_activity_ms': 0
             }
+        return {
+            'session_id': session_id,
+            'start_time': session['start_time'],
+            'is_active': session['is_active'],
+            'clients_connected': session['clients_connected'],
+            'last_activity_ms': session.get('last_activity_ms', 0)
+        }
+    
+    # --- Notifications de changement ---
+    
+    def add_change_listener(self, callback):
+        """Enregistre callback(session_id), appelé hors verrou après chaque changement d'une session"""
+        self._change_listeners.append(callback)
+    
+    def wait_for_change(self, version, timeout=None):
+        """Bloque jusqu'à un changement postérieur à `version` (toutes sessions), retourne la version courante"""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+    
+    def notify_change(self, session_id=None):
+        """Signale un changement d'une session (aussi pour les données tenues ailleurs: nombre de chunks)"""
+        with self._changed:
+            session_id = self._resolve(session_id)
+            self.version = next(self._versions)
+            self._changed.notify_all()
+        for listener in self._change_listeners:
+            listener(session_id)
+    
+    def get_session_info(self, session_id=None):
+        """Retourne les informations d'une session (la session courante par défaut)"""
+        with self._lock:
+            return self._info(self._resolve(session_id))
+    
+    def get_current_session_id(self):
+        """Retourne l'ID de la session courante"""
+        with self._lock:
+            return self._current_session_id
+    
+    def list_sessions(self):
+        """Retourne les informations de toutes les sessions connues"""
+        with self._lock:
+            return [self._info(session_id) for session_id in self._sessions]
+    
+    def get_active_session_ids(self):
+        """Retourne les IDs des sessions actives"""
+        with self._lock:
+            return [session_id for session_id, session in self._sessions.items() if session['is_active']]
     
     def update_session_info(self, session_id, start_time, is_active, clients_connected):
         """
-        Met à jour les informations de session
+        Met à jour les informations d'une session et en fait la session courante
         
         Args:
             session_id (str): ID de session
@@ -52,18 +116,22 @@ class SessionManager:
             clients_connected (int): Nombre de clients connectés
         """
         with self._lock:
-            logger.info(f"Mise à jour SessionInfo:")
-            logger.info(f"  - Session ID: '{self._session_id}' -> '{session_id}'")
-            logger.info(f"  - Start Time: '{self._start_time}' -> '{start_time}'")
-            logger.info(f"  - Is Active: {self._is_active} -> {is_active}")
-            logger.info(f"  - Clients Connected: {self._clients_connected} -> {clients_connected}")
+            previous = self._info(session_id)
+            logger.info(f"Mise à jour SessionInfo '{session_id}':")
+            logger.info(f"  - Start Time: '{previous['start_time']}' -> '{start_time}'")
+            logger.info(f"  - Is Active: {previous['is_active']} -> {is_active}")
+            logger.info(f"  - Clients Connected: {previous['clients_connected']} -> {clients_connected}")
             
-            self._session_id = session_id
-            self._start_time = start_time
-            self._is_active = is_active
-            self._clients_connected = clients_connected
+            self._sessions[session_id] = {
+                'start_time': start_time,
+                'is_active': is_active,
+                'clients_connected': clients_connected,
+                'last_activity_ms': previous['last_activity_ms']
+            }
+            self._current_session_id = session_id
             
             logger.info("SessionInfo mis à jour avec succès")
+        self.notify_change(session_id)
     
     def update_from_proto(self, session_info_proto):
         """
@@ -79,52 +147,100 @@ class SessionManager:
             session_info_proto.clients_connected
         )
     
-    def clear_session(self):
-        """Efface toutes les informations de session"""
+    def clear_session(self, session_id=None):
+        """Efface les informations d'une session (la session courante par défaut)"""
         with self._lock:
-            logger.info("Effacement des informations de session")
-            self._session_id = ""
-            self._start_time = ""
-            self._is_active = False
-            self._clients_connected = 0
+            session_id = self._resolve(session_id)
+            logger.info(f"Effacement des informations de session '{session_id}'")
+            self._sessions.pop(session_id, None)
+            if session_id == self._current_session_id:
+                # Repli sur une autre session active s'il y en a une
+                active = [sid for sid, session in self._sessions.items() if session['is_active']]
+                self._current_session_id = active[-1] if active else ""
+        self.notify_change(session_id)
     
     def set_session_id(self, session_id):
-        """Met à jour uniquement l'ID de session"""
+        """Renomme la session courante"""
         with self._lock:
-            logger.debug(f"Mise à jour session ID: '{self._session_id}' -> '{session_id}'")
-            self._session_id = session_id
+            logger.debug(f"Mise à jour session ID: '{self._current_session_id}' -> '{session_id}'")
+            session = self._sessions.pop(self._current_session_id, None)
+            if session is not None:
+                self._sessions[session_id] = session
+            self._current_session_id = session_id
+        self.notify_change(session_id)
     
-    def set_active_state(self, is_active):
-        """Met à jour uniquement l'état actif"""
+    def has_session(self, session_id):
+        """La session est connue (créée par update_session_info, pas encore effacée)"""
         with self._lock:
-            logger.debug(f"Mise à jour état actif: {self._is_active} -> {is_active}")
-            self._is_active = is_active
+            return session_id in self._sessions
     
-    def set_clients_count(self, clients_connected):
-        """Met à jour uniquement le nombre de clients"""
+    def set_active_state(self, is_active, session_id=None):
+        """Met à jour uniquement l'état actif (ignoré pour une session inconnue)"""
         with self._lock:
-            logger.debug(f"Mise à jour clients connectés: {self._clients_connected} -> {clients_connected}")
-            self._clients_connected = clients_connected
+            session = self._sessions.get(self._resolve(session_id))
+            if session is None:
+                return
+            logger.debug(f"Mise à jour état actif: {session['is_active']} -> {is_active}")
+            session['is_active'] = is_active
+        self.notify_change(session_id)
     
-    def increment_clients(self):
-        """Incrémente le nombre de clients connectés"""
+    def set_clients_count(self, clients_connected, session_id=None):
+        """Met à jour uniquement le nombre de clients (ignoré pour une session inconnue)
+        
+        Un flux ouvert avant la session, ou qui se termine après son
+        effacement, ne recrée pas d'entrée: le compte est repris de
+        l'appelant quand la session est (re)créée.
+        """
+        with self._lock:
+            session = self._sessions.get(self._resolve(session_id))
+            if session is None:
+                return
+            logger.debug(f"Mise à jour clients connectés: {session['clients_connected']} -> {clients_connected}")
+            session['clients_connected'] = clients_connected
+        self.notify_change(session_id)
+    
+    def increment_clients(self, session_id=None):
+        """Incrémente le nombre de clients connectés (0 pour une session inconnue)"""
         with self._lock:
-            self._clients_connected += 1
-            logger.debug(f"Client ajouté, total: {self._clients_connected}")
-            return self._clients_connected
+            session = self._sessions.get(self._resolve(session_id))
+            if session is None:
+                return 0
+            session['clients_connected'] += 1
+            logger.debug(f"Client ajouté, total: {session['clients_connected']}")
+            count = session['clients_connected']
+        self.notify_change(session_id)
+        return count
     
-    def decrement_clients(self):
+    def decrement_clients(self, session_id=None):
         """Décrémente le nombre de clients connectés"""
         with self._lock:
-            if self._clients_connected > 0:
-                self._clients_connected -= 1
-            logger.debug(f"Client retiré, total: {self._clients_connected}")
-            return self._clients_connected
+            session_id = self._resolve(session_id)
+            session = self._sessions.get(session_id)
+            if session is None:
+                return 0
+            if session['clients_connected'] > 0:
+                session['clients_connected'] -= 1
+            logger.debug(f"Client retiré, total: {session['clients_connected']}")
+            count = session['clients_connected']
+        self.notify_change(session_id)
+        return count
+    
+    def record_activity(self, session_id, timestamp_ms):
+        """Dernière donnée reçue du producteur, False pour une session inconnue (ignoré)"""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return False
+            session['last_activity_ms'] = timestamp_ms
+        self.notify_change(session_id)
+        return True
     
     def __str__(self):
         """Représentation string du SessionManager"""
         with self._lock:
-            return (f"SessionManager(id='{self._session_id}', "
-                   f"active={self._is_active}, "
-                   f"clients={self._clients_connected}, "
-                   f"start='{self._start_time}')")
+            info = self._info(self._current_session_id)
+            return (f"SessionManager(id='{info['session_id']}', "
+                   f"active={info['is_active']}, "
+                   f"clients={info['clients_connected']}, "
+                   f"start='{info['start_time']}', "
+                   f"sessions={len(self._sessions)})")
@@ -0,0 +1,112 @@
+# SessionTimeline.py - Journal ordonné des événements de chaque session (flux multiplexé StreamSession)
+import bisect
+import threading
+
+# Types d'événements: référence associée
+# 'chunks'     -> dernière séquence scellée
+# 'poses'      -> index de la PoseList dans le buffer de poses de la session
+# 'correction' -> révision des corrections de poses
+# 'session'    -> None (l'état courant est lu dans le SessionManager)
+EVENT_KINDS = ('chunks', 'poses', 'correction', 'session')
+
+
+class SessionJournal:
+    """Événements d'une session, dans l'ordre où le serveur les a vus
+
+    Le journal ne garde que des références (séquence, index, révision) :
+    les données restent dans le cache et les buffers de poses. Un flux
+    relit le journal depuis son tick et envoie géométrie, trajectoire et
+    événements de session dans ce même ordre.
+
+    Au-delà de max_events, les événements les plus anciens sont compactés :
+    seul le dernier de chaque type est gardé, avec son tick. Les références
+    sont cumulatives (dernière séquence, dernier index de poses, dernière
+    révision), un flux en retard rattrape donc tout ce qu'il a manqué sur
+    ces événements, seul l'entrelacement fin des plus anciens est perdu.
+    """
+    def __init__(self, session_id, max_events=4096):
+        self.session_id = session_id
+        self.max_events = max_events
+        self.closed = False  # session nettoyée: le flux doit repartir d'un nouveau journal
+        self._events = []    # (tick, type, référence), ticks croissants
+        self._ticks = []     # tick de chaque événement de _events (recherche dichotomique)
+        self._last_tick = 0
+        self._changed = threading.Condition()
+
+    @property
+    def tick(self):
+        return self._last_tick
+
+    def append(self, kind, ref=None):
+        """Ajoute un événement, retourne son tick (à partir de 1)"""
+        with self._changed:
+            self._last_tick += 1
+            self._events.append((self._last_tick, kind, ref))
+            self._ticks.append(self._last_tick)
+            if len(self._events) > self.max_events:
+                self._compact()
+            self._changed.notify_all()
+            return self._last_tick
+
+    def _compact(self):
+        """Réduit la plus ancienne moitié du journal au dernier événement de chaque type"""
+        keep = self.max_events // 2
+        latest = {kind: (tick, kind, ref) for tick, kind, ref in self._events[:-keep]}
+        self._events = sorted(latest.values()) + self._events[-keep:]
+        self._ticks = [tick for tick, _, _ in self._events]
+
+    def events_after(self, tick):
+        """Événements postérieurs à `tick`: [(tick, type, référence)]"""
+        with self._changed:
+            return self._events[bisect.bisect_right(self._ticks, tick):]
+
+    def wait(self, tick, timeout=None):
+        """Bloque jusqu'à un événement après `tick`, la fermeture du journal ou le délai"""
+        with self._changed:
+            self._changed.wait_for(lambda: self._last_tick > tick or self.closed, timeout)
+
+    def close(self):
+        with self._changed:
+            self.closed = True
+            self._changed.notify_all()
+
+
+class SessionTimeline:
+    """Journaux des sessions, créés à la demande
+
+    publish() est appelé par les sources (scellement de chunks, PoseList
+    reçue, correction de poses, changement d'état de session) au moment où
+    l'événement se produit : le tick attribué fixe l'ordre commun de tous
+    les clients. clear() ferme le journal d'une session nettoyée.
+    """
+    def __init__(self, max_events=4096):
+        self.max_events = max_events  # événements gardés par journal avant compaction
+        self._lock = threading.Lock()
+        self._journals = {}  # session_id -> SessionJournal
+        self._change_listeners = []  # callback(session_id) après chaque publication ou fermeture
+
+    def add_change_listener(self, callback):
+        self._change_listeners.append(callback)
+
+    def journal(self, session_id):
+        with self._lock:
+            journal = self._journals.get(session_id)
+            if journal is None:
+                journal = self._journals[session_id] = SessionJournal(session_id, self.max_events)
+            return journal
+
+    def publish(self, session_id, kind, ref=None):
+        if kind not in EVENT_KINDS:
+            raise ValueError(f"Type d'événement inconnu: {kind}")
+        tick = self.journal(session_id).append(kind, ref)
+        for listener in self._change_listeners:
+            listener(session_id)
+        return tick
+
+    def clear(self, session_id):
+        with self._lock:
+            journal = self._journals.pop(session_id, None)
+        if journal is not None:
+            journal.close()
+            for listener in self._change_listeners:
+                listener(session_id)
@@ -0,0 +1,283 @@
+# SpatialIndex.py - Index spatial des chunks (grille uniforme) et régions de requête
+import heapq
+import itertools
+import math
+import threading
+
+import numpy as np
+
+
+class BoxRegion:
+    """Boîte alignée sur les axes [min, max]"""
+    def __init__(self, bbox_min, bbox_max):
+        self.bbox_min = np.asarray(bbox_min, dtype=np.float64)
+        self.bbox_max = np.asarray(bbox_max, dtype=np.float64)
+
+    def bounds(self):
+        return self.bbox_min, self.bbox_max
+
+    def intersects_aabb(self, bbox_min, bbox_max):
+        return bool(np.all(self.bbox_min <= bbox_max) and np.all(np.asarray(bbox_min) <= self.bbox_max))
+
+    def contains(self, xyz):
+        """Masque booléen des points (N, 3) dans la région"""
+        return np.all((xyz >= self.bbox_min) & (xyz <= self.bbox_max), axis=1)
+
+
+class SphereRegion:
+    """Sphère de centre `center` et de rayon `radius`"""
+    def __init__(self, center, radius):
+        self.center = np.asarray(center, dtype=np.float64)
+        self.radius = float(radius)
+
+    def bounds(self):
+        return self.center - self.radius, self.center + self.radius
+
+    def intersects_aabb(self, bbox_min, bbox_max):
+        closest = np.clip(self.center, bbox_min, bbox_max)
+        return float(np.sum((closest - self.center) ** 2)) <= self.radius ** 2
+
+    def contains(self, xyz):
+        return np.sum((xyz - self.center) ** 2, axis=1) <= self.radius ** 2
+
+
+class FrustumRegion:
+    """Frustum de caméra
+
+    `pose` est la matrice 4x4 caméra -> monde (ligne par ligne, comme
+    Pose.matrix). La caméra regarde selon +Z, X à droite, Y en bas
+    (convention SLAM/OpenCV). `fov_y` est le champ de vision vertical en
+    degrés, `aspect` le rapport largeur / hauteur.
+    """
+    def __init__(self, pose, fov_y, aspect, near, far):
+        pose = np.asarray(pose, dtype=np.float64).reshape(4, 4)
+        self.rotation = pose[:3, :3]
+        self.position = pose[:3, 3]
+        self.near = float(near)
+        self.far = float(far)
+        self.tan_y = math.tan(math.radians(fov_y) / 2.0)
+        self.tan_x = self.tan_y * float(aspect)
+        self.corners = self._corners()
+        self.planes = self._planes()
+
+    def _corners(self):
+        corners = []
+        for depth in (self.near, self.far):
+            for sx in (-1.0, 1.0):
+                for sy in (-1.0, 1.0):
+                    local = np.array([sx * self.tan_x * depth, sy * self.tan_y * depth, depth])
+                    corners.append(self.rotation @ local + self.position)
+        return np.array(corners)
+
+    def _planes(self):
+        """6 plans (normale intérieure n, d) tels que n.x + d >= 0 à l'intérieur"""
+        local_normals = [
+            np.array([0.0, 0.0, 1.0]),                    # near
+            np.array([0.0, 0.0, -1.0]),                   # far
+            np.array([1.0, 0.0, self.tan_x]),             # gauche
+            np.array([-1.0, 0.0, self.tan_x]),            # droite
+            np.array([0.0, 1.0, self.tan_y]),             # haut
+            np.array([0.0, -1.0, self.tan_y]),            # bas
+        ]
+        local_offsets = [-self.near, self.far, 0.0, 0.0, 0.0, 0.0]
+        planes = []
+        for normal, offset in zip(local_normals, local_offsets):
+            world_normal = self.rotation @ normal
+            planes.append((world_normal, offset - float(world_normal @ self.position)))
+        return planes
+
+    def bounds(self):
+        return self.corners.min(axis=0), self.corners.max(axis=0)
+
+    def intersects_aabb(self, bbox_min, bbox_max):
+        """Test conservatif: rejette la boîte si elle est entièrement hors d'un plan"""
+        for normal, offset in self.planes:
+            p_vertex = np.where(normal >= 0, bbox_max, bbox_min)
+            if float(normal @ p_vertex) + offset < 0:
+                return False
+        return True
+
+    def contains(self, xyz):
+        local = (xyz - self.position) @ self.rotation  # R^T (p - t)
+        z = local[:, 2]
+        return ((z >= self.near) & (z <= self.far) &
+                (np.abs(local[:, 0]) <= z * self.tan_x) &
+                (np.abs(local[:, 1]) <= z * self.tan_y))
+
+
+class Viewpoint:
+    """Point de vue d'un client pour prioriser l'envoi des chunks
+
+    Modes: 'distance' (centroïde le plus proche d'abord) ou 'visibility'
+    (chunks dans le cône de vision d'abord, puis les autres, chacun par
+    distance).
+    """
+    def __init__(self, position, direction=None, fov=90.0, mode='distance'):
+        self.position = np.asarray(position, dtype=np.float64)
+        self.direction = None
+        if direction is not None:
+            direction = np.asarray(direction, dtype=np.float64)
+            norm = np.linalg.norm(direction)
+            self.direction = direction / norm if norm > 0 else None
+        self.cos_half_fov = math.cos(math.radians(fov) / 2.0)
+        self.mode = mode
+
+    @classmethod
+    def from_pose(cls, pose, fov=90.0, mode='visibility'):
+        """Depuis une matrice 4x4 caméra -> monde (caméra regardant selon +Z)"""
+        pose = np.asarray(pose, dtype=np.float64).reshape(4, 4)
+        return cls(pose[:3, 3], pose[:3, 2], fov=fov, mode=mode)
+
+    def priority(self, metadata):
+        """Clé de tri (plus petit = envoyé en premier)"""
+        if metadata.centroid is None:
+            return (2, 0.0)
+        offset = np.asarray(metadata.centroid) - self.position
+        distance = float(np.linalg.norm(offset))
+        if self.mode != 'visibility' or self.direction is None:
+            return (0, distance)
+        # Visible si le centroïde est dans le cône ou si l'AABB contient la caméra
+        inside = (metadata.bbox_min is not None and
+                  np.all(self.position >= metadata.bbox_min) and np.all(self.position <= metadata.bbox_max))
+        visible = inside or (distance > 0 and float(offset @ self.direction) / distance >= self.cos_half_fov)
+        return (0 if visible else 1, distance)
+
+
+def iter_by_priority(entries, priority, max_queue=1024):
+    """Parcourt les entrées par priorité croissante avec une file bornée
+
+    Les entrées sont consommées dans leur ordre d'origine (séquence) et
+    placées dans un tas d'au plus max_queue éléments : dès que le tas est
+    plein, la meilleure entrée est émise. L'ordre est exact si
+    len(entries) <= max_queue, et la mémoire reste bornée sinon.
+    """
+    heap = []
+    counter = itertools.count()  # départage stable à priorité égale
+    for entry in entries:
+        heapq.heappush(heap, (priority(entry), next(counter), entry))
+        if len(heap) > max_queue:
+            yield heapq.heappop(heap)[2]
+    while heap:
+        yield heapq.heappop(heap)[2]
+
+
+class ChunkSpatialIndex:
+    """Index spatial des chunks par hachage sur une grille uniforme
+
+    Chaque chunk est enregistré dans toutes les cellules que couvre son AABB.
+    L'écrivain modifie des ensembles par cellule et note les cellules
+    touchées, publish() gèle uniquement celles-ci dans la table lue par les
+    lecteurs (sans verrou) : un insert coûte le nombre de cellules couvertes,
+    pas leur population. Les chunks couvrant trop de cellules sont gardés à
+    part et toujours renvoyés comme candidats.
+    """
+    def __init__(self, cell_size=4.0, max_cells_per_chunk=512):
+        self.cell_size = float(cell_size)
+        self.max_cells_per_chunk = max_cells_per_chunk
+        self._cells = {}            # (i, j, k) -> set(chunk_id), côté écrivain
+        self._large = set()         # chunks couvrant plus de max_cells_per_chunk cellules
+        self._chunk_cells = {}      # chunk_id -> liste des cellules (None pour les grands chunks)
+        self._dirty = set()         # cellules modifiées depuis le dernier publish()
+        self._large_dirty = False
+        self._published = {}        # (i, j, k) -> frozenset(chunk_id), lu sans verrou
+        self._published_large = frozenset()
+        self._write_lock = threading.Lock()
+
+    def _cell_range(self, bbox_min, bbox_max):
+        low = np.floor(np.asarray(bbox_min) / self.cell_size).astype(np.int64)
+        high = np.floor(np.asarray(bbox_max) / self.cell_size).astype(np.int64)
+        return low, high
+
+    def insert(self, chunk_id, bbox_min, bbox_max):
+        """Enregistre l'AABB d'un chunk (visible par les lecteurs au prochain publish())"""
+        low, high = self._cell_range(bbox_min, bbox_max)
+        with self._write_lock:
+            self._insert(chunk_id, low, high)
+
+    def _insert(self, chunk_id, low, high):
+        if int(np.prod(high - low + 1)) > self.max_cells_per_chunk:
+            self._large.add(chunk_id)
+            self._large_dirty = True
+            self._chunk_cells[chunk_id] = None
+            return
+        cells = [(i, j, k)
+                 for i in range(low[0], high[0] + 1)
+                 for j in range(low[1], high[1] + 1)
+                 for k in range(low[2], high[2] + 1)]
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(chunk_id)
+        self._dirty.update(cells)
+        self._chunk_cells[chunk_id] = cells
+
+    def remove(self, chunk_id):
+        """Retire un chunk de l'index (au prochain publish() pour les lecteurs)"""
+        with self._write_lock:
+            self._remove(chunk_id)
+
+    def _remove(self, chunk_id):
+        if chunk_id not in self._chunk_cells:
+            return
+        cells = self._chunk_cells.pop(chunk_id)
+        if cells is None:
+            self._large.discard(chunk_id)
+            self._large_dirty = True
+            return
+        for cell in cells:
+            chunk_ids = self._cells.get(cell)
+            if chunk_ids is not None:
+                chunk_ids.discard(chunk_id)
+                if not chunk_ids:
+                    del self._cells[cell]
+        self._dirty.update(cells)
+
+    def update(self, chunk_id, bbox_min, bbox_max):
+        """Remplace l'AABB d'un chunk (retrait puis insertion)"""
+        low, high = self._cell_range(bbox_min, bbox_max)
+        with self._write_lock:
+            self._remove(chunk_id)
+            self._insert(chunk_id, low, high)
+
+    def publish(self):
+        """Gèle les cellules modifiées depuis l'appel précédent dans la table des lecteurs"""
+        with self._write_lock:
+            for cell in self._dirty:
+                chunk_ids = self._cells.get(cell)
+                if chunk_ids:
+                    self._published[cell] = frozenset(chunk_ids)
+                else:
+                    self._published.pop(cell, None)
+            self._dirty.clear()
+            if self._large_dirty:
+                self._published_large = frozenset(self._large)
+                self._large_dirty = False
+
+    def clear(self):
+        with self._write_lock:
+            self._cells = {}
+            self._large = set()
+            self._chunk_cells = {}
+            self._dirty = set()
+            self._large_dirty = False
+            self._published = {}
+            self._published_large = frozenset()
+
+    def candidates(self, bbox_min, bbox_max):
+        """IDs des chunks dont les cellules recoupent la boîte [bbox_min, bbox_max]"""
+        low, high = self._cell_range(bbox_min, bbox_max)
+        cells = self._published
+        result = set(self._published_large)
+        query_cells = np.prod((high - low + 1).astype(np.float64))
+        if query_cells <= len(cells):
+            for i in range(low[0], high[0] + 1):
+                for j in range(low[1], high[1] + 1):
+                    for k in range(low[2], high[2] + 1):
+                        result.update(cells.get((i, j, k), ()))
+        else:
+            # Requête plus grande que la carte: parcourir les cellules occupées
+            for (i, j, k), chunk_ids in list(cells.items()):
+                if (low[0] <= i <= high[0] and low[1] <= j <= high[1] and low[2] <= k <= high[2]):
+                    result.update(chunk_ids)
+        return result
+
+    def __len__(self):
+        return len(self._chunk_cells)
@@ -0,0 +1,534 @@
+# SqliteDataCache.py - Backend SQLite (stdlib) pour le stockage des chunks
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from PersistentDataCache2 import PersistentDataCache, ChunkMetadata
+from utils import world_xyzrgb
+
+import sys
+current_dir = os.path.dirname(os.path.abspath(__file__))
+gen_python_path = os.path.join(current_dir, '..', 'proto_files_slam')
+sys.path.append(gen_python_path)
+
+import pointcloud_pb2
+
+import logging
+LOGGER_NAME = os.path.splitext(os.path.basename(__file__))[0]
+DEBUG_LOGS = True
+
+logger = logging.getLogger(LOGGER_NAME)
+logger.setLevel(logging.DEBUG if DEBUG_LOGS else logging.INFO)
+handler = logging.StreamHandler()
+formatter = logging.Formatter('[%(asctime)s][%(name)s][%(levelname)s] %(message)s')
+handler.setFormatter(formatter)
+logger.handlers = [handler]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    session_id      TEXT    NOT NULL,
+    sequence_number INTEGER NOT NULL,
+    chunk_id        TEXT    NOT NULL UNIQUE,
+    timestamp       INTEGER NOT NULL,
+    point_count     INTEGER NOT NULL,
+    size_bytes      INTEGER NOT NULL,
+    data            BLOB    NOT NULL,
+    min_x REAL, min_y REAL, min_z REAL,
+    max_x REAL, max_y REAL, max_z REAL,
+    centroid_x REAL, centroid_y REAL, centroid_z REAL,
+    PRIMARY KEY (session_id, sequence_number)
+)
+"""
+
+# Index keyframe -> chunks (une ligne par keyframe ayant contribué des points au chunk)
+KEYFRAME_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunk_keyframes (
+    session_id  TEXT    NOT NULL,
+    keyframe_id INTEGER NOT NULL,
+    chunk_id    TEXT    NOT NULL,
+    PRIMARY KEY (session_id, keyframe_id, chunk_id)
+)
+"""
+
+# Poses corrigées des keyframes (la dernière correction de chaque keyframe)
+POSE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS keyframe_poses (
+    session_id  TEXT    NOT NULL,
+    keyframe_id INTEGER NOT NULL,
+    revision    INTEGER NOT NULL,
+    pose        BLOB    NOT NULL,
+    PRIMARY KEY (session_id, keyframe_id)
+)
+"""
+
+# Requêtes historiques par date de création (la clé primaire couvre déjà la séquence)
+TIME_INDEX = "CREATE INDEX IF NOT EXISTS chunks_by_time ON chunks (session_id, timestamp)"
+
+
+class SqliteDataCache(PersistentDataCache):
+    """Cache persistant des chunks dans une base SQLite (mode WAL)
+
+    Même interface que PersistentDataCache : l'ingestion (filtre voxel,
+    découpage en chunks) est héritée, seul le stockage des chunks scellés
+    passe par SQLite. Les chunks créés par un même message d'ingestion sont
+    écrits dans une seule transaction, au moment où le cache mémoire
+    publierait son snapshot, avec l'éviction au-delà de MAX_CHUNKS. Les
+    sessions déjà en base sont reprises à l'ouverture.
+
+    Les lignes survivent à la fin d'une session : clear_cache ne libère que
+    l'état en mémoire, la session est reprise depuis la base au prochain
+    accès. Seuls delete_session et la rétention (retention_seconds, appliquée
+    à l'ouverture et par purge_expired) suppriment des chunks de la base.
+
+    Pas de compaction : la table ne garde qu'une forme des chunks (une
+    ligne par séquence), compact_session ne fait rien.
+    """
+    SUPPORTS_COMPACTION = False
+
+    def __init__(self, session_manager, db_path='slam_chunks.db', retention_seconds=0):
+        super().__init__(session_manager)
+        self._db_path = db_path
+        self.retention_seconds = retention_seconds  # sessions sans chunk plus récent supprimées (0 = garder tout)
+        self._write_lock = threading.Lock()  # une seule connexion d'écriture pour toutes les sessions
+        self._local = threading.local()
+
+        # Connexion d'écriture unique, protégée par self._write_lock
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(SCHEMA)
+        self._conn.execute(TIME_INDEX)
+        self._conn.execute(KEYFRAME_SCHEMA)
+        self._conn.execute(POSE_SCHEMA)
+        self._conn.commit()
+
+        logger.info(f"SqliteDataCache initialisé: {db_path}")
+        self.purge_expired()
+        self._reopen_sessions()
+
+    def _reopen_sessions(self):
+        """Recrée un store pour chaque session déjà en base (numérotation, corrections, pyramide)"""
+        rows = self._reader().execute(
+            'SELECT session_id FROM chunks UNION SELECT session_id FROM keyframe_poses'
+        ).fetchall()
+        for session_id, in rows:
+            self._get_store(session_id)
+        if rows:
+            logger.info(f"{len(rows)} sessions reprises depuis {self._db_path}")
+
+    def _reader(self):
+        """Connexion de lecture propre au thread (lectures concurrentes en WAL)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._local.conn = conn
+        return conn
+
+    def _get_store(self, session_id, create=True):
+        """Retourne le SessionStore, en reprenant la numérotation des chunks déjà en base"""
+        with self._lock:
+            resolved = self._resolve_session_id(session_id)
+            is_new = create and resolved not in self._sessions
+            store = super()._get_store(resolved, create)
+            if is_new:
+                store.pending_rows = []
+                store.pending_keyframe_rows = []
+                store.pending_bounds = {}  # chunk_id -> AABB corrigée, écrite avec les poses
+                store.chunk_count = 0      # lignes de la session dans la table chunks (éviction)
+                store.voxels_loaded = True  # voxel_cache à jour (False: chunks repris, rechargés à l'ingestion)
+                self._load_pose_corrections(store)
+                self._resume_sequence(store)
+            return store
+
+    def _resume_sequence(self, store):
+        """Reprend la numérotation après les chunks déjà en base pour cette session"""
+        row = self._reader().execute(
+            'SELECT MAX(sequence_number), COUNT(*) FROM chunks WHERE session_id = ?', (store.session_id,)
+        ).fetchone()
+        if row[0] is not None:
+            store.sequence_counter = row[0] + 1
+            store.chunk_count = row[1]
+            store.voxels_loaded = False
+            logger.info(f"Reprise de la session '{store.session_id}' à la séquence {store.sequence_counter}")
+            self._rebuild_lod(store)
+
+    def _load_pose_corrections(self, store):
+        """Recharge les poses corrigées d'une session (avant la reconstruction de la pyramide)"""
+        rows = self._reader().execute(
+            'SELECT keyframe_id, revision, pose FROM keyframe_poses WHERE session_id = ?', (store.session_id,)
+        ).fetchall()
+        for keyframe_id, revision, blob in rows:
+            pose = pointcloud_pb2.Pose()
+            pose.ParseFromString(blob)
+            store.pose_corrections[keyframe_id] = pose
+            store.correction_revisions[keyframe_id] = revision
+            store.pose_revision = max(store.pose_revision, revision)
+
+    def _persist_pose_corrections(self, store, poses, revision):
+        """Écrit les poses corrigées et les AABB recalculées dans une seule transaction"""
+        with self._write_lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO keyframe_poses VALUES (?, ?, ?, ?)',
+                [(store.session_id, keyframe_id, revision, pose.SerializeToString())
+                 for keyframe_id, pose in poses.items()]
+            )
+            self._write_pending_bounds(store)
+
+    def _update_bounds(self, store, metadata, bounds):
+        """Met en attente les colonnes d'AABB d'un chunk après correction de pose (écrites en lot)"""
+        bbox_min, bbox_max, centroid, _ = bounds
+        store.pending_bounds[metadata.chunk_id] = (
+            *(bbox_min or (None,) * 3), *(bbox_max or (None,) * 3), *(centroid or (None,) * 3)
+        )
+
+    def _write_pending_bounds(self, store):
+        # Appelé dans la transaction de l'appelant (self._write_lock pris)
+        if store.pending_bounds:
+            self._conn.executemany(
+                'UPDATE chunks SET min_x = ?, min_y = ?, min_z = ?, max_x = ?, max_y = ?, max_z = ?, '
+                'centroid_x = ?, centroid_y = ?, centroid_z = ? WHERE chunk_id = ?',
+                [(*bounds, chunk_id) for chunk_id, bounds in store.pending_bounds.items()]
+            )
+            store.pending_bounds = {}
+
+    def _rebuild_lod(self, store):
+        """Reconstruit la pyramide de niveaux de détail à partir des chunks déjà en base"""
+        rows = self._reader().execute(
+            'SELECT data, sequence_number FROM chunks WHERE session_id = ? ORDER BY sequence_number',
+            (store.session_id,)
+        )
+        for blob, sequence_number in rows:
+            store.lod.add_xyzrgb(world_xyzrgb(self._parse(blob), store.pose_corrections), sequence_number)
+
+    def add_slam_data(self, pointcloudlist, poselist, indexlist, voxel_size=0.01, session_id=None):
+        """Comme PersistentDataCache.add_slam_data, voxels des chunks repris rechargés au premier message"""
+        store = self._get_store(session_id)
+        if not store.voxels_loaded:
+            with store.lock:
+                if not store.voxels_loaded:
+                    self._load_voxels(store, voxel_size)
+        return super().add_slam_data(pointcloudlist, poselist, indexlist, voxel_size, store.session_id)
+
+    def _load_voxels(self, store, voxel_size):
+        """Remplit voxel_cache avec les voxels des chunks en base (repère d'ingestion, sans corrections)
+
+        Sans cela, une session reprise ré-ingère les voxels déjà stockés.
+        La taille de voxel n'est connue qu'à l'ingestion: chargement au
+        premier message reçu après la reprise.
+        """
+        rows = self._reader().execute(
+            'SELECT data FROM chunks WHERE session_id = ? ORDER BY sequence_number', (store.session_id,)
+        )
+        for blob, in rows:
+            xyz = world_xyzrgb(self._parse(blob))[:, :3]
+            # Même clé que l'ingestion: int(coordonnée / voxel_size), tronqué vers 0
+            keys = np.trunc(xyz / voxel_size).astype(np.int64)
+            store.voxel_cache.update(dict.fromkeys(map(tuple, keys.tolist()), True))
+        store.voxels_loaded = True
+        logger.info(f"[{store.session_id}] {len(store.voxel_cache)} voxels rechargés depuis SQLite")
+
+    def _store_chunk(self, store, metadata, slam_data):
+        """Met le chunk en attente d'écriture (écrit en lot par _write_pending_rows)"""
+        store.pending_rows.append((
+            metadata.session_id,
+            metadata.sequence_number,
+            metadata.chunk_id,
+            metadata.timestamp,
+            metadata.point_count,
+            metadata.size_bytes,
+            slam_data.SerializeToString(),
+            *(metadata.bbox_min or (None,) * 3),
+            *(metadata.bbox_max or (None,) * 3),
+            *(metadata.centroid or (None,) * 3)
+        ))
+        store.pending_keyframe_rows.extend(
+            (metadata.session_id, keyframe_id, metadata.chunk_id) for keyframe_id in metadata.keyframe_ids
+        )
+
+    def _write_pending_rows(self, store):
+        """Écrit en une transaction tous les chunks créés depuis le dernier appel, puis applique MAX_CHUNKS"""
+        if not store.pending_rows and not store.pending_bounds:
+            return
+        with self._write_lock, self._conn:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                store.pending_rows
+            )
+            self._conn.executemany(
+                'INSERT OR IGNORE INTO chunk_keyframes VALUES (?, ?, ?)', store.pending_keyframe_rows
+            )
+            self._write_pending_bounds(store)
+            store.chunk_count += len(store.pending_rows)
+            evicted = self._evict_oldest(store)
+        logger.debug(f"[{store.session_id}] {len(store.pending_rows)} chunks écrits dans SQLite"
+                     + (f", {evicted} évincés" if evicted else ""))
+        store.pending_rows = []
+        store.pending_keyframe_rows = []
+
+    def _evict_oldest(self, store):
+        """Supprime les chunks les plus anciens au-delà de MAX_CHUNKS (dans la transaction de l'appelant)"""
+        excess = store.chunk_count - self.MAX_CHUNKS
+        if excess <= 0:
+            return 0
+        rows = self._conn.execute(
+            'SELECT chunk_id, data FROM chunks WHERE session_id = ? ORDER BY sequence_number LIMIT ?',
+            (store.session_id, excess)
+        ).fetchall()
+        for _, blob in rows:
+            store.lod.remove_xyzrgb(world_xyzrgb(self._parse(blob), store.pose_corrections))
+        chunk_ids = [(chunk_id,) for chunk_id, _ in rows]
+        for chunk_id, in chunk_ids:
+            store.world_chunks.pop(chunk_id, None)
+        self._conn.executemany('DELETE FROM chunks WHERE chunk_id = ?', chunk_ids)
+        self._conn.executemany(
+            'DELETE FROM chunk_keyframes WHERE session_id = ? AND chunk_id = ?',
+            [(store.session_id, chunk_id) for chunk_id, in chunk_ids]
+        )
+        store.chunk_count -= len(rows)
+        return len(rows)
+
+    def _publish_snapshot(self, store):
+        """Publication = écriture en lot des chunks scellés par ce message d'ingestion"""
+        self._write_pending_rows(store)
+
+    def compact_session(self, session_id, min_fill=0.5, revoxel_size=None):
+        """Non supporté par ce backend (voir SUPPORTS_COMPACTION)"""
+        logger.warning(f"[{session_id}] Compaction non supportée par le backend SQLite, chunks laissés tels quels")
+        return 0
+
+    @staticmethod
+    def _parse(blob):
+        slam_data = pointcloud_pb2.SlamData()
+        slam_data.ParseFromString(blob)
+        return slam_data
+
+    def get_chunk(self, chunk_id, session_id=None):
+        """Récupère un chunk spécifique (chunk_id est unique dans la table)"""
+        row = self._reader().execute(
+            'SELECT data FROM chunks WHERE chunk_id = ?', (chunk_id,)
+        ).fetchone()
+        return self._parse(row[0]) if row else None
+
+    def get_chunks_after_sequence(self, sequence_number, session_id):
+        """Récupère tous les chunks après un numéro de séquence"""
+        rows = self._reader().execute(
+            'SELECT data FROM chunks WHERE session_id = ? AND sequence_number > ? '
+            'ORDER BY sequence_number',
+            (session_id, sequence_number)
+        ).fetchall()
+        return [self._parse(blob) for blob, in rows]
+
+    def get_chunks_in_sequence_range(self, session_id, start_sequence, end_sequence):
+        """Récupère les chunks dont la séquence est dans [start_sequence, end_sequence]"""
+        rows = self._reader().execute(
+            'SELECT data FROM chunks WHERE session_id = ? AND sequence_number BETWEEN ? AND ? '
+            'ORDER BY sequence_number',
+            (session_id, start_sequence, end_sequence)
+        ).fetchall()
+        return [self._parse(blob) for blob, in rows]
+
+    def get_catchup_frames(self, session_id, after_sequence, until_sequence, batch_size=64):
+        """Chunks de rattrapage déjà sérialisés: les blobs de la base, lus sans les parser
+
+        Lus par lots (une requête terminée par lot): le générateur peut être
+        repris depuis un autre thread (server_aio) sans curseur SQLite ouvert.
+        """
+        while True:
+            rows = self._reader().execute(
+                'SELECT sequence_number, data FROM chunks WHERE session_id = ? AND sequence_number > ? '
+                'AND sequence_number <= ? ORDER BY sequence_number LIMIT ?',
+                (session_id, after_sequence, until_sequence, batch_size)
+            ).fetchall()
+            for sequence_number, blob in rows:
+                yield sequence_number, bytes(blob)
+            if len(rows) < batch_size:
+                return
+            after_sequence = rows[-1][0]
+
+    _ENTRY_COLUMNS = ('data, chunk_id, sequence_number, timestamp, point_count, size_bytes, '
+                      'min_x, min_y, min_z, max_x, max_y, max_z, centroid_x, centroid_y, centroid_z')
+
+    def _entry(self, session_id, row):
+        """(metadata, slam_data) à partir d'une ligne _ENTRY_COLUMNS"""
+        blob, chunk_id, sequence_number, timestamp, point_count, size_bytes, *bounds = row
+        metadata = ChunkMetadata(chunk_id, sequence_number, session_id)
+        metadata.timestamp = timestamp
+        metadata.point_count = point_count
+        metadata.size_bytes = size_bytes
+        if bounds[0] is not None:
+            metadata.bbox_min, metadata.bbox_max, metadata.centroid = (
+                tuple(bounds[:3]), tuple(bounds[3:6]), tuple(bounds[6:])
+            )
+        return metadata, self._parse(blob)
+
+    def get_entries_after_sequence(self, sequence_number, session_id, until_sequence=None):
+        """Comme get_chunks_after_sequence, avec les métadonnées: [(metadata, slam_data)]
+        
+        until_sequence borne la plage (incluse), par clé primaire.
+        """
+        rows = self._reader().execute(
+            f'SELECT {self._ENTRY_COLUMNS} FROM chunks WHERE session_id = ? AND sequence_number > ? '
+            'AND sequence_number <= ? ORDER BY sequence_number',
+            (session_id, sequence_number, 2 ** 63 - 1 if until_sequence is None else until_sequence)
+        ).fetchall()
+        return [self._entry(session_id, row) for row in rows]
+
+    def get_entries_in_sequence_range(self, session_id, start_sequence, end_sequence):
+        """Chunks (metadata, slam_data) dans [start_sequence, end_sequence], par clé primaire"""
+        rows = self._reader().execute(
+            f'SELECT {self._ENTRY_COLUMNS} FROM chunks WHERE session_id = ? '
+            'AND sequence_number BETWEEN ? AND ? ORDER BY sequence_number',
+            (session_id, start_sequence, end_sequence)
+        ).fetchall()
+        return [self._entry(session_id, row) for row in rows]
+
+    def get_entries_in_time_range(self, session_id, start_ms, end_ms):
+        """Chunks (metadata, slam_data) créés entre start_ms et end_ms, par l'index chunks_by_time"""
+        rows = self._reader().execute(
+            f'SELECT {self._ENTRY_COLUMNS} FROM chunks WHERE session_id = ? '
+            'AND timestamp BETWEEN ? AND ? ORDER BY sequence_number',
+            (session_id, start_ms, end_ms)
+        ).fetchall()
+        return [self._entry(session_id, row) for row in rows]
+
+    def get_chunk_ids_for_keyframes(self, session_id, keyframe_ids):
+        """IDs des chunks contenant des points des keyframes demandées (ordre de séquence)"""
+        return [chunk_id for chunk_id, in self._keyframe_rows('chunk_id', session_id, keyframe_ids)]
+
+    def get_entries_for_keyframes(self, session_id, keyframe_ids):
+        """Chunks (metadata, slam_data) contenant des points des keyframes demandées"""
+        return [self._entry(session_id, row)
+                for row in self._keyframe_rows(self._ENTRY_COLUMNS, session_id, keyframe_ids)]
+
+    def _keyframe_rows(self, columns, session_id, keyframe_ids):
+        keyframe_ids = list(keyframe_ids)
+        if not keyframe_ids:
+            return []
+        placeholders = ', '.join('?' * len(keyframe_ids))
+        return self._reader().execute(
+            f'SELECT {columns} FROM chunks WHERE session_id = ? AND chunk_id IN '
+            f'(SELECT chunk_id FROM chunk_keyframes WHERE session_id = ? AND keyframe_id IN ({placeholders})) '
+            'ORDER BY sequence_number',
+            (session_id, session_id, *keyframe_ids)
+        ).fetchall()
+
+    def query_region(self, session_id, region):
+        """Chunks dont l'AABB recoupe une région (pré-filtre SQL sur les colonnes de l'AABB)"""
+        bbox_min, bbox_max = region.bounds()
+        rows = self._reader().execute(
+            f'SELECT {self._ENTRY_COLUMNS} FROM chunks '
+            'WHERE session_id = ? AND max_x >= ? AND min_x <= ? AND max_y >= ? AND min_y <= ? '
+            'AND max_z >= ? AND min_z <= ? ORDER BY sequence_number',
+            (session_id,
+             float(bbox_min[0]), float(bbox_max[0]),
+             float(bbox_min[1]), float(bbox_max[1]),
+             float(bbox_min[2]), float(bbox_max[2]))
+        ).fetchall()
+        result = []
+        for row in rows:
+            metadata, slam_data = self._entry(session_id, row)
+            if region.intersects_aabb(metadata.bbox_min, metadata.bbox_max):
+                result.append((metadata, slam_data))
+        return result
+
+    def get_sync_status(self, session_id):
+        """Retourne l'état de synchronisation"""
+        rows = self._reader().execute(
+            'SELECT chunk_id, sequence_number FROM chunks WHERE session_id = ? '
+            'ORDER BY sequence_number',
+            (session_id,)
+        ).fetchall()
+        return {
+            'session_id': session_id,
+            'total_chunks': len(rows),
+            'latest_sequence_number': rows[-1][1] if rows else -1,
+            'available_chunk_ids': [chunk_id for chunk_id, _ in rows]
+        }
+
+    def get_all_chunks_for_session(self, session_id):
+        """Récupère tous les chunks d'une session dans l'ordre"""
+        return self.get_chunks_after_sequence(-1, session_id)
+
+    def clear_cache(self, session_id=None):
+        """Fin de session: libère l'état en mémoire (toutes les sessions si session_id est None)
+
+        Les lignes restent en base (requêtes historiques, redémarrage) : la
+        session est aussitôt reprise depuis SQLite, comme à l'ouverture
+        (numérotation, corrections, pyramide, voxels au prochain message).
+        Voir delete_session et purge_expired pour supprimer des chunks.
+        """
+        with self._lock:
+            if session_id is None:
+                stores = list(self._sessions.values())
+                self._sessions.clear()
+            else:
+                store = self._sessions.pop(session_id, None)
+                stores = [store] if store else []
+        for store in stores:
+            with store.lock:
+                self._write_pending_rows(store)
+            logger.info(f"Session '{store.session_id}' libérée de la mémoire, {store.chunk_count} chunks gardés en base")
+            self._get_store(store.session_id)
+            # Les flux en attente se réveillent et retrouvent le nouveau store de la session
+            self._notify_readers(store)
+
+    def get_stats(self, session_id=None):
+        """Retourne les statistiques du cache (toutes sessions confondues si session_id est None)"""
+        query = 'SELECT COUNT(*), COALESCE(SUM(point_count), 0), COALESCE(SUM(size_bytes), 0) FROM chunks'
+        params = ()
+        if session_id:
+            query += ' WHERE session_id = ?'
+            params = (session_id,)
+        total_chunks, total_points, total_bytes = self._reader().execute(query, params).fetchone()
+        stats = super().get_stats(session_id)
+        stats.update({
+            'total_chunks': total_chunks,
+            'total_points': total_points,
+            'cache_size_mb': total_bytes / (1024 * 1024),
+        })
+        return stats
+
+    def _delete_rows(self, session_id):
+        """Supprime de la base les chunks, l'index keyframes et les poses d'une session (toutes si None)"""
+        where, params = ('WHERE session_id = ?', (session_id,)) if session_id is not None else ('', ())
+        with self._write_lock, self._conn:
+            deleted = self._conn.execute(f'DELETE FROM chunks {where}', params).rowcount
+            self._conn.execute(f'DELETE FROM chunk_keyframes {where}', params)
+            self._conn.execute(f'DELETE FROM keyframe_poses {where}', params)
+        logger.info(f"Nettoyage du cache '{session_id}': {deleted} chunks supprimés de SQLite")
+        return deleted
+
+    def delete_session(self, session_id):
+        """Supprime une session: son store et tous ses chunks en base"""
+        with self._lock:
+            store = self._sessions.pop(session_id, None)
+        if store is not None:
+            self._notify_readers(store)
+        return self._delete_rows(session_id)
+
+    def purge_expired(self, now_ms=None):
+        """Rétention: supprime les sessions dont le chunk le plus récent a plus de retention_seconds
+
+        Returns:
+            list: IDs des sessions supprimées
+        """
+        if self.retention_seconds <= 0:
+            return []
+        now_ms = now_ms if now_ms is not None else int(time.time() * 1000)
+        rows = self._reader().execute(
+            'SELECT session_id FROM chunks GROUP BY session_id HAVING MAX(timestamp) < ?',
+            (now_ms - int(self.retention_seconds * 1000),)
+        ).fetchall()
+        for session_id, in rows:
+            self.delete_session(session_id)
+        if rows:
+            logger.info(f"Rétention: {len(rows)} sessions de plus de {self.retention_seconds} s supprimées")
+        return [session_id for session_id, in rows]
+
+    def close(self):
+        """Ferme la connexion d'écriture"""
+        with self._write_lock:
+            self._conn.close()
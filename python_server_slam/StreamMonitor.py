@@ -8,33 +8,39 @@ LOGGER_NAME = os.path.splitext(os.path.basename(__file__))[0]
 logger = logging.getLogger(LOGGER_NAME)
 
 class StreamMonitor:
-    """Moniteur basé sur l'état de la session - avec reset correct du flag"""
+    """Moniteur basé sur l'état des sessions - suivi indépendant par session_id"""
     def __init__(self, timeout_seconds=5):
         self.timeout_seconds = timeout_seconds
-        self.last_data_time = None
         self.is_active = False
         self.lock = threading.Lock()
         self.monitor_thread = None
         self.callbacks = []
-        self.has_received_data = False
+        
+        # Suivi par session: session_id -> timestamp de la dernière activité
+        self.last_data_time = {}
+        # Sessions ayant déjà été vues actives (condition pour déclencher le timeout)
+        self.had_active_session = set()
         
         # Pour la surveillance de la session
         self.session_manager = None
-        self.last_session_check_time = None
         self.session_check_interval = 2.0
-        self.has_had_active_session = False
+        # Activité remontée au SessionManager (WatchSession) au plus une fois par intervalle
+        self.activity_notify_interval = 2.0
+        self.last_notified = {}
+        # Réveil immédiat de la boucle à chaque changement de session (fin de session sans attendre le tick)
+        self._wake = threading.Event()
         
     def set_session_manager(self, session_manager):
         """Injection du session manager pour vérifier l'état"""
         self.session_manager = session_manager
+        session_manager.add_change_listener(lambda session_id: self._wake.set())
         
     def start(self):
         """Démarre le monitoring du stream"""
         self.is_active = True
-        self.last_data_time = None
-        self.has_received_data = False
-        self.last_session_check_time = time.time()
-        self.has_had_active_session = False
+        with self.lock:
+            self.last_data_time.clear()
+            self.had_active_session.clear()
         
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
@@ -43,93 +49,123 @@ class StreamMonitor:
     def stop(self):
         """Arrête le monitoring"""
         self.is_active = False
+        self._wake.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=1)
         logger.info("🛑 Stream monitor arrêté")
+    
+    def _resolve_session_id(self, session_id):
+        if session_id is None and self.session_manager:
+            return self.session_manager.get_current_session_id()
+        return session_id or ''
         
-    def update_activity(self):
-        """Met à jour le timestamp de la dernière activité"""
+    def update_activity(self, session_id=None):
+        """Met à jour le timestamp de la dernière activité d'une session (courante par défaut)
+        
+        Ignoré pour une session inconnue du session manager: rien ne
+        l'effacerait (pas de timeout sans session active).
+        """
+        session_id = self._resolve_session_id(session_id)
+        if self.session_manager and not self.session_manager.has_session(session_id):
+            return
+        with self.lock:
+            if session_id not in self.last_data_time:
+                logger.info(f"📡 Première donnée reçue pour '{session_id}' - monitoring actif")
+            now = self.last_data_time[session_id] = time.time()
+            notify = now - self.last_notified.get(session_id, 0) >= self.activity_notify_interval
+        if notify and self.session_manager and self.session_manager.record_activity(session_id, int(now * 1000)):
+            with self.lock:
+                self.last_notified[session_id] = now
+                
+    def forget(self, session_id):
+        """Oublie le suivi d'une session (fin de session): le même ID repart de zéro"""
         with self.lock:
-            self.last_data_time = time.time()
-            if not self.has_received_data:
-                self.has_received_data = True
-                logger.info("📡 Première donnée reçue - monitoring actif")
+            self.last_data_time.pop(session_id, None)
+            self.last_notified.pop(session_id, None)
+            self.had_active_session.discard(session_id)
                 
     def add_timeout_callback(self, callback):
-        """Ajoute un callback à appeler en cas de timeout"""
+        """Ajoute un callback appelé avec le session_id en cas de timeout"""
         self.callbacks.append(callback)
         
     def _monitor_loop(self):
-        """Boucle de monitoring basée sur l'état de la session"""
+        """Boucle de monitoring basée sur l'état des sessions"""
         logger.info("🔄 Boucle de monitoring démarrée - Mode session-based")
         
         while self.is_active:
-            time.sleep(1)
+            self._wake.wait(1)
+            self._wake.clear()
             current_time = time.time()
             
             with self.lock:
-                # Condition de timeout classique
-                should_timeout_classic = False
-                time_since_last_data = float('inf')
-                
-                if self.has_received_data and self.last_data_time is not None:
-                    time_since_last_data = current_time - self.last_data_time
-                    should_timeout_classic = time_since_last_data > self.timeout_seconds
-            
-            # Vérifier l'état de la session
-            session_active = True
-            session_id = ''
-            
+                session_ids = set(self.last_data_time) | self.had_active_session
             if self.session_manager:
-                session_info = self.session_manager.get_session_info()
-                session_active = session_info.get('is_active', False)
-                session_id = session_info.get('session_id', '')
-                
-                # Marquer qu'on a eu une session active
-                if session_active and session_id:
-                    if not self.has_had_active_session:
-                        logger.info(f"✅ Première session active détectée: '{session_id}'")
-                    self.has_had_active_session = True
-                
-                # Log périodique
-                if int(current_time) % 20 == 0:
-                    logger.debug(f"📊 État session: {'active' if session_active else 'inactive'} ('{session_id}'), "
-                               f"Had active: {self.has_had_active_session}")
+                session_ids |= set(self.session_manager.get_active_session_ids())
             
-            # Condition de timeout
-            should_timeout = (
-                self.has_had_active_session and
-                not session_active and
-                (should_timeout_classic or time_since_last_data > 2.0)
-            )
+            for session_id in session_ids:
+                self._check_session(session_id, current_time)
+        
+        logger.info("🔚 Fin boucle monitoring")
+    
+    def _check_session(self, session_id, current_time):
+        """Vérifie une session et déclenche les callbacks si elle est terminée"""
+        with self.lock:
+            # Condition de timeout classique
+            should_timeout_classic = False
+            time_since_last_data = float('inf')
             
-            if should_timeout:
-                logger.warning(f"⏰ Timeout déclenché:")
-                logger.warning(f"  - Session active: {session_active}")
-                logger.warning(f"  - Session ID: '{session_id}'")
-                logger.warning(f"  - Avait session active: {self.has_had_active_session}")
-                logger.warning(f"  - Temps depuis dernières données: {time_since_last_data:.1f}s")
-                
-                # Appeler tous les callbacks
-                for callback in self.callbacks:
-                    try:
-                        logger.info("📞 Appel callback de nettoyage")
-                        callback()
-                        logger.info("✅ Callback terminé")
-                    except Exception as e:
-                        logger.error(f"Erreur dans callback de timeout: {e}")
-                        import traceback
-                        traceback.print_exc()
-                
-                # IMPORTANT: Reset complet après nettoyage pour nouvelle session
+            last_data_time = self.last_data_time.get(session_id)
+            if last_data_time is not None:
+                time_since_last_data = current_time - last_data_time
+                should_timeout_classic = time_since_last_data > self.timeout_seconds
+        
+        # Vérifier l'état de la session
+        session_active = True
+        
+        if self.session_manager:
+            session_info = self.session_manager.get_session_info(session_id)
+            session_active = session_info.get('is_active', False)
+            
+            # Marquer qu'on a eu une session active
+            if session_active and session_id:
                 with self.lock:
-                    self.has_received_data = False
-                    self.last_data_time = None
-                    self.has_had_active_session = False  # RESET pour permettre nouvelle session
-                
-                logger.info("🔄 Flags réinitialisés - prêt pour nouvelle session")
-                
-                # NE PAS SORTIR de la boucle - continuer pour la prochaine session
-                # break  # <-- SUPPRIMÉ
+                    if session_id not in self.had_active_session:
+                        logger.info(f"✅ Session active détectée: '{session_id}'")
+                    self.had_active_session.add(session_id)
+            
+            # Log périodique
+            if int(current_time) % 20 == 0:
+                logger.debug(f"📊 État session '{session_id}': {'active' if session_active else 'inactive'}")
         
-        logger.info("🔚 Fin boucle monitoring")
+        # Condition de timeout
+        with self.lock:
+            had_active = session_id in self.had_active_session
+        should_timeout = (
+            had_active and
+            not session_active and
+            (should_timeout_classic or time_since_last_data > 2.0)
+        )
+        
+        if not should_timeout:
+            return
+        
+        logger.warning(f"⏰ Timeout déclenché:")
+        logger.warning(f"  - Session active: {session_active}")
+        logger.warning(f"  - Session ID: '{session_id}'")
+        logger.warning(f"  - Temps depuis dernières données: {time_since_last_data:.1f}s")
+        
+        # Appeler tous les callbacks
+        for callback in self.callbacks:
+            try:
+                logger.info(f"📞 Appel callback de nettoyage pour '{session_id}'")
+                callback(session_id)
+                logger.info("✅ Callback terminé")
+            except Exception as e:
+                logger.error(f"Erreur dans callback de timeout: {e}")
+                import traceback
+                traceback.print_exc()
+        
+        # IMPORTANT: Reset complet après nettoyage pour une nouvelle session avec le même ID
+        self.forget(session_id)
+        
+        logger.info(f"🔄 Flags réinitialisés pour '{session_id}' - prêt pour nouvelle session")
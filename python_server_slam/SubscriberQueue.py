@@ -0,0 +1,192 @@
+# SubscriberQueue.py - Files d'envoi bornées par client et diffusion des chunks scellés
+import os
+import threading
+from collections import deque
+
+import logging
+LOGGER_NAME = os.path.splitext(os.path.basename(__file__))[0]
+DEBUG_LOGS = True
+
+logger = logging.getLogger(LOGGER_NAME)
+logger.setLevel(logging.DEBUG if DEBUG_LOGS else logging.INFO)
+handler = logging.StreamHandler()
+formatter = logging.Formatter('[%(asctime)s][%(name)s][%(levelname)s] %(message)s')
+handler.setFormatter(formatter)
+logger.handlers = [handler]
+
+# Politiques quand la file d'un client est pleine
+QUEUE_POLICIES = ('block', 'latest_lod', 'coalesce', 'disconnect')
+
+
+class SubscriberQueue:
+    """File d'envoi bornée d'un client temps réel
+
+    Alimentée par ChunkFanout à chaque scellement, vidée par le flux du
+    client (pop). Quand elle est pleine :
+    - 'block': le scellement attend qu'il y ait de la place (ralentit le producteur,
+      réservée à la configuration du serveur)
+    - 'latest_lod': les chunks en file sont abandonnés, le client recevra
+      la pyramide de niveaux de détail courante à la place
+    - 'coalesce': les chunks suivants ne sont plus mis en file mais
+      regroupés en un seul message de rattrapage, envoyé une fois la file vidée
+    - 'disconnect': le flux est fermé, le client reprend depuis son curseur
+
+    Actions renvoyées par pop: ('chunk', slam_data), ('lod', séquence
+    couverte) ou ('catchup', (première séquence, dernière séquence)).
+    """
+    def __init__(self, session_id, client_id, after_sequence=-1, capacity=32, policy='coalesce'):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Politique de file inconnue: {policy}")
+        self.session_id = session_id
+        self.client_id = client_id
+        self.capacity = max(1, int(capacity))
+        self.policy = policy
+        self.enqueued_sequence = after_sequence  # dernière séquence proposée à cette file
+        self.on_change = None  # callback() appelé après chaque changement (réveil asyncio)
+
+        self._queue = deque()
+        self._lod_sequence = None  # 'latest_lod': séquence couverte par le niveau de détail à envoyer
+        self._gap = None           # 'coalesce': (première, dernière) séquence à regrouper
+        self.overflowed = False    # 'disconnect': file débordée, le flux doit se fermer
+        self.closed = False
+        self.dropped = 0           # chunks remplacés par un niveau de détail ou regroupés
+        self.version = 0
+        self._changed = threading.Condition()
+
+    @property
+    def depth(self):
+        return len(self._queue)
+
+    def _notify(self):
+        # Appelé sous self._changed
+        self.version += 1
+        self._changed.notify_all()
+        if self.on_change is not None:
+            self.on_change()
+
+    def offer(self, entries):
+        """Met en file les chunks (metadata, slam_data) postérieurs à enqueued_sequence"""
+        with self._changed:
+            if self.closed:
+                return
+            for metadata, slam_data in entries:
+                if metadata.sequence_number <= self.enqueued_sequence:
+                    continue
+                self.enqueued_sequence = metadata.sequence_number
+                if self._gap is not None:
+                    # Rattrapage en attente: garder l'ordre, tout passe par le regroupement
+                    self._gap = (self._gap[0], metadata.sequence_number)
+                    self.dropped += 1
+                    continue
+                if len(self._queue) >= self.capacity:
+                    if not self._overflow(metadata):
+                        return
+                    if self._gap is not None:
+                        continue
+                self._queue.append(slam_data)
+            self._notify()
+
+    def _overflow(self, metadata):
+        """Applique la politique sur une file pleine, False si le flux doit s'arrêter"""
+        if self.policy == 'block':
+            self._notify()  # le client doit vider la file pour libérer le scellement
+            while len(self._queue) >= self.capacity and not self.closed:
+                self._changed.wait()
+            return not self.closed
+        if self.policy == 'latest_lod':
+            self.dropped += len(self._queue)
+            self._queue.clear()
+            self._lod_sequence = metadata.sequence_number
+            logger.info(f"🐢 {self.client_id}: file pleine, chunks remplacés par le niveau de détail courant")
+            return True
+        if self.policy == 'coalesce':
+            self._gap = (metadata.sequence_number, metadata.sequence_number)
+            self.dropped += 1
+            logger.info(f"🐢 {self.client_id}: file pleine, chunks suivants regroupés en un rattrapage")
+            return True
+        self.overflowed = True
+        self.closed = True
+        logger.warning(f"🐢 {self.client_id}: file pleine, déconnexion avec curseur de reprise")
+        self._notify()
+        return False
+
+    def pop(self):
+        """Prochaine action à envoyer, None si la file est vide"""
+        with self._changed:
+            if self._lod_sequence is not None:
+                action, self._lod_sequence = ('lod', self._lod_sequence), None
+            elif self._queue:
+                action = ('chunk', self._queue.popleft())
+            elif self._gap is not None:
+                action, self._gap = ('catchup', self._gap), None
+            else:
+                return None
+            self._changed.notify_all()  # place libérée ('block')
+            return action
+
+    def wait(self, version, timeout=None):
+        """Bloque jusqu'à un changement après `version` (ou jusqu'au délai), retourne la version courante"""
+        with self._changed:
+            self._changed.wait_for(lambda: self.version != version, timeout)
+            return self.version
+
+    def close(self):
+        with self._changed:
+            self.closed = True
+            self._notify()
+
+
+class ChunkFanout:
+    """Diffuse les chunks scellés d'une session dans les files de ses clients
+
+    Enregistré comme listener du cache: à chaque changement de version
+    d'une session, les nouveaux chunks sont lus une seule fois puis
+    proposés à chaque file, dans le thread de l'écrivain.
+    """
+    def __init__(self, persistent_cache):
+        self._cache = persistent_cache
+        self._lock = threading.Lock()
+        self._subscribers = {}  # session_id -> {client_id: SubscriberQueue}
+        persistent_cache.add_change_listener(self._on_change)
+
+    def subscribe(self, session_id, client_id, after_sequence=-1, capacity=32, policy='coalesce', on_change=None):
+        """Crée la file d'un client, remplie des chunks déjà scellés après after_sequence"""
+        queue = SubscriberQueue(session_id, client_id, after_sequence, capacity, policy)
+        queue.on_change = on_change
+        with self._lock:
+            self._subscribers.setdefault(session_id, {})[client_id] = queue
+        # Chunks scellés entre le rattrapage du client et son inscription
+        self._on_change(session_id)
+        return queue
+
+    def unsubscribe(self, queue):
+        queue.close()  # débloque un scellement en attente ('block')
+        with self._lock:
+            queues = self._subscribers.get(queue.session_id, {})
+            queues.pop(queue.client_id, None)
+            if not queues:
+                self._subscribers.pop(queue.session_id, None)
+
+    def unsubscribe_client(self, session_id, client_id):
+        """Ferme la file d'un client s'il en a une (client parti pendant que son flux attend)"""
+        with self._lock:
+            queue = self._subscribers.get(session_id, {}).get(client_id)
+        if queue is not None:
+            self.unsubscribe(queue)
+
+    def _on_change(self, session_id):
+        with self._lock:
+            queues = list(self._subscribers.get(session_id, {}).values())
+        if not queues:
+            return
+        entries = self._cache.get_entries_after_sequence(
+            min(queue.enqueued_sequence for queue in queues), session_id
+        )
+        if entries:
+            for queue in queues:
+                queue.offer(entries)
+
+    def queue_depths(self, session_id):
+        """client_id -> nombre de chunks en attente d'envoi"""
+        with self._lock:
+            return {client_id: queue.depth for client_id, queue in self._subscribers.get(session_id, {}).items()}
@@ -0,0 +1,111 @@
+# TrajectoryDecimator.py - Simplification de trajectoire (delta minimal, Ramer-Douglas-Peucker)
+import math
+
+import numpy as np
+
+from utils import pose_matrix
+
+
+def rotation_angle(rotation_a, rotation_b):
+    """Angle (degrés) de la rotation relative entre deux matrices 3x3"""
+    cos_angle = (np.trace(rotation_a.T @ rotation_b) - 1.0) / 2.0
+    return math.degrees(math.acos(min(1.0, max(-1.0, cos_angle))))
+
+
+def rdp_indices(xyz, epsilon):
+    """Indices des positions (N, 3) conservées par Ramer-Douglas-Peucker
+
+    Version itérative (pile de segments) : pas de limite de récursion sur
+    les longues trajectoires, et la distance au segment est calculée pour
+    tous les points du segment d'un coup.
+    """
+    n = len(xyz)
+    if n <= 2 or epsilon <= 0:
+        return np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        start, end = xyz[first], xyz[last]
+        points = xyz[first + 1:last]
+        segment = end - start
+        length_sq = float(segment @ segment)
+        if length_sq > 0:
+            # Distance au segment [start, end] (projection bornée)
+            t = np.clip((points - start) @ segment / length_sq, 0.0, 1.0)
+            distances = np.linalg.norm(points - (start + t[:, None] * segment), axis=1)
+        else:
+            distances = np.linalg.norm(points - start, axis=1)
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > epsilon:
+            index = first + 1 + farthest
+            keep[index] = True
+            stack.append((first, index))
+            stack.append((index, last))
+    return np.flatnonzero(keep)
+
+
+class TrajectoryDecimator:
+    """Sous-échantillonne un flux de poses pour l'affichage de trajectoire
+
+    Modes:
+    - 'full': toutes les poses (pleine fréquence)
+    - 'delta': une pose dès que la translation depuis la dernière pose
+      conservée atteint min_translation (m) ou que la rotation atteint
+      min_rotation (degrés)
+    - 'rdp': Ramer-Douglas-Peucker sur les positions avec la tolérance
+      epsilon (m). RDP a besoin de la trajectoire complète: il s'applique
+      à l'historique (decimate), puis le flux live continue en mode
+      'delta' avec min_translation = epsilon.
+    """
+    MODES = ('full', 'delta', 'rdp')
+
+    def __init__(self, mode='full', min_translation=0.0, min_rotation=0.0, epsilon=0.0):
+        if mode not in self.MODES:
+            raise ValueError(f"Mode de décimation inconnu: {mode}")
+        self.mode = mode
+        self.min_translation = float(min_translation)
+        self.min_rotation = float(min_rotation)
+        self.epsilon = float(epsilon)
+        if mode == 'rdp':
+            self.min_translation = self.epsilon
+            self.min_rotation = 0.0
+        self._last_kept = None  # matrice 4x4 de la dernière pose conservée
+
+    def reset(self):
+        """Nouvelle trajectoire (session suivante du même ID): la prochaine pose est conservée"""
+        self._last_kept = None
+
+    def _moved_enough(self, matrix):
+        if self._last_kept is None:
+            return True
+        translation = float(np.linalg.norm(matrix[:3, 3] - self._last_kept[:3, 3]))
+        if self.min_translation > 0 and translation >= self.min_translation:
+            return True
+        if self.min_rotation > 0 and rotation_angle(self._last_kept[:3, :3], matrix[:3, :3]) >= self.min_rotation:
+            return True
+        return self.min_translation <= 0 and self.min_rotation <= 0
+
+    def accept(self, pose):
+        """Pose suivante du flux live: True si elle doit être envoyée"""
+        if self.mode == 'full':
+            return True
+        matrix = pose_matrix(pose)
+        if not self._moved_enough(matrix):
+            return False
+        self._last_kept = matrix
+        return True
+
+    def decimate(self, poses):
+        """Indices des poses conservées dans un historique (liste de Pose)"""
+        if self.mode != 'rdp':
+            return [i for i, pose in enumerate(poses) if self.accept(pose)]
+        if not poses:
+            return []
+        matrices = np.array([pose_matrix(pose) for pose in poses])
+        kept = rdp_indices(matrices[:, :3, 3], self.epsilon).tolist()
+        self._last_kept = matrices[kept[-1]]
+        return kept
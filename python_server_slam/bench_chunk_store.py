@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark des backends de stockage des chunks (mémoire vs SQLite)
+
+Usage: python bench_chunk_store.py [nb_messages] [keyframes_par_message] [points_par_keyframe]
+
+Mesure aussi le coût de la suppression des points aberrants (par million de points).
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+gen_python_path = os.path.join(current_dir, '..', 'proto_files_slam')
+sys.path.append(gen_python_path)
+
+import logging
+logging.disable(logging.INFO)
+
+import numpy as np
+
+import pointcloud_pb2
+from PersistentDataCache2 import PersistentDataCache
+from SqliteDataCache import SqliteDataCache
+from SessionManager import SessionManager
+from utils import outlier_mask
+
+VOXEL_SIZE = 0.01
+
+
+def generate_messages(num_messages, keyframes_per_message, points_per_keyframe, seed=0):
+    """Génère des SlamData synthétiques (points aléatoires le long d'une trajectoire en X)"""
+    rng = np.random.default_rng(seed)
+    messages = []
+    keyframe = 0
+    for _ in range(num_messages):
+        slam_data = pointcloud_pb2.SlamData()
+        for _ in range(keyframes_per_message):
+            xyz = rng.uniform(0.0, 2.0, (points_per_keyframe, 3))
+            xyz[:, 0] += keyframe * 0.5
+            rgb = rng.uniform(0.0, 1.0, (points_per_keyframe, 3))
+            points = [pointcloud_pb2.Point(x=p[0], y=p[1], z=p[2], r=p[3], g=p[4], b=p[5])
+                      for p in np.hstack((xyz, rgb)).tolist()]
+            slam_data.pointcloudlist.pointclouds.append(pointcloud_pb2.PointCloud(points=points))
+            pose = np.eye(4)
+            pose[0, 3] = keyframe * 0.5
+            slam_data.poselist.poses.append(pointcloud_pb2.Pose(matrix=pose.flatten().tolist()))
+            slam_data.indexlist.index.append(keyframe)
+            keyframe += 1
+        messages.append(slam_data)
+    return messages
+
+
+def generate_noisy_surfaces(num_points, outlier_fraction=0.02, seed=0):
+    """Points sur deux plans (sol et mur, bruit de profondeur) + pixels volants uniformes
+
+    Returns:
+        (xyz (N, 3), masque des vrais aberrants (N,))
+    """
+    rng = np.random.default_rng(seed)
+    num_outliers = int(num_points * outlier_fraction)
+    num_surface = num_points - num_outliers
+    floor = np.column_stack((rng.uniform(0, 10, num_surface // 2), rng.uniform(0, 10, num_surface // 2),
+                             rng.normal(0, 0.005, num_surface // 2)))
+    wall_count = num_surface - num_surface // 2
+    wall = np.column_stack((rng.uniform(0, 10, wall_count), rng.normal(10, 0.005, wall_count),
+                            rng.uniform(0, 3, wall_count)))
+    flying = rng.uniform((0, 0, 0.2), (10, 9.8, 3), (num_outliers, 3))
+    xyz = np.concatenate((floor, wall, flying))
+    return xyz, np.arange(len(xyz)) >= num_surface
+
+
+def bench_outliers(num_points=1_000_000, radius=0.05, min_neighbors=3, std_ratio=1.0):
+    """Coût par million de points et qualité du filtre (rayon, statistique)"""
+    xyz, is_outlier = generate_noisy_surfaces(num_points)
+    for name, ratio in (('radius', 0.0), ('statistical', std_ratio)):
+        start = time.perf_counter()
+        keep = outlier_mask(xyz, radius, min_neighbors, ratio)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"outliers {name:<11} {elapsed_ms * 1e6 / num_points:8.1f}ms / M points"
+              f" | aberrants retirés {np.mean(~keep[is_outlier]) * 100:5.1f}%"
+              f" | points valides gardés {np.mean(keep[~is_outlier]) * 100:5.1f}%")
+
+
+def run(name, cache, messages, session_id):
+    """Mesure ingestion, rattrapage complet et lecture incrémentale"""
+    start = time.perf_counter()
+    for data in messages:
+        cache.add_slam_data(data.pointcloudlist, data.poselist, data.indexlist, VOXEL_SIZE)
+    cache.flush_pending()
+    ingest_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunks = cache.get_all_chunks_for_session(session_id)
+    catchup_s = time.perf_counter() - start
+
+    middle = chunks[len(chunks) // 2].sequence_number if chunks else -1
+    start = time.perf_counter()
+    for _ in range(100):
+        cache.get_chunks_after_sequence(middle, session_id)
+    incremental_ms = (time.perf_counter() - start) * 1000 / 100
+
+    stats = cache.get_stats()
+    print(f"{name:<10} ingest {ingest_s:8.3f}s | catch-up {len(chunks):5d} chunks {catchup_s * 1000:8.1f}ms"
+          f" | after-seq {incremental_ms:7.2f}ms | points {stats['total_points']}")
+
+
+def main():
+    num_messages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    keyframes_per_message = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    points_per_keyframe = int(sys.argv[3]) if len(sys.argv) > 3 else 2000
+
+    messages = generate_messages(num_messages, keyframes_per_message, points_per_keyframe)
+    print(f"{num_messages} messages x {keyframes_per_message} keyframes x {points_per_keyframe} points")
+
+    session_manager = SessionManager()
+    session_manager.update_session_info('bench', '', True, 0)
+    session_id = 'bench'
+
+    run('memory', PersistentDataCache(session_manager), messages, session_id)
+
+    cache = PersistentDataCache(session_manager)
+    cache.OUTLIER_FILTER = 'radius'
+    run('memory+sor', cache, messages, session_id)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SqliteDataCache(session_manager, db_path=os.path.join(tmp, 'bench.db'))
+        run('sqlite', cache, messages, session_id)
+        cache.close()
+
+    bench_outliers()
+
+
+if __name__ == '__main__':
+    main()
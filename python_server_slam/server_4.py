@@ -61,7 +61,7 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
         self.stream_monitor.add_timeout_callback(self._handle_stream_timeout)
         self.stream_monitor.start()
         
-    def _handle_stream_timeout(self):
+    def _handle_stream_timeout(self, session_id=None):
         """Gère le timeout du stream"""
         logger.warning("🏁 Fin du stream détectée - nettoyage en cours...")
         
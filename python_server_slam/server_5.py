@@ -18,20 +18,73 @@ import pointcloud_pb2
 import slam_service_pb2
 import slam_service_pb2_grpc
 
-from utils import apply_voxel_grid_filter
+from utils import (apply_voxel_grid_filter, clip_slam_data, merge_slam_data, select_keyframes, to_world_slam_data,
+                   with_resume_sequence)
+# Regions pour les requetes spatiales
+from SpatialIndex import BoxRegion, SphereRegion, FrustumRegion, Viewpoint, iter_by_priority
+# Budget de points par client (echantillonnage + directives replace / drop)
+from PointBudget import PointBudgetPlanner, sample_slam_data
+# Files d'envoi bornees par client (politiques pour les clients lents)
+from SubscriberQueue import ChunkFanout, QUEUE_POLICIES
+# Debit d'envoi par client et lien montant partage (seaux a jetons)
+from BandwidthShaper import ClientShaper, RateMeter, TokenBucket
+# Decimation de trajectoire (delta minimal, Ramer-Douglas-Peucker)
+from TrajectoryDecimator import TrajectoryDecimator
+# Journal ordonne des evenements de chaque session (flux multiplexe StreamSession)
+from SessionTimeline import SessionTimeline
 
 # PersistentCache pour garder les donnees en cache serveur pour un nouveu client
 from PersistentDataCache2 import PersistentDataCache
+# backend SQLite optionnel pour les petits deploiements qui veulent la durabilite
+from SqliteDataCache import SqliteDataCache
 # session manager pour garder les infos sur la session en cours
 from SessionManager import SessionManager
 # Stream Monitor pour monitorer le stream pour gerer la fin du SLAM
 from StreamMonitor import StreamMonitor
+# Compaction en tache de fond des petits chunks
+from ChunkCompactor import ChunkCompactor
+# Capacite reservee par classe de RPC (ingestion, viewers, unaires)
+from AdmissionControl import AdmissionController, AdmissionInterceptor
+# Envoi des trames de rattrapage pre-serialisees sans re-serialisation
+from CatchupBundle import PreSerializedInterceptor
 
 import logging
 LOGGER_NAME = os.path.splitext(os.path.basename(__file__))[0]
 DEBUG_CLIENT = False
 DEBUG_LOGS = True
 
+# Backend de stockage des chunks: 'memory' (defaut) ou 'sqlite'
+CACHE_BACKEND = os.environ.get('SLAM_CACHE_BACKEND', 'memory')
+SQLITE_DB_PATH = os.environ.get('SLAM_SQLITE_DB', os.path.join(current_dir, 'slam_chunks.db'))
+# Rétention des sessions terminées dans SQLite, en secondes depuis leur dernier chunk (0 = garder tout)
+SQLITE_RETENTION_SECONDS = float(os.environ.get('SLAM_SQLITE_RETENTION_S', 0))
+# Suppression des pixels volants à l'ingestion: '' (désactivée), 'radius' ou 'statistical'
+OUTLIER_FILTER = os.environ.get('SLAM_OUTLIER_FILTER', '')
+# Débit max (octets/s, 0 = illimité) de chaque viewer GetSlamData et de tous les viewers ensemble
+CLIENT_MAX_BPS = int(os.environ.get('SLAM_CLIENT_MAX_BPS', 0))
+UPLINK_MAX_BPS = int(os.environ.get('SLAM_UPLINK_MAX_BPS', 0))
+# Appels simultanés max par classe de RPC: le pool du serveur a un thread par place,
+# les viewers ne peuvent donc jamais prendre les threads du producteur
+ADMISSION_CAPACITIES = {
+    'ingest': int(os.environ.get('SLAM_INGEST_SLOTS', 4)),
+    'viewer': int(os.environ.get('SLAM_VIEWER_SLOTS', 32)),
+    'unary': int(os.environ.get('SLAM_UNARY_SLOTS', 4)),
+}
+# Détection des clients morts: ping HTTP/2 toutes les KEEPALIVE_TIME_MS, connexion
+# fermée (et appels terminés) sans réponse au bout de KEEPALIVE_TIMEOUT_MS
+KEEPALIVE_TIME_MS = int(os.environ.get('SLAM_KEEPALIVE_TIME_MS', 10000))
+KEEPALIVE_TIMEOUT_MS = int(os.environ.get('SLAM_KEEPALIVE_TIMEOUT_MS', 5000))
+SERVER_OPTIONS = [
+    ('grpc.max_receive_message_length', 50 * 1024 * 1024),
+    ('grpc.max_send_message_length', 50 * 1024 * 1024),
+    ('grpc.keepalive_time_ms', KEEPALIVE_TIME_MS),
+    ('grpc.keepalive_timeout_ms', KEEPALIVE_TIMEOUT_MS),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    # Pings des clients (et d'Envoy) acceptés jusqu'à un toutes les 5 s
+    ('grpc.http2.min_recv_ping_interval_without_data_ms', 5000),
+]
+
 logger = logging.getLogger(LOGGER_NAME)
 logger.setLevel(logging.DEBUG if DEBUG_LOGS else logging.INFO)
 handler = logging.StreamHandler()
@@ -43,32 +96,115 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
     def __init__(self):
         # Gestionnaires
         self.session_manager = SessionManager()
-        self.persistent_cache = PersistentDataCache(self.session_manager)
+        if CACHE_BACKEND == 'sqlite':
+            self.persistent_cache = SqliteDataCache(self.session_manager, db_path=SQLITE_DB_PATH,
+                                                    retention_seconds=SQLITE_RETENTION_SECONDS)
+        else:
+            self.persistent_cache = PersistentDataCache(self.session_manager)
+        logger.info(f"Backend de stockage des chunks: {CACHE_BACKEND}")
+        if OUTLIER_FILTER:
+            self.persistent_cache.OUTLIER_FILTER = OUTLIER_FILTER
+            logger.info(f"Suppression des points aberrants à l'ingestion: {OUTLIER_FILTER}")
         
         # Buffers temporaires pour compatibilité
         self.slam_data = []
-        self._global_buffer_poses = []
+        self._pose_buffers = collections.defaultdict(list)  # session_id -> [PoseList]
+        self._poses_changed = threading.Condition()  # signalée à chaque PoseList reçue
         
         # Configuration
         self.VOXEL_SIZE_SEND = 0.01
+        self.CATCHUP_PRIORITY_QUEUE = 1024  # taille max de la file de priorité du rattrapage
+        self.LOD_TILE_POINTS = 5000  # points par message en mode progressif
+        self.BUDGET_FALLOFF = 5.0  # distance (m) où la densité est divisée par 2 sous budget de points
+        self.STREAM_WAIT_TIMEOUT = 1.0  # attente max (s) d'un flux temps réel avant de revérifier le client
+        self.SEND_QUEUE_SIZE = 32  # chunks en attente d'envoi par client temps réel
+        self.SEND_QUEUE_POLICY = 'coalesce'  # file pleine: 'block', 'latest_lod', 'coalesce' ou 'disconnect'
+        self.MIN_SEND_QUEUE_SIZE = 8  # taille minimale imposée à la file demandée par un client
+        self.SLOW_CLIENT_LOD_LEVEL = 2  # niveau de détail envoyé à la place des chunks abandonnés ('latest_lod')
+        self.CLIENT_MAX_BYTES_PER_SECOND = CLIENT_MAX_BPS  # débit max d'un viewer (0 = celui qu'il demande)
+        self.UPLINK_MAX_BYTES_PER_SECOND = UPLINK_MAX_BPS  # débit max de tous les viewers ensemble (0 = illimité)
+        self.CATCHUP_MIN_SHARE = 0.25  # part minimale du débit d'un client laissée au rattrapage
+        self.CATCHUP_BYTES_PER_SECOND = 8_000_000  # débit de la voie de rattrapage par client (0 = illimité)
+        self.PRESERIALIZED_CATCHUP = False  # trames du bundle envoyées telles quelles (PreSerializedInterceptor requis)
+        self.SESSION_HEARTBEAT_SECONDS = 5.0  # StreamSession: Heartbeat envoyé après ce délai sans message
+        self.SESSION_TIMELINE_EVENTS = 4096  # StreamSession: événements gardés par session avant compaction
+        self.SESSION_CHUNK_MILESTONE = 100  # WatchSession: SessionInfo poussé tous les N chunks scellés
+        self.CLIENT_HEARTBEAT_SECONDS = 5.0  # GetSlamData: SlamData vide après ce délai sans message (0 = désactivé)
+        
+        # Lien montant partagé par les viewers et débit d'ingestion de chaque session
+        self.uplink_bucket = (TokenBucket(self.UPLINK_MAX_BYTES_PER_SECOND, self.UPLINK_MAX_BYTES_PER_SECOND)
+                              if self.UPLINK_MAX_BYTES_PER_SECOND > 0 else None)
+        self._ingest_rates = collections.defaultdict(RateMeter)  # session_id -> octets/s reçus du producteur
         
-        # Suivi des clients et leurs états
-        self._client_states = {}  # client_id -> last_sequence_number
+        # Suivi des clients et leurs états: seule source de clients_connected (SessionManager)
+        self._client_states = {}  # session_id -> {client_id: last_sequence_number}
         self._client_lock = threading.Lock()
+        self._anonymous_sessions = set()  # sessions ouvertes par un producteur sans metadata 'session-id'
         
         # Moniteur de stream basé sur l'état de la session
         self.stream_monitor = StreamMonitor(timeout_seconds=5)  # Timeout plus long
         self.stream_monitor.set_session_manager(self.session_manager)  # NOUVEAU: Injection
         self.stream_monitor.add_timeout_callback(self._handle_stream_timeout)
         self.stream_monitor.start()
+        
+        # Diffusion des chunks scellés dans les files d'envoi des clients temps réel
+        self.fanout = ChunkFanout(self.persistent_cache)
+        
+        # Timeline de chaque session pour le flux multiplexé (chunks, poses, corrections, session)
+        self.timeline = SessionTimeline(max_events=self.SESSION_TIMELINE_EVENTS)
+        self._timeline_sequences = {}  # session_id -> dernière séquence publiée dans la timeline
+        self.persistent_cache.add_change_listener(self._publish_chunks)
+        self.session_manager.add_change_listener(self._publish_session)
+        
+        # Compaction des petits chunks produits par flush_pending
+        self.compactor = ChunkCompactor(self.persistent_cache, interval_seconds=10, min_fill=0.5)
+        self.compactor.start()
+
+    def _resolve_session_id(self, context):
+        """Session visée par l'appel: metadata 'session-id', sinon la session courante"""
+        metadata = dict(context.invocation_metadata())
+        session_id = metadata.get('session-id', '')
+        if session_id:
+            return session_id
+        return self.session_manager.get_current_session_id()
+
+    def _producer_session_id(self, context):
+        """Session alimentée par un producteur, None si elle appartient à un autre producteur
+        
+        Sans metadata 'session-id', le producteur reprend la session courante
+        seulement si personne ne l'alimente (inactive) ou s'il l'a lui-même
+        ouverte sans metadata (reconnexion): sinon ses données iraient dans
+        la session d'un autre robot.
+        """
+        session_id = dict(context.invocation_metadata()).get('session-id', '')
+        if session_id:
+            return session_id
+        current = self.session_manager.get_session_info()
+        if not current['session_id']:
+            session_id = f'SLAM-{int(time.time())}'
+        elif not current['is_active'] or current['session_id'] in self._anonymous_sessions:
+            session_id = current['session_id']
+        else:
+            return None
+        self._anonymous_sessions.add(session_id)
+        return session_id
+
+    def _wants_local(self, context):
+        """Le client re-transforme lui-même les points (metadata 'local-coordinates')"""
+        metadata = dict(context.invocation_metadata())
+        return metadata.get('local-coordinates', '').lower() in ('1', 'true')
+
+    def _present(self, session_id, slam_data, local):
+        """Chunk du cache tel qu'envoyé: repère keyframe + poses, ou sa copie monde partagée (poses corrigées)"""
+        return slam_data if local else self.persistent_cache.get_world_chunk(session_id, slam_data)
 
-    def _handle_stream_timeout(self):
-        """Gère le timeout du stream"""
-        logger.warning("🏁 Fin du stream détectée - nettoyage en cours...")
+    def _handle_stream_timeout(self, session_id):
+        """Gère le timeout du stream d'une session"""
+        logger.warning(f"🏁 Fin du stream détectée pour '{session_id}' - nettoyage en cours...")
         
         # Sauvegarder les stats finales
-        session_info = self.session_manager.get_session_info()
-        stats = self.persistent_cache.get_stats()
+        session_info = self.session_manager.get_session_info(session_id)
+        stats = self.persistent_cache.get_stats(session_id)
         
         # Calculer la durée de session de manière sûre
         session_duration = 0
@@ -95,7 +231,7 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
         
         # Forcer la création d'un dernier chunk si nécessaire
         try:
-            final_chunk = self.persistent_cache.flush_pending()
+            final_chunk = self.persistent_cache.flush_pending(session_id)
             if final_chunk:
                 logger.info(f"💾 Chunk final créé: {final_chunk}")
         except Exception as e:
@@ -103,23 +239,27 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
         
         # Réinitialiser la session
         logger.info("🔄 Réinitialisation de la session...")
-        self.session_manager.clear_session()
+        self.session_manager.clear_session(session_id)
         
-        # Nettoyer le cache
+        # Nettoyer le cache (SQLite: mémoire seulement, les chunks restent en base)
         logger.info("🗑️ Nettoyage du cache...")
-        self.persistent_cache.clear_cache()
+        self.persistent_cache.clear_cache(session_id)
         
-        # Réinitialiser les buffers
-        self.slam_data = []
-        self._global_buffer_poses = []
+        # Réinitialiser les buffers et la timeline (les flux StreamSession repartent d'un nouveau journal)
+        self._release_poses(session_id)
+        self._timeline_sequences.pop(session_id, None)
+        self.timeline.clear(session_id)
         
-        # Nettoyer les états clients
-        with self._client_lock:
-            self._client_states.clear()
+        # Plus de suivi pour cet ID: monitor, producteur sans metadata
+        self.stream_monitor.forget(session_id)
+        self._anonymous_sessions.discard(session_id)
         
-        logger.info("✅ Nettoyage terminé - prêt pour une nouvelle session")
+        # Les états clients sont libérés par leurs flux (fin du flux ou de l'appel gRPC), pas ici:
+        # les clients encore connectés restent comptés pour la session suivante du même ID
+        
+        logger.info(f"✅ Nettoyage de '{session_id}' terminé - prêt pour une nouvelle session")
 
-        # verification session vide
+        # verification session courante
         session_info = self.session_manager.get_session_info()
 
         logger.info(f"Session actuelle : {session_info}")
@@ -127,15 +267,16 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
 
 
     def GetSyncStatus(self, request, context):
-        """Retourne l'état de synchronisation pour la session courante"""
-        session_info = self.session_manager.get_session_info()
-        sync_status = self.persistent_cache.get_sync_status(session_info['session_id'])
+        """Retourne l'état de synchronisation pour la session demandée (courante par défaut)"""
+        session_id = self._resolve_session_id(context)
+        sync_status = self.persistent_cache.get_sync_status(session_id)
         
         return pointcloud_pb2.SyncStatus(
             session_id=sync_status['session_id'],
             total_chunks=sync_status['total_chunks'],
             latest_sequence_number=sync_status['latest_sequence_number'],
-            available_chunk_ids=sync_status['available_chunk_ids']
+            available_chunk_ids=sync_status['available_chunk_ids'],
+            client_queue_depths=self.fanout.queue_depths(session_id)
         )
     
 
@@ -144,23 +285,27 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
         """Envoie des chunks spécifiques demandés par le client"""
         logger.info(f"Client demande {len(request.missing_chunk_ids)} chunks manquants")
         
+        session_id = request.session_id or self._resolve_session_id(context)
+        
         # Mettre à jour l'activité
-        self.stream_monitor.update_activity()
+        self.stream_monitor.update_activity(session_id)
         
         for chunk_id in request.missing_chunk_ids:
-            slam_data = self.persistent_cache.get_chunk(chunk_id)
+            slam_data = self.persistent_cache.get_chunk(chunk_id, session_id)
             if slam_data:
+                # DataChunk n'a qu'un PointCloud: toujours en coordonnées monde
+                slam_data = self._present(session_id, slam_data, local=False)
                 # Convertir en DataChunk
                 data_chunk = pointcloud_pb2.DataChunk(
                     chunk_id=slam_data.chunk_id,
                     sequence_number=slam_data.sequence_number,
-                    session_id=request.session_id,
+                    session_id=session_id,
                     timestamp=int(time.time() * 1000)
                 )
                 
-                # Copier les données
-                if slam_data.pointcloudlist and slam_data.pointcloudlist.pointclouds:
-                    data_chunk.pointcloud.CopyFrom(slam_data.pointcloudlist.pointclouds[0])
+                # Copier les données (un pointcloud par keyframe dans le chunk)
+                for pointcloud in slam_data.pointcloudlist.pointclouds:
+                    data_chunk.pointcloud.points.extend(pointcloud.points)
                 
                 if slam_data.poselist and slam_data.poselist.poses:
                     data_chunk.pose.CopyFrom(slam_data.poselist.poses[0])
@@ -173,81 +318,374 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
 
 
 
+    def GetRegionChunks(self, request, context):
+        """Envoie les chunks scellés qui recoupent une région (boîte, sphère ou frustum)"""
+        session_id = request.session_id or self._resolve_session_id(context)
+        region = region_from_request(request)
+        if region is None:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Région manquante (box, sphere ou frustum)")
+        
+        matches = self.persistent_cache.query_region(session_id, region)
+        logger.info(f"🔎 Requête {request.WhichOneof('region')} sur '{session_id}': {len(matches)} chunks candidats")
+        
+        local = self._wants_local(context) and not request.clip_points  # découpe en coordonnées monde
+        for metadata, slam_data in matches:
+            slam_data = self._present(session_id, slam_data, local)
+            if request.clip_points:
+                slam_data = clip_slam_data(slam_data, region.contains)
+                if slam_data is None:
+                    continue
+            yield slam_data
+
+
+
+    def GetHistory(self, request, context):
+        """Envoie les chunks d'origine d'une plage de séquences ou de dates (état passé de la carte)"""
+        session_id = request.session_id or self._resolve_session_id(context)
+        kind = request.WhichOneof('range')
+        if kind == 'sequence':
+            # end absent ou négatif: jusqu'au dernier chunk (end = 0 ne garde que le chunk 0)
+            end = request.sequence.end
+            if not request.sequence.HasField('end') or end < 0:
+                end = 2 ** 31 - 1
+            entries = self.persistent_cache.get_entries_in_sequence_range(session_id, request.sequence.start, end)
+        elif kind == 'time':
+            end_ms = request.time.end_ms or int(time.time() * 1000)
+            entries = self.persistent_cache.get_entries_in_time_range(session_id, request.time.start_ms, end_ms)
+        else:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Plage manquante (sequence ou time)")
+        
+        logger.info(f"🕰️ Historique {kind} de '{session_id}': {len(entries)} chunks")
+        local = self._wants_local(context)
+        for _, slam_data in entries:
+            yield self._present(session_id, slam_data, local)
+
+
+
+    def GetKeyframeChunks(self, request, context):
+        """Envoie les chunks contenant des points des keyframes demandées"""
+        session_id = request.session_id or self._resolve_session_id(context)
+        entries = self.persistent_cache.get_entries_for_keyframes(session_id, request.keyframe_ids)
+        logger.info(f"🔑 {len(request.keyframe_ids)} keyframes de '{session_id}': {len(entries)} chunks")
+        
+        local = self._wants_local(context)
+        for _, slam_data in entries:
+            slam_data = self._present(session_id, slam_data, local)
+            if request.keyframes_only:
+                slam_data = select_keyframes(slam_data, request.keyframe_ids)
+                if slam_data is None:
+                    continue
+            yield slam_data
+
+
+
+    def GetMapSnapshot(self, request, context):
+        """Carte entière en un seul message, servie depuis la pyramide de niveaux de détail"""
+        session_id = request.session_id or self._resolve_session_id(context)
+        pyramid = self.persistent_cache.get_lod_pyramid(session_id)
+        if pyramid is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, f"Session inconnue: {session_id}")
+        if request.voxel_size < 0 or request.max_points < 0:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "voxel_size et max_points doivent être positifs")
+
+        slam_data = pyramid.snapshot(session_id, request.voxel_size, request.max_points)
+        logger.info(f"🗺️ Instantané de '{session_id}' à {slam_data.lod_voxel_size * 100:g} cm: "
+                    f"{len(slam_data.pointcloudlist.pointclouds[0].points)} points (séquence {slam_data.sequence_number})")
+        return slam_data
+
+
+
+    def CorrectPoses(self, request, context):
+        """Reçoit des poses de keyframes corrigées par le producteur (fermeture de boucle)"""
+        session_id = request.session_id or self._resolve_session_id(context)
+        poses = {keyframe_pose.keyframe_id: keyframe_pose.pose for keyframe_pose in request.poses}
+        if poses:
+            self.stream_monitor.update_activity(session_id)
+            revision, chunk_ids = self.persistent_cache.apply_pose_corrections(session_id, poses)
+            self.timeline.publish(session_id, 'correction', revision)
+            logger.info(f"🔁 Correction #{revision} de '{session_id}': {len(poses)} poses, "
+                        f"{len(chunk_ids)} chunks re-transformés sans renvoi des points")
+        return Empty()
+
+
+
+    def GetPoseCorrections(self, request, context):
+        """Stream des corrections de poses: toutes les corrections existantes, puis les nouvelles"""
+        session_id = self._resolve_session_id(context)
+        logger.info(f"Envoi des corrections de poses de '{session_id}' au client...")
+        revision = 0
+        version = self.persistent_cache.data_version(session_id)
+        while context.is_active():
+            current, poses = self.persistent_cache.get_pose_corrections(session_id, revision)
+            if poses:
+                yield self._pose_correction(session_id, current, poses)
+            revision = current
+            version = yield from self._wait_for_data(session_id, version)
+
+
+
+    @staticmethod
+    def _pose_correction(session_id, revision, poses):
+        """PoseCorrection envoyée aux clients pour des poses {keyframe_id: Pose}"""
+        return pointcloud_pb2.PoseCorrection(
+            session_id=session_id,
+            revision=revision,
+            poses=[pointcloud_pb2.KeyframePose(keyframe_id=keyframe_id, pose=pose)
+                   for keyframe_id, pose in poses.items()]
+        )
+
     def ConnectPoses(self, request_iterator, context):
         """Réception d'un stream de PoseList côté client."""
-        logger.info("Réception d'un stream PoseList (ConnectPoses) du client...")
+        session_id = self._resolve_session_id(context)
+        logger.info(f"Réception d'un stream PoseList (ConnectPoses) pour '{session_id}'...")
         
         for poselist in request_iterator:
             # Mettre à jour l'activité
-            self.stream_monitor.update_activity()
+            self.stream_monitor.update_activity(session_id)
             
             logger.debug(f"Reçu PoseList contenant {len(poselist.poses)} poses.")
-            self._global_buffer_poses.append(poselist)
+            self._append_poses(session_id, poselist)
         return Empty()
 
+    def _append_poses(self, session_id, poselist):
+        """Ajoute une PoseList au buffer de la session et réveille les flux de poses"""
+        with self._poses_changed:
+            poses = self._pose_buffers[session_id]
+            poses.append(poselist)
+            self._poses_changed.notify_all()
+            self.timeline.publish(session_id, 'poses', len(poses) - 1)
+
+    def _release_poses(self, session_id):
+        """Libère le buffer de poses d'une session terminée et réveille ses flux de poses"""
+        with self._poses_changed:
+            self._pose_buffers.pop(session_id, None)
+            self._poses_changed.notify_all()
+
+    def _poses_of(self, session_id):
+        """Buffer de poses d'une session, sans le créer (tuple vide tant qu'aucune PoseList n'est reçue)"""
+        return self._pose_buffers.get(session_id, ())
 
+    def _publish_session(self, session_id):
+        """Listener du SessionManager: événement 'session' dans la timeline (début, clients, activité, fin)"""
+        if session_id:
+            self.timeline.publish(session_id, 'session')
+
+    def _publish_chunks(self, session_id):
+        """Listener du cache: événement 'chunks' dans la timeline quand une nouvelle séquence est scellée"""
+        sequence_number = self.persistent_cache.latest_sequence(session_id)
+        previous = self._timeline_sequences.get(session_id, -1)
+        if sequence_number > previous:
+            self._timeline_sequences[session_id] = sequence_number
+            self.timeline.publish(session_id, 'chunks', sequence_number)
+            # Palier de chunks: changement de session poussé aux flux WatchSession
+            if (sequence_number + 1) // self.SESSION_CHUNK_MILESTONE > (previous + 1) // self.SESSION_CHUNK_MILESTONE:
+                self.session_manager.notify_change(session_id)
+
+
+
+    # Attentes des flux temps réel. Ce sont des générateurs, utilisés avec `yield from`:
+    # server_aio les remplace par des attentes asyncio sans réécrire les flux.
+    def _wait_for_poses(self, session_id, poses, sent_count):
+        """Bloque jusqu'à ce que le buffer de poses dépasse sent_count ou soit remplacé (ou jusqu'au délai)"""
+        with self._poses_changed:
+            self._poses_changed.wait_for(
+                lambda: len(poses) > sent_count or self._poses_of(session_id) is not poses, self.STREAM_WAIT_TIMEOUT)
+        return
+        yield
+
+    def _wait_for_queue(self, queue, version, timeout=None):
+        """Bloque jusqu'à un changement de la file d'envoi après `version`, retourne la nouvelle version"""
+        return queue.wait(version, self.STREAM_WAIT_TIMEOUT if timeout is None else min(timeout, self.STREAM_WAIT_TIMEOUT))
+        yield
+
+    def _queue_settings(self, client_cache_info):
+        """Taille et politique de la file d'envoi demandées par un client, bornées par le serveur
+        
+        'block' ralentit l'ingestion de toute la session: seul le serveur
+        peut la choisir (SEND_QUEUE_POLICY), jamais un client.
+        """
+        policy = client_cache_info.get('queuePolicy', self.SEND_QUEUE_POLICY)
+        if policy not in QUEUE_POLICIES or (policy == 'block' and self.SEND_QUEUE_POLICY != 'block'):
+            logger.warning(f"Politique de file '{policy}' refusée, utilisation de '{self.SEND_QUEUE_POLICY}'")
+            policy = self.SEND_QUEUE_POLICY
+        capacity = max(self.MIN_SEND_QUEUE_SIZE, int(client_cache_info.get('queueSize') or self.SEND_QUEUE_SIZE))
+        return capacity, policy
+
+    def _subscribe(self, session_id, client_id, after_sequence, capacity, policy):
+        """File d'envoi d'un client temps réel (surchargé par server_aio pour le réveil asyncio)"""
+        return self.fanout.subscribe(session_id, client_id, after_sequence, capacity, policy)
+
+    def _wait_for_data(self, session_id, version):
+        """Bloque jusqu'à un scellement ou une correction après `version`, retourne la nouvelle version"""
+        return self.persistent_cache.wait_for_change(session_id, version, self.STREAM_WAIT_TIMEOUT)
+        yield
+
+    def _wait_for_timeline(self, journal, tick):
+        """Bloque jusqu'à un événement de la timeline après `tick` (ou jusqu'au délai)"""
+        journal.wait(tick, self.STREAM_WAIT_TIMEOUT)
+        return
+        yield
+
+    def _wait_for_session(self, version):
+        """Bloque jusqu'à un changement de session après `version` (ou jusqu'au délai), retourne la nouvelle version"""
+        return self.session_manager.wait_for_change(version, self.STREAM_WAIT_TIMEOUT)
+        yield
+
+    def _pace(self, delay):
+        """Attend `delay` secondes avant l'envoi suivant d'un client limité en débit"""
+        time.sleep(delay)
+        return
+        yield
+
+    def _send(self, shaper, message, catchup=False):
+        """Envoie un message (ou une trame déjà sérialisée) au rythme du seau à jetons du client"""
+        if shaper is not None and shaper.limited:
+            delay = shaper.reserve(len(message) if isinstance(message, bytes) else message.ByteSize(), catchup)
+            if delay > 0:
+                yield from self._pace(delay)
+        yield message
+
+    def _shaper_for(self, session_id, client_cache_info):
+        """Limiteur d'un client: débit demandé (maxBytesPerSecond) plafonné par celui du serveur,
+        débit du rattrapage demandé (catchupBytesPerSecond) ou celui du serveur"""
+        rates = [rate for rate in (int(client_cache_info.get('maxBytesPerSecond') or 0),
+                                   self.CLIENT_MAX_BYTES_PER_SECOND) if rate > 0]
+        return ClientShaper(
+            min(rates) if rates else 0,
+            uplink=self.uplink_bucket,
+            live_meter=self._ingest_rates[session_id],
+            catchup_min_share=self.CATCHUP_MIN_SHARE,
+            catchup_rate=int(client_cache_info.get('catchupBytesPerSecond') or self.CATCHUP_BYTES_PER_SECOND)
+        )
+
+
+
+    def _connect_client(self, session_id, client_id, context, last_sequence=-1):
+        """Enregistre un client de flux, retourne le nombre de clients de la session
+
+        La libération est attachée à la fin de l'appel gRPC (context.add_callback):
+        un client parti est libéré tout de suite, même si son flux attend
+        encore de nouvelles données.
+        """
+        with self._client_lock:
+            clients = self._client_states.setdefault(session_id, {})
+            clients[client_id] = last_sequence
+            count = len(clients)
+        self.session_manager.set_clients_count(count, session_id)
+        if not context.add_callback(lambda: self._disconnect_client(session_id, client_id)):
+            self._disconnect_client(session_id, client_id)  # appel déjà terminé
+        return count
+
+    def _disconnect_client(self, session_id, client_id):
+        """Libère l'état d'un client (idempotent): fin de son flux ou de son appel gRPC"""
+        with self._client_lock:
+            clients = self._client_states.get(session_id, {})
+            if client_id not in clients:
+                return
+            del clients[client_id]
+            if not clients:
+                del self._client_states[session_id]
+            count = len(clients)
+        # Réveille un flux en attente sur sa file d'envoi pour qu'il se termine
+        self.fanout.unsubscribe_client(session_id, client_id)
+        self.session_manager.set_clients_count(count, session_id)
+        logger.info(f"👋 Client {client_id} de '{session_id}' libéré, clients restants: {count}")
+
+    def _clients_count(self, session_id):
+        with self._client_lock:
+            return len(self._client_states.get(session_id, {}))
+
+    def _set_client_cursor(self, session_id, client_id, sequence_number):
+        """Dernière séquence reçue par un client encore connecté (ignoré s'il a été libéré)"""
+        with self._client_lock:
+            clients = self._client_states.get(session_id)
+            if clients is not None and client_id in clients:
+                clients[client_id] = sequence_number
 
     def GetPoses(self, request, context):
         """Envoi d'un stream de PoseList vers le client."""
-        logger.info("Envoi d'un stream PoseList (GetPoses) au client...")
-        sent_count = 0
+        session_id = self._resolve_session_id(context)
+        logger.info(f"Envoi d'un stream PoseList (GetPoses) de '{session_id}' au client...")
+        poses, sent_count = self._poses_of(session_id), 0
         try:
-            while True:
-                while sent_count < len(self._global_buffer_poses):
-                    poselist = self._global_buffer_poses[sent_count]
+            while context.is_active():
+                if self._poses_of(session_id) is not poses:
+                    # Première PoseList, ou buffer libéré en fin de session: suivre le buffer courant
+                    poses, sent_count = self._poses_of(session_id), 0
+                while sent_count < len(poses):
+                    poselist = poses[sent_count]
                     logger.debug(f"Envoi PoseList {sent_count} contenant {len(poselist.poses)} poses")
                     yield poselist
                     sent_count += 1
-                time.sleep(0.1)
+                yield from self._wait_for_poses(session_id, poses, sent_count)
         except grpc.RpcError as e:
             logger.error(f"Erreur RPC dans GetPoses: {e.code()}, message : {e.details()}")
 
 
 
+    def GetTrajectory(self, request, context):
+        """Trajectoire sous-échantillonnée: historique décimé, puis flux live filtré
+
+        Une pose par PoseList reçue (la dernière, comme le client web), et
+        une pose par message envoyé.
+        """
+        session_id = request.session_id or self._resolve_session_id(context)
+        modes = {
+            pointcloud_pb2.DECIMATION_FULL: 'full',
+            pointcloud_pb2.DECIMATION_MIN_DELTA: 'delta',
+            pointcloud_pb2.DECIMATION_RDP: 'rdp',
+        }
+        if request.mode not in modes:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Mode de décimation inconnu: {request.mode}")
+        decimator = TrajectoryDecimator(modes[request.mode], request.min_translation,
+                                        request.min_rotation, request.epsilon)
+        poses = self._poses_of(session_id)
+
+        history_count = len(poses)
+        history = [poselist.poses[-1] for poselist in poses[:history_count] if poselist.poses]
+        kept = decimator.decimate(history)
+        logger.info(f"📉 Trajectoire de '{session_id}' ({modes[request.mode]}): "
+                    f"{len(kept)}/{len(history)} poses de l'historique envoyées")
+        for index in kept:
+            yield pointcloud_pb2.PoseList(poses=[history[index]])
+        if request.history_only:
+            return
+
+        sent_count = history_count
+        try:
+            while context.is_active():
+                if self._poses_of(session_id) is not poses:
+                    # Première PoseList, ou session suivante du même ID: nouvelle trajectoire
+                    poses, sent_count = self._poses_of(session_id), 0
+                    decimator.reset()
+                while sent_count < len(poses):
+                    poselist = poses[sent_count]
+                    sent_count += 1
+                    if poselist.poses and decimator.accept(poselist.poses[-1]):
+                        yield pointcloud_pb2.PoseList(poses=[poselist.poses[-1]])
+                yield from self._wait_for_poses(session_id, poses, sent_count)
+        except grpc.RpcError as e:
+            logger.error(f"Erreur RPC dans GetTrajectory: {e.code()}, message : {e.details()}")
+
+
+
     def ConnectSlamData(self, request_iterator, context):
         """Réception des données SLAM et création de chunks"""
-        logger.info("Réception des slam data du client...")
-        
-        # Signaler l'activité au monitor (nouvelles keyframes reçues)
-        self.stream_monitor.update_activity()
+        session_id = self._producer_session_id(context)
+        if session_id is None:
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION,
+                          "Une autre session est alimentée: metadata 'session-id' requise")
+        logger.info(f"Réception des slam data pour la session '{session_id}'...")
         
-        # Mettre à jour la session comme active
-        current_session = self.session_manager.get_session_info()
-        if not current_session.get('is_active'):
-            # Créer une nouvelle session active si nécessaire
-            from slam_service_pb2 import SessionInfo as ProtoSessionInfo
-            session_update = ProtoSessionInfo(
-                session_id=current_session.get('session_id', f'SLAM-{int(time.time())}'),
-                start_time=current_session.get('start_time', datetime.now().isoformat()),
-                is_active=True,
-                clients_connected=current_session.get('clients_connected', 0)
-            )
-            self.session_manager.update_from_proto(session_update)
+        self._activate_session(session_id)
         
         data_count = 0
         try:
             for data in request_iterator:
-                # Créer des chunks à partir des données reçues
-                chunk_ids = self.persistent_cache.add_slam_data(
-                    data.pointcloudlist, 
-                    data.poselist, 
-                    data.indexlist, 
-                    self.VOXEL_SIZE_SEND
-                )
-                
+                self._ingest_slam_data(session_id, data)
                 data_count += 1
-                
-                if DEBUG_CLIENT and chunk_ids:
-                    logger.debug(f"Créé {len(chunk_ids)} nouveaux chunks")
             
-            # Forcer la création d'un dernier chunk avec les données restantes
-            final_chunk = self.persistent_cache.flush_pending()
-            if final_chunk:
-                logger.debug(f"Chunk final créé: {final_chunk}")
-                
-            if DEBUG_CLIENT:
-                stats = self.persistent_cache.get_stats()
-                logger.debug(f"Cache stats: {stats}")
+            self._finish_ingest(session_id)
                 
         except grpc.RpcError as e:
             logger.error(f"Erreur dans ConnectSlamData: {e}")
@@ -258,12 +696,60 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
         return Empty()
 
 
+    def _activate_session(self, session_id):
+        """Marque la session du producteur comme active"""
+        # Mettre à jour la session comme active
+        current_session = self.session_manager.get_session_info(session_id)
+        if not current_session.get('is_active'):
+            # Créer une nouvelle session active si nécessaire
+            session_update = pointcloud_pb2.SessionInfo(
+                session_id=session_id,
+                start_time=current_session.get('start_time') or datetime.now().isoformat(),
+                is_active=True,
+                clients_connected=self._clients_count(session_id)
+            )
+            self.session_manager.update_from_proto(session_update)
+        
+        # Signaler l'activité au monitor (session connue: nouvelles keyframes reçues)
+        self.stream_monitor.update_activity(session_id)
+
+    def _ingest_slam_data(self, session_id, data):
+        """Filtre un message du producteur et crée les chunks (coûteux en CPU)"""
+        self._ingest_rates[session_id].add(data.ByteSize())
+        chunk_ids = self.persistent_cache.add_slam_data(
+            data.pointcloudlist, 
+            data.poselist, 
+            data.indexlist, 
+            self.VOXEL_SIZE_SEND,
+            session_id=session_id
+        )
+        self.stream_monitor.update_activity(session_id)
+        
+        if DEBUG_CLIENT and chunk_ids:
+            logger.debug(f"Créé {len(chunk_ids)} nouveaux chunks")
+        return chunk_ids
+
+    def _finish_ingest(self, session_id):
+        """Fin d'un stream du producteur: dernier chunk avec les données restantes"""
+        # Forcer la création d'un dernier chunk avec les données restantes
+        final_chunk = self.persistent_cache.flush_pending(session_id)
+        if final_chunk:
+            logger.debug(f"Chunk final créé: {final_chunk}")
+            self.compactor.compact_now()
+            
+        if DEBUG_CLIENT:
+            stats = self.persistent_cache.get_stats(session_id)
+            logger.debug(f"Cache stats: {stats}")
+
+
+
     def GetSlamData(self, request, context):
         """Envoi des données SLAM avec support pour la synchronisation intelligente"""
         client_id = str(uuid.uuid4())
+        session_id = self._resolve_session_id(context)
         
         # Mettre à jour l'activité
-        self.stream_monitor.update_activity()
+        self.stream_monitor.update_activity(session_id)
         
         # Extraire les infos du cache client depuis custom-header-1
         metadata = dict(context.invocation_metadata())
@@ -291,7 +777,7 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
         
 
         # Vérification simple basée uniquement sur is_active
-        session_info = self.session_manager.get_session_info()
+        session_info = self.session_manager.get_session_info(session_id)
         initial_session_id = session_info.get('session_id', '')
         is_active = session_info.get('is_active', False)
         
@@ -305,102 +791,297 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
             return
  
 
-        # Ajouter le client
-        client_count = self.session_manager.increment_clients()
-        logger.debug(f"Nombre de clients connectés: {client_count}")
+        # Ajouter le client (libéré dès la fin de l'appel, même si le flux est en attente)
+        client_count = self._connect_client(session_id, client_id, context, client_last_sequence)
+        logger.debug(f"Nombre de clients connectés à '{session_id}': {client_count}")
         
         try:
-            session_info = self.session_manager.get_session_info()
-            session_id = session_info['session_id']
+            # Débit d'envoi du client (seau à jetons), rattrapage compris
+            shaper = self._shaper_for(session_id, client_cache_info)
+            if shaper.rate > 0:
+                logger.info(f"🚦 Client {client_id} limité à {int(shaper.rate)} octets/s")
             
-            # Initialiser l'état du client
-            with self._client_lock:
-                self._client_states[client_id] = client_last_sequence
+            # Client sous budget de points: flux échantillonné, sans cache client
+            local = self._wants_local(context)
+            point_budget = client_cache_info.get('pointBudget')
+            if point_budget:
+                yield from self._stream_with_budget(
+                    session_id, client_id, int(point_budget), viewpoint_from_header(client_cache_info), local,
+                    context, shaper
+                )
+                return
             
             # Décider quoi envoyer basé sur l'état du cache client
             if client_session_id != session_id or client_last_sequence == -1:
                 # Nouvelle session ou premier connect - envoyer tout
                 logger.info(f"❌ Cache invalide ou nouvelle session - envoi complet")
                 logger.info(f"  - Client session: '{client_session_id}' vs Server session: '{session_id}'")
-                historical_chunks = self.persistent_cache.get_all_chunks_for_session(session_id)
-                logger.info(f"📤 Envoi de {len(historical_chunks)} chunks (historique complet)")
+                catchup_from = -1
             else:
                 # Session existante - envoyer seulement les nouveaux chunks
                 logger.info(f"✅ Cache valide - envoi incrémental après sequence {client_last_sequence}")
-                historical_chunks = self.persistent_cache.get_chunks_after_sequence(
-                    client_last_sequence, session_id
-                )
-                logger.info(f"📤 Envoi de {len(historical_chunks)} nouveaux chunks seulement")
-                
-                # Stats d'optimisation
-                total_chunks = self.persistent_cache.get_stats()['total_chunks']
-                saved_chunks = total_chunks - len(historical_chunks)
-                if saved_chunks > 0:
-                    logger.info(f"🚀 Optimisation: {saved_chunks} chunks économisés grâce au cache client")
+                catchup_from = client_last_sequence
             
-            # Envoyer les chunks nécessaires
-            sent_count = 0
-            for slam_data in historical_chunks:
-                yield slam_data
-                sent_count += 1
+            # Rattrapage dans l'ordre et en repère keyframe: trames pré-sérialisées, sans parcourir les chunks
+            viewpoint = viewpoint_from_header(client_cache_info)
+            use_frames = self.PRESERIALIZED_CATCHUP and local and viewpoint is None
+            if use_frames:
+                historical_entries = []
+                catchup_end = max(catchup_from,
+                                  self.persistent_cache.get_sync_status(session_id)['latest_sequence_number'])
+                logger.info(f"📤 Rattrapage pré-sérialisé des séquences {catchup_from + 1} à {catchup_end}")
+            else:
+                historical_entries = self.persistent_cache.get_entries_after_sequence(catchup_from, session_id)
+                catchup_end = historical_entries[-1][0].sequence_number if historical_entries else catchup_from
+                logger.info(f"📤 Envoi de {len(historical_entries)} chunks")
                 
-                # Mettre à jour le dernier numéro de séquence envoyé
-                with self._client_lock:
-                    self._client_states[client_id] = slam_data.sequence_number
-                    
-                # Log de progression pour les gros envois
-                if sent_count % 100 == 0:
-                    logger.debug(f"Progression: {sent_count}/{len(historical_chunks)} chunks envoyés")
+                # Stats d'optimisation
+                if catchup_from != -1:
+                    total_chunks = self.persistent_cache.get_stats(session_id)['total_chunks']
+                    saved_chunks = total_chunks - len(historical_entries)
+                    if saved_chunks > 0:
+                        logger.info(f"🚀 Optimisation: {saved_chunks} chunks économisés grâce au cache client")
             
-            logger.info(f"✅ Envoi initial terminé: {sent_count} chunks")
+            # Ordre du rattrapage: séquence (défaut) ou priorité depuis le point de vue du client
+            if viewpoint is not None:
+                logger.info(f"🎥 Rattrapage priorisé par '{viewpoint.mode}' depuis {viewpoint.position.tolist()}")
+                historical_chunks = (
+                    slam_data for _, slam_data in iter_by_priority(
+                        historical_entries,
+                        lambda entry: viewpoint.priority(entry[0]),
+                        self.CATCHUP_PRIORITY_QUEUE
+                    )
+                )
+            else:
+                historical_chunks = (slam_data for _, slam_data in historical_entries)
             
-            # 2. Mode temps réel - surveiller les nouveaux chunks
-            logger.info("🎯 Passage en mode temps réel...")
-            last_check_time = time.time()
+            # Voie de rattrapage: tuiles progressives puis historique, servie quand le temps réel est à jour
+            catchup = self._catchup_lane(
+                session_id, historical_chunks,
+                progressive=bool(client_cache_info.get('progressive')) and catchup_from == -1,
+                frames_range=(catchup_from, catchup_end) if use_frames else None
+            )
+            self._set_client_cursor(session_id, client_id, catchup_from)
             
-            while True:
-                current_time = time.time()
-                
-                # Vérifier les nouveaux chunks toutes les 100ms
-                if current_time - last_check_time > 0.1:
-                    with self._client_lock:
-                        last_sequence = self._client_states[client_id]
-                    
-                    # Récupérer les nouveaux chunks
-                    new_chunks = self.persistent_cache.get_chunks_after_sequence(
-                        last_sequence, session_id
-                    )
-                    
-                    # Envoyer les nouveaux chunks
-                    for slam_data in new_chunks:
-                        yield slam_data
-                        
-                        with self._client_lock:
-                            self._client_states[client_id] = slam_data.sequence_number
-                        
-                        logger.debug(f"📦 Nouveau chunk temps réel: {slam_data.chunk_id}")
-                    
-                    last_check_time = current_time
-                
-                # Petite pause pour éviter la surcharge CPU
-                time.sleep(0.05)
+            # 2. Voie temps réel - file d'envoi bornée alimentée à chaque scellement, servie en priorité
+            logger.info("🎯 Temps réel immédiat, rattrapage en arrière-plan")
+            capacity, policy = self._queue_settings(client_cache_info)
+            queue = self._subscribe(session_id, client_id, catchup_end, capacity, policy)
+            heartbeat = client_cache_info.get('heartbeatSeconds')
+            heartbeat = float(self.CLIENT_HEARTBEAT_SECONDS if heartbeat is None else heartbeat)
+            try:
+                yield from self._stream_queue(queue, context, local, shaper,
+                                              catchup, catchup_from, catchup_end, in_order=viewpoint is None,
+                                              heartbeat=heartbeat)
+            finally:
+                self.fanout.unsubscribe(queue)
                 
         except grpc.RpcError as e:
             logger.error(f"Client {client_id} déconnecté: {e.code()}")
         finally:
-            # Nettoyer l'état du client
-            with self._client_lock:
-                if client_id in self._client_states:
-                    del self._client_states[client_id]
-            
-            # Retirer le client
-            client_count = self.session_manager.decrement_clients()
-            logger.debug(f"Client déconnecté, clients restants: {client_count}")
+            # Nettoyer l'état du client (déjà fait si la fin de l'appel a été détectée avant)
+            self._disconnect_client(session_id, client_id)
+
+
+
 
 
 
 
 
+    def _catchup_lane(self, session_id, historical_chunks, progressive=False, frames_range=None):
+        """Messages du rattrapage: (message, séquence), séquence None pour une tuile de niveau de détail
+
+        Avec frames_range = (après, jusqu'à), l'historique est lu en trames
+        pré-sérialisées (bytes) dans le cache, envoyées telles quelles.
+        """
+        if progressive:
+            # Mode progressif: toute la carte du niveau le plus grossier au plus fin, puis pleine résolution
+            pyramid = self.persistent_cache.get_lod_pyramid(session_id)
+            lod_sent = 0
+            for level in (pyramid.coarse_to_fine() if pyramid else []):
+                for slam_data in pyramid.level_chunks(level, session_id, self.LOD_TILE_POINTS):
+                    yield slam_data, None
+                    lod_sent += 1
+            logger.info(f"🧊 Mode progressif: {lod_sent} tuiles de niveaux de détail envoyées")
+        
+        sent_count = 0
+        if frames_range is not None:
+            after_sequence, until_sequence = frames_range
+            for sequence_number, frame in self.persistent_cache.get_catchup_frames(
+                    session_id, after_sequence, until_sequence):
+                yield frame, sequence_number
+                after_sequence = sequence_number
+                sent_count += 1
+            # Reste éventuel (chunk compacté à cheval sur le curseur, bundle désactivé): depuis les chunks
+            historical_chunks = (
+                slam_data for metadata, slam_data in
+                self.persistent_cache.get_entries_after_sequence(after_sequence, session_id)
+                if metadata.sequence_number <= until_sequence
+            )
+        
+        for slam_data in historical_chunks:
+            yield slam_data, slam_data.sequence_number
+            sent_count += 1
+            # Log de progression pour les gros envois
+            if sent_count % 100 == 0:
+                logger.debug(f"Progression du rattrapage: {sent_count} chunks envoyés")
+
+    def _stream_queue(self, queue, context, local=False, shaper=None,
+                      catchup=None, cursor=-1, catchup_end=-1, in_order=True, heartbeat=0):
+        """Vide la file d'envoi d'un client temps réel, en attendant sans CPU quand elle est vide
+
+        La voie de rattrapage (catchup) n'est servie que quand la file temps
+        réel est vide, au débit de rattrapage du client. Tant qu'elle n'est
+        pas terminée, chaque message porte resume_sequence = cursor, la
+        dernière séquence reçue sans trou (qui n'avance que si le rattrapage
+        est envoyé dans l'ordre). Avec heartbeat > 0, un SlamData vide part
+        après heartbeat secondes sans message.
+        """
+        session_id, client_id = queue.session_id, queue.client_id
+        seen = queue.version
+        live_sequence = catchup_end  # la file temps réel reprend juste après le rattrapage
+        pending = None  # (message, séquence, instant d'envoi) du rattrapage en attente de débit
+        catchup_sent = 0
+        last_sent = time.monotonic()
+        while context.is_active():
+            if queue.overflowed:
+                with self._client_lock:
+                    cursor = self._client_states.get(session_id, {}).get(client_id, -1)
+                logger.warning(f"🐢 Client {client_id} trop lent, déconnecté (reprise après la séquence {cursor})")
+                context.set_trailing_metadata((('resume-cursor', str(cursor)),))
+                context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                              f"File d'envoi pleine, reprendre après la séquence {cursor}")
+            
+            action = queue.pop()
+            if action is not None:
+                # Voie temps réel: toujours servie en premier
+                catching_up = catchup is not None or pending is not None
+                for message in self._live_messages(session_id, action, local):
+                    yield from self._send(shaper, with_resume_sequence(message, cursor) if catching_up else message)
+                last_sent = time.monotonic()
+                kind, item = action
+                live_sequence = item.sequence_number if kind == 'chunk' else item if kind == 'lod' else item[1]
+                if not catching_up:
+                    cursor = live_sequence
+                    self._set_client_cursor(session_id, client_id, cursor)
+                continue
+            
+            if pending is None and catchup is not None:
+                next_catchup = next(catchup, None)
+                if next_catchup is None:
+                    # Rattrapage terminé: tout est chez le client jusqu'au dernier chunk temps réel
+                    catchup = None
+                    cursor = live_sequence
+                    self._set_client_cursor(session_id, client_id, cursor)
+                    logger.info(f"✅ Rattrapage terminé: {catchup_sent} messages")
+                    continue
+                message, sequence_number = next_catchup
+                if sequence_number is not None and not isinstance(message, bytes):
+                    message = self._present(session_id, message, local)
+                size = len(message) if isinstance(message, bytes) else message.ByteSize()
+                delay = shaper.reserve(size, catchup=True) if shaper is not None and shaper.limited else 0.0
+                pending = (message, sequence_number, time.monotonic() + delay)
+            
+            if pending is None:
+                idle_timeout = None
+                if heartbeat > 0:
+                    idle_timeout = heartbeat - (time.monotonic() - last_sent)
+                    if idle_timeout <= 0:
+                        # Client inactif: un envoi fait remonter une connexion morte que le flux n'aurait pas vue
+                        last_sent = time.monotonic()
+                        yield pointcloud_pb2.SlamData()
+                        continue
+                seen = yield from self._wait_for_queue(queue, seen, idle_timeout)
+                continue
+            
+            # Voie de rattrapage: attendre son débit, le temps réel peut passer avant
+            message, sequence_number, send_at = pending
+            remaining = send_at - time.monotonic()
+            if remaining > 0:
+                seen = yield from self._wait_for_queue(queue, seen, remaining)
+                continue
+            pending = None
+            if in_order and sequence_number is not None:
+                cursor = sequence_number
+                self._set_client_cursor(session_id, client_id, cursor)
+            yield with_resume_sequence(message, cursor)
+            last_sent = time.monotonic()
+            catchup_sent += 1
+
+    def _live_messages(self, session_id, action, local=False):
+        """Messages d'une action de la file d'envoi temps réel"""
+        kind, item = action
+        if kind == 'chunk':
+            logger.debug(f"📦 Nouveau chunk temps réel: {item.chunk_id}")
+            yield self._present(session_id, item, local)
+        elif kind == 'lod':
+            # Chunks abandonnés: la carte entière au niveau de détail courant à la place
+            pyramid = self.persistent_cache.get_lod_pyramid(session_id)
+            yield from (pyramid.level_chunks(self.SLOW_CLIENT_LOD_LEVEL, session_id, self.LOD_TILE_POINTS)
+                        if pyramid else [])
+        else:
+            # Chunks regroupés pendant que la file était pleine: un seul message de rattrapage
+            start, end = item
+            entries = self.persistent_cache.get_entries_in_sequence_range(session_id, start, end)
+            if entries:
+                # Copies monde partagées pour un client sans repère local: rien à reconvertir
+                merged = merge_slam_data([self._present(session_id, slam_data, local) for _, slam_data in entries],
+                                         f"{session_id}_catchup_{start}-{end}",
+                                         self.persistent_cache.get_keyframe_corrections(session_id))
+                logger.debug(f"📦 Rattrapage regroupé {start}-{end}: {len(entries)} chunks")
+                yield merged
+
+    def _stream_with_budget(self, session_id, client_id, point_budget, viewpoint, local=False, context=None,
+                            shaper=None):
+        """Rattrapage puis temps réel en restant sous le budget de points du client"""
+        planner = PointBudgetPlanner(point_budget, viewpoint, falloff=self.BUDGET_FALLOFF)
+        logger.info(f"🎚️ Client {client_id} sous budget de {point_budget} points")
+        last_sequence = -1
+        catchup = True  # premier lot: rattrapage, ensuite temps réel
+        version = self.persistent_cache.data_version(session_id)
+        while context is None or context.is_active():
+            entries = self.persistent_cache.get_entries_after_sequence(last_sequence, session_id)
+            if entries:
+                if viewpoint is not None:
+                    entries.sort(key=lambda entry: viewpoint.priority(entry[0]))
+                chunks = {metadata.chunk_id: self._present(session_id, slam_data, local)
+                          for metadata, slam_data in entries}
+                corrections = self.persistent_cache.get_keyframe_corrections(session_id)
+                for directive, chunk_id, count in planner.plan([metadata for metadata, _ in entries]):
+                    message = self._budget_message(session_id, directive, chunk_id, count,
+                                                   chunks.get(chunk_id), corrections)
+                    if message is None:
+                        # Chunk évincé du cache entre-temps: le retirer chez le client
+                        planner.forget(chunk_id)
+                        message = pointcloud_pb2.SlamData(chunk_id=chunk_id, directive=pointcloud_pb2.CHUNK_DROP)
+                    if not local:
+                        message = to_world_slam_data(message, corrections)  # chunk relu hors de `chunks`
+                    yield from self._send(shaper, message, catchup)
+                    planner.applied(message.directive, chunk_id, count)
+                
+                last_sequence = max(last_sequence, max(metadata.sequence_number for metadata, _ in entries))
+                self._set_client_cursor(session_id, client_id, last_sequence)
+                logger.debug(f"🎚️ {client_id}: {planner.points_sent}/{point_budget} points chez le client")
+            
+            catchup = False
+            version = yield from self._wait_for_data(session_id, version)
+
+    def _budget_message(self, session_id, directive, chunk_id, count, slam_data=None, corrections=None):
+        """SlamData d'une directive du budget (None si le chunk n'est plus dans le cache)"""
+        if directive == pointcloud_pb2.CHUNK_DROP:
+            return pointcloud_pb2.SlamData(chunk_id=chunk_id, directive=directive)
+        if slam_data is None:
+            slam_data = self.persistent_cache.get_chunk(chunk_id, session_id)
+            if slam_data is None:
+                return None
+        total = sum(len(pc.points) for pc in slam_data.pointcloudlist.pointclouds)
+        if directive == pointcloud_pb2.CHUNK_ADD and count >= total:
+            return slam_data
+        # Copie échantillonnée: ne jamais modifier le SlamData partagé du cache
+        sampled = sample_slam_data(slam_data, count, corrections=corrections)
+        sampled.directive = directive
+        return sampled
 
 
 
@@ -425,17 +1106,124 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
                 pass
 
         """Endpoint pour obtenir les informations de session"""
-        session_info = self.session_manager.get_session_info()
-        stats = self.persistent_cache.get_stats()
+        return self._session_info(self._resolve_session_id(context))
+
+    def _session_info(self, session_id):
+        """SessionInfo d'une session (session_id vide si elle est inconnue ou nettoyée)"""
+        session_info = self.session_manager.get_session_info(session_id)
+        stats = self.persistent_cache.get_stats(session_id)
         
         return pointcloud_pb2.SessionInfo(
             session_id=session_info['session_id'],
             start_time=session_info['start_time'],
             is_active=session_info['is_active'],
             clients_connected=session_info['clients_connected'],
-            total_chunks=stats['total_chunks']
+            total_chunks=stats['total_chunks'],
+            last_activity_ms=session_info['last_activity_ms']
         )
 
+    def WatchSession(self, request, context):
+        """Flux des changements de SessionInfo: début, activité, clients, paliers de chunks, fin
+
+        Remplace le polling de GetSessionInfo : l'état courant à la connexion,
+        puis un message à chaque changement signalé par le SessionManager.
+        Sans metadata 'session-id', suit la session courante (et passe à la
+        suivante quand elle change).
+        """
+        watched = dict(context.invocation_metadata()).get('session-id', '')
+        logger.info(f"👀 Surveillance de la session '{watched or '(courante)'}'")
+        last_info = None
+        version = None
+        while context.is_active():
+            current = self.session_manager.version
+            if current != version:
+                version = current
+                info = self._session_info(watched or self.session_manager.get_current_session_id())
+                if watched:
+                    info.session_id = watched  # même après le nettoyage de la session
+                if info != last_info:
+                    last_info = info
+                    yield info
+            yield from self._wait_for_session(version)
+
+    def StreamSession(self, request, context):
+        """Flux multiplexé d'une session: chunks, poses, corrections et état de session
+
+        Le client reçoit l'état de la session (tick 0), puis le journal de la
+        session depuis son début : chaque événement part dans l'ordre où le
+        serveur l'a vu, géométrie et trajectoire restent donc cohérentes. Un
+        Heartbeat part quand rien n'a été envoyé depuis SESSION_HEARTBEAT_SECONDS.
+        Quand la session est nettoyée, le flux continue sur la session suivante
+        du même session_id.
+        """
+        session_id = self._resolve_session_id(context)
+        local = self._wants_local(context)
+        shaper = self._shaper_for(session_id, {})
+        logger.info(f"🔀 Flux multiplexé de '{session_id}' ouvert")
+        
+        client_id = str(uuid.uuid4())
+        client_count = self._connect_client(session_id, client_id, context)
+        logger.debug(f"Nombre de clients connectés à '{session_id}': {client_count}")
+        try:
+            session_info = self._session_info(session_id)
+            session_info.session_id = session_id  # même après le nettoyage de la session
+            yield from self._send(shaper, pointcloud_pb2.SessionUpdate(tick=0, session=session_info))
+            last_sent = time.monotonic()
+            
+            journal = self.timeline.journal(session_id)
+            # Curseurs cumulatifs: un événement envoie tout ce qui précède sa référence (journal compacté)
+            tick, last_sequence, pose_index, revision = 0, -1, 0, 0
+            while context.is_active():
+                events = journal.events_after(tick)
+                if not events and journal.closed:
+                    # Session nettoyée: reprise sur le journal de la session suivante
+                    journal = self.timeline.journal(session_id)
+                    tick, last_sequence, pose_index, revision = 0, -1, 0, 0
+                    continue
+                
+                for tick, kind, ref in events:
+                    updates = []
+                    if kind == 'chunks':
+                        # Seuls les chunks de ]last_sequence, ref] sont lus
+                        for metadata, slam_data in self.persistent_cache.get_entries_after_sequence(
+                                last_sequence, session_id, until_sequence=ref):
+                            updates.append(pointcloud_pb2.SessionUpdate(
+                                tick=tick, chunk=self._present(session_id, slam_data, local)))
+                            last_sequence = metadata.sequence_number
+                    elif kind == 'poses':
+                        poses = self._pose_buffers.get(session_id, ())
+                        for poselist in poses[pose_index:ref + 1]:
+                            updates.append(pointcloud_pb2.SessionUpdate(tick=tick, poses=poselist))
+                        pose_index = max(pose_index, min(ref + 1, len(poses)))
+                    elif kind == 'correction':
+                        current, poses = self.persistent_cache.get_pose_corrections(session_id, revision)
+                        if poses:
+                            updates.append(pointcloud_pb2.SessionUpdate(
+                                tick=tick, correction=self._pose_correction(session_id, current, poses)))
+                        revision = current
+                    else:
+                        info = self._session_info(session_id)
+                        info.session_id = session_id
+                        if info != session_info:
+                            session_info = info
+                            updates.append(pointcloud_pb2.SessionUpdate(tick=tick, session=info))
+                    
+                    for update in updates:
+                        yield from self._send(shaper, update)
+                        last_sent = time.monotonic()
+                
+                if time.monotonic() - last_sent >= self.SESSION_HEARTBEAT_SECONDS:
+                    heartbeat = pointcloud_pb2.Heartbeat(timestamp_ms=int(time.time() * 1000))
+                    yield from self._send(shaper, pointcloud_pb2.SessionUpdate(tick=tick, heartbeat=heartbeat))
+                    last_sent = time.monotonic()
+                yield from self._wait_for_timeline(journal, tick)
+                
+        except grpc.RpcError as e:
+            logger.error(f"Erreur RPC dans StreamSession: {e.code()}, message : {e.details()}")
+        finally:
+            self._disconnect_client(session_id, client_id)
+            logger.info(f"🔀 Flux multiplexé de '{session_id}' fermé")
+
 
 
     # def SetSessionInfo(self, request, context):
@@ -468,14 +1256,17 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
             logger.info(f"  - Start time: {request.start_time}")
             logger.info(f"  - Clients: {request.clients_connected}")
             
-            # Mettre à jour l'activité du monitor si la session est active
+            # Mettre à jour le session manager (le nombre de clients est celui des flux connectés)
+            session_update = pointcloud_pb2.SessionInfo()
+            session_update.CopyFrom(request)
+            session_update.clients_connected = self._clients_count(request.session_id)
+            self.session_manager.update_from_proto(session_update)
+            
+            # Mettre à jour l'activité du monitor si la session est active (une fois connue du manager)
             if request.is_active:
-                self.stream_monitor.update_activity()
+                self.stream_monitor.update_activity(request.session_id)
                 logger.debug("🔄 Session active - activité mise à jour")
             
-            # Mettre à jour le session manager
-            self.session_manager.update_from_proto(request)
-            
             # Si session marquée comme inactive, préparer le nettoyage
             if not request.is_active:
                 logger.warning("🛑 Session marquée comme inactive par le client")
@@ -496,20 +1287,61 @@ class SlamServiceServicer(slam_service_pb2_grpc.SlamServiceServicer):
         """Arrêt propre du service"""
         logger.info("🛑 Arrêt du service SLAM...")
         self.stream_monitor.stop()
+        self.compactor.stop()
+
+
+
+
+def viewpoint_from_header(client_cache_info):
+    """Point de vue du client depuis custom-header-1, None pour l'ordre de séquence
+
+    Format attendu: {"syncOrder": "distance" | "visibility" | "sequence",
+                     "viewpoint": {"position": [x, y, z], "direction": [dx, dy, dz], "fov": 90}}
+    ou {"viewpoint": {"pose": [16 valeurs]}} (caméra -> monde, regard selon +Z).
+    """
+    order = client_cache_info.get('syncOrder', 'sequence')
+    view = client_cache_info.get('viewpoint')
+    if order == 'sequence' or not view:
+        return None
+    try:
+        fov = float(view.get('fov', 90.0))
+        if view.get('pose'):
+            return Viewpoint.from_pose(view['pose'], fov=fov, mode=order)
+        return Viewpoint(view['position'], view.get('direction'), fov=fov, mode=order)
+    except (KeyError, TypeError, ValueError) as e:
+        logger.warning(f"Point de vue invalide ignoré ({e}), rattrapage par séquence")
+        return None
+
+
+def region_from_request(request):
+    """Convertit la région d'un RegionRequest en BoxRegion / SphereRegion / FrustumRegion"""
+    kind = request.WhichOneof('region')
+    if kind == 'box':
+        box = request.box
+        return BoxRegion((box.min.x, box.min.y, box.min.z), (box.max.x, box.max.y, box.max.z))
+    if kind == 'sphere':
+        sphere = request.sphere
+        return SphereRegion((sphere.center.x, sphere.center.y, sphere.center.z), sphere.radius)
+    if kind == 'frustum':
+        frustum = request.frustum
+        return FrustumRegion(list(frustum.pose.matrix), frustum.fov_y, frustum.aspect,
+                             frustum.near, frustum.far)
+    return None
 
 
 
 
 def serve():
+    admission = AdmissionController(ADMISSION_CAPACITIES)
+    logger.info(f"Capacité par classe de RPC: {admission.capacities}")
     server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=10),
-        options=[
-            ('grpc.max_receive_message_length', 50 * 1024 * 1024),
-            ('grpc.max_send_message_length', 50 * 1024 * 1024),
-        ]
+        futures.ThreadPoolExecutor(max_workers=admission.total_capacity()),
+        interceptors=[AdmissionInterceptor(admission), PreSerializedInterceptor()],
+        options=SERVER_OPTIONS
     )
 
     servicer = SlamServiceServicer()
+    servicer.PRESERIALIZED_CATCHUP = True
     slam_service_pb2_grpc.add_SlamServiceServicer_to_server(servicer, server)
     server.add_insecure_port('[::]:9090')
     server.add_insecure_port('[::]:50051')
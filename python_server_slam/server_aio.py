@@ -0,0 +1,368 @@
+# server_aio.py - SlamService sur grpc.aio: les flux sont des coroutines, pas des threads
+import os
+import sys
+import asyncio
+from concurrent import futures
+
+import grpc
+from google.protobuf.empty_pb2 import Empty
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+gen_python_path = os.path.join(current_dir, '..', 'proto_files_slam')
+sys.path.append(gen_python_path)
+
+import slam_service_pb2_grpc
+
+# Même logique métier que le serveur à threads (cache, sessions, rattrapage, budget...)
+from server_5 import SlamServiceServicer, SERVER_OPTIONS
+# Capacité réservée par classe de RPC (ingestion, viewers, unaires)
+from AdmissionControl import AdmissionController, AsyncAdmissionInterceptor, rpc_class
+# Envoi des trames de rattrapage pré-sérialisées sans re-sérialisation
+from CatchupBundle import AsyncPreSerializedInterceptor
+
+import logging
+LOGGER_NAME = os.path.splitext(os.path.basename(__file__))[0]
+DEBUG_LOGS = True
+
+# Threads pour le travail CPU, un pool par classe de RPC: l'ingestion (filtrage, création
+# des chunks) n'attend jamais derrière la conversion et l'échantillonnage des viewers
+EXECUTOR_WORKERS = {
+    'ingest': int(os.environ.get('SLAM_AIO_INGEST_WORKERS', 2)),
+    'viewer': int(os.environ.get('SLAM_AIO_WORKERS', os.cpu_count() or 4)),
+    'unary': int(os.environ.get('SLAM_AIO_UNARY_WORKERS', 2)),
+}
+# Appels simultanés max par classe de RPC (un flux en attente ne tient pas de thread ici)
+ADMISSION_CAPACITIES = {
+    'ingest': int(os.environ.get('SLAM_INGEST_SLOTS', 4)),
+    'viewer': int(os.environ.get('SLAM_VIEWER_SLOTS', 2000)),
+    'unary': int(os.environ.get('SLAM_UNARY_SLOTS', 64)),
+}
+
+logger = logging.getLogger(LOGGER_NAME)
+logger.setLevel(logging.DEBUG if DEBUG_LOGS else logging.INFO)
+handler = logging.StreamHandler()
+formatter = logging.Formatter('[%(asctime)s][%(name)s][%(levelname)s] %(message)s')
+handler.setFormatter(formatter)
+logger.handlers = [handler]
+
+
+class _Abort(Exception):
+    """context.abort() appelé par un handler synchrone, rejoué sur le contexte grpc.aio"""
+    def __init__(self, code, details):
+        super().__init__(details)
+        self.code = code
+        self.details = details
+
+
+class _ContextAdapter:
+    """Contexte grpc.aio présenté avec l'API synchrone utilisée par SlamServiceServicer"""
+    def __init__(self, context):
+        self._context = context
+
+    def invocation_metadata(self):
+        return self._context.invocation_metadata()
+
+    def is_active(self):
+        return not self._context.done()
+
+    def abort(self, code, details):
+        raise _Abort(code, details)
+
+    def set_code(self, code):
+        self._context.set_code(code)
+
+    def set_details(self, details):
+        self._context.set_details(details)
+
+    def set_trailing_metadata(self, trailing_metadata):
+        self._context.set_trailing_metadata(trailing_metadata)
+
+    def peer(self):
+        return self._context.peer()
+
+    def add_callback(self, callback):
+        self._context.add_done_callback(lambda _: callback())
+        return True
+
+
+class _StreamWait:
+    """Attente demandée par un flux: reprise quand ready() est vrai (ou après timeout s), avec la valeur de result()"""
+    def __init__(self, key, ready, result=lambda: None, timeout=None):
+        self.key = key
+        self.ready = ready
+        self.result = result
+        self.timeout = timeout
+
+
+class _StreamSleep:
+    """Pause demandée par un flux limité en débit, sans tenir de thread"""
+    def __init__(self, delay):
+        self.delay = delay
+
+
+class AsyncSlamServiceServicer(SlamServiceServicer):
+    """SlamService pour grpc.aio
+
+    Les handlers du servicer synchrone sont réutilisés tels quels : chaque
+    étape d'un flux (jusqu'au prochain message) s'exécute dans l'executor,
+    et les attentes de nouvelles données (_wait_for_data, _wait_for_queue,
+    _wait_for_poses, _wait_for_timeline, _wait_for_session) deviennent des
+    futures asyncio réveillées par le cache et le SessionManager. Un client
+    en attente ne tient donc aucun thread : des milliers de clients
+    inactifs ne coûtent que de la mémoire. Doit être construit dans la
+    boucle asyncio.
+    """
+    def __init__(self, executor_workers=EXECUTOR_WORKERS):
+        super().__init__()
+        self._loop = asyncio.get_running_loop()
+        self._executors = {
+            name: futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f'slam-aio-{name}')
+            for name, workers in executor_workers.items()
+        }
+        self._signals = {}  # clé d'attente -> future partagée par les flux en attente
+        self.persistent_cache.add_change_listener(
+            lambda session_id: self._loop.call_soon_threadsafe(self._signal, ('data', session_id))
+        )
+        self.timeline.add_change_listener(
+            lambda session_id: self._loop.call_soon_threadsafe(self._signal, ('timeline', session_id))
+        )
+        self.session_manager.add_change_listener(
+            lambda session_id: self._loop.call_soon_threadsafe(self._signal, ('session',))
+        )
+
+    # --- Réveil des flux (toujours dans le thread de la boucle) ---
+
+    def _signal(self, key):
+        future = self._signals.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(None)
+
+    async def _wait(self, wait):
+        deadline = None if wait.timeout is None else self._loop.time() + wait.timeout
+        while not wait.ready():
+            future = self._signals.get(wait.key)
+            if future is None:
+                future = self._signals[wait.key] = self._loop.create_future()
+            # shield: l'annulation d'un client ne doit pas annuler la future des autres
+            if deadline is None:
+                await asyncio.shield(future)
+                continue
+            try:
+                await asyncio.wait_for(asyncio.shield(future), deadline - self._loop.time())
+            except asyncio.TimeoutError:
+                break
+        return wait.result()
+
+    def _wait_for_data(self, session_id, version):
+        cache = self.persistent_cache
+        return (yield _StreamWait(('data', session_id),
+                                  lambda: cache.data_version(session_id) != version,
+                                  lambda: cache.data_version(session_id)))
+
+    def _wait_for_queue(self, queue, version, timeout=None):
+        return (yield _StreamWait(('queue', queue.client_id),
+                                  lambda: queue.version != version,
+                                  lambda: queue.version,
+                                  timeout))
+
+    def _subscribe(self, session_id, client_id, after_sequence, capacity, policy):
+        return self.fanout.subscribe(
+            session_id, client_id, after_sequence, capacity, policy,
+            on_change=lambda: self._loop.call_soon_threadsafe(self._signal, ('queue', client_id))
+        )
+
+    def _wait_for_poses(self, session_id, poses, sent_count):
+        yield _StreamWait(('poses', session_id),
+                          lambda: len(poses) > sent_count or self._poses_of(session_id) is not poses,
+                          timeout=self.STREAM_WAIT_TIMEOUT)
+
+    def _wait_for_timeline(self, journal, tick):
+        yield _StreamWait(('timeline', journal.session_id), lambda: journal.tick > tick or journal.closed,
+                          timeout=self.STREAM_WAIT_TIMEOUT)
+
+    def _wait_for_session(self, version):
+        sessions = self.session_manager
+        return (yield _StreamWait(('session',), lambda: sessions.version != version,
+                                  lambda: sessions.version, self.STREAM_WAIT_TIMEOUT))
+
+    def _pace(self, delay):
+        yield _StreamSleep(delay)
+
+    def _append_poses(self, session_id, poselist):
+        super()._append_poses(session_id, poselist)
+        self._loop.call_soon_threadsafe(self._signal, ('poses', session_id))
+
+    def _release_poses(self, session_id):
+        super()._release_poses(session_id)
+        self._loop.call_soon_threadsafe(self._signal, ('poses', session_id))
+
+    # --- Exécution des handlers synchrones ---
+
+    @staticmethod
+    def _step(generator, value):
+        # StopIteration ne peut pas traverser une future asyncio
+        try:
+            return False, generator.send(value)
+        except StopIteration:
+            return True, None
+
+    async def _stream(self, method, request, context):
+        """Déroule un flux synchrone: étapes dans l'executor, attentes dans la boucle"""
+        generator = method(request, _ContextAdapter(context))
+        executor = self._executors[rpc_class(method.__name__)]
+        value = None
+        step = None
+        try:
+            while True:
+                step = executor.submit(self._step, generator, value)
+                done, item = await asyncio.wrap_future(step)
+                step = None
+                if done:
+                    return
+                if isinstance(item, _StreamWait):
+                    value = await self._wait(item)
+                elif isinstance(item, _StreamSleep):
+                    value = None
+                    await asyncio.sleep(item.delay)
+                else:
+                    value = None
+                    yield item
+        except _Abort as abort:
+            await context.abort(abort.code, abort.details)
+        finally:
+            # Client parti: fermer le générateur (ses finally nettoient l'état du client),
+            # après l'étape en cours si elle tourne encore dans l'executor
+            if step is not None and not step.done():
+                step.add_done_callback(lambda _: generator.close())
+            else:
+                generator.close()
+
+    async def _unary(self, method, request, context):
+        try:
+            executor = self._executors[rpc_class(method.__name__)]
+            return await self._loop.run_in_executor(executor, method, request, _ContextAdapter(context))
+        except _Abort as abort:
+            await context.abort(abort.code, abort.details)
+
+    # --- Flux serveur -> client ---
+
+    async def GetSlamData(self, request, context):
+        async for message in self._stream(super().GetSlamData, request, context):
+            yield message
+
+    async def GetPoses(self, request, context):
+        async for message in self._stream(super().GetPoses, request, context):
+            yield message
+
+    async def GetTrajectory(self, request, context):
+        async for message in self._stream(super().GetTrajectory, request, context):
+            yield message
+
+    async def GetPoseCorrections(self, request, context):
+        async for message in self._stream(super().GetPoseCorrections, request, context):
+            yield message
+
+    async def GetSpecificChunks(self, request, context):
+        async for message in self._stream(super().GetSpecificChunks, request, context):
+            yield message
+
+    async def GetRegionChunks(self, request, context):
+        async for message in self._stream(super().GetRegionChunks, request, context):
+            yield message
+
+    async def GetHistory(self, request, context):
+        async for message in self._stream(super().GetHistory, request, context):
+            yield message
+
+    async def GetKeyframeChunks(self, request, context):
+        async for message in self._stream(super().GetKeyframeChunks, request, context):
+            yield message
+
+    async def WatchSession(self, request, context):
+        async for message in self._stream(super().WatchSession, request, context):
+            yield message
+
+    async def StreamSession(self, request, context):
+        async for message in self._stream(super().StreamSession, request, context):
+            yield message
+
+    # --- Flux client -> serveur ---
+
+    async def ConnectSlamData(self, request_iterator, context):
+        """Réception des données SLAM: filtrage et création des chunks dans l'executor"""
+        session_id = self._producer_session_id(context)
+        if session_id is None:
+            await context.abort(grpc.StatusCode.FAILED_PRECONDITION,
+                                "Une autre session est alimentée: metadata 'session-id' requise")
+        logger.info(f"Réception des slam data pour la session '{session_id}'...")
+        await self._loop.run_in_executor(self._executors['ingest'], self._activate_session, session_id)
+
+        data_count = 0
+        try:
+            async for data in request_iterator:
+                await self._loop.run_in_executor(self._executors['ingest'], self._ingest_slam_data, session_id, data)
+                data_count += 1
+            await self._loop.run_in_executor(self._executors['ingest'], self._finish_ingest, session_id)
+        finally:
+            logger.info(f"📡 Stream ConnectSlamData terminé ({data_count} paquets dans cette connexion)")
+        return Empty()
+
+    async def ConnectPoses(self, request_iterator, context):
+        session_id = self._resolve_session_id(context)
+        logger.info(f"Réception d'un stream PoseList (ConnectPoses) pour '{session_id}'...")
+        async for poselist in request_iterator:
+            self.stream_monitor.update_activity(session_id)
+            self._append_poses(session_id, poselist)
+        return Empty()
+
+    # --- Appels unaires ---
+
+    async def GetSyncStatus(self, request, context):
+        return await self._unary(super().GetSyncStatus, request, context)
+
+    async def GetMapSnapshot(self, request, context):
+        return await self._unary(super().GetMapSnapshot, request, context)
+
+    async def CorrectPoses(self, request, context):
+        return await self._unary(super().CorrectPoses, request, context)
+
+    async def GetSessionInfo(self, request, context):
+        return await self._unary(super().GetSessionInfo, request, context)
+
+    async def SetSessionInfo(self, request, context):
+        return await self._unary(super().SetSessionInfo, request, context)
+
+    def shutdown(self):
+        super().shutdown()
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+
+
+async def serve():
+    admission = AdmissionController(ADMISSION_CAPACITIES)
+    logger.info(f"Capacité par classe de RPC: {admission.capacities}")
+    server = grpc.aio.server(
+        interceptors=[AsyncAdmissionInterceptor(admission), AsyncPreSerializedInterceptor()],
+        options=SERVER_OPTIONS
+    )
+
+    servicer = AsyncSlamServiceServicer()
+    servicer.PRESERIALIZED_CATCHUP = True
+    slam_service_pb2_grpc.add_SlamServiceServicer_to_server(servicer, server)
+    server.add_insecure_port('[::]:9090')
+    server.add_insecure_port('[::]:50051')
+    print("Le serveur asyncio est en cours d'exécution sur le port 9090 et 50051...")
+    await server.start()
+
+    try:
+        await server.wait_for_termination()
+    finally:
+        logger.info("Arrêt en cours...")
+        servicer.shutdown()
+        await server.stop(grace=5)
+
+if __name__ == '__main__':
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
@@ -26,7 +26,7 @@ from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 import pointcloud_pb2 as pointcloud__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12slam_service.proto\x12\x08IVM.slam\x1a\x1bgoogle/protobuf/empty.proto\x1a\x10pointcloud.proto2\xb4\x06\n\x0bSlamService\x12?\n\rGetPointCloud\x12\x16.google.protobuf.Empty\x1a\x14.IVM.slam.PointCloud0\x01\x12\x43\n\x11\x43onnectPointCloud\x12\x14.IVM.slam.PointCloud\x1a\x16.google.protobuf.Empty(\x01\x12O\n\x15GetPointCloudWithPose\x12\x16.google.protobuf.Empty\x1a\x1c.IVM.slam.PointCloudWithPose0\x01\x12S\n\x19\x43onnectPointCloudWithPose\x12\x1c.IVM.slam.PointCloudWithPose\x1a\x16.google.protobuf.Empty(\x01\x12\x38\n\x08GetPoses\x12\x16.google.protobuf.Empty\x1a\x12.IVM.slam.PoseList0\x01\x12<\n\x0c\x43onnectPoses\x12\x12.IVM.slam.PoseList\x1a\x16.google.protobuf.Empty(\x01\x12;\n\x0bGetSlamData\x12\x16.google.protobuf.Empty\x1a\x12.IVM.slam.SlamData0\x01\x12?\n\x0f\x43onnectSlamData\x12\x12.IVM.slam.SlamData\x1a\x16.google.protobuf.Empty(\x01\x12=\n\rGetSyncStatus\x12\x16.google.protobuf.Empty\x1a\x14.IVM.slam.SyncStatus\x12\x42\n\x11GetSpecificChunks\x12\x16.IVM.slam.ChunkRequest\x1a\x13.IVM.slam.DataChunk0\x01\x12?\n\x0eGetSessionInfo\x12\x16.google.protobuf.Empty\x1a\x15.IVM.slam.SessionInfo\x12?\n\x0eSetSessionInfo\x12\x15.IVM.slam.SessionInfo\x1a\x16.google.protobuf.Emptyb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x12slam_service.proto\x12\x08IVM.slam\x1a\x1bgoogle/protobuf/empty.proto\x1a\x10pointcloud.proto2\x93\x0b\n\x0bSlamService\x12?\n\rGetPointCloud\x12\x16.google.protobuf.Empty\x1a\x14.IVM.slam.PointCloud0\x01\x12\x43\n\x11\x43onnectPointCloud\x12\x14.IVM.slam.PointCloud\x1a\x16.google.protobuf.Empty(\x01\x12O\n\x15GetPointCloudWithPose\x12\x16.google.protobuf.Empty\x1a\x1c.IVM.slam.PointCloudWithPose0\x01\x12S\n\x19\x43onnectPointCloudWithPose\x12\x1c.IVM.slam.PointCloudWithPose\x1a\x16.google.protobuf.Empty(\x01\x12\x38\n\x08GetPoses\x12\x16.google.protobuf.Empty\x1a\x12.IVM.slam.PoseList0\x01\x12<\n\x0c\x43onnectPoses\x12\x12.IVM.slam.PoseList\x1a\x16.google.protobuf.Empty(\x01\x12;\n\x0bGetSlamData\x12\x16.google.protobuf.Empty\x1a\x12.IVM.slam.SlamData0\x01\x12?\n\x0f\x43onnectSlamData\x12\x12.IVM.slam.SlamData\x1a\x16.google.protobuf.Empty(\x01\x12=\n\rGetSyncStatus\x12\x16.google.protobuf.Empty\x1a\x14.IVM.slam.SyncStatus\x12\x42\n\x11GetSpecificChunks\x12\x16.IVM.slam.ChunkRequest\x1a\x13.IVM.slam.DataChunk0\x01\x12@\n\x0fGetRegionChunks\x12\x17.IVM.slam.RegionRequest\x1a\x12.IVM.slam.SlamData0\x01\x12<\n\nGetHistory\x12\x18.IVM.slam.HistoryRequest\x1a\x12.IVM.slam.SlamData0\x01\x12\x44\n\x11GetKeyframeChunks\x12\x19.IVM.slam.KeyframeRequest\x1a\x12.IVM.slam.SlamData0\x01\x12\x42\n\rGetTrajectory\x12\x1b.IVM.slam.TrajectoryRequest\x1a\x12.IVM.slam.PoseList0\x01\x12\x42\n\x0eGetMapSnapshot\x12\x1c.IVM.slam.MapSnapshotRequest\x1a\x12.IVM.slam.SlamData\x12@\n\x0c\x43orrectPoses\x12\x18.IVM.slam.PoseCorrection\x1a\x16.google.protobuf.Empty\x12H\n\x12GetPoseCorrections\x12\x16.google.protobuf.Empty\x1a\x18.IVM.slam.PoseCorrection0\x01\x12?\n\x0eGetSessionInfo\x12\x16.google.protobuf.Empty\x1a\x15.IVM.slam.SessionInfo\x12?\n\x0eSetSessionInfo\x12\x15.IVM.slam.SessionInfo\x1a\x16.google.protobuf.Empty\x12?\n\x0cWatchSession\x12\x16.google.protobuf.Empty\x1a\x15.IVM.slam.SessionInfo0\x01\x12\x42\n\rStreamSession\x12\x16.google.protobuf.Empty\x1a\x17.IVM.slam.SessionUpdate0\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,5 +34,5 @@ _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'slam_service_pb2', _globals
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
   _globals['_SLAMSERVICE']._serialized_start=80
-  _globals['_SLAMSERVICE']._serialized_end=900
+  _globals['_SLAMSERVICE']._serialized_end=1507
 # @@protoc_insertion_point(module_scope)
@@ -85,6 +85,41 @@ class SlamServiceStub(object):
                 request_serializer=pointcloud__pb2.ChunkRequest.SerializeToString,
                 response_deserializer=pointcloud__pb2.DataChunk.FromString,
                 _registered_method=True)
+        self.GetRegionChunks = channel.unary_stream(
+                '/IVM.slam.SlamService/GetRegionChunks',
+                request_serializer=pointcloud__pb2.RegionRequest.SerializeToString,
+                response_deserializer=pointcloud__pb2.SlamData.FromString,
+                _registered_method=True)
+        self.GetHistory = channel.unary_stream(
+                '/IVM.slam.SlamService/GetHistory',
+                request_serializer=pointcloud__pb2.HistoryRequest.SerializeToString,
+                response_deserializer=pointcloud__pb2.SlamData.FromString,
+                _registered_method=True)
+        self.GetKeyframeChunks = channel.unary_stream(
+                '/IVM.slam.SlamService/GetKeyframeChunks',
+                request_serializer=pointcloud__pb2.KeyframeRequest.SerializeToString,
+                response_deserializer=pointcloud__pb2.SlamData.FromString,
+                _registered_method=True)
+        self.GetTrajectory = channel.unary_stream(
+                '/IVM.slam.SlamService/GetTrajectory',
+                request_serializer=pointcloud__pb2.TrajectoryRequest.SerializeToString,
+                response_deserializer=pointcloud__pb2.PoseList.FromString,
+                _registered_method=True)
+        self.GetMapSnapshot = channel.unary_unary(
+                '/IVM.slam.SlamService/GetMapSnapshot',
+                request_serializer=pointcloud__pb2.MapSnapshotRequest.SerializeToString,
+                response_deserializer=pointcloud__pb2.SlamData.FromString,
+                _registered_method=True)
+        self.CorrectPoses = channel.unary_unary(
+                '/IVM.slam.SlamService/CorrectPoses',
+                request_serializer=pointcloud__pb2.PoseCorrection.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
+        self.GetPoseCorrections = channel.unary_stream(
+                '/IVM.slam.SlamService/GetPoseCorrections',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=pointcloud__pb2.PoseCorrection.FromString,
+                _registered_method=True)
         self.GetSessionInfo = channel.unary_unary(
                 '/IVM.slam.SlamService/GetSessionInfo',
                 request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
@@ -95,6 +130,16 @@ class SlamServiceStub(object):
                 request_serializer=pointcloud__pb2.SessionInfo.SerializeToString,
                 response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
                 _registered_method=True)
+        self.WatchSession = channel.unary_stream(
+                '/IVM.slam.SlamService/WatchSession',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=pointcloud__pb2.SessionInfo.FromString,
+                _registered_method=True)
+        self.StreamSession = channel.unary_stream(
+                '/IVM.slam.SlamService/StreamSession',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=pointcloud__pb2.SessionUpdate.FromString,
+                _registered_method=True)
 
 
 class SlamServiceServicer(object):
@@ -163,6 +208,54 @@ class SlamServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetRegionChunks(self, request, context):
+        """Requêtes spatiales
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetHistory(self, request, context):
+        """Requêtes historiques (revue d'incident, rejeu)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetKeyframeChunks(self, request, context):
+        """Chunks d'une sélection de keyframes
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetTrajectory(self, request, context):
+        """Trajectoire décimée (GetPoses reste à pleine fréquence)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetMapSnapshot(self, request, context):
+        """Carte entière à résolution grossière (réponse unique)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CorrectPoses(self, request, context):
+        """Corrections de poses (producteur -> serveur -> clients)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetPoseCorrections(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetSessionInfo(self, request, context):
         """Services de session
         """
@@ -176,6 +269,20 @@ class SlamServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchSession(self, request, context):
+        """Changements de SessionInfo poussés (début, activité, clients, paliers de chunks, fin)
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamSession(self, request, context):
+        """Flux unique par viewer: chunks, poses, corrections et session sur une même timeline
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_SlamServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -229,6 +336,41 @@ def add_SlamServiceServicer_to_server(servicer, server):
                     request_deserializer=pointcloud__pb2.ChunkRequest.FromString,
                     response_serializer=pointcloud__pb2.DataChunk.SerializeToString,
             ),
+            'GetRegionChunks': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetRegionChunks,
+                    request_deserializer=pointcloud__pb2.RegionRequest.FromString,
+                    response_serializer=pointcloud__pb2.SlamData.SerializeToString,
+            ),
+            'GetHistory': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetHistory,
+                    request_deserializer=pointcloud__pb2.HistoryRequest.FromString,
+                    response_serializer=pointcloud__pb2.SlamData.SerializeToString,
+            ),
+            'GetKeyframeChunks': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetKeyframeChunks,
+                    request_deserializer=pointcloud__pb2.KeyframeRequest.FromString,
+                    response_serializer=pointcloud__pb2.SlamData.SerializeToString,
+            ),
+            'GetTrajectory': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetTrajectory,
+                    request_deserializer=pointcloud__pb2.TrajectoryRequest.FromString,
+                    response_serializer=pointcloud__pb2.PoseList.SerializeToString,
+            ),
+            'GetMapSnapshot': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMapSnapshot,
+                    request_deserializer=pointcloud__pb2.MapSnapshotRequest.FromString,
+                    response_serializer=pointcloud__pb2.SlamData.SerializeToString,
+            ),
+            'CorrectPoses': grpc.unary_unary_rpc_method_handler(
+                    servicer.CorrectPoses,
+                    request_deserializer=pointcloud__pb2.PoseCorrection.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'GetPoseCorrections': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetPoseCorrections,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=pointcloud__pb2.PoseCorrection.SerializeToString,
+            ),
             'GetSessionInfo': grpc.unary_unary_rpc_method_handler(
                     servicer.GetSessionInfo,
                     request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
@@ -239,6 +381,16 @@ def add_SlamServiceServicer_to_server(servicer, server):
                     request_deserializer=pointcloud__pb2.SessionInfo.FromString,
                     response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
             ),
+            'WatchSession': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchSession,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=pointcloud__pb2.SessionInfo.SerializeToString,
+            ),
+            'StreamSession': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamSession,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=pointcloud__pb2.SessionUpdate.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'IVM.slam.SlamService', rpc_method_handlers)
@@ -520,6 +672,195 @@ class SlamService(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetRegionChunks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/IVM.slam.SlamService/GetRegionChunks',
+            pointcloud__pb2.RegionRequest.SerializeToString,
+            pointcloud__pb2.SlamData.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetHistory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/IVM.slam.SlamService/GetHistory',
+            pointcloud__pb2.HistoryRequest.SerializeToString,
+            pointcloud__pb2.SlamData.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetKeyframeChunks(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/IVM.slam.SlamService/GetKeyframeChunks',
+            pointcloud__pb2.KeyframeRequest.SerializeToString,
+            pointcloud__pb2.SlamData.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetTrajectory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/IVM.slam.SlamService/GetTrajectory',
+            pointcloud__pb2.TrajectoryRequest.SerializeToString,
+            pointcloud__pb2.PoseList.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetMapSnapshot(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/IVM.slam.SlamService/GetMapSnapshot',
+            pointcloud__pb2.MapSnapshotRequest.SerializeToString,
+            pointcloud__pb2.SlamData.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CorrectPoses(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/IVM.slam.SlamService/CorrectPoses',
+            pointcloud__pb2.PoseCorrection.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetPoseCorrections(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/IVM.slam.SlamService/GetPoseCorrections',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            pointcloud__pb2.PoseCorrection.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetSessionInfo(request,
             target,
@@ -573,3 +914,57 @@ class SlamService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def WatchSession(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/IVM.slam.SlamService/WatchSession',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            pointcloud__pb2.SessionInfo.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamSession(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/IVM.slam.SlamService/StreamSession',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            pointcloud__pb2.SessionUpdate.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
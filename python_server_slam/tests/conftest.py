@@ -0,0 +1,165 @@
+# conftest.py - Fixtures communes des tests du serveur SLAM (lancer: python -m pytest tests)
+import asyncio
+import os
+import sys
+import threading
+import types
+from concurrent import futures
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+
+import grpc
+import pytest
+
+from bench_chunk_store import generate_messages  # désactive aussi les logs INFO
+from PersistentDataCache2 import PersistentDataCache
+from SqliteDataCache import SqliteDataCache
+from SessionManager import SessionManager
+from AdmissionControl import AdmissionController, AdmissionInterceptor, AsyncAdmissionInterceptor
+import server_5
+import server_aio
+import slam_service_pb2_grpc
+
+SESSION_ID = 'robot-test'
+VOXEL_SIZE = 0.01
+
+
+@pytest.fixture
+def session_manager():
+    manager = SessionManager()
+    manager.update_session_info(SESSION_ID, '', True, 0)
+    return manager
+
+
+@pytest.fixture
+def memory_cache(session_manager):
+    return PersistentDataCache(session_manager)
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    return str(tmp_path / 'chunks.db')
+
+
+@pytest.fixture
+def sqlite_cache(session_manager, sqlite_path):
+    cache = SqliteDataCache(session_manager, db_path=sqlite_path)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def cache(request, session_manager, sqlite_path):
+    """Les deux backends, pour les comportements qu'ils doivent partager"""
+    if request.param == 'memory':
+        yield PersistentDataCache(session_manager)
+        return
+    cache = SqliteDataCache(session_manager, db_path=sqlite_path)
+    yield cache
+    cache.close()
+
+
+class Aborted(Exception):
+    """Levée par FakeContext.abort (comme grpc, abort ne rend pas la main)"""
+
+    def __init__(self, code, details):
+        super().__init__(details)
+        self.code = code
+
+
+class FakeContext:
+    """Contexte gRPC minimal pour appeler les handlers sans serveur"""
+
+    def __init__(self, active_checks=None, **metadata):
+        self.metadata = list(metadata.items())
+        self.active_checks = active_checks  # nombre d'appels à is_active() avant la fin de l'appel (None = jamais)
+
+    def invocation_metadata(self):
+        return self.metadata
+
+    def is_active(self):
+        if self.active_checks is None:
+            return True
+        self.active_checks -= 1
+        return self.active_checks >= 0
+
+    def abort(self, code, details):
+        raise Aborted(code, details)
+
+    def add_callback(self, callback):
+        return True
+
+
+@pytest.fixture
+def servicer(monkeypatch):
+    """Servicer synchrone en mémoire (threads de surveillance arrêtés à la fin)"""
+    monkeypatch.setattr(server_5, 'CACHE_BACKEND', 'memory')
+    servicer = server_5.SlamServiceServicer()
+    yield servicer
+    servicer.shutdown()
+
+
+def _serve_sync(admission):
+    servicer = server_5.SlamServiceServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=16), interceptors=[AdmissionInterceptor(admission)])
+    slam_service_pb2_grpc.add_SlamServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+
+    def stop():
+        server.stop(0)
+        servicer.shutdown()
+    return servicer, port, stop
+
+
+def _serve_aio(admission):
+    loop = asyncio.new_event_loop()
+    started = {}
+    ready = threading.Event()
+
+    async def start():
+        server = grpc.aio.server(interceptors=[AsyncAdmissionInterceptor(admission)])
+        servicer = server_aio.AsyncSlamServiceServicer()
+        slam_service_pb2_grpc.add_SlamServiceServicer_to_server(servicer, server)
+        started.update(servicer=servicer, server=server, port=server.add_insecure_port('127.0.0.1:0'))
+        await server.start()
+        ready.set()
+
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(start(), loop)
+    ready.wait(10)
+
+    def stop():
+        asyncio.run_coroutine_threadsafe(started['server'].stop(0), loop).result(10)
+        started['servicer'].shutdown()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(10)
+    return started['servicer'], started['port'], stop
+
+
+@pytest.fixture(params=['sync', 'aio'])
+def served(request, monkeypatch):
+    """Serveur gRPC local (grpc.server ou grpc.aio), avec contrôle d'admission, et son stub"""
+    monkeypatch.setattr(server_5, 'CACHE_BACKEND', 'memory')
+    admission = AdmissionController()
+    servicer, port, stop = (_serve_sync if request.param == 'sync' else _serve_aio)(admission)
+    channel = grpc.insecure_channel(f'127.0.0.1:{port}')
+    yield types.SimpleNamespace(servicer=servicer, admission=admission,
+                                stub=slam_service_pb2_grpc.SlamServiceStub(channel))
+    channel.close()
+    stop()
+
+
+def ingest(cache, num_messages=4, keyframes=2, points=1500, seed=0, session_id=SESSION_ID, flush=True):
+    """Ingère des messages synthétiques, retourne la liste des chunk_id créés"""
+    created = []
+    for data in generate_messages(num_messages, keyframes, points, seed=seed):
+        created += cache.add_slam_data(data.pointcloudlist, data.poselist, data.indexlist, VOXEL_SIZE,
+                                       session_id=session_id)
+    if flush:
+        chunk_id = cache.flush_pending(session_id)
+        if chunk_id:
+            created.append(chunk_id)
+    return created
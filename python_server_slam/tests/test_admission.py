@@ -0,0 +1,53 @@
+# test_admission.py - Contrôle d'admission: capacité réservée par classe de RPC (synchrone et asyncio)
+import time
+
+import grpc
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+import pointcloud_pb2
+from AdmissionControl import AdmissionController, rpc_class
+from bench_chunk_store import generate_messages
+
+ROBOT = [('session-id', 'robot-admission')]
+
+
+def _produce(stub, num_messages=3, seed=0):
+    stub.ConnectSlamData(iter(generate_messages(num_messages, 2, 1500, seed=seed)), metadata=ROBOT)
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_viewer_capacity_does_not_block_other_classes(served):
+    served.admission.capacities['viewer'] = 1
+    stream = served.stub.GetPoses(Empty(), metadata=ROBOT, timeout=10)
+    _wait_until(lambda: served.admission.get_stats()['viewer']['active'] == 1)
+
+    with pytest.raises(grpc.RpcError) as error:
+        list(served.stub.GetTrajectory(pointcloud_pb2.TrajectoryRequest(history_only=True), metadata=ROBOT, timeout=5))
+    assert error.value.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
+    # Ingestion et appels unaires ont leur propre capacité
+    _produce(served.stub, num_messages=1)
+    assert served.stub.GetSessionInfo(Empty(), metadata=ROBOT).total_chunks > 0
+
+    stream.cancel()
+    _wait_until(lambda: served.admission.get_stats()['viewer']['active'] == 0)
+    assert served.admission.get_stats()['viewer']['rejected'] == 1
+
+
+def test_admission_capacity_per_class():
+    controller = AdmissionController({'viewer': 2})
+    assert rpc_class('/slam.SlamService/GetSlamData') == 'viewer'
+    assert rpc_class('ConnectPoses') == 'ingest' and rpc_class('Unknown') == 'unary'
+    assert controller.try_acquire('viewer') and controller.try_acquire('viewer')
+    assert not controller.try_acquire('viewer')
+    assert controller.try_acquire('ingest')
+    controller.release('viewer')
+    assert controller.try_acquire('viewer')
+    stats = controller.get_stats()['viewer']
+    assert (stats['active'], stats['capacity'], stats['rejected']) == (2, 2, 1)
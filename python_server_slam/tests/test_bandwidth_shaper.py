@@ -0,0 +1,85 @@
+# test_bandwidth_shaper.py - Seaux à jetons et rythme d'envoi des clients (horloge simulée) et rattrapage servi au rythme du client
+import json
+import time
+
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+import BandwidthShaper
+from BandwidthShaper import ClientShaper, RateMeter, TokenBucket
+from bench_chunk_store import generate_messages
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(BandwidthShaper.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_token_bucket_burst_then_debt(clock):
+    bucket = TokenBucket(rate=1000, burst=500)
+    assert bucket.reserve(400) == 0.0
+    # Dépassement de la rafale: envoyé quand même, la dette fixe l'attente
+    assert bucket.reserve(600) == pytest.approx(0.5)
+    clock[0] += 0.5
+    assert bucket.reserve(0) == 0.0
+    clock[0] += 10.0
+    assert bucket.reserve(500) == 0.0  # remplissage plafonné à la rafale
+    assert bucket.reserve(100) == pytest.approx(0.1)
+
+
+def test_token_bucket_rate_change_keeps_accrued_tokens(clock):
+    bucket = TokenBucket(rate=100, burst=100)
+    bucket.reserve(100)
+    clock[0] += 0.5
+    bucket.set_rate(1000)
+    assert bucket.reserve(50) == 0.0
+    assert bucket.reserve(100) == pytest.approx(0.1)
+
+
+def test_rate_meter_decays(clock):
+    meter = RateMeter(half_life=2.0)
+    meter.add(4000)
+    assert meter.rate() == pytest.approx(2000)
+    clock[0] += 2.0
+    assert meter.rate() == pytest.approx(1000)
+
+
+def test_catchup_leaves_room_for_live(clock):
+    live = RateMeter(half_life=1.0)
+    live.add(800)  # 800 o/s de flux temps réel
+    shaper = ClientShaper(rate=1000, live_meter=live, catchup_min_share=0.25)
+    assert shaper._catchup_rate() == pytest.approx(250)  # 1000 - 800 < 25 %: part minimale
+    clock[0] += 3.0  # flux temps réel retombé à 100 o/s
+    assert shaper._catchup_rate() == pytest.approx(900)
+    assert ClientShaper(rate=1000, catchup_rate=300)._catchup_rate() == pytest.approx(300)
+    assert not ClientShaper().limited
+
+
+
+ROBOT = [('session-id', 'robot-paced')]
+
+
+def _catchup(served, **cache_info):
+    """Rattrapage complet d'un viewer: (octets reçus, durée en s)"""
+    total_chunks = served.servicer.persistent_cache.get_stats('robot-paced')['total_chunks']
+    header = json.dumps(dict(lastSequence=-1, heartbeatSeconds=0, **cache_info))
+    stream = served.stub.GetSlamData(Empty(), metadata=ROBOT + [('custom-header-1', header)], timeout=10)
+    received, start = [], time.monotonic()
+    for data in stream:
+        received.append(data)
+        if len(received) == total_chunks:
+            break
+    elapsed = time.monotonic() - start
+    stream.cancel()
+    return sum(data.ByteSize() for data in received), elapsed
+
+
+def test_served_catchup_is_paced(served):
+    served.stub.ConnectSlamData(iter(generate_messages(4, 2, 1500)), metadata=ROBOT)
+    total_bytes, unlimited = _catchup(served)
+    # Débit = un rattrapage par seconde: la rafale (0.5 s) passe, le reste attend le seau
+    paced_bytes, elapsed = _catchup(served, maxBytesPerSecond=total_bytes)
+    assert paced_bytes == total_bytes
+    assert elapsed >= 0.3 and elapsed > unlimited
@@ -0,0 +1,85 @@
+# test_catchup_bundle.py - Rattrapage pré-sérialisé: trames du bundle et envoi sans re-sérialisation
+import json
+from concurrent import futures
+
+import grpc
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+import pointcloud_pb2
+import server_5
+import slam_service_pb2_grpc
+from CatchupBundle import PreSerializedInterceptor
+from bench_chunk_store import generate_messages
+from utils import with_resume_sequence
+
+from conftest import SESSION_ID, ingest
+
+ROBOT = [('session-id', 'robot-bundle'), ('local-coordinates', 'true')]
+
+
+@pytest.fixture
+def preserialized(monkeypatch):
+    """Serveur synchrone comme serve(): trames du bundle envoyées telles quelles"""
+    monkeypatch.setattr(server_5, 'CACHE_BACKEND', 'memory')
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8), interceptors=[PreSerializedInterceptor()])
+    servicer = server_5.SlamServiceServicer()
+    servicer.PRESERIALIZED_CATCHUP = True
+    slam_service_pb2_grpc.add_SlamServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port('127.0.0.1:0')
+    server.start()
+    channel = grpc.insecure_channel(f'127.0.0.1:{port}')
+    yield servicer, slam_service_pb2_grpc.SlamServiceStub(channel)
+    channel.close()
+    server.stop(0)
+    servicer.shutdown()
+
+
+def test_frames_are_the_serialized_entries(cache):
+    ingest(cache, num_messages=5)
+    latest = cache.get_sync_status(SESSION_ID)['latest_sequence_number']
+    for after in (-1, 1):
+        frames = list(cache.get_catchup_frames(SESSION_ID, after, latest))
+        entries = cache.get_entries_after_sequence(after, SESSION_ID)
+        assert frames == [(metadata.sequence_number, slam_data.SerializeToString())
+                          for metadata, slam_data in entries]
+
+
+def test_bundle_is_extended_not_rebuilt(memory_cache):
+    created = ingest(memory_cache, num_messages=3)
+    bundle = memory_cache._sessions[SESSION_ID].bundle
+    list(memory_cache.get_catchup_frames(SESSION_ID, -1, 2**31 - 1))
+    assert bundle.frames_serialized == len(created)
+
+    # Seuls les nouveaux chunks sont sérialisés, les lecteurs n'en ajoutent aucun
+    created += ingest(memory_cache, num_messages=2, seed=1)
+    list(memory_cache.get_catchup_frames(SESSION_ID, -1, 2**31 - 1))
+    assert bundle.frames_serialized == len(created)
+
+
+def test_resume_sequence_on_a_frame():
+    slam_data = next(iter(generate_messages(1, 1, 100)))
+    frame = with_resume_sequence(slam_data.SerializeToString(), 300)
+    assert pointcloud_pb2.SlamData.FromString(frame) == with_resume_sequence(slam_data, 300)
+
+
+def test_served_frames_match_the_object_path(preserialized):
+    servicer, stub = preserialized
+    stub.ConnectSlamData(iter(generate_messages(6, 2, 1500)), metadata=ROBOT)
+    total_chunks = stub.GetSessionInfo(Empty(), metadata=ROBOT).total_chunks
+
+    def catchup():
+        header = json.dumps({'lastSequence': -1, 'heartbeatSeconds': 0})
+        stream = stub.GetSlamData(Empty(), metadata=ROBOT + [('custom-header-1', header)], timeout=10)
+        received = [next(stream) for _ in range(total_chunks)]
+        stream.cancel()
+        return received
+
+    cache, reads = servicer.persistent_cache, []
+    read_frames = cache.get_catchup_frames
+    cache.get_catchup_frames = lambda *args: reads.append(args) or read_frames(*args)
+    from_frames = catchup()
+    assert reads
+    servicer.PRESERIALIZED_CATCHUP = False
+    assert from_frames == catchup()
+    assert [data.sequence_number for data in from_frames] == list(range(total_chunks))
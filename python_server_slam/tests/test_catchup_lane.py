@@ -0,0 +1,57 @@
+# test_catchup_lane.py - Voie temps réel prioritaire sur un rattrapage limité en débit, reprise par resume_sequence
+import json
+
+import grpc
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+from bench_chunk_store import generate_messages
+
+ROBOT = [('session-id', 'robot-lane')]
+
+
+@pytest.fixture
+def backlog(served):
+    """Historique de la session: (nombre de chunks, débit de rattrapage d'environ 5 chunks par seconde)"""
+    served.stub.ConnectSlamData(iter(generate_messages(8, 1, 1500)), metadata=ROBOT)
+    entries = served.servicer.persistent_cache.get_entries_after_sequence(-1, 'robot-lane')
+    return len(entries), 5 * max(slam_data.ByteSize() for _, slam_data in entries)
+
+
+def _viewer(served, timeout=10, **cache_info):
+    header = json.dumps(dict(sessionId='robot-lane', heartbeatSeconds=0, **cache_info))
+    return served.stub.GetSlamData(Empty(), metadata=ROBOT + [('custom-header-1', header)], timeout=timeout)
+
+
+def test_live_chunk_overtakes_catchup(served, backlog):
+    total_chunks, rate = backlog
+    stream = _viewer(served, lastSequence=-1, catchupBytesPerSecond=rate)
+    received = [next(stream)]
+    served.stub.ConnectSlamData(iter(generate_messages(1, 1, 1500, seed=1)), metadata=ROBOT)
+    while received[-1].sequence_number < total_chunks:
+        received.append(next(stream))
+    stream.cancel()
+
+    history = [data.sequence_number for data in received[:-1]]
+    assert history == list(range(len(history))) and len(history) < total_chunks
+    # Rattrapage inachevé: chaque message porte la dernière séquence reçue sans trou
+    assert all(data.HasField('resume_sequence') for data in received)
+    assert received[-1].resume_sequence == history[-1]
+
+
+def test_interrupted_catchup_resumes_without_holes(served, backlog):
+    total_chunks, rate = backlog
+    stream = _viewer(served, lastSequence=-1, catchupBytesPerSecond=rate)
+    first = [next(stream), next(stream)]
+    stream.cancel()
+    resume = first[-1].resume_sequence
+
+    stream = _viewer(served, timeout=1.5, lastSequence=resume)
+    rest = []
+    try:
+        rest.extend(stream)
+    except grpc.RpcError:
+        pass
+    sequences = [data.sequence_number for data in first] + [data.sequence_number for data in rest]
+    assert sorted(set(sequences)) == list(range(total_chunks))
+    assert rest[-1].resume_sequence == total_chunks - 1
@@ -0,0 +1,46 @@
+# test_chunk_fanout.py - Réveil des flux temps réel au scellement d'un chunk (sans scrutation)
+import json
+import threading
+import time
+
+from google.protobuf.empty_pb2 import Empty
+
+from bench_chunk_store import generate_messages
+
+from conftest import SESSION_ID, ingest
+
+ROBOT = [('session-id', 'robot-fanout')]
+
+
+def test_seal_notifies_listeners_and_wakes_waiters(memory_cache):
+    ingest(memory_cache, num_messages=1, session_id='other')
+    notified = []
+    memory_cache.add_change_listener(notified.append)
+    version = memory_cache.data_version(SESSION_ID)
+    other_version = memory_cache.data_version('other')
+
+    writer = threading.Timer(0.1, lambda: ingest(memory_cache, num_messages=1))
+    writer.start()
+    start = time.monotonic()
+    new_version = memory_cache.wait_for_change(SESSION_ID, version, timeout=5.0)
+    writer.join()
+    assert new_version != version and time.monotonic() - start < 1.0
+    assert set(notified) == {SESSION_ID}
+    assert memory_cache.data_version('other') == other_version
+
+
+def test_live_stream_wakes_on_seal(served):
+    # Délai d'attente bien plus long que le test: seul le scellement peut réveiller le flux
+    served.servicer.STREAM_WAIT_TIMEOUT = 30.0
+    served.stub.ConnectSlamData(iter(generate_messages(1, 1, 1500)), metadata=ROBOT)
+    last = served.stub.GetSessionInfo(Empty(), metadata=ROBOT).total_chunks - 1
+    header = json.dumps({'sessionId': 'robot-fanout', 'lastSequence': last, 'heartbeatSeconds': 0})
+    stream = served.stub.GetSlamData(Empty(), metadata=ROBOT + [('custom-header-1', header)], timeout=10)
+    time.sleep(0.3)
+
+    sealed_at = time.monotonic()
+    served.stub.ConnectSlamData(iter(generate_messages(1, 1, 1500, seed=1)), metadata=ROBOT)
+    data = next(stream)
+    latency = time.monotonic() - sealed_at
+    stream.cancel()
+    assert data.sequence_number == last + 1 and latency < 1.0
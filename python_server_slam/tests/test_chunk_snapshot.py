@@ -0,0 +1,78 @@
+# test_chunk_snapshot.py - Snapshots du cache mémoire: isolation pendant l'écriture, publication incrémentale
+import threading
+
+from conftest import SESSION_ID, ingest
+
+
+def _view(snapshot):
+    return ([metadata.chunk_id for metadata, _ in snapshot.view_entries()],
+            snapshot.total_points, snapshot.size_bytes, snapshot.latest_sequence)
+
+
+def test_snapshot_unchanged_by_later_seals(memory_cache):
+    ingest(memory_cache, num_messages=3)
+    snapshot = memory_cache._snapshot(SESSION_ID)
+    before = _view(snapshot)
+    first_chunk_id = before[0][0]
+    history = [metadata.chunk_id for metadata, _ in snapshot.entries_in_time_range(0, 2 ** 62)]
+
+    # Nouveaux scellements, évictions et compaction après la lecture du snapshot
+    memory_cache.MAX_CHUNKS = len(before[0])
+    ingest(memory_cache, num_messages=3, seed=1)
+    memory_cache.compact_session(SESSION_ID, min_fill=1.0)
+
+    assert _view(snapshot) == before
+    assert snapshot.entry(first_chunk_id) is not None
+    assert [metadata.chunk_id for metadata, _ in snapshot.entries_after_sequence(-1)] == before[0]
+    assert [metadata.chunk_id for metadata, _ in snapshot.entries_in_time_range(0, 2 ** 62)] == history
+    # Le snapshot courant, lui, a bien évincé les plus anciens
+    current = memory_cache._snapshot(SESSION_ID)
+    assert current.entry(first_chunk_id) is None
+    assert current.latest_sequence > before[3]
+
+
+def test_snapshot_stable_while_writer_is_active(memory_cache):
+    ingest(memory_cache, num_messages=2)
+    memory_cache.MAX_CHUNKS = 8
+    done = threading.Event()
+    errors = []
+
+    def writer():
+        try:
+            for seed in range(1, 6):
+                ingest(memory_cache, num_messages=2, seed=seed)
+        except Exception as e:  # pragma: no cover - remonté par l'assertion
+            errors.append(e)
+        finally:
+            done.set()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    while not done.is_set():
+        snapshot = memory_cache._snapshot(SESSION_ID)
+        before = _view(snapshot)
+        sequences = [metadata.sequence_number for metadata, _ in snapshot.view_entries()]
+        assert sequences == sorted(sequences)
+        assert _view(snapshot) == before
+    thread.join()
+    assert not errors
+
+
+def test_publication_shares_structure(memory_cache):
+    ingest(memory_cache, num_messages=2)
+    store = memory_cache._get_store(SESSION_ID)
+    log = store.view
+    ingest(memory_cache, num_messages=1, seed=1)
+    # Ajout en fin du même log, et le bundle de rattrapage ne sérialise que les nouveaux chunks
+    assert store.view is log
+    assert store.bundle.frames_serialized == len(store.snapshot)
+
+
+def test_catchup_bundle_matches_view_after_compaction(memory_cache):
+    ingest(memory_cache, num_messages=2)
+    for seed in range(1, 4):
+        ingest(memory_cache, num_messages=1, points=200, seed=seed)
+    assert memory_cache.compact_session(SESSION_ID) > 0
+    snapshot = memory_cache._snapshot(SESSION_ID)
+    frames = [sequence for sequence, _ in memory_cache.get_catchup_frames(SESSION_ID, -1, snapshot.latest_sequence)]
+    assert frames == [metadata.sequence_number for metadata, _ in snapshot.view_entries()]
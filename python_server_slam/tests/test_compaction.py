@@ -0,0 +1,66 @@
+# test_compaction.py - Compaction des petits chunks (mémoire) et refus explicite du backend SQLite
+import numpy as np
+
+import pointcloud_pb2
+from ChunkCompactor import ChunkCompactor
+
+from conftest import SESSION_ID, ingest
+
+
+def _small_chunks(cache, count=4):
+    """Une suite de petits chunks (flush_pending après chaque petit message)"""
+    created = []
+    for seed in range(count):
+        created += ingest(cache, num_messages=1, keyframes=1, points=150, seed=seed)
+    return created
+
+
+def test_small_chunks_are_merged(memory_cache):
+    created = _small_chunks(memory_cache)
+    points = memory_cache.get_stats(SESSION_ID)['total_points']
+    assert memory_cache.compact_session(SESSION_ID) == 1
+
+    snapshot = memory_cache._snapshot(SESSION_ID)
+    assert len(snapshot) == 1
+    (metadata, _), = snapshot.view_entries()
+    assert metadata.source_chunk_ids == tuple(created)
+    assert (metadata.first_sequence, metadata.sequence_number) == (0, len(created) - 1)
+    assert snapshot.total_points == points
+    # Les originaux restent lisibles
+    assert all(memory_cache.get_chunk(chunk_id, SESSION_ID) is not None for chunk_id in created)
+
+
+def test_cursor_inside_compacted_chunk_gets_remaining_originals(memory_cache):
+    created = _small_chunks(memory_cache)
+    memory_cache.compact_session(SESSION_ID)
+    entries = memory_cache.get_entries_after_sequence(1, SESSION_ID)
+    assert [metadata.chunk_id for metadata, _ in entries] == created[2:]
+
+
+def test_sqlite_refuses_compaction(sqlite_cache):
+    created = _small_chunks(sqlite_cache)
+    assert not sqlite_cache.SUPPORTS_COMPACTION
+    assert sqlite_cache.compact_session(SESSION_ID) == 0
+    assert sqlite_cache.get_sync_status(SESSION_ID)['available_chunk_ids'] == created
+
+    compactor = ChunkCompactor(sqlite_cache)
+    compactor.start()
+    assert compactor.compactor_thread is None and not compactor.is_active
+
+
+def test_revoxelized_chunk_follows_pose_corrections(memory_cache):
+    _small_chunks(memory_cache)
+    assert memory_cache.compact_session(SESSION_ID, revoxel_size=0.05) == 1
+    (metadata, slam_data), = memory_cache._snapshot(SESSION_ID).view_entries()
+    assert slam_data.local_coordinates
+    assert tuple(slam_data.indexlist.index) == metadata.keyframe_ids
+    bbox_min = np.array(metadata.bbox_min)
+
+    # Toutes les keyframes décalées de 10 m en x: le chunk compacté suit, sans re-compaction
+    corrections = {}
+    for keyframe_id, pose in zip(slam_data.indexlist.index, slam_data.poselist.poses):
+        matrix = list(pose.matrix)
+        matrix[3] += 10
+        corrections[keyframe_id] = pointcloud_pb2.Pose(matrix=matrix)
+    memory_cache.apply_pose_corrections(SESSION_ID, corrections)
+    assert np.allclose(metadata.bbox_min, bbox_min + [10, 0, 0])
@@ -0,0 +1,61 @@
+# test_dead_clients.py - Heartbeat des flux viewers et libération des clients dont l'appel se termine
+import json
+import time
+
+import grpc
+from google.protobuf.empty_pb2 import Empty
+
+import pointcloud_pb2
+from bench_chunk_store import generate_messages
+
+ROBOT = [('session-id', 'robot-dead')]
+
+
+def _viewer_metadata(**cache_info):
+    return ROBOT + [('custom-header-1', json.dumps(cache_info))]
+
+
+def _clients(served):
+    return served.servicer.session_manager.get_session_info('robot-dead')['clients_connected']
+
+
+def _wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_heartbeat_is_on_by_default(served):
+    served.servicer.CLIENT_HEARTBEAT_SECONDS = 0.2
+    served.stub.ConnectSlamData(iter(generate_messages(1, 1, 500)), metadata=ROBOT)
+    stream = served.stub.GetSlamData(Empty(), metadata=_viewer_metadata(lastSequence=-1), timeout=5)
+    received = []
+    for data in stream:
+        received.append(data)
+        if data == pointcloud_pb2.SlamData():
+            break
+    stream.cancel()
+    assert received[0].chunk_id and received[-1].chunk_id == ''
+
+
+def test_client_can_disable_heartbeat(served):
+    served.servicer.CLIENT_HEARTBEAT_SECONDS = 0.1
+    served.stub.ConnectSlamData(iter(generate_messages(1, 1, 500)), metadata=ROBOT)
+    stream = served.stub.GetSlamData(Empty(), metadata=_viewer_metadata(lastSequence=0, heartbeatSeconds=0),
+                                     timeout=0.6)
+    received = []
+    try:
+        received.extend(stream)
+    except grpc.RpcError:  # DEADLINE_EXCEEDED: pas de heartbeat pour réveiller le flux
+        pass
+    assert received and all(data.chunk_id for data in received)
+
+
+def test_cancelled_viewer_is_released(served):
+    served.stub.ConnectSlamData(iter(generate_messages(1, 1, 500)), metadata=ROBOT)
+    stream = served.stub.GetSlamData(Empty(), metadata=_viewer_metadata(lastSequence=0), timeout=10)
+    _wait_until(lambda: _clients(served) == 1)
+    stream.cancel()
+    _wait_until(lambda: _clients(served) == 0)
+    assert not served.servicer._client_states.get('robot-dead')
@@ -0,0 +1,45 @@
+# test_history.py - GetHistory: état passé de la carte par plage de séquences ou de dates
+from google.protobuf.empty_pb2 import Empty
+
+import pointcloud_pb2
+from bench_chunk_store import generate_messages
+
+from conftest import SESSION_ID, FakeContext, ingest
+
+ROBOT = [('session-id', 'robot-history')]
+
+
+def _history(servicer, **sequence):
+    request = pointcloud_pb2.HistoryRequest(session_id=SESSION_ID, sequence=pointcloud_pb2.SequenceRange(**sequence))
+    return [data.chunk_id for data in servicer.GetHistory(request, FakeContext())]
+
+
+def test_sequence_range(servicer):
+    servicer.session_manager.update_session_info(SESSION_ID, '', True, 0)
+    created = ingest(servicer.persistent_cache, num_messages=4)
+
+    # {start: N} sans end, ou end négatif: jusqu'au dernier chunk
+    assert _history(servicer, start=1) == created[1:]
+    assert _history(servicer, start=1, end=-1) == created[1:]
+    assert _history(servicer, start=1, end=2) == created[1:3]
+    # end = 0 est une borne comme une autre: la carte à la séquence 0
+    assert _history(servicer, start=0, end=0) == created[:1]
+
+
+def test_time_range_until_now(servicer):
+    servicer.session_manager.update_session_info(SESSION_ID, '', True, 0)
+    created = ingest(servicer.persistent_cache, num_messages=3)
+    request = pointcloud_pb2.HistoryRequest(session_id=SESSION_ID, time=pointcloud_pb2.TimeRange(start_ms=0))
+    assert [data.chunk_id for data in servicer.GetHistory(request, FakeContext())] == created
+
+
+def test_served_history(served):
+    served.stub.ConnectSlamData(iter(generate_messages(3, 2, 1500)), metadata=ROBOT)
+    info = served.stub.GetSessionInfo(Empty(), metadata=ROBOT)
+    assert info.total_chunks > 1
+
+    request = pointcloud_pb2.HistoryRequest(sequence=pointcloud_pb2.SequenceRange(start=0))
+    history = list(served.stub.GetHistory(request, metadata=ROBOT, timeout=5))
+    assert [data.sequence_number for data in history] == list(range(info.total_chunks))
+    request.sequence.end = 0
+    assert [data.sequence_number for data in served.stub.GetHistory(request, metadata=ROBOT, timeout=5)] == [0]
@@ -0,0 +1,37 @@
+# test_keyframe_index.py - Index keyframe -> chunks construit depuis indexlist et GetKeyframeChunks
+import pointcloud_pb2
+
+from conftest import SESSION_ID, FakeContext, ingest
+
+
+def _chunks_with_keyframe(cache, keyframe_id):
+    return [metadata.chunk_id for metadata, slam_data in cache.get_entries_after_sequence(-1, SESSION_ID)
+            if keyframe_id in slam_data.indexlist.index]
+
+
+def test_index_matches_indexlist(cache):
+    ingest(cache, num_messages=6, keyframes=3)
+    for keyframe_id in range(20):
+        assert cache.get_chunk_ids_for_keyframes(SESSION_ID, [keyframe_id]) == _chunks_with_keyframe(cache, keyframe_id)
+    assert cache.get_chunk_ids_for_keyframes('unknown', [0]) == []
+
+
+def test_evicted_chunks_leave_the_index(memory_cache):
+    memory_cache.MAX_CHUNKS = 3
+    created = ingest(memory_cache, num_messages=6)
+    assert set(memory_cache.get_chunk_ids_for_keyframes(SESSION_ID, range(100))) == set(created[-3:])
+
+
+def test_keyframes_only_keeps_requested_pointclouds(servicer):
+    servicer.session_manager.update_session_info(SESSION_ID, '', True, 0)
+    ingest(servicer.persistent_cache, num_messages=4, keyframes=3)
+    keyframe_id = servicer.persistent_cache.get_entries_after_sequence(-1, SESSION_ID)[0][1].indexlist.index[-1]
+    request = pointcloud_pb2.KeyframeRequest(session_id=SESSION_ID, keyframe_ids=[keyframe_id])
+
+    whole = list(servicer.GetKeyframeChunks(request, FakeContext()))
+    assert [data.chunk_id for data in whole] == _chunks_with_keyframe(servicer.persistent_cache, keyframe_id)
+    request.keyframes_only = True
+    selected = list(servicer.GetKeyframeChunks(request, FakeContext()))
+    assert [data.chunk_id for data in selected] == [data.chunk_id for data in whole]
+    assert all(list(data.indexlist.index) == [keyframe_id] and len(data.pointcloudlist.pointclouds) == 1
+               for data in selected)
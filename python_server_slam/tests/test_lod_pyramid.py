@@ -0,0 +1,93 @@
+# test_lod_pyramid.py - Instantané de la carte: points encodés mis à jour voxel par voxel, GetMapSnapshot
+import grpc
+import numpy as np
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+import pointcloud_pb2
+from bench_chunk_store import generate_messages
+from LodPyramid import LodPyramid
+from utils import fill_points, fill_wire_points, point_wire_entries, points_to_xyzrgb, set_wire_points
+
+from conftest import SESSION_ID
+
+ROBOT = [('session-id', 'robot-snapshot')]
+
+
+def _cloud(seed, count=2000, offset=0.0):
+    rng = np.random.default_rng(seed)
+    xyzrgb = rng.uniform(0.0, 1.0, (count, 6))
+    xyzrgb[:, :3] = xyzrgb[:, :3] * 4.0 + offset
+    return xyzrgb
+
+
+def _snapshot_points(pyramid, voxel_size=0.0, max_points=0):
+    slam_data = pyramid.snapshot(SESSION_ID, voxel_size, max_points)
+    return points_to_xyzrgb(slam_data.pointcloudlist.pointclouds[0].points)
+
+
+def _sorted(xyzrgb):
+    return xyzrgb[np.lexsort(xyzrgb.T[::-1])]
+
+
+def test_wire_points_match_fill_points():
+    xyzrgb = _cloud(0, count=50)
+    expected = pointcloud_pb2.PointCloud()
+    fill_points(expected.points, xyzrgb)
+    entries = point_wire_entries(len(xyzrgb))
+    set_wire_points(entries, xyzrgb)
+    encoded = pointcloud_pb2.PointCloud()
+    fill_wire_points(encoded, entries)
+    assert encoded == expected
+
+
+def test_snapshot_follows_adds_and_removes():
+    pyramid = LodPyramid()
+    first, second = _cloud(0), _cloud(1, offset=10.0)
+    pyramid.add_xyzrgb(first, 0)
+    before = _snapshot_points(pyramid)
+    assert np.allclose(_sorted(before), _sorted(pyramid.levels[-1].points()))
+
+    pyramid.add_xyzrgb(second, 1)
+    # Seuls les voxels touchés par le second chunk sont à recalculer
+    coarsest = pyramid.levels[-1]
+    touched = len(np.unique(np.floor(second[:, :3] / coarsest.voxel_size), axis=0))
+    assert len(coarsest._dirty) == touched
+    after = _snapshot_points(pyramid)
+    assert not coarsest._dirty
+    assert np.allclose(_sorted(after), _sorted(coarsest.points()))
+
+    # Voxels vidés: retirés de l'instantané
+    pyramid.remove_xyzrgb(second)
+    assert np.allclose(_sorted(_snapshot_points(pyramid)), _sorted(before))
+
+
+def test_snapshot_resolutions_and_cache():
+    pyramid = LodPyramid()
+    pyramid.add_xyzrgb(_cloud(0), 0)
+    finest = pyramid.levels[0]
+    assert np.allclose(_sorted(_snapshot_points(pyramid, finest.voxel_size)), _sorted(finest.points()))
+    regrouped = _snapshot_points(pyramid, 1.0)
+    assert np.allclose(_sorted(regrouped), _sorted(pyramid.levels[-1].resample(1.0)))
+    assert len(_snapshot_points(pyramid, finest.voxel_size, max_points=100)) == 100
+
+    snapshot = pyramid.snapshot(SESSION_ID)
+    assert pyramid.snapshot(SESSION_ID) is snapshot
+    pyramid.add_xyzrgb(_cloud(2, offset=10.0), 1)
+    assert pyramid.snapshot(SESSION_ID) is not snapshot
+
+
+def test_served_snapshot(served):
+    served.stub.ConnectSlamData(iter(generate_messages(3, 2, 1500)), metadata=ROBOT)
+    info = served.stub.GetSessionInfo(Empty(), metadata=ROBOT)
+    request = pointcloud_pb2.MapSnapshotRequest(voxel_size=0.04, max_points=500)
+    snapshot = served.stub.GetMapSnapshot(request, metadata=ROBOT)
+    assert len(snapshot.pointcloudlist.pointclouds[0].points) == 500
+    assert snapshot.sequence_number == info.total_chunks - 1
+
+    with pytest.raises(grpc.RpcError) as error:
+        served.stub.GetMapSnapshot(pointcloud_pb2.MapSnapshotRequest(session_id='ghost'))
+    assert error.value.code() == grpc.StatusCode.NOT_FOUND
+    with pytest.raises(grpc.RpcError) as error:
+        served.stub.GetMapSnapshot(pointcloud_pb2.MapSnapshotRequest(voxel_size=-1.0), metadata=ROBOT)
+    assert error.value.code() == grpc.StatusCode.INVALID_ARGUMENT
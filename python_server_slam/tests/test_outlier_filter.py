@@ -0,0 +1,50 @@
+# test_outlier_filter.py - Retrait vectorisé des points isolés à l'ingestion
+import numpy as np
+import pytest
+
+import pointcloud_pb2
+from utils import fill_points, grid_neighbor_counts, outlier_mask
+
+from conftest import SESSION_ID, VOXEL_SIZE
+
+
+def _brute_force_counts(xyz, cell_size):
+    cells = np.floor(xyz / cell_size).astype(np.int64)
+    return np.array([int(np.sum(np.all(np.abs(cells - cell) <= 1, axis=1))) - 1 for cell in cells])
+
+
+def _cluster_with_flying_pixels(seed=0):
+    rng = np.random.default_rng(seed)
+    cluster = rng.normal(0.0, 0.05, (2000, 3))
+    flying = rng.uniform(2.0, 4.0, (20, 3))
+    return np.concatenate((cluster, flying)), len(cluster)
+
+
+def test_neighbor_counts_match_brute_force():
+    xyz = np.random.default_rng(1).uniform(-1.0, 1.0, (800, 3))
+    assert np.array_equal(grid_neighbor_counts(xyz, 0.2), _brute_force_counts(xyz, 0.2))
+    assert len(grid_neighbor_counts(np.empty((0, 3)), 0.2)) == 0
+
+
+@pytest.mark.parametrize('std_ratio', [0.0, 1.0])
+def test_isolated_points_removed(std_ratio):
+    xyz, cluster_size = _cluster_with_flying_pixels()
+    keep = outlier_mask(xyz, radius=0.05, min_neighbors=3, std_ratio=std_ratio)
+    assert not keep[cluster_size:].any()
+    assert keep[:cluster_size].mean() > (0.9 if std_ratio == 0 else 0.5)
+
+
+def test_ingest_stage(memory_cache):
+    memory_cache.OUTLIER_FILTER = 'radius'
+    xyz, _ = _cluster_with_flying_pixels()
+    pointcloudlist = pointcloud_pb2.PointCloudList()
+    fill_points(pointcloudlist.pointclouds.add().points, np.hstack((xyz, np.full((len(xyz), 3), 0.5))))
+    poselist = pointcloud_pb2.PoseList(poses=[pointcloud_pb2.Pose(matrix=np.eye(4).flatten().tolist())])
+    memory_cache.add_slam_data(pointcloudlist, poselist, pointcloud_pb2.Index(index=[0]), VOXEL_SIZE,
+                               session_id=SESSION_ID)
+    memory_cache.flush_pending(SESSION_ID)
+
+    stats = memory_cache.get_stats(SESSION_ID)
+    assert stats['outliers_removed'] >= 20
+    entries = memory_cache.get_entries_after_sequence(-1, SESSION_ID)
+    assert entries and all(max(metadata.bbox_max) < 2.0 for metadata, _ in entries)
@@ -0,0 +1,79 @@
+# test_point_budget.py - Budget de points par client: échantillonnage et directives replace / drop
+import json
+import types
+
+import grpc
+import numpy as np
+from google.protobuf.empty_pb2 import Empty
+
+import pointcloud_pb2
+from bench_chunk_store import generate_messages
+from PointBudget import PointBudgetPlanner, sample_slam_data, stratified_indices
+from SpatialIndex import Viewpoint
+
+from conftest import SESSION_ID, ingest
+
+ROBOT = [('session-id', 'robot-budget')]
+
+
+def _metadata(chunk_id, point_count, centroid=(0.0, 0.0, 0.0)):
+    return types.SimpleNamespace(chunk_id=chunk_id, point_count=point_count, centroid=centroid)
+
+
+def _apply(planner, directives):
+    for directive, chunk_id, count in directives:
+        planner.applied(directive, chunk_id, count)
+
+
+def test_stratified_indices_spread_over_space():
+    rng = np.random.default_rng(0)
+    # Nuage dense dans un coin, clairsemé ailleurs: l'échantillon ne reste pas dans le coin
+    xyz = np.concatenate((rng.uniform(0, 0.1, (9000, 3)), rng.uniform(0, 10, (1000, 3))))
+    indices = stratified_indices(xyz, 500)
+    assert len(np.unique(indices)) == 500
+    assert np.array_equal(indices, stratified_indices(xyz, 500))
+    assert np.mean(indices >= 9000) > 0.5
+    assert len(stratified_indices(xyz, 20000)) == len(xyz)
+
+
+def test_sample_slam_data_keeps_count(memory_cache):
+    created = ingest(memory_cache, num_messages=1)
+    slam_data = memory_cache.get_chunk(created[0], SESSION_ID)
+    sampled = sample_slam_data(slam_data, 100)
+    assert sum(len(pc.points) for pc in sampled.pointcloudlist.pointclouds) == 100
+    assert sampled.indexlist == slam_data.indexlist
+
+
+def test_growing_map_shrinks_sent_chunks_before_adding():
+    planner = PointBudgetPlanner(1000, min_points=16)
+    first = planner.plan([_metadata('a', 600), _metadata('b', 300)])
+    assert [directive for directive, _, _ in first] == [pointcloud_pb2.CHUNK_ADD] * 2
+    _apply(planner, first)
+
+    second = planner.plan([_metadata('c', 900)])
+    _apply(planner, second)
+    kinds = [directive for directive, _, _ in second]
+    assert kinds[-1] == pointcloud_pb2.CHUNK_ADD and pointcloud_pb2.CHUNK_REPLACE in kinds[:-1]
+    assert planner.points_sent <= 1000
+
+
+def test_viewpoint_favours_near_chunks():
+    planner = PointBudgetPlanner(1000, Viewpoint((0, 0, 0)), falloff=1.0)
+    planner.plan([_metadata('near', 1000, (0.5, 0, 0)), _metadata('far', 1000, (20, 0, 0))])
+    quotas = planner.allocate()
+    assert quotas['near'] > 10 * quotas['far'] and sum(quotas.values()) <= 1000
+
+
+def test_served_client_stays_under_budget(served):
+    served.stub.ConnectSlamData(iter(generate_messages(6, 2, 1500)), metadata=ROBOT)
+    header = json.dumps({'lastSequence': -1, 'pointBudget': 2000})
+    on_client = {}
+    try:
+        for data in served.stub.GetSlamData(Empty(), metadata=ROBOT + [('custom-header-1', header)], timeout=1.5):
+            if data.directive == pointcloud_pb2.CHUNK_DROP:
+                on_client.pop(data.chunk_id, None)
+            elif data.chunk_id:
+                on_client[data.chunk_id] = sum(len(pc.points) for pc in data.pointcloudlist.pointclouds)
+    except grpc.RpcError:
+        pass
+    assert on_client and 1000 < sum(on_client.values()) <= 2000
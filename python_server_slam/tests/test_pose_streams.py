@@ -0,0 +1,64 @@
+# test_pose_streams.py - Flux de poses: buffers par session, réveil et attentes bornées (synchrone et asyncio)
+import threading
+
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+import pointcloud_pb2
+import server_aio
+
+from conftest import SESSION_ID, FakeContext
+
+ROBOT = [('session-id', 'robot-poses')]
+
+
+def _poselist(x):
+    pose = pointcloud_pb2.Pose(matrix=[1, 0, 0, x, 0, 1, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1])
+    return pointcloud_pb2.PoseList(poses=[pose])
+
+
+def test_pose_stream_follows_buffer_after_release(servicer):
+    servicer.STREAM_WAIT_TIMEOUT = 0.05
+    first, second = _poselist(1.0), _poselist(2.0)
+    servicer._append_poses(SESSION_ID, first)
+    stream = servicer.GetPoses(Empty(), FakeContext(**{'session-id': SESSION_ID}))
+    assert next(stream) is first
+
+    # Fin de session: le buffer est libéré, le flux ne le retient pas et suit le suivant
+    servicer._release_poses(SESSION_ID)
+    assert SESSION_ID not in servicer._pose_buffers
+    servicer._append_poses(SESSION_ID, second)
+    assert next(stream) is second
+    stream.close()
+
+
+def test_pose_readers_do_not_create_buffers(servicer):
+    servicer.STREAM_WAIT_TIMEOUT = 0.01
+    request = pointcloud_pb2.TrajectoryRequest(session_id='unknown', history_only=True)
+    assert list(servicer.GetTrajectory(request, FakeContext())) == []
+    assert list(servicer.GetPoses(Empty(), FakeContext(active_checks=2, **{'session-id': 'unknown'}))) == []
+    assert 'unknown' not in servicer._pose_buffers
+
+
+def test_pose_stream_wakes_on_new_poses(served):
+    stream = served.stub.GetPoses(Empty(), metadata=ROBOT, timeout=5)
+    received = []
+    reader = threading.Thread(target=lambda: received.extend(p.poses[0].matrix[3] for _, p in zip(range(2), stream)))
+    reader.start()
+    served.stub.ConnectPoses(iter([_poselist(1.0), _poselist(2.0)]), metadata=ROBOT)
+    reader.join(5)
+    stream.cancel()
+    assert received == [1.0, 2.0]
+
+
+def test_idle_aio_pose_streams_use_no_threads(served):
+    if not isinstance(served.servicer, server_aio.AsyncSlamServiceServicer):
+        pytest.skip("grpc.server: un thread par flux, borné par l'admission")
+    served.servicer.STREAM_WAIT_TIMEOUT = 0.05
+    threads = threading.active_count()
+    streams = [served.stub.GetPoses(Empty(), metadata=ROBOT, timeout=5) for _ in range(12)]
+    served.stub.ConnectPoses(iter([_poselist(1.0)]), metadata=ROBOT)
+    assert [next(stream).poses[0].matrix[3] for stream in streams] == [1.0] * 12
+    assert threading.active_count() <= threads + 2
+    for stream in streams:
+        stream.cancel()
@@ -0,0 +1,49 @@
+# test_progressive.py - Pyramide de niveaux de détail et rattrapage progressif (grossier vers fin)
+import json
+
+import grpc
+import numpy as np
+from google.protobuf.empty_pb2 import Empty
+
+from bench_chunk_store import generate_messages
+from LodPyramid import LodPyramid
+
+from conftest import SESSION_ID
+
+ROBOT = [('session-id', 'robot-lod')]
+
+
+def test_levels_tiles_and_order():
+    pyramid = LodPyramid()
+    rng = np.random.default_rng(0)
+    xyzrgb = rng.uniform(0.0, 1.0, (20000, 6))
+    xyzrgb[:, :3] *= 4.0
+    pyramid.add_xyzrgb(xyzrgb, 7)
+
+    assert pyramid.coarse_to_fine() == [3, 2, 1]
+    counts = [len(level) for level in pyramid.levels]
+    assert counts == sorted(counts, reverse=True) and counts[-1] < counts[0] < len(xyzrgb)
+
+    tiles = list(pyramid.level_chunks(1, SESSION_ID, tile_points=1000))
+    assert len(tiles) == -(-counts[0] // 1000)
+    assert sum(len(tile.pointcloudlist.pointclouds[0].points) for tile in tiles) == counts[0]
+    assert {(tile.lod_level, tile.sequence_number, tile.lod_voxel_size) for tile in tiles} == {(1, 7, 0.04)}
+
+
+def test_progressive_catchup_sends_coarse_to_fine_then_chunks(served):
+    served.stub.ConnectSlamData(iter(generate_messages(4, 2, 1500)), metadata=ROBOT)
+    total_chunks = served.stub.GetSessionInfo(Empty(), metadata=ROBOT).total_chunks
+
+    header = json.dumps({'lastSequence': -1, 'progressive': True})
+    received = []
+    try:
+        for data in served.stub.GetSlamData(Empty(), metadata=ROBOT + [('custom-header-1', header)], timeout=1.5):
+            received.append(data)
+    except grpc.RpcError:
+        pass
+    levels = [data.lod_level for data in received if data.lod_level]
+    assert levels == sorted(levels, reverse=True) and set(levels) == {1, 2, 3}
+    # Tuiles d'abord, puis la pleine résolution dans l'ordre des séquences
+    full = received[len(levels):]
+    assert [data.sequence_number for data in full] == list(range(total_chunks))
+    assert not any(data.lod_level for data in full)
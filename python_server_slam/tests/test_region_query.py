@@ -0,0 +1,61 @@
+# test_region_query.py - GetRegionChunks: boîte, sphère ou frustum, avec ou sans découpe des points
+import grpc
+import numpy as np
+import pytest
+from google.protobuf.empty_pb2 import Empty
+
+import pointcloud_pb2
+from bench_chunk_store import generate_messages
+from SpatialIndex import FrustumRegion
+from utils import points_to_xyz
+
+from conftest import SESSION_ID, Aborted, FakeContext, ingest
+
+ROBOT = [('session-id', 'robot-region')]
+
+
+def _box(bbox_min, bbox_max):
+    return pointcloud_pb2.Box(min=pointcloud_pb2.Vector3(x=bbox_min[0], y=bbox_min[1], z=bbox_min[2]),
+                              max=pointcloud_pb2.Vector3(x=bbox_max[0], y=bbox_max[1], z=bbox_max[2]))
+
+
+def _region_points(servicer, request):
+    chunks = list(servicer.GetRegionChunks(request, FakeContext()))
+    return chunks, np.concatenate([points_to_xyz(pc.points) for data in chunks
+                                   for pc in data.pointcloudlist.pointclouds] or [np.empty((0, 3))])
+
+
+def test_frustum_contains_and_culls():
+    # Caméra à l'origine regardant selon +Z, 90° d'ouverture
+    frustum = FrustumRegion(np.eye(4).flatten(), fov_y=90.0, aspect=1.0, near=0.1, far=10.0)
+    inside = frustum.contains(np.array([[0.0, 0.0, 5.0], [4.0, -4.0, 5.0], [0.0, 0.0, -1.0], [6.0, 0.0, 5.0]]))
+    assert inside.tolist() == [True, True, False, False]
+    assert frustum.intersects_aabb(np.array([-1.0, -1.0, 4.0]), np.array([1.0, 1.0, 6.0]))
+    assert not frustum.intersects_aabb(np.array([-1.0, -1.0, -6.0]), np.array([1.0, 1.0, -4.0]))
+
+
+def test_clip_points_keeps_only_points_in_region(servicer):
+    servicer.session_manager.update_session_info(SESSION_ID, '', True, 0)
+    ingest(servicer.persistent_cache, num_messages=4)
+    request = pointcloud_pb2.RegionRequest(session_id=SESSION_ID, box=_box((0, 0, 0), (1.5, 2, 2)))
+    chunks, xyz = _region_points(servicer, request)
+    assert chunks and not np.all((xyz >= 0) & (xyz <= [1.5, 2, 2]))
+
+    request.clip_points = True
+    clipped, clipped_xyz = _region_points(servicer, request)
+    assert len(clipped) <= len(chunks) and 0 < len(clipped_xyz) < len(xyz)
+    assert np.all((clipped_xyz >= 0) & (clipped_xyz <= [1.5, 2, 2]))
+
+
+def test_missing_region_is_rejected(servicer):
+    with pytest.raises(Aborted) as aborted:
+        list(servicer.GetRegionChunks(pointcloud_pb2.RegionRequest(session_id=SESSION_ID), FakeContext()))
+    assert aborted.value.code == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_served_region(served):
+    served.stub.ConnectSlamData(iter(generate_messages(3, 2, 1500)), metadata=ROBOT)
+    info = served.stub.GetSessionInfo(Empty(), metadata=ROBOT)
+    request = pointcloud_pb2.RegionRequest(box=_box((-1, -1, -1), (1, 3, 3)))
+    region = list(served.stub.GetRegionChunks(request, metadata=ROBOT, timeout=5))
+    assert 0 < len(region) < info.total_chunks
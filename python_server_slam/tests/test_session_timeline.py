@@ -0,0 +1,31 @@
+# test_session_timeline.py - Journal des sessions (compaction) et lecture bornée des chunks du flux multiplexé
+from SessionTimeline import SessionJournal
+
+from conftest import SESSION_ID, ingest
+
+
+def test_compaction_keeps_latest_event_of_each_kind():
+    journal = SessionJournal(SESSION_ID, max_events=8)
+    for i in range(20):
+        journal.append('chunks', i)
+        if i % 5 == 0:
+            journal.append('poses', i // 5)
+    assert journal.tick == 24
+    events = journal.events_after(0)
+    assert len(events) <= 8
+    ticks = [tick for tick, _, _ in events]
+    assert ticks == sorted(ticks) and ticks[-1] == 24
+    # Références cumulatives: la dernière de chaque type suffit à rattraper
+    assert max(ref for _, kind, ref in events if kind == 'chunks') == 19
+    assert max(ref for _, kind, ref in events if kind == 'poses') == 3
+    # Un flux à jour ne voit que la suite
+    assert journal.events_after(22) == [(23, 'chunks', 18), (24, 'chunks', 19)]
+
+
+def test_entries_until_sequence(cache):
+    ingest(cache, num_messages=6)
+    entries = cache.get_entries_after_sequence(-1, SESSION_ID)
+    sequences = [metadata.sequence_number for metadata, _ in entries]
+    middle = sequences[len(sequences) // 2]
+    bounded = cache.get_entries_after_sequence(sequences[0], SESSION_ID, until_sequence=middle)
+    assert [metadata.sequence_number for metadata, _ in bounded] == [s for s in sequences if sequences[0] < s <= middle]
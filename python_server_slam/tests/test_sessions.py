@@ -0,0 +1,59 @@
+# test_sessions.py - Sessions multiples: producteurs sans metadata et entrées de sessions terminées
+import grpc
+import pytest
+
+from bench_chunk_store import generate_messages
+from SessionManager import SessionManager
+
+from conftest import Aborted, FakeContext
+
+
+def _produce(servicer, context, seed=0):
+    servicer.ConnectSlamData(iter(generate_messages(1, 1, 500, seed=seed)), context)
+
+
+def test_anonymous_producer_keeps_its_own_session(servicer):
+    _produce(servicer, FakeContext())
+    session_id = servicer.session_manager.get_current_session_id()
+    assert session_id.startswith('SLAM-')
+
+    # Reconnexion du même producteur: même session
+    _produce(servicer, FakeContext(), seed=1)
+    assert servicer.session_manager.get_current_session_id() == session_id
+    assert servicer.persistent_cache.get_stats(session_id)['total_chunks'] == 2
+
+
+def test_anonymous_producer_does_not_write_into_another_robot(servicer):
+    _produce(servicer, FakeContext(**{'session-id': 'robot-a'}))
+    with pytest.raises(Aborted) as aborted:
+        _produce(servicer, FakeContext(), seed=1)
+    assert aborted.value.code == grpc.StatusCode.FAILED_PRECONDITION
+    assert servicer.persistent_cache.get_stats('robot-a')['total_chunks'] == 1
+
+    # Session terminée (inactive): le producteur sans metadata peut la reprendre
+    servicer.session_manager.set_active_state(False, 'robot-a')
+    _produce(servicer, FakeContext(), seed=1)
+    assert servicer.persistent_cache.get_stats('robot-a')['total_chunks'] == 2
+
+
+def test_updates_do_not_create_sessions():
+    manager = SessionManager()
+    manager.set_clients_count(3, 'ghost')
+    manager.set_active_state(True, 'ghost')
+    assert manager.increment_clients('ghost') == 0
+    assert not manager.has_session('ghost') and manager.list_sessions() == []
+
+
+def test_session_end_leaves_no_entries(servicer):
+    context = FakeContext(**{'session-id': 'robot-a'})
+    _produce(servicer, context)
+    servicer._connect_client('robot-a', 'viewer', context)
+    assert 'robot-a' in servicer.stream_monitor.last_data_time
+
+    servicer._handle_stream_timeout('robot-a')
+    # Le viewer part après la fin de session, une requête arrive pour un ID inconnu
+    servicer._disconnect_client('robot-a', 'viewer')
+    servicer.stream_monitor.update_activity('ghost')
+    assert not servicer.session_manager.has_session('robot-a')
+    assert not {'robot-a', 'ghost'} & set(servicer.stream_monitor.last_data_time)
+    assert not {'robot-a', 'ghost'} & servicer.stream_monitor.had_active_session
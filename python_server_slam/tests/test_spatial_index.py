@@ -0,0 +1,47 @@
+# test_spatial_index.py - Index spatial (publication des cellules) et requêtes par région
+import numpy as np
+
+from SpatialIndex import BoxRegion, ChunkSpatialIndex, SphereRegion
+
+from conftest import SESSION_ID, ingest
+
+
+def test_changes_visible_after_publish():
+    index = ChunkSpatialIndex(cell_size=1.0)
+    index.insert('a', (0, 0, 0), (0.5, 0.5, 0.5))
+    assert index.candidates((0, 0, 0), (1, 1, 1)) == set()
+    index.publish()
+    published = index._published[(0, 0, 0)]
+    index.insert('b', (0.2, 0.2, 0.2), (0.4, 0.4, 0.4))
+    # Les lecteurs gardent l'ensemble gelé tant que rien n'est publié
+    assert index.candidates((0, 0, 0), (1, 1, 1)) == {'a'}
+    index.publish()
+    assert index.candidates((0, 0, 0), (1, 1, 1)) == {'a', 'b'}
+    assert published == frozenset({'a'})
+
+    index.update('a', (5, 5, 5), (5.5, 5.5, 5.5))
+    index.remove('b')
+    index.publish()
+    assert index.candidates((0, 0, 0), (1, 1, 1)) == set()
+    assert index.candidates((5, 5, 5), (6, 6, 6)) == {'a'}
+    assert (0, 0, 0) not in index._published
+
+
+def test_large_chunks_always_candidates():
+    index = ChunkSpatialIndex(cell_size=1.0, max_cells_per_chunk=8)
+    index.insert('big', (0, 0, 0), (10, 10, 10))
+    index.publish()
+    assert index.candidates((100, 100, 100), (101, 101, 101)) == {'big'}
+    index.remove('big')
+    index.publish()
+    assert index.candidates((0, 0, 0), (1, 1, 1)) == set()
+
+
+def test_query_region_matches_brute_force(cache):
+    ingest(cache, num_messages=6)
+    entries = cache.get_entries_after_sequence(-1, SESSION_ID)
+    for region in (BoxRegion((0, 0, 0), (1.5, 2, 2)), SphereRegion((3.0, 1.0, 1.0), 0.5)):
+        expected = [metadata.chunk_id for metadata, _ in entries
+                    if region.intersects_aabb(np.asarray(metadata.bbox_min), np.asarray(metadata.bbox_max))]
+        found = [metadata.chunk_id for metadata, _ in cache.query_region(SESSION_ID, region)]
+        assert found == expected and found
@@ -0,0 +1,105 @@
+# test_sqlite_cache.py - Backend SQLite: reprise après réouverture, éviction, nettoyage, corrections
+import sqlite3
+import time
+
+import numpy as np
+
+import pointcloud_pb2
+from SqliteDataCache import SqliteDataCache
+
+from conftest import SESSION_ID, ingest
+
+
+def _rows(path, session_id=SESSION_ID):
+    with sqlite3.connect(path) as conn:
+        return conn.execute('SELECT COUNT(*) FROM chunks WHERE session_id = ?', (session_id,)).fetchone()[0]
+
+
+def test_reopen_restores_sessions_and_sequence(session_manager, sqlite_path):
+    cache = SqliteDataCache(session_manager, db_path=sqlite_path)
+    created = ingest(cache)
+    cache.close()
+
+    reopened = SqliteDataCache(session_manager, db_path=sqlite_path)
+    assert reopened.get_session_ids() == [SESSION_ID]
+    assert len(reopened.get_entries_after_sequence(-1, SESSION_ID)) == len(created)
+    # La numérotation reprend après les chunks déjà en base
+    more = ingest(reopened, num_messages=1, seed=1)
+    sequences = [metadata.sequence_number for metadata, _ in reopened.get_entries_after_sequence(-1, SESSION_ID)]
+    assert sequences == list(range(len(created) + len(more)))
+    assert reopened.get_lod_pyramid(SESSION_ID).snapshot(SESSION_ID).pointcloudlist.pointclouds
+    reopened.close()
+
+
+def test_max_chunks_evicts_oldest(sqlite_cache, sqlite_path):
+    sqlite_cache.MAX_CHUNKS = 3
+    created = ingest(sqlite_cache, num_messages=6)
+    assert len(created) > 3
+    status = sqlite_cache.get_sync_status(SESSION_ID)
+    assert status['available_chunk_ids'] == created[-3:]
+    assert _rows(sqlite_path) == 3
+    # L'index keyframe -> chunks ne garde que les chunks restants
+    kept = set(sqlite_cache.get_chunk_ids_for_keyframes(SESSION_ID, range(100)))
+    assert kept == set(created[-3:])
+
+
+def test_session_end_keeps_rows(sqlite_cache, sqlite_path):
+    created = ingest(sqlite_cache)
+    sqlite_cache.apply_pose_corrections(SESSION_ID, {0: pointcloud_pb2.Pose(matrix=np.eye(4).flatten().tolist())})
+    store = sqlite_cache._get_store(SESSION_ID)
+    sqlite_cache.clear_cache(SESSION_ID)
+    assert sqlite_cache._get_store(SESSION_ID) is not store
+    assert _rows(sqlite_path) == len(created)
+    assert sqlite_cache.get_sync_status(SESSION_ID)['available_chunk_ids'] == created
+    # Session reprise depuis la base: numérotation et corrections conservées
+    assert sqlite_cache.get_pose_corrections(SESSION_ID)[0] == 1
+    assert sqlite_cache.latest_sequence(SESSION_ID) == len(created) - 1
+
+
+def test_resumed_session_does_not_reingest_voxels(session_manager, sqlite_path):
+    cache = SqliteDataCache(session_manager, db_path=sqlite_path)
+    created = ingest(cache)
+    cache.close()
+
+    reopened = SqliteDataCache(session_manager, db_path=sqlite_path)
+    # Mêmes messages: tous leurs voxels sont déjà en base
+    assert ingest(reopened) == []
+    assert _rows(sqlite_path) == len(created)
+    assert len(ingest(reopened, seed=1)) > 0
+    reopened.close()
+
+
+def test_delete_session_and_retention(session_manager, sqlite_cache, sqlite_path):
+    ingest(sqlite_cache)
+    ingest(sqlite_cache, session_id='robot-old', seed=1)
+    assert sqlite_cache.delete_session(SESSION_ID) > 0
+    assert _rows(sqlite_path) == 0
+    assert sqlite_cache.get_pose_corrections(SESSION_ID) == (0, {})
+
+    # Rétention appliquée à l'ouverture
+    sqlite_cache.close()
+    kept = SqliteDataCache(session_manager, db_path=sqlite_path, retention_seconds=3600)
+    assert kept.get_session_ids() == ['robot-old']
+    assert kept.purge_expired(now_ms=int(time.time() * 1000) + 7200 * 1000) == ['robot-old']
+    assert _rows(sqlite_path, 'robot-old') == 0
+    kept.close()
+
+
+def test_pose_correction_bounds_survive_reopen(session_manager, sqlite_cache, sqlite_path):
+    ingest(sqlite_cache)
+    chunk_ids = sqlite_cache.get_chunk_ids_for_keyframes(SESSION_ID, [0])
+    before = {metadata.chunk_id: metadata.bbox_max
+              for metadata, _ in sqlite_cache.get_entries_after_sequence(-1, SESSION_ID)}
+    shifted = np.eye(4)
+    shifted[2, 3] = 10.0
+    revision, corrected = sqlite_cache.apply_pose_corrections(
+        SESSION_ID, {0: pointcloud_pb2.Pose(matrix=shifted.flatten().tolist())})
+    assert revision == 1 and corrected == chunk_ids
+
+    reopened = SqliteDataCache(session_manager, db_path=sqlite_path)
+    after = {metadata.chunk_id: metadata.bbox_max
+             for metadata, _ in reopened.get_entries_after_sequence(-1, SESSION_ID)}
+    for chunk_id in chunk_ids:
+        assert after[chunk_id][2] > before[chunk_id][2] + 5.0
+    assert reopened.get_pose_corrections(SESSION_ID)[0] == 1
+    reopened.close()
@@ -0,0 +1,92 @@
+# test_subscriber_queue.py - Files d'envoi des clients temps réel: politiques de débordement et diffusion
+import threading
+
+from SubscriberQueue import SubscriberQueue
+
+from conftest import SESSION_ID, ingest
+
+
+class _Metadata:
+    def __init__(self, sequence_number):
+        self.sequence_number = sequence_number
+
+
+def _entries(first, last):
+    return [(_Metadata(sequence), f'chunk-{sequence}') for sequence in range(first, last + 1)]
+
+
+def _drain(queue):
+    actions = []
+    while (action := queue.pop()) is not None:
+        actions.append(action)
+    return actions
+
+
+def test_latest_lod_replaces_queued_chunks():
+    queue = SubscriberQueue(SESSION_ID, 'viewer', capacity=2, policy='latest_lod')
+    queue.offer(_entries(0, 4))
+    # Chaque débordement remplace la file par le niveau de détail couvrant la séquence
+    assert _drain(queue) == [('lod', 4), ('chunk', 'chunk-4')]
+    assert queue.dropped == 4
+
+
+def test_coalesce_keeps_order_with_one_catchup():
+    queue = SubscriberQueue(SESSION_ID, 'viewer', capacity=2, policy='coalesce')
+    queue.offer(_entries(0, 3))
+    queue.offer(_entries(4, 5))
+    assert _drain(queue) == [('chunk', 'chunk-0'), ('chunk', 'chunk-1'), ('catchup', (2, 5))]
+    # Déjà proposés: ignorés
+    queue.offer(_entries(0, 5))
+    assert queue.pop() is None
+
+
+def test_disconnect_closes_the_queue():
+    queue = SubscriberQueue(SESSION_ID, 'viewer', capacity=2, policy='disconnect')
+    queue.offer(_entries(0, 2))
+    assert queue.overflowed and queue.closed
+    assert queue.enqueued_sequence == 2
+    queue.offer(_entries(3, 3))
+    assert queue.depth == 2
+
+
+def test_block_waits_for_room():
+    queue = SubscriberQueue(SESSION_ID, 'viewer', capacity=1, policy='block')
+    writer = threading.Thread(target=queue.offer, args=(_entries(0, 2),))
+    writer.start()
+    received = []
+    while len(received) < 3:
+        version = queue.version
+        received += _drain(queue)
+        queue.wait(version, timeout=1.0)
+    writer.join(timeout=1.0)
+    assert not writer.is_alive()
+    assert received == [('chunk', f'chunk-{sequence}') for sequence in range(3)]
+
+
+def test_blocked_fanout_does_not_hold_session_lock(servicer):
+    cache = servicer.persistent_cache
+    ingest(cache, num_messages=1)
+    queue = servicer.fanout.subscribe(SESSION_ID, 'slow', cache.latest_sequence(SESSION_ID),
+                                      capacity=1, policy='block')
+    writer = threading.Thread(target=ingest, args=(cache,), kwargs={'num_messages': 3, 'seed': 1})
+    writer.start()
+    try:
+        # L'écrivain attend de la place dans la file, hors du verrou de la session
+        while writer.is_alive() and queue.depth < 1:
+            writer.join(timeout=0.01)
+        store = cache._get_store(SESSION_ID)
+        assert store.lock.acquire(timeout=1.0)
+        store.lock.release()
+    finally:
+        servicer.fanout.unsubscribe(queue)
+        writer.join(timeout=5.0)
+    assert not writer.is_alive()
+
+
+def test_client_cannot_choose_block_or_tiny_queue(servicer):
+    assert servicer._queue_settings({'queuePolicy': 'block', 'queueSize': 1}) == (
+        servicer.MIN_SEND_QUEUE_SIZE, servicer.SEND_QUEUE_POLICY)
+    assert servicer._queue_settings({'queuePolicy': 'latest_lod', 'queueSize': 64}) == (64, 'latest_lod')
+    assert servicer._queue_settings({}) == (servicer.SEND_QUEUE_SIZE, servicer.SEND_QUEUE_POLICY)
+    servicer.SEND_QUEUE_POLICY = 'block'
+    assert servicer._queue_settings({'queuePolicy': 'block'})[1] == 'block'
@@ -0,0 +1,51 @@
+# test_trajectory.py - Décimation de trajectoire (GetTrajectory): modes delta et RDP, modes inconnus
+import grpc
+import numpy as np
+import pytest
+
+import pointcloud_pb2
+from TrajectoryDecimator import TrajectoryDecimator, rdp_indices
+
+from conftest import SESSION_ID, Aborted, FakeContext
+
+
+def _pose(x, y=0.0, yaw_degrees=0.0):
+    yaw = np.radians(yaw_degrees)
+    matrix = np.eye(4)
+    matrix[:2, :2] = [[np.cos(yaw), -np.sin(yaw)], [np.sin(yaw), np.cos(yaw)]]
+    matrix[:2, 3] = (x, y)
+    return pointcloud_pb2.Pose(matrix=matrix.flatten().tolist())
+
+
+def test_delta_keeps_poses_that_moved_or_turned_enough():
+    decimator = TrajectoryDecimator('delta', min_translation=1.0, min_rotation=30.0)
+    poses = [_pose(0.0), _pose(0.4), _pose(1.1), _pose(1.2, yaw_degrees=45.0), _pose(1.3, yaw_degrees=50.0)]
+    assert decimator.decimate(poses) == [0, 2, 3]
+    # Nouvelle trajectoire: la première pose repart
+    decimator.reset()
+    assert decimator.accept(_pose(1.3, yaw_degrees=50.0))
+
+
+def test_rdp_keeps_corners_and_continues_live_in_delta():
+    xyz = np.array([[0, 0, 0], [1, 0.01, 0], [2, 0, 0], [2, 1, 0], [2, 2, 0]], dtype=np.float64)
+    assert rdp_indices(xyz, 0.1).tolist() == [0, 2, 4]
+
+    decimator = TrajectoryDecimator('rdp', epsilon=0.1)
+    assert decimator.decimate([_pose(x, y) for x, y, _ in xyz]) == [0, 2, 4]
+    assert not decimator.accept(_pose(2.0, 2.05)) and decimator.accept(_pose(2.0, 2.2))
+
+
+def test_unknown_mode_is_rejected(servicer):
+    with pytest.raises(ValueError):
+        TrajectoryDecimator('spline')
+    request = pointcloud_pb2.TrajectoryRequest(session_id=SESSION_ID, mode=42, history_only=True)
+    with pytest.raises(Aborted) as aborted:
+        list(servicer.GetTrajectory(request, FakeContext()))
+    assert aborted.value.code == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_served_unknown_mode(served):
+    with pytest.raises(grpc.RpcError) as error:
+        list(served.stub.GetTrajectory(pointcloud_pb2.TrajectoryRequest(mode=42), metadata=[('session-id', 'robot-a')],
+                                       timeout=5))
+    assert error.value.code() == grpc.StatusCode.INVALID_ARGUMENT
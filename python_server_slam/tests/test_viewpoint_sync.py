@@ -0,0 +1,60 @@
+# test_viewpoint_sync.py - Rattrapage initial priorisé par le point de vue du client
+import json
+import types
+
+import grpc
+import numpy as np
+from google.protobuf.empty_pb2 import Empty
+
+from bench_chunk_store import generate_messages
+from server_5 import viewpoint_from_header
+from SpatialIndex import Viewpoint, iter_by_priority
+
+ROBOT = [('session-id', 'robot-view')]
+
+
+def _chunk(centroid, bbox_min=None, bbox_max=None):
+    return types.SimpleNamespace(centroid=centroid, bbox_min=bbox_min, bbox_max=bbox_max)
+
+
+def test_iter_by_priority_is_exact_within_queue_and_bounded_beyond():
+    entries = [5, 3, 9, 1, 7]
+    assert list(iter_by_priority(entries, lambda entry: entry)) == [1, 3, 5, 7, 9]
+    # File de 2: le meilleur des 3 premiers sort avant d'avoir vu le reste
+    assert list(iter_by_priority(entries, lambda entry: entry, max_queue=2)) == [3, 1, 5, 7, 9]
+
+
+def test_visible_chunks_first_then_by_distance():
+    viewpoint = Viewpoint((0, 0, 0), direction=(1, 0, 0), fov=60, mode='visibility')
+    ahead_far, behind_near, ahead_near = _chunk((10, 0, 0)), _chunk((-1, 0, 0)), _chunk((2, 0.5, 0))
+    # Caméra à l'intérieur de l'AABB: visible même si le centroïde est derrière
+    around = _chunk((-3, 0, 0), bbox_min=(-5, -1, -1), bbox_max=(1, 1, 1))
+    chunks = [ahead_far, behind_near, ahead_near, around, _chunk(None)]
+    ordered = sorted(chunks, key=viewpoint.priority)
+    assert ordered == [ahead_near, around, ahead_far, behind_near, chunks[-1]]
+
+
+def test_viewpoint_from_header():
+    assert viewpoint_from_header({}) is None
+    assert viewpoint_from_header({'syncOrder': 'distance', 'viewpoint': {'position': 'nowhere'}}) is None
+    pose = np.eye(4)
+    pose[:3, 3] = (1, 2, 3)
+    viewpoint = viewpoint_from_header({'syncOrder': 'visibility', 'viewpoint': {'pose': pose.flatten().tolist()}})
+    assert viewpoint.position.tolist() == [1, 2, 3] and viewpoint.direction.tolist() == [0, 0, 1]
+
+
+def test_catchup_nearest_chunks_first(served):
+    served.stub.ConnectSlamData(iter(generate_messages(6, 2, 1500, seed=2)), metadata=ROBOT)
+    entries = served.servicer.persistent_cache.get_entries_after_sequence(-1, 'robot-view')
+    position = np.array([5.0, 1.0, 1.0])
+    expected = [metadata.sequence_number for metadata, _ in
+                sorted(entries, key=lambda entry: np.linalg.norm(np.asarray(entry[0].centroid) - position))]
+
+    header = json.dumps({'syncOrder': 'distance', 'viewpoint': {'position': position.tolist()}})
+    received = []
+    try:
+        for data in served.stub.GetSlamData(Empty(), metadata=ROBOT + [('custom-header-1', header)], timeout=1.5):
+            received.append(data.sequence_number)
+    except grpc.RpcError:
+        pass
+    assert received == expected and expected != sorted(expected)
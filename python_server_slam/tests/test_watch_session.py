@@ -0,0 +1,68 @@
+# test_watch_session.py - SessionInfo poussé par WatchSession au lieu d'être interrogé (synchrone et asyncio)
+import json
+import threading
+import time
+
+from google.protobuf.empty_pb2 import Empty
+
+from bench_chunk_store import generate_messages
+from SessionManager import SessionManager
+
+ROBOT = [('session-id', 'robot-watch')]
+
+
+def _next_until(stream, condition):
+    """Premier SessionInfo poussé qui vérifie condition"""
+    for info in stream:
+        if condition(info):
+            return info
+    raise AssertionError("flux WatchSession terminé")
+
+
+def test_changes_notify_listeners_and_wake_waiters():
+    manager = SessionManager()
+    notified = []
+    manager.add_change_listener(notified.append)
+    version = manager.version
+
+    writer = threading.Timer(0.1, lambda: manager.update_session_info('robot-a', '', True, 0))
+    writer.start()
+    start = time.monotonic()
+    new_version = manager.wait_for_change(version, timeout=5.0)
+    writer.join()
+    assert new_version != version and time.monotonic() - start < 1.0
+    assert notified and set(notified) == {'robot-a'}
+
+
+def test_session_lifecycle_is_pushed(served):
+    # Délai d'attente bien plus long que le test: seuls les changements de session réveillent le flux
+    served.servicer.STREAM_WAIT_TIMEOUT = 30.0
+    served.servicer.SESSION_CHUNK_MILESTONE = 2
+    stream = served.stub.WatchSession(Empty(), metadata=ROBOT, timeout=10)
+    first = next(stream)
+    assert first.session_id == 'robot-watch' and not first.is_active
+
+    served.stub.ConnectSlamData(iter(generate_messages(3, 2, 1500)), metadata=ROBOT)
+    assert _next_until(stream, lambda info: info.is_active).start_time
+    assert _next_until(stream, lambda info: info.total_chunks >= 2).is_active
+
+    # Fin de session: poussée tout de suite
+    ended_at = time.monotonic()
+    served.servicer.session_manager.set_active_state(False, 'robot-watch')
+    _next_until(stream, lambda info: not info.is_active)
+    latency = time.monotonic() - ended_at
+    stream.cancel()
+    assert latency < 1.0
+
+
+def test_viewer_count_is_pushed(served):
+    served.stub.ConnectSlamData(iter(generate_messages(1, 1, 500)), metadata=ROBOT)
+    watcher = served.stub.WatchSession(Empty(), metadata=ROBOT, timeout=10)
+    assert next(watcher).clients_connected == 0
+
+    header = json.dumps({'lastSequence': -1, 'heartbeatSeconds': 0})
+    viewer = served.stub.GetSlamData(Empty(), metadata=ROBOT + [('custom-header-1', header)], timeout=10)
+    _next_until(watcher, lambda info: info.clients_connected == 1)
+    viewer.cancel()
+    _next_until(watcher, lambda info: info.clients_connected == 0)
+    watcher.cancel()
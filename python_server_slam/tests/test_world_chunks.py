@@ -0,0 +1,61 @@
+# test_world_chunks.py - Copies en coordonnées monde partagées (par révision de correction) et GetSpecificChunks
+import numpy as np
+
+import pointcloud_pb2
+
+from conftest import SESSION_ID, FakeContext, ingest
+
+
+def _shifted_pose(x):
+    pose = np.eye(4)
+    pose[0, 3] = x
+    return pointcloud_pb2.Pose(matrix=pose.flatten().tolist())
+
+
+def test_world_chunk_cached_per_correction_revision(memory_cache):
+    created = ingest(memory_cache, num_messages=3)
+    slam_data = memory_cache.get_chunk(created[0], SESSION_ID)
+    world = memory_cache.get_world_chunk(SESSION_ID, slam_data)
+    assert not world.local_coordinates
+    assert memory_cache.get_world_chunk(SESSION_ID, slam_data) is world
+
+    # Correction d'une autre keyframe: la copie reste valable
+    keyframes = list(slam_data.indexlist.index)
+    other_keyframes = list(memory_cache.get_chunk(created[-1], SESSION_ID).indexlist.index)
+    assert not set(keyframes) & set(other_keyframes)
+    memory_cache.apply_pose_corrections(SESSION_ID, {other_keyframes[0]: _shifted_pose(100.0)})
+    assert memory_cache.get_world_chunk(SESSION_ID, slam_data) is world
+
+    memory_cache.apply_pose_corrections(SESSION_ID, {keyframes[0]: _shifted_pose(100.0)})
+    corrected = memory_cache.get_world_chunk(SESSION_ID, slam_data)
+    assert corrected is not world
+    assert corrected.pointcloudlist.pointclouds[0].points[0].x > 99.0
+    assert memory_cache.get_world_chunk(SESSION_ID, slam_data) is corrected
+
+
+def test_specific_chunks_use_resolved_session(servicer):
+    servicer.session_manager.update_session_info(SESSION_ID, '', True, 0)
+    created = ingest(servicer.persistent_cache, num_messages=2)
+    keyframe = servicer.persistent_cache.get_chunk(created[0], SESSION_ID).indexlist.index[0]
+    servicer.persistent_cache.apply_pose_corrections(SESSION_ID, {keyframe: _shifted_pose(100.0)})
+
+    # Pas de session_id dans la requête: session des metadata, corrections de cette session
+    request = pointcloud_pb2.ChunkRequest(missing_chunk_ids=[created[0]])
+    chunks = list(servicer.GetSpecificChunks(request, FakeContext(**{'session-id': SESSION_ID})))
+    assert [chunk.chunk_id for chunk in chunks] == [created[0]]
+    assert chunks[0].session_id == SESSION_ID
+    assert chunks[0].pointcloud.points[0].x > 99.0
+
+
+def test_lod_gets_corrected_points_of_chunks_sealed_after_a_correction(memory_cache):
+    ingest(memory_cache, num_messages=2, flush=False)
+    store = memory_cache._sessions[SESSION_ID]
+    keyframe = store.temp_indices[-1]
+    memory_cache.apply_pose_corrections(SESSION_ID, {keyframe: _shifted_pose(100.0)})
+    memory_cache.flush_pending(SESSION_ID)
+
+    # La seconde correction retire de la pyramide exactement ce que le scellement y a mis
+    memory_cache.apply_pose_corrections(SESSION_ID, {keyframe: _shifted_pose(200.0)})
+    finest = store.lod.levels[0]
+    assert finest._counts.sum() == memory_cache.get_stats(SESSION_ID)['total_points']
+    assert finest.points()[:, 0].max() > 199.0
@@ -1,6 +1,8 @@
 
 import collections
 
+import numpy as np
+
 # voxel filter
 def apply_voxel_grid_filter(pointcloud, voxel_size=0.01):
     """Filtre voxel grid existant"""
@@ -42,3 +44,291 @@ def apply_voxel_grid_filter(pointcloud, voxel_size=0.01):
     return new_pointcloud
 
 
+
+# conversion des points protobuf en tableau numpy (N, 3)
+def points_to_xyz(points):
+    """Coordonnées (N, 3) float64 d'une liste de Point"""
+    xyz = np.fromiter(
+        (c for p in points for c in (p.x, p.y, p.z)),
+        dtype=np.float64,
+        count=3 * len(points)
+    )
+    return xyz.reshape(-1, 3)
+
+
+def points_to_xyzrgb(points):
+    """Coordonnées et couleurs (N, 6) float64 d'une liste de Point"""
+    xyzrgb = np.fromiter(
+        (c for p in points for c in (p.x, p.y, p.z, p.r, p.g, p.b)),
+        dtype=np.float64,
+        count=6 * len(points)
+    )
+    return xyzrgb.reshape(-1, 6)
+
+
+# metadonnees spatiales d'un chunk
+def compute_bounds(pointcloudlist):
+    """AABB (min, max), centroïde et nombre de points d'un PointCloudList"""
+    xyz = np.concatenate(
+        [points_to_xyz(pc.points) for pc in pointcloudlist.pointclouds] or [np.empty((0, 3))]
+    )
+    return bounds_from_xyz(xyz)
+
+
+def bounds_from_xyz(xyz):
+    """AABB (min, max), centroïde et nombre de points d'un tableau (N, 3)"""
+    if len(xyz) == 0:
+        return None, None, None, 0
+    return (
+        tuple(xyz.min(axis=0).tolist()),
+        tuple(xyz.max(axis=0).tolist()),
+        tuple(xyz.mean(axis=0).tolist()),
+        len(xyz)
+    )
+
+
+# suppression des points aberrants (pixels volants) par comptage de voisins sur grille
+def grid_neighbor_counts(xyz, cell_size):
+    """Nombre de voisins de chaque point (N,) dans les 27 cellules autour de la sienne
+
+    Les cellules sont hachées en un entier int64 (21 bits par axe) : les
+    comptes par cellule s'obtiennent par np.unique, ceux des cellules
+    voisines par recherche dichotomique dans les clés triées. Tout est
+    vectorisé, sans boucle Python sur les points. Le voisinage est le cube
+    de 3 cellules de côté, sur-ensemble de la sphère de rayon cell_size.
+    """
+    if len(xyz) == 0:
+        return np.zeros(0, dtype=np.int64)
+    cells = np.floor(xyz / cell_size).astype(np.int64) + (1 << 20)
+    keys = (cells[:, 0] << 42) | (cells[:, 1] << 21) | cells[:, 2]
+    unique, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+
+    neighbors = np.zeros(len(unique), dtype=np.int64)
+    unique_cells = np.stack(((unique >> 42) & 0x1FFFFF, (unique >> 21) & 0x1FFFFF, unique & 0x1FFFFF), axis=1)
+    for di in (-1, 0, 1):
+        for dj in (-1, 0, 1):
+            for dk in (-1, 0, 1):
+                shifted = unique_cells + (di, dj, dk)
+                shifted_keys = (shifted[:, 0] << 42) | (shifted[:, 1] << 21) | shifted[:, 2]
+                found = np.minimum(np.searchsorted(unique, shifted_keys), len(unique) - 1)
+                neighbors += np.where(unique[found] == shifted_keys, counts[found], 0)
+    return neighbors[inverse] - 1  # sans le point lui-même
+
+
+def outlier_mask(xyz, radius, min_neighbors=3, std_ratio=0.0):
+    """Masque des points à garder (N,) d'un lot de points (N, 3)
+
+    - rayon (std_ratio = 0): au moins min_neighbors voisins à moins d'environ `radius`
+    - statistique (std_ratio > 0): densité de voisinage au moins égale à
+      moyenne - std_ratio * écart-type de la densité du lot
+    """
+    counts = grid_neighbor_counts(xyz, radius)
+    if std_ratio > 0 and len(counts):
+        threshold = max(float(counts.mean() - std_ratio * counts.std()), float(min_neighbors))
+    else:
+        threshold = min_neighbors
+    return counts >= threshold
+
+
+# decoupage d'un chunk par un masque vectorise
+def clip_slam_data(slam_data, contains):
+    """Copie de SlamData ne gardant que les points pour lesquels contains(xyz) est vrai
+
+    Returns:
+        SlamData ou None si aucun point n'est conservé
+    """
+    clipped = type(slam_data)()
+    clipped.CopyFrom(slam_data)
+    del clipped.pointcloudlist.pointclouds[:]
+    kept = 0
+    for pc in slam_data.pointcloudlist.pointclouds:
+        mask = contains(points_to_xyz(pc.points)) if len(pc.points) else []
+        new_pc = clipped.pointcloudlist.pointclouds.add()
+        new_pc.points.extend(point for point, keep in zip(pc.points, mask) if keep)
+        kept += len(new_pc.points)
+    return clipped if kept else None
+
+
+# regroupement de chunks en un seul message (pointclouds / poses / indexlist concaténés)
+def merge_slam_data(slam_datas, chunk_id, corrections=None):
+    """SlamData réunissant plusieurs chunks, à la séquence du dernier
+
+    En repère local si tous les chunks le sont (pointclouds toujours
+    alignés sur leurs keyframes), sinon tout est converti en monde.
+    """
+    local_coordinates = all(slam_data.local_coordinates for slam_data in slam_datas)
+    merged = type(slam_datas[0])(
+        chunk_id=chunk_id,
+        sequence_number=slam_datas[-1].sequence_number,
+        local_coordinates=local_coordinates
+    )
+    for slam_data in slam_datas:
+        if not local_coordinates:
+            slam_data = to_world_slam_data(slam_data, corrections)
+        merged.pointcloudlist.pointclouds.extend(slam_data.pointcloudlist.pointclouds)
+        merged.poselist.poses.extend(slam_data.poselist.poses)
+        merged.indexlist.index.extend(slam_data.indexlist.index)
+    return merged
+
+
+# curseur de reprise du client pendant un rattrapage entrelacé avec le temps réel
+RESUME_SEQUENCE_TAG = bytes([(10 << 3) | 0])  # SlamData.resume_sequence: champ 10, varint
+
+
+def encode_varint(value):
+    """Varint protobuf d'un int32/int64 (négatifs sur 10 octets, comme protobuf)"""
+    value &= (1 << 64) - 1
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def with_resume_sequence(slam_data, sequence_number):
+    """Copie d'un SlamData portant resume_sequence (le chunk du cache n'est pas modifié)
+
+    Une trame déjà sérialisée (bytes) reçoit le champ en fin de trame : à la
+    lecture, protobuf fusionne les champs concaténés.
+    """
+    if isinstance(slam_data, bytes):
+        return slam_data + RESUME_SEQUENCE_TAG + encode_varint(sequence_number)
+    resumed = type(slam_data)()
+    resumed.CopyFrom(slam_data)
+    resumed.resume_sequence = sequence_number
+    return resumed
+
+
+# extraction des keyframes d'un chunk (pointclouds / poses / indexlist alignés)
+def select_keyframes(slam_data, keyframe_ids):
+    """Copie de SlamData ne gardant que les pointclouds des keyframes demandées
+
+    Returns:
+        SlamData ou None si le chunk ne contient aucune de ces keyframes
+    """
+    keyframe_ids = set(keyframe_ids)
+    selected = type(slam_data)()
+    selected.CopyFrom(slam_data)
+    del selected.pointcloudlist.pointclouds[:]
+    del selected.poselist.poses[:]
+    del selected.indexlist.index[:]
+    poses = slam_data.poselist.poses
+    for i, keyframe_id in enumerate(slam_data.indexlist.index):
+        if keyframe_id not in keyframe_ids or i >= len(slam_data.pointcloudlist.pointclouds):
+            continue
+        selected.pointcloudlist.pointclouds.append(slam_data.pointcloudlist.pointclouds[i])
+        if i < len(poses):
+            selected.poselist.poses.append(poses[i])
+        selected.indexlist.index.append(keyframe_id)
+    return selected if selected.indexlist.index else None
+
+
+
+# repere local des keyframes: points stockes en coordonnees keyframe, pose a part
+def pose_matrix(pose):
+    """Matrice 4x4 d'une Pose (ligne par ligne), identité si la pose est vide"""
+    if pose is None or len(pose.matrix) != 16:
+        return np.eye(4)
+    return np.asarray(pose.matrix, dtype=np.float64).reshape(4, 4)
+
+
+def transform_xyz(xyz, matrix):
+    """Applique une transformation rigide 4x4 à des points (N, 3)"""
+    return xyz @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def fill_points(points, xyzrgb):
+    """Ajoute à un champ repeated Point les points d'un tableau (N, 6)"""
+    for p in xyzrgb.tolist():
+        points.add(x=p[0], y=p[1], z=p[2], r=p[3], g=p[4], b=p[5])
+
+
+# Entrée encodée du champ `repeated Point points = 1` de PointCloud: clé, longueur (54), puis
+# les six champs double (clé + 8 octets). Un tableau de ces entrées est un PointCloud sérialisé.
+POINT_FIELDS = ('x', 'y', 'z', 'r', 'g', 'b')
+POINT_WIRE_DTYPE = np.dtype([('key', 'u1'), ('size', 'u1')]
+                            + [item for name in POINT_FIELDS for item in ((f'{name}_key', 'u1'), (name, '<f8'))])
+
+
+def point_wire_entries(count):
+    """Tableau de `count` entrées Point encodées, clés et longueurs remplies, valeurs à 0"""
+    entries = np.zeros(count, dtype=POINT_WIRE_DTYPE)
+    entries['key'] = (1 << 3) | 2  # champ 1, longueur délimitée
+    entries['size'] = POINT_WIRE_DTYPE.itemsize - 2
+    for number, name in enumerate(POINT_FIELDS, start=1):
+        entries[f'{name}_key'] = (number << 3) | 1  # double: 64 bits
+    return entries
+
+
+def set_wire_points(entries, xyzrgb, rows=slice(None)):
+    """Écrit les points (N, 6) dans les lignes `rows` d'entrées Point encodées"""
+    for column, name in enumerate(POINT_FIELDS):
+        entries[name][rows] = xyzrgb[:, column]
+
+
+def wire_xyzrgb(entries):
+    """Points (N, 6) d'entrées Point encodées"""
+    return np.stack([entries[name] for name in POINT_FIELDS], axis=1)
+
+
+def fill_wire_points(pointcloud, entries):
+    """Ajoute à un PointCloud des entrées Point encodées (analyse en C, sans boucle Python)"""
+    pointcloud.MergeFromString(entries.tobytes())
+
+
+def to_local_pointcloud(pointcloud, pose):
+    """Copie d'un PointCloud exprimée dans le repère de la keyframe de pose `pose`"""
+    xyzrgb = points_to_xyzrgb(pointcloud.points)
+    xyzrgb[:, :3] = transform_xyz(xyzrgb[:, :3], np.linalg.inv(pose_matrix(pose)))
+    local = type(pointcloud)()
+    fill_points(local.points, xyzrgb)
+    return local
+
+
+def keyframe_poses(slam_data, corrections=None):
+    """Pose de chaque pointcloud du chunk: correction de la keyframe si elle existe, sinon pose du chunk"""
+    corrections = corrections or {}
+    poses = slam_data.poselist.poses
+    keyframe_ids = slam_data.indexlist.index
+    result = []
+    for i in range(len(slam_data.pointcloudlist.pointclouds)):
+        pose = corrections.get(keyframe_ids[i]) if i < len(keyframe_ids) else None
+        if pose is None and i < len(poses):
+            pose = poses[i]
+        result.append(pose)
+    return result
+
+
+def world_xyzrgb(slam_data, corrections=None):
+    """Points (N, 6) d'un chunk en coordonnées monde (chunks en repère local ou non)"""
+    arrays = []
+    poses = keyframe_poses(slam_data, corrections) if slam_data.local_coordinates else None
+    for i, pc in enumerate(slam_data.pointcloudlist.pointclouds):
+        xyzrgb = points_to_xyzrgb(pc.points)
+        if poses is not None:
+            xyzrgb[:, :3] = transform_xyz(xyzrgb[:, :3], pose_matrix(poses[i]))
+        arrays.append(xyzrgb)
+    return np.concatenate(arrays) if arrays else np.empty((0, 6))
+
+
+def to_world_slam_data(slam_data, corrections=None):
+    """Copie d'un chunk en coordonnées monde, avec les poses courantes (clients sans repère local)"""
+    if not slam_data.local_coordinates:
+        return slam_data
+    poses = keyframe_poses(slam_data, corrections)
+    world = type(slam_data)()
+    world.CopyFrom(slam_data)
+    world.local_coordinates = False
+    del world.pointcloudlist.pointclouds[:]
+    del world.poselist.poses[:]
+    for pc, pose in zip(slam_data.pointcloudlist.pointclouds, poses):
+        xyzrgb = points_to_xyzrgb(pc.points)
+        xyzrgb[:, :3] = transform_xyz(xyzrgb[:, :3], pose_matrix(pose))
+        fill_points(world.pointcloudlist.pointclouds.add().points, xyzrgb)
+        if pose is not None:
+            world.poselist.poses.append(pose)
+        else:
+            world.poselist.poses.add()
+    return world
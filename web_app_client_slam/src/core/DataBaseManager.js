@@ -132,6 +132,9 @@ export class DataBaseManager {
                 timestamp: chunkData.timestamp || Date.now(),
                 coords: chunkData.coords, // Float32Array
                 colors: chunkData.colors, // Float32Array
+                keyframes: chunkData.keyframes || [], // keyframe de chaque pointcloud du chunk
+                counts: chunkData.counts || [],       // points par keyframe, dans l'ordre de coords
+                poses: chunkData.poses || [],         // pose appliquée à chaque keyframe (null = monde)
                 pointCount: chunkData.coords ? chunkData.coords.length / 3 : 0,
                 savedAt: Date.now()
             };
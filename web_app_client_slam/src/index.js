@@ -272,6 +272,7 @@ async function mainLoop() {
             }
             
             const slam = new SlamService(SERVER_URL, dbManager);
+            slam.setViewpoint(camera, 'visibility');
             const pose = new PoseService(SERVER_URL);
 
             // Ecoute du flux
@@ -296,6 +297,11 @@ async function mainLoop() {
                     else if (res) poseController.processRaw(res);
                 });
 
+                pose.onPoseCorrections((err, res) => {
+                    if (err) console.error("Erreur dans le flux de corrections de poses:", err);
+                    else if (res) pcController.applyPoseCorrection(res);
+                });
+
                 // Animation
                 animate({ renderer, scene, camera, controls, stats, pcController, overlay });
 
@@ -19,9 +19,37 @@ export class SessionMonitor {
 
     stop() {
         this.shouldStop = true;
+        if (this.stopWatch) this.stopWatch();
         console.log('🛑 Arrêt de la surveillance...');
     }
 
+    // Attend une session valide poussée par le serveur (WatchSession)
+    // Résout undefined si le stream est indisponible ou coupé: repli sur le polling
+    waitForPushedSession() {
+        return new Promise(resolve => {
+            const stream = this.sessionService.watchSessionInfo((err, sessionInfo) => {
+                if (err) {
+                    console.warn('⚠️ WatchSession interrompu, repli sur le polling:', err.message);
+                    resolve(undefined);
+                } else if (sessionInfo.sessionId && sessionInfo.sessionId.trim() !== '') {
+                    console.log('✅ SessionId valide poussé par le serveur:', sessionInfo.sessionId);
+                    stream.cancel();
+                    resolve(sessionInfo);
+                } else {
+                    console.warn('⏳ En attente du début de session...');
+                }
+            });
+            if (!stream) {
+                resolve(undefined);
+                return;
+            }
+            this.stopWatch = () => {
+                stream.cancel();
+                resolve(null);
+            };
+        });
+    }
+
     async testGrpcConnection() {
 
         console.log("testGrpcConnection method");
@@ -63,6 +91,13 @@ export class SessionMonitor {
 
         console.log("this.shouldStop : ", this.shouldStop);
 
+        // Début de session poussé par le serveur: pas de polling si les stubs connaissent WatchSession
+        const pushedSession = await this.waitForPushedSession();
+        this.stopWatch = null;
+        if (pushedSession !== undefined) {
+            return pushedSession;
+        }
+
         while (!this.shouldStop) {
             // Vérifier la connexion gRPC
             const isConnected = await this.testGrpcConnection();
@@ -5,6 +5,11 @@ import { enablePointDistanceMeasurement } from './PointDistanceMeasurement.js';
 import { transpose16, applyPoseToMesh } from '../core/utils.js';
 import { DataBaseManager } from '../core/DataBaseManager.js';
 
+// Valeurs de l'enum ChunkDirective (pointcloud.proto)
+const CHUNK_ADD = 0;
+const CHUNK_REPLACE = 1;
+const CHUNK_DROP = 2;
+
 export class PointCloudController {
     /**
         * @param {THREE.Scene} scene
@@ -34,6 +39,15 @@ export class PointCloudController {
 
         this.dbManager = dbManager;
 
+        // Budget de points: chunks échantillonnés par le serveur, jamais sauvegardés
+        this.pointBudget = null;
+        this.chunkRanges = new Map(); // chunkId -> { start, count } dans le buffer
+
+        // Repère keyframe: points reçus en coordonnées locales + pose, déplacés lors des corrections
+        this.localCoordinates = true; // même valeur que SlamService.localCoordinates
+        this.keyframePoses = new Map(); // keyframeId -> pose corrigée (16 valeurs)
+        this.keyframeRanges = new Map(); // keyframeId -> [{ chunkId, offset, count, pose }]
+
         // init geometry
         this._initGeometry();
         // enable picking
@@ -84,6 +98,151 @@ export class PointCloudController {
         this.pickgeom.setAttribute('position', new THREE.Float32BufferAttribute([],3));
         const pickMaterial = new THREE.PointsMaterial({ size: 0.01, visible: false});
         this.pickmesh = new THREE.Points(this.pickgeom, pickMaterial);
+
+        this._initLod();
+    }
+
+    // Calque provisoire des niveaux de détail (mode progressif)
+    _initLod() {
+        this.lodLevel = 0;
+        this.lodSequence = -1;
+        this.lodCoords = new Float32Array(0);
+        this.lodColors = new Float32Array(0);
+        this.lodGeom = new THREE.BufferGeometry();
+        const mat = new THREE.PointsMaterial({ vertexColors: true, size: 0.04 });
+        this.lodPoints = new THREE.Points(this.lodGeom, mat);
+        this.lodPoints.frustumCulled = false;
+        this.lodPoints.visible = false;
+        this.scene.add(this.lodPoints);
+    }
+
+    // Ajoute une tuile de niveau de détail; un niveau plus fin remplace le précédent
+    _updateLod(coords, colors, metadata) {
+        const concat = (a, b) => {
+            const out = new Float32Array(a.length + b.length);
+            out.set(a);
+            out.set(b, a.length);
+            return out;
+        };
+        if (metadata.lodLevel !== this.lodLevel) {
+            this.lodLevel = metadata.lodLevel;
+            this.lodCoords = new Float32Array(0);
+            this.lodColors = new Float32Array(0);
+            this.lodPoints.material.size = metadata.lodVoxelSize || this.lodPoints.material.size;
+        }
+        this.lodCoords = concat(this.lodCoords, coords);
+        this.lodColors = concat(this.lodColors, colors);
+        this.lodSequence = metadata.sequenceNumber;
+        this.lodGeom.setAttribute('position', new THREE.BufferAttribute(this.lodCoords, 3));
+        this.lodGeom.setAttribute('color', new THREE.BufferAttribute(this.lodColors, 3));
+        this.lodPoints.visible = true;
+        console.log(`🧊 Niveau de détail ${metadata.lodLevel}: ${this.lodCoords.length / 3} points`);
+    }
+
+    // Masque le calque de détail dès que la pleine résolution couvre la même séquence
+    _hideLodIfCovered(metadata) {
+        if (!this.lodPoints.visible || !metadata || metadata.sequenceNumber < this.lodSequence) return;
+        this.lodPoints.visible = false;
+        this.lodGeom.dispose();
+        this.lodGeom = new THREE.BufferGeometry();
+        this.lodPoints.geometry = this.lodGeom;
+        this.lodLevel = 0;
+        console.log('🧊 Pleine résolution atteinte, calque de détail retiré');
+    }
+
+    // Active le mode budget (à appeler avec la même valeur que SlamService.setPointBudget)
+    setPointBudget(pointBudget) {
+        this.pointBudget = pointBudget;
+    }
+
+    // Mémorise où sont les points de chaque keyframe et avec quelle pose ils ont été placés
+    _indexKeyframes(chunkId, keyframes, counts, poses) {
+        let offset = 0;
+        return keyframes.map((keyframeId, i) => {
+            const count = counts[i] || 0;
+            const range = { chunkId, offset, count, pose: poses[i] || null };
+            if (!this.keyframeRanges.has(keyframeId)) this.keyframeRanges.set(keyframeId, []);
+            this.keyframeRanges.get(keyframeId).push(range);
+            offset += count;
+            return range;
+        });
+    }
+
+    // Déplace les points d'une plage de keyframe vers sa nouvelle pose, retourne le nombre de points
+    _moveRange(range, newPose) {
+        const toMatrix = values => values && values.length === 16
+            ? new THREE.Matrix4().set(...values)   // set() prend la matrice ligne par ligne
+            : new THREE.Matrix4();
+        const point = new THREE.Vector3();
+        // delta = nouvelle pose * inverse(pose utilisée pour placer les points)
+        const delta = toMatrix(newPose).multiply(toMatrix(range.pose).invert());
+        const start = this.chunkRanges.get(range.chunkId).start + range.offset;
+        for (let i = start; i < start + range.count; i++) {
+            point.fromArray(this.posArr, i * 3).applyMatrix4(delta).toArray(this.posArr, i * 3);
+        }
+        range.pose = newPose;
+        return range.count;
+    }
+
+    // Correction de poses: re-transforme les points déjà affichés (res est un PoseCorrection)
+    applyPoseCorrection(res) {
+        let moved = 0;
+
+        res.getPosesList().forEach(keyframePose => {
+            const keyframeId = keyframePose.getKeyframeId();
+            const newPose = keyframePose.getPose().getMatrixList();
+            this.keyframePoses.set(keyframeId, newPose);
+
+            // Chunks retirés entre-temps (budget de points): oublier leurs plages
+            const ranges = (this.keyframeRanges.get(keyframeId) || []).filter(r => this.chunkRanges.has(r.chunkId));
+            this.keyframeRanges.set(keyframeId, ranges);
+            ranges.forEach(range => {
+                moved += this._moveRange(range, newPose);
+            });
+        });
+
+        this.posAttr.updateRange.offset = 0;
+        this.posAttr.updateRange.count = this.writeIndex * 3;
+        this.posAttr.needsUpdate = true;
+        console.log(`🔁 Correction de poses #${res.getRevision()}: ${moved} points déplacés`);
+    }
+
+    // Retire les points d'un chunk du buffer en décalant les suivants
+    _removeChunk(chunkId) {
+        const range = this.chunkRanges.get(chunkId);
+        if (!range) return;
+        this.chunkRanges.delete(chunkId);
+        const end = range.start + range.count;
+
+        this.posArr.copyWithin(range.start * 3, end * 3, this.writeIndex * 3);
+        this.colArr.copyWithin(range.start * 3, end * 3, this.writeIndex * 3);
+        for (const other of this.chunkRanges.values()) {
+            if (other.start >= end) other.start -= range.count;
+        }
+
+        // Picking: oublier les points retirés, décaler les suivants
+        const pickPositions = [];
+        const pickIndices = [];
+        this.pickOriginalIndices.forEach((idx, i) => {
+            if (idx >= range.start && idx < end) return;
+            pickPositions.push(...this.pickPositions.slice(i * 3, i * 3 + 3));
+            pickIndices.push(idx >= end ? idx - range.count : idx);
+        });
+        this.pickPositions = pickPositions;
+        this.pickOriginalIndices.splice(0, this.pickOriginalIndices.length, ...pickIndices);
+        this.pickgeom.setAttribute('position', new THREE.Float32BufferAttribute(this.pickPositions, 3));
+
+        this.posAttr.updateRange.offset = range.start * 3;
+        this.posAttr.updateRange.count = (this.writeIndex - range.start) * 3;
+        this.posAttr.needsUpdate = true;
+        this.colAttr.updateRange.offset = range.start * 3;
+        this.colAttr.updateRange.count = (this.writeIndex - range.start) * 3;
+        this.colAttr.needsUpdate = true;
+
+        this.writeIndex -= range.count;
+        this.displayCount = this.writeIndex;
+        this.geom.setDrawRange(0, this.displayCount);
+        console.log(`✂️ Chunk retiré: ${chunkId} (${range.count} points)`);
     }
 
     // enable distance picking
@@ -110,16 +269,33 @@ export class PointCloudController {
     // Configure l'écoute du worker
     _setupWorker() {
         this.worker.onmessage = e => {
-            const { coords, colors, metadata } = e.data;
+            const { coords, colors, metadata, counts, poses } = e.data;
             console.log(`🔧 Worker terminé: ${coords.length / 3} points traités`);
+
+            // Tuile de niveau de détail: affichage provisoire, jamais sauvegardée
+            if (metadata && metadata.lodLevel > 0) {
+                this._updateLod(coords, colors, metadata);
+                return;
+            }
+            if (metadata && metadata.directive === CHUNK_REPLACE) {
+                this._removeChunk(metadata.chunkId);
+            }
+            if (metadata && metadata.chunkId) {
+                this.chunkRanges.set(metadata.chunkId, { start: this.writeIndex, count: coords.length / 3 });
+            }
             this._updateBuffers(coords, colors);
+            if (metadata && metadata.chunkId && metadata.keyframes) {
+                this._indexKeyframes(metadata.chunkId, metadata.keyframes, counts, poses);
+            }
+            this._hideLodIfCovered(metadata);
+            if (this.pointBudget) return;
             
             console.log("metadata : ", metadata);
 
             // Sauvegarder directement avec les données traitées
             if (metadata && metadata.chunkId && metadata.sequenceNumber !== null) {
                 console.log("save metadata")
-                this.saveChunkOptimized(coords, colors, metadata);
+                this.saveChunkOptimized(coords, colors, metadata, counts, poses);
             }
         };
     }
@@ -207,13 +383,43 @@ export class PointCloudController {
         const sequenceNumber = response.getSequenceNumber ? response.getSequenceNumber() : null;
         const sessionId = response.getSessionId ? response.getSessionId() : null;
         const timestamp = response.getTimestamp ? response.getTimestamp() : Date.now();
+        const lodLevel = response.getLodLevel ? response.getLodLevel() : 0;
+        const directive = response.getDirective ? response.getDirective() : CHUNK_ADD;
+
+        // Points en repère keyframe: pose courante de chaque keyframe (corrigée si connue)
+        const local = raw.localCoordinates ?? this.localCoordinates;
+        const keyframes = raw.indexlist ? raw.indexlist.indexList : [];
+        const chunkPoses = raw.poselist ? raw.poselist.posesList : [];
+        const poses = (raw.pointcloudlist ? raw.pointcloudlist.pointcloudsList : []).map((_, i) => {
+            if (!local) return null;
+            const corrected = this.keyframePoses.get(keyframes[i]);
+            if (corrected) return corrected;
+            const matrix = chunkPoses[i] ? chunkPoses[i].matrixList : null;
+            return matrix && matrix.length === 16 ? matrix : null;
+        });
+
+        // Budget de points: le serveur retire un chunk devenu superflu
+        if (directive === CHUNK_DROP) {
+            this._removeChunk(chunkId);
+            return;
+        }
+
+        // Tuile de niveau de détail (mode progressif): pas de sauvegarde en base
+        if (lodLevel > 0) {
+            this.worker.postMessage({
+                type: 'processPointCloud',
+                payload: raw,
+                metadata: { lodLevel, lodVoxelSize: response.getLodVoxelSize(), sequenceNumber }
+            });
+            return;
+        }
        
         
         console.log("chunkId : ", chunkId);
 
         // Passer les métadonnées au worker pour éviter le double traitement
         const metadata = (chunkId && sequenceNumber !== null) ? 
-            { chunkId, sequenceNumber, sessionId, timestamp } : null;
+            { chunkId, sequenceNumber, sessionId, timestamp, directive, keyframes } : null;
         
         
         console.log("metadata : ", metadata)
@@ -222,12 +428,14 @@ export class PointCloudController {
         this.worker.postMessage({ 
             type: 'processPointCloud', 
             payload: raw,
-            metadata: metadata
+            metadata: metadata,
+            poses: poses
         });
     }
 
     // Sauvegarde optimisée avec données déjà traitées par le worker
-    async saveChunkOptimized(coords, colors, metadata) {
+    // (keyframes, points par keyframe et poses appliquées: corrections possibles après rechargement)
+    async saveChunkOptimized(coords, colors, metadata, counts = [], poses = []) {
         try {
 
             console.log("SaveChunkOptimized")
@@ -246,7 +454,10 @@ export class PointCloudController {
                 sessionId: metadata.sessionId,
                 timestamp: metadata.timestamp,
                 coords: coords,
-                colors: colors
+                colors: colors,
+                keyframes: metadata.keyframes || [],
+                counts: counts,
+                poses: poses
             };
             
 
@@ -297,14 +508,29 @@ export class PointCloudController {
             // Charger TOUS les chunks d'un coup
             const startTime = performance.now();
             
+            let moved = 0;
             chunks.forEach((chunk, index) => {
                 if (chunk.coords && chunk.colors) {
+                    this.chunkRanges.set(chunk.chunkId, { start: this.writeIndex, count: chunk.coords.length / 3 });
                     this._updateBuffers(chunk.coords, chunk.colors);
+                    // Points placés avec les poses de la sauvegarde: appliquer les corrections reçues depuis
+                    if (chunk.keyframes && chunk.counts) {
+                        const ranges = this._indexKeyframes(chunk.chunkId, chunk.keyframes, chunk.counts, chunk.poses || []);
+                        ranges.forEach((range, i) => {
+                            const corrected = this.keyframePoses.get(chunk.keyframes[i]);
+                            if (corrected) moved += this._moveRange(range, corrected);
+                        });
+                    }
                 }
             });
+            if (moved > 0) {
+                this.posAttr.updateRange.offset = 0;
+                this.posAttr.updateRange.count = this.writeIndex * 3;
+                this.posAttr.needsUpdate = true;
+            }
             
             const loadTime = performance.now() - startTime;
-            console.log(`✅ Rejeu terminé en ${loadTime.toFixed(2)}ms`);
+            console.log(`✅ Rejeu terminé en ${loadTime.toFixed(2)}ms (${moved} points corrigés)`);
 
             
         } catch (error) {
@@ -3,22 +3,35 @@
 // Ce module sera chargé en tant que Web Worker via new Worker(new URL(...), import.meta.url)
 
 self.onmessage = function(event) {
-  const { type, payload, metadata } = event.data;
+  const { type, payload, metadata, poses = [] } = event.data;
   if (type === 'processPointCloud') {
         console.log('🔧 Worker: Début traitement chunk');
         
         const obj = payload;
         const coordsList = [];
         const colorsList = [];
+        const counts = [];
         
         if (obj.pointcloudlist && obj.pointcloudlist.pointcloudsList) {
             console.log(`🔧 Worker: ${obj.pointcloudlist.pointcloudsList.length} pointcloud(s) à traiter`);
             
-            obj.pointcloudlist.pointcloudsList.forEach((pointCloud) => {
+            obj.pointcloudlist.pointcloudsList.forEach((pointCloud, i) => {
+                // Pose keyframe -> monde (16 valeurs, ligne par ligne) si les points sont en repère local
+                const m = poses[i];
+                const count = pointCloud.pointsList ? pointCloud.pointsList.length : 0;
+                counts.push(count);
                 if (pointCloud.pointsList) {
-                    console.log(`🔧 Worker: Traitement de ${pointCloud.pointsList.length} points`);
+                    console.log(`🔧 Worker: Traitement de ${count} points`);
                     pointCloud.pointsList.forEach((point) => {
-                        coordsList.push(point.x, point.y, point.z);
+                        if (m) {
+                            coordsList.push(
+                                m[0] * point.x + m[1] * point.y + m[2] * point.z + m[3],
+                                m[4] * point.x + m[5] * point.y + m[6] * point.z + m[7],
+                                m[8] * point.x + m[9] * point.y + m[10] * point.z + m[11]
+                            );
+                        } else {
+                            coordsList.push(point.x, point.y, point.z);
+                        }
                         colorsList.push(point.r, point.g, point.b);
                     });
                 }
@@ -34,7 +47,9 @@ self.onmessage = function(event) {
             {
                 coords: coordsArray,
                 colors: colorsArray,
-                metadata: metadata // Retourner les métadonnées pour la sauvegarde
+                metadata: metadata, // Retourner les métadonnées pour la sauvegarde
+                counts: counts,     // points par pointcloud (une keyframe chacun)
+                poses: poses        // poses appliquées, pour les corrections suivantes
             },
             [coordsArray.buffer, colorsArray.buffer]
         );
@@ -15,4 +15,15 @@ export class PoseService {
         });
         stream.on('error', err => callback(err));
     }
+
+    // Corrections de poses des keyframes (fermeture de boucle), res est un PoseCorrection
+    onPoseCorrections(callback) {
+        if (!this.client.getPoseCorrections) {
+            console.warn('⚠️ Stubs grpc-web sans GetPoseCorrections (relancer gen_web.sh)');
+            return;
+        }
+        const stream = this.client.getPoseCorrections(new Empty(), {});
+        stream.on('data', res => callback(null, res));
+        stream.on('error', err => callback(err));
+    }
 }
@@ -61,18 +61,25 @@ export class SessionService {
                     reject(err);
                 } else {
                     console.log("✅ Réponse reçue (vérifier logs serveur pour metadata)");
-                    resolve({
-                        sessionId: response.getSessionId(),
-                        startTime: response.getStartTime(),
-                        isActive: response.getIsActive(),
-                        clientsConnected: response.getClientsConnected(),
-                        totalChunks: response.getTotalChunks()
-                    });
+                    resolve(toSessionInfo(response));
                 }
             });
         });
     }
 
+    // Changements de SessionInfo poussés par le serveur (début, activité, clients, fin), sans polling
+    // Retourne le stream (cancel() pour arrêter), null si les stubs ne connaissent pas WatchSession
+    watchSessionInfo(callback) {
+        if (!this.client.watchSession) {
+            console.warn('⚠️ Stubs grpc-web sans WatchSession (relancer gen_web.sh)');
+            return null;
+        }
+        const stream = this.client.watchSession(new Empty(), {});
+        stream.on('data', response => callback(null, toSessionInfo(response)));
+        stream.on('error', err => callback(err));
+        return stream;
+    }
+
 
     async setSessionInfo(sessionInfo) {
         return new Promise((resolve, reject) => {
@@ -94,3 +101,14 @@ export class SessionService {
         });
     }
 }
+
+function toSessionInfo(response) {
+    return {
+        sessionId: response.getSessionId(),
+        startTime: response.getStartTime(),
+        isActive: response.getIsActive(),
+        clientsConnected: response.getClientsConnected(),
+        totalChunks: response.getTotalChunks(),
+        lastActivityMs: response.getLastActivityMs ? response.getLastActivityMs() : 0
+    };
+}
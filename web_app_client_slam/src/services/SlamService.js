@@ -6,6 +6,66 @@ export class SlamService {
         this.client = new SlamServiceClient(url, null, null);
         this.receivedPacked = 0;
         this.dbManager = dbManager;
+        // Point de vue pour prioriser le rattrapage ('sequence' = ordre historique)
+        this.syncOrder = 'sequence';
+        this.viewpoint = null;
+        // Mode progressif: carte entière en niveaux de détail grossiers avant la pleine résolution
+        this.progressive = false;
+        // Budget de points (null = tous les points): le serveur échantillonne et envoie replace / drop
+        this.pointBudget = null;
+        // Points reçus dans le repère de leur keyframe: les corrections de poses les déplacent sans re-téléchargement
+        this.localCoordinates = true;
+        // SlamData vide envoyé par le serveur après ce délai sans chunk: fait tomber une connexion morte
+        this.heartbeatSeconds = 5;
+        // Curseur de reprise pendant un rattrapage entrelacé avec le temps réel (null = rattrapage terminé)
+        this.resumeSequence = this._loadResumeSequence();
+    }
+
+
+    _loadResumeSequence() {
+        const stored = typeof localStorage !== 'undefined' ? localStorage.getItem('slam-resume-sequence') : null;
+        return stored === null ? null : Number(stored);
+    }
+
+
+    // Les chunks temps réel arrivent avant la fin du rattrapage: tant que le serveur envoie
+    // resume_sequence, c'est lui (et non la plus grande séquence reçue) qu'il faut renvoyer
+    _saveResumeSequence(res) {
+        const resumeSequence = res.hasResumeSequence && res.hasResumeSequence() ? res.getResumeSequence() : null;
+        if (resumeSequence === this.resumeSequence || typeof localStorage === 'undefined') {
+            this.resumeSequence = resumeSequence;
+            return;
+        }
+        this.resumeSequence = resumeSequence;
+        if (resumeSequence === null) {
+            localStorage.removeItem('slam-resume-sequence');
+        } else {
+            localStorage.setItem('slam-resume-sequence', String(resumeSequence));
+        }
+    }
+
+
+    // Demande au serveur d'envoyer d'abord les chunks proches / visibles depuis la caméra
+    setViewpoint(camera, syncOrder = 'visibility') {
+        const direction = camera.getWorldDirection(camera.position.clone());
+        this.syncOrder = syncOrder;
+        this.viewpoint = {
+            position: camera.position.toArray(),
+            direction: direction.toArray(),
+            fov: camera.fov
+        };
+    }
+
+
+    // Demande d'abord la silhouette de la carte (64, 16 puis 4 cm) puis les chunks pleine résolution
+    setProgressive(enabled = true) {
+        this.progressive = enabled;
+    }
+
+
+    // Limite le nombre de points affichés (tablettes): échantillonnage plus dense près de la caméra
+    setPointBudget(pointBudget) {
+        this.pointBudget = pointBudget;
     }
 
 
@@ -32,6 +92,10 @@ export class SlamService {
                     lastSequenceNumber = Math.max(...chunks.map(c => c.sequenceNumber || -1));
                 }
             }
+            // Rattrapage interrompu: reprendre après le dernier chunk reçu sans trou
+            if (this.resumeSequence !== null) {
+                lastSequenceNumber = Math.min(lastSequenceNumber, this.resumeSequence);
+            }
 
             return {
                 lastSequenceNumber,
@@ -62,11 +126,17 @@ export class SlamService {
 
         // 2. Encoder les infos dans custom-header-1 (déjà autorisé par Envoy)
         const metadata = {
+            'local-coordinates': this.localCoordinates ? '1' : '0',
             'custom-header-1': JSON.stringify({
                 lastSequence: cacheInfo.lastSequenceNumber,
                 sessionId: cacheInfo.sessionId,
                 chunkCount: cacheInfo.chunkCount,
-                timestamp: Date.now()
+                timestamp: Date.now(),
+                syncOrder: this.syncOrder,
+                viewpoint: this.viewpoint,
+                progressive: this.progressive,
+                pointBudget: this.pointBudget,
+                heartbeatSeconds: this.heartbeatSeconds
             })
         };
 
@@ -77,6 +147,9 @@ export class SlamService {
         const stream = this.client.getSlamData(new Empty(), metadata);
         
         stream.on('data', res => {
+            // Heartbeat: SlamData vide, rien à afficher
+            if (!res.getChunkId() && !res.hasPointcloudlist()) return;
+
             // Log des infos du chunk
             const chunkId = res.getChunkId ? res.getChunkId() : 'N/A';
             const sequenceNumber = res.getSequenceNumber ? res.getSequenceNumber() : 'N/A';
@@ -91,6 +164,7 @@ export class SlamService {
                 receivedAt: new Date().toISOString()
             });
             
+            this._saveResumeSequence(res);
             callback(null, res);
         });
         
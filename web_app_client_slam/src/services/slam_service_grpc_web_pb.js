@@ -420,6 +420,408 @@ proto.IVM.slam.SlamServicePromiseClient.prototype.getSpecificChunks =
 };
 
 
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.IVM.slam.RegionRequest,
+ *   !proto.IVM.slam.SlamData>}
+ */
+const methodDescriptor_SlamService_GetRegionChunks = new grpc.web.MethodDescriptor(
+  '/IVM.slam.SlamService/GetRegionChunks',
+  grpc.web.MethodType.SERVER_STREAMING,
+  pointcloud_pb.RegionRequest,
+  pointcloud_pb.SlamData,
+  /**
+   * @param {!proto.IVM.slam.RegionRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  pointcloud_pb.SlamData.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.IVM.slam.RegionRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SlamData>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServiceClient.prototype.getRegionChunks =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetRegionChunks',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetRegionChunks);
+};
+
+
+/**
+ * @param {!proto.IVM.slam.RegionRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SlamData>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServicePromiseClient.prototype.getRegionChunks =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetRegionChunks',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetRegionChunks);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.IVM.slam.HistoryRequest,
+ *   !proto.IVM.slam.SlamData>}
+ */
+const methodDescriptor_SlamService_GetHistory = new grpc.web.MethodDescriptor(
+  '/IVM.slam.SlamService/GetHistory',
+  grpc.web.MethodType.SERVER_STREAMING,
+  pointcloud_pb.HistoryRequest,
+  pointcloud_pb.SlamData,
+  /**
+   * @param {!proto.IVM.slam.HistoryRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  pointcloud_pb.SlamData.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.IVM.slam.HistoryRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SlamData>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServiceClient.prototype.getHistory =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetHistory',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetHistory);
+};
+
+
+/**
+ * @param {!proto.IVM.slam.HistoryRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SlamData>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServicePromiseClient.prototype.getHistory =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetHistory',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetHistory);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.IVM.slam.KeyframeRequest,
+ *   !proto.IVM.slam.SlamData>}
+ */
+const methodDescriptor_SlamService_GetKeyframeChunks = new grpc.web.MethodDescriptor(
+  '/IVM.slam.SlamService/GetKeyframeChunks',
+  grpc.web.MethodType.SERVER_STREAMING,
+  pointcloud_pb.KeyframeRequest,
+  pointcloud_pb.SlamData,
+  /**
+   * @param {!proto.IVM.slam.KeyframeRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  pointcloud_pb.SlamData.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.IVM.slam.KeyframeRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SlamData>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServiceClient.prototype.getKeyframeChunks =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetKeyframeChunks',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetKeyframeChunks);
+};
+
+
+/**
+ * @param {!proto.IVM.slam.KeyframeRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SlamData>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServicePromiseClient.prototype.getKeyframeChunks =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetKeyframeChunks',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetKeyframeChunks);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.IVM.slam.TrajectoryRequest,
+ *   !proto.IVM.slam.PoseList>}
+ */
+const methodDescriptor_SlamService_GetTrajectory = new grpc.web.MethodDescriptor(
+  '/IVM.slam.SlamService/GetTrajectory',
+  grpc.web.MethodType.SERVER_STREAMING,
+  pointcloud_pb.TrajectoryRequest,
+  pointcloud_pb.PoseList,
+  /**
+   * @param {!proto.IVM.slam.TrajectoryRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  pointcloud_pb.PoseList.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.IVM.slam.TrajectoryRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.PoseList>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServiceClient.prototype.getTrajectory =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetTrajectory',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetTrajectory);
+};
+
+
+/**
+ * @param {!proto.IVM.slam.TrajectoryRequest} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.PoseList>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServicePromiseClient.prototype.getTrajectory =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetTrajectory',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetTrajectory);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.IVM.slam.MapSnapshotRequest,
+ *   !proto.IVM.slam.SlamData>}
+ */
+const methodDescriptor_SlamService_GetMapSnapshot = new grpc.web.MethodDescriptor(
+  '/IVM.slam.SlamService/GetMapSnapshot',
+  grpc.web.MethodType.UNARY,
+  pointcloud_pb.MapSnapshotRequest,
+  pointcloud_pb.SlamData,
+  /**
+   * @param {!proto.IVM.slam.MapSnapshotRequest} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  pointcloud_pb.SlamData.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.IVM.slam.MapSnapshotRequest} request The
+ *     request proto
+ * @param {?Object<string, string>} metadata User defined
+ *     call metadata
+ * @param {function(?grpc.web.RpcError, ?proto.IVM.slam.SlamData)}
+ *     callback The callback function(error, response)
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SlamData>|undefined}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServiceClient.prototype.getMapSnapshot =
+    function(request, metadata, callback) {
+  return this.client_.rpcCall(this.hostname_ +
+      '/IVM.slam.SlamService/GetMapSnapshot',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetMapSnapshot,
+      callback);
+};
+
+
+/**
+ * @param {!proto.IVM.slam.MapSnapshotRequest} request The
+ *     request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!Promise<!proto.IVM.slam.SlamData>}
+ *     Promise that resolves to the response
+ */
+proto.IVM.slam.SlamServicePromiseClient.prototype.getMapSnapshot =
+    function(request, metadata) {
+  return this.client_.unaryCall(this.hostname_ +
+      '/IVM.slam.SlamService/GetMapSnapshot',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetMapSnapshot);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.IVM.slam.PoseCorrection,
+ *   !proto.google.protobuf.Empty>}
+ */
+const methodDescriptor_SlamService_CorrectPoses = new grpc.web.MethodDescriptor(
+  '/IVM.slam.SlamService/CorrectPoses',
+  grpc.web.MethodType.UNARY,
+  pointcloud_pb.PoseCorrection,
+  google_protobuf_empty_pb.Empty,
+  /**
+   * @param {!proto.IVM.slam.PoseCorrection} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  google_protobuf_empty_pb.Empty.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.IVM.slam.PoseCorrection} request The
+ *     request proto
+ * @param {?Object<string, string>} metadata User defined
+ *     call metadata
+ * @param {function(?grpc.web.RpcError, ?proto.google.protobuf.Empty)}
+ *     callback The callback function(error, response)
+ * @return {!grpc.web.ClientReadableStream<!proto.google.protobuf.Empty>|undefined}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServiceClient.prototype.correctPoses =
+    function(request, metadata, callback) {
+  return this.client_.rpcCall(this.hostname_ +
+      '/IVM.slam.SlamService/CorrectPoses',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_CorrectPoses,
+      callback);
+};
+
+
+/**
+ * @param {!proto.IVM.slam.PoseCorrection} request The
+ *     request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!Promise<!proto.google.protobuf.Empty>}
+ *     Promise that resolves to the response
+ */
+proto.IVM.slam.SlamServicePromiseClient.prototype.correctPoses =
+    function(request, metadata) {
+  return this.client_.unaryCall(this.hostname_ +
+      '/IVM.slam.SlamService/CorrectPoses',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_CorrectPoses);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.google.protobuf.Empty,
+ *   !proto.IVM.slam.PoseCorrection>}
+ */
+const methodDescriptor_SlamService_GetPoseCorrections = new grpc.web.MethodDescriptor(
+  '/IVM.slam.SlamService/GetPoseCorrections',
+  grpc.web.MethodType.SERVER_STREAMING,
+  google_protobuf_empty_pb.Empty,
+  pointcloud_pb.PoseCorrection,
+  /**
+   * @param {!proto.google.protobuf.Empty} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  pointcloud_pb.PoseCorrection.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.google.protobuf.Empty} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.PoseCorrection>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServiceClient.prototype.getPoseCorrections =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetPoseCorrections',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetPoseCorrections);
+};
+
+
+/**
+ * @param {!proto.google.protobuf.Empty} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.PoseCorrection>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServicePromiseClient.prototype.getPoseCorrections =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/GetPoseCorrections',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_GetPoseCorrections);
+};
+
+
 /**
  * @const
  * @type {!grpc.web.MethodDescriptor<
@@ -542,5 +944,117 @@ proto.IVM.slam.SlamServicePromiseClient.prototype.setSessionInfo =
 };
 
 
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.google.protobuf.Empty,
+ *   !proto.IVM.slam.SessionInfo>}
+ */
+const methodDescriptor_SlamService_WatchSession = new grpc.web.MethodDescriptor(
+  '/IVM.slam.SlamService/WatchSession',
+  grpc.web.MethodType.SERVER_STREAMING,
+  google_protobuf_empty_pb.Empty,
+  pointcloud_pb.SessionInfo,
+  /**
+   * @param {!proto.google.protobuf.Empty} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  pointcloud_pb.SessionInfo.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.google.protobuf.Empty} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SessionInfo>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServiceClient.prototype.watchSession =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/WatchSession',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_WatchSession);
+};
+
+
+/**
+ * @param {!proto.google.protobuf.Empty} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SessionInfo>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServicePromiseClient.prototype.watchSession =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/WatchSession',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_WatchSession);
+};
+
+
+/**
+ * @const
+ * @type {!grpc.web.MethodDescriptor<
+ *   !proto.google.protobuf.Empty,
+ *   !proto.IVM.slam.SessionUpdate>}
+ */
+const methodDescriptor_SlamService_StreamSession = new grpc.web.MethodDescriptor(
+  '/IVM.slam.SlamService/StreamSession',
+  grpc.web.MethodType.SERVER_STREAMING,
+  google_protobuf_empty_pb.Empty,
+  pointcloud_pb.SessionUpdate,
+  /**
+   * @param {!proto.google.protobuf.Empty} request
+   * @return {!Uint8Array}
+   */
+  function(request) {
+    return request.serializeBinary();
+  },
+  pointcloud_pb.SessionUpdate.deserializeBinary
+);
+
+
+/**
+ * @param {!proto.google.protobuf.Empty} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SessionUpdate>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServiceClient.prototype.streamSession =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/StreamSession',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_StreamSession);
+};
+
+
+/**
+ * @param {!proto.google.protobuf.Empty} request The request proto
+ * @param {?Object<string, string>=} metadata User defined
+ *     call metadata
+ * @return {!grpc.web.ClientReadableStream<!proto.IVM.slam.SessionUpdate>}
+ *     The XHR Node Readable Stream
+ */
+proto.IVM.slam.SlamServicePromiseClient.prototype.streamSession =
+    function(request, metadata) {
+  return this.client_.serverStreaming(this.hostname_ +
+      '/IVM.slam.SlamService/StreamSession',
+      request,
+      metadata || {},
+      methodDescriptor_SlamService_StreamSession);
+};
+
+
 module.exports = proto.IVM.slam;
 